@@ -4,10 +4,28 @@ from uuid import UUID, uuid4
 from typing import Any, Callable, Generator, List
 
 from dotenv import dotenv_values
+import httpx
 from pytest_mock import MockerFixture
 import requests_mock
 
 from vellum.workflows.logging import load_logger
+from vellum.workflows.nodes.displayable.bases.api_node.http_client import set_default_api_node_httpx_client
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption("--benchmarks", action="store_true", default=False, help="Also run tests marked as benchmarks")
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: List[pytest.Item]) -> None:
+    """Benchmarks compare timings, which are too noisy to assert on in CI, so they only run when asked for"""
+
+    if config.getoption("--benchmarks"):
+        return
+
+    skip_benchmark = pytest.mark.skip(reason="Benchmarks only run with --benchmarks")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip_benchmark)
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -64,3 +82,15 @@ def vellum_adhoc_prompt_client(vellum_client: Any) -> Any:
 def mock_requests() -> Any:
     with requests_mock.Mocker() as m:
         yield m
+
+
+@pytest.fixture
+def mock_api_node_transport(mocker: MockerFixture) -> Generator[Any, None, None]:
+    """Sends every API Node request to a mocked transport, whose `handle_request` returns the response"""
+
+    transport = mocker.MagicMock(spec=httpx.BaseTransport)
+    set_default_api_node_httpx_client(httpx.Client(transport=transport))
+
+    yield transport
+
+    set_default_api_node_httpx_client(None)
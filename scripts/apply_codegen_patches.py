@@ -0,0 +1,55 @@
+"""
+Re-applies the hooks that our hand-written client code needs in the files Fern generates.
+
+Fern overwrites every file that isn't listed in `.fernignore`, so rather than fencing off generated files, the few lines
+we add to them, like the import that installs our retrying HttpClient, are kept as patches under
+`scripts/codegen_patches`, each at the path of the file it applies to. The behaviour those hooks call into lives in
+modules Fern doesn't generate, so that the patches stay small and rarely conflict with a regeneration.
+
+It is idempotent, skipping patches that are already applied, and runs as part of `make post-codegen` after
+regenerating the SDK. A patch that no longer applies because Fern changed the code around it fails the run, and should
+be recreated against the newly generated file, see CONTRIBUTING.md:
+
+    python -m scripts.apply_codegen_patches
+"""
+
+import os
+import subprocess
+import sys
+from typing import List, Sequence
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PATCHES_DIR = os.path.join(ROOT, "scripts", "codegen_patches")
+
+
+def get_patches() -> List[str]:
+    patches: List[str] = []
+    for directory, _, file_names in os.walk(PATCHES_DIR):
+        patches.extend(os.path.join(directory, file_name) for file_name in file_names if file_name.endswith(".patch"))
+
+    return sorted(patches)
+
+
+def _git_apply(patch: str, *args: str) -> "subprocess.CompletedProcess[str]":
+    return subprocess.run(["git", "apply", *args, patch], cwd=ROOT, capture_output=True, text=True)
+
+
+def main(patches: Sequence[str]) -> None:
+    failed_patches = []
+    for patch in patches or get_patches():
+        # A patch that can be reversed cleanly has already been applied
+        if _git_apply(patch, "--reverse", "--check").returncode == 0:
+            continue
+
+        result = _git_apply(patch)
+        if result.returncode != 0:
+            sys.stderr.write(f"{os.path.relpath(patch, ROOT)} no longer applies:\n{result.stderr}\n")
+            failed_patches.append(patch)
+
+    if failed_patches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,242 @@
+"""
+Rewrites a package's `__init__.py` so that the names it re-exports are only imported on first access.
+
+Fern generates package roots like `vellum.client.types` that eagerly import every model in the package, which
+means importing any single model builds the schemas of all of them. This script replaces those imports with a
+name -> module index that a module-level `__getattr__` resolves lazily, while keeping the original imports under
+`typing.TYPE_CHECKING` so that type checkers and IDEs still see every name. Star imports, as used by our
+backwards-compatible shim packages, are expanded into the index using the imported module's `__all__`.
+
+Package roots that Fern generates as a full module, like `vellum.client`, first have their contents moved into a
+sibling module that the package root then lazily re-exports. That sibling module is generated too, and is rewritten
+from Fern's output every time the package root is regenerated.
+
+It is idempotent, and runs as part of `make post-codegen` after regenerating the SDK, see CONTRIBUTING.md:
+
+    python -m scripts.generate_lazy_imports
+"""
+
+import ast
+import importlib
+import os
+import sys
+from typing import Dict, List, Optional, Sequence, Union
+
+from typing_extensions import TypeGuard
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+LAZY_PACKAGES = [
+    "src/vellum/client/types/__init__.py",
+    "src/vellum/types/__init__.py",
+    "src/vellum/__init__.py",
+]
+
+# Package roots that Fern generates as a full module rather than as re-exports. Their contents are moved into the
+# given sibling module so that the package root itself can be made lazy.
+MODULE_ROOTS = {
+    "src/vellum/client/__init__.py": "client",
+}
+
+LAZY_MARKER = "# Names are imported lazily, see scripts/generate_lazy_imports.py"
+
+LAZY_LOADER = """
+
+def __getattr__(name: str) -> typing.Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+
+    # Cache the resolved value so that __getattr__ is only hit once per name
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> typing.List[str]:
+    return sorted(set(globals()) | set(__all__))
+"""
+
+
+def _get_module_name(node: ast.ImportFrom) -> str:
+    return "." * node.level + (node.module or "")
+
+
+def _get_source_segment(source: str, node: ast.stmt) -> str:
+    segment = ast.get_source_segment(source, node)
+    if segment is None:
+        return ast.unparse(node)
+
+    # Statements nested under `if typing.TYPE_CHECKING:` keep their indentation on every line but the first
+    lines = segment.splitlines()
+    return "\n".join([lines[0]] + [line[node.col_offset :] for line in lines[1:]])
+
+
+def _get_star_import_names(module_name: str) -> List[str]:
+    if module_name.startswith("."):
+        raise ValueError(f"Relative star imports are not supported: {module_name}")
+
+    module = importlib.import_module(module_name)
+    return list(getattr(module, "__all__"))
+
+
+def _is_all_assignment(node: ast.stmt) -> TypeGuard[Union[ast.Assign, ast.AnnAssign]]:
+    # Our lazy package roots annotate `__all__`, while Fern's don't
+    if isinstance(node, ast.AnnAssign):
+        return isinstance(node.target, ast.Name) and node.target.id == "__all__"
+
+    return isinstance(node, ast.Assign) and any(
+        isinstance(target, ast.Name) and target.id == "__all__" for target in node.targets
+    )
+
+
+def _get_header(source: str) -> List[str]:
+    header = []
+    for line in source.splitlines():
+        if not line.startswith("#"):
+            break
+        if line != LAZY_MARKER:
+            header.append(line)
+
+    return header
+
+
+def _get_eager_source(source: str) -> str:
+    """
+    Recovers the original eager imports from a file that was already made lazy, so that rerunning is a no-op.
+    """
+
+    if LAZY_MARKER not in source:
+        return source
+
+    tree = ast.parse(source)
+    statements: List[str] = []
+    for node in tree.body:
+        if isinstance(node, ast.If) and ast.unparse(node.test) == "typing.TYPE_CHECKING":
+            statements.extend(_get_source_segment(source, child) for child in node.body)
+        elif _is_all_assignment(node):
+            statements.append(_get_source_segment(source, node))
+
+    return "\n".join(_get_header(source) + [""] + statements) + "\n"
+
+
+def _format_list(name: str, values: Sequence[str]) -> str:
+    if not values:
+        return f"{name}: typing.List[str] = []"
+
+    lines = [f"{name}: typing.List[str] = ["]
+    lines.extend(f'    "{value}",' for value in values)
+    lines.append("]")
+    return "\n".join(lines)
+
+
+def _format_dict(name: str, values: Dict[str, str]) -> str:
+    if not values:
+        return f"{name}: typing.Dict[str, str] = {{}}"
+
+    lines = [f"{name}: typing.Dict[str, str] = {{"]
+    lines.extend(f'    "{key}": "{value}",' for key, value in values.items())
+    lines.append("}")
+    return "\n".join(lines)
+
+
+def generate_lazy_init(source: str) -> str:
+    source = _get_eager_source(source)
+    tree = ast.parse(source)
+
+    lazy_imports: Dict[str, str] = {}
+    type_checking_imports: List[str] = []
+    all_names: Optional[List[str]] = None
+
+    for node in tree.body:
+        if isinstance(node, ast.ImportFrom):
+            module_name = _get_module_name(node)
+            if any(alias.name == "*" for alias in node.names):
+                for name in _get_star_import_names(module_name):
+                    lazy_imports[name] = module_name
+            else:
+                for alias in node.names:
+                    if alias.asname and alias.asname != alias.name:
+                        raise ValueError(f"Aliased imports are not supported: {ast.unparse(node)}")
+                    lazy_imports[alias.name] = module_name
+
+            type_checking_imports.append(_get_source_segment(source, node))
+        elif _is_all_assignment(node):
+            assert node.value is not None
+            all_names = ast.literal_eval(node.value)
+        else:
+            raise ValueError(f"Unsupported statement in package root: {ast.unparse(node)}")
+
+    if all_names is None:
+        all_names = list(lazy_imports)
+
+    lines = _get_header(source)
+    lines.append(LAZY_MARKER)
+    lines.append("")
+    lines.append("import importlib")
+    lines.append("import typing")
+    lines.append("")
+    lines.append("if typing.TYPE_CHECKING:")
+    for statement in type_checking_imports:
+        lines.extend(f"    {line}" for line in statement.splitlines())
+    lines.append("")
+    lines.append(_format_dict("_LAZY_IMPORTS", lazy_imports))
+    lines.append(LAZY_LOADER.rstrip("\n"))
+    lines.append("")
+    lines.append("")
+    lines.append(_format_list("__all__", all_names))
+
+    return "\n".join(lines) + "\n"
+
+
+def split_module_root(source: str, module_name: str) -> str:
+    """
+    Returns the eager package root re-exporting everything the given module root defined or imported relatively.
+    """
+
+    tree = ast.parse(source)
+    defined_names: List[str] = []
+    statements: List[str] = []
+    for node in tree.body:
+        if isinstance(node, ast.ImportFrom) and node.level > 0:
+            statements.append(_get_source_segment(source, node))
+        elif isinstance(node, (ast.ClassDef, ast.FunctionDef)):
+            defined_names.append(node.name)
+        elif isinstance(node, ast.Assign):
+            defined_names.extend(target.id for target in node.targets if isinstance(target, ast.Name))
+
+    public_names = [name for name in defined_names if not name.startswith("_")]
+    statements.insert(0, f"from .{module_name} import {', '.join(public_names)}")
+    return "\n".join(_get_header(source) + [""] + statements) + "\n"
+
+
+def main(paths: Sequence[str]) -> None:
+    for path, module_name in MODULE_ROOTS.items():
+        if paths and path not in paths:
+            continue
+
+        full_path = os.path.join(ROOT, path)
+        with open(full_path) as f:
+            source = f.read()
+
+        if LAZY_MARKER in source:
+            continue
+
+        with open(os.path.join(os.path.dirname(full_path), f"{module_name}.py"), "w") as f:
+            f.write(source)
+
+        with open(full_path, "w") as f:
+            f.write(split_module_root(source, module_name))
+
+    for path in paths or [*MODULE_ROOTS, *LAZY_PACKAGES]:
+        full_path = os.path.join(ROOT, path)
+        with open(full_path) as f:
+            lazy_source = generate_lazy_init(f.read())
+
+        with open(full_path, "w") as f:
+            f.write(lazy_source)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -1,529 +1,1076 @@
 # This file was auto-generated by Fern from our API Definition.
+# Names are imported lazily, see scripts/generate_lazy_imports.py
 
-from .types import (
-    AdHocExecutePromptEvent,
-    AdHocExpandMeta,
-    AdHocFulfilledPromptExecutionMeta,
-    AdHocInitiatedPromptExecutionMeta,
-    AdHocRejectedPromptExecutionMeta,
-    AdHocStreamingPromptExecutionMeta,
-    AddOpenaiApiKeyEnum,
-    ApiNodeResult,
-    ApiNodeResultData,
-    ArrayChatMessageContent,
-    ArrayChatMessageContentItem,
-    ArrayChatMessageContentItemRequest,
-    ArrayChatMessageContentRequest,
-    ArrayInput,
-    ArrayVariableValue,
-    ArrayVariableValueItem,
-    ArrayVellumValue,
-    ArrayVellumValueRequest,
-    AudioChatMessageContent,
-    AudioChatMessageContentRequest,
-    AudioVariableValue,
-    AudioVellumValue,
-    AudioVellumValueRequest,
-    BasicVectorizerIntfloatMultilingualE5Large,
-    BasicVectorizerIntfloatMultilingualE5LargeRequest,
-    BasicVectorizerSentenceTransformersMultiQaMpnetBaseCosV1,
-    BasicVectorizerSentenceTransformersMultiQaMpnetBaseCosV1Request,
-    BasicVectorizerSentenceTransformersMultiQaMpnetBaseDotV1,
-    BasicVectorizerSentenceTransformersMultiQaMpnetBaseDotV1Request,
-    ChatHistoryInput,
-    ChatHistoryInputRequest,
-    ChatHistoryVariableValue,
-    ChatHistoryVellumValue,
-    ChatHistoryVellumValueRequest,
-    ChatMessage,
-    ChatMessageContent,
-    ChatMessageContentRequest,
-    ChatMessagePromptBlock,
-    ChatMessageRequest,
-    ChatMessageRole,
-    CodeExecutionNodeArrayResult,
-    CodeExecutionNodeChatHistoryResult,
-    CodeExecutionNodeErrorResult,
-    CodeExecutionNodeFunctionCallResult,
-    CodeExecutionNodeJsonResult,
-    CodeExecutionNodeNumberResult,
-    CodeExecutionNodeResult,
-    CodeExecutionNodeResultData,
-    CodeExecutionNodeResultOutput,
-    CodeExecutionNodeSearchResultsResult,
-    CodeExecutionNodeStringResult,
-    CodeExecutionPackage,
-    CodeExecutionRuntime,
-    CodeExecutorInput,
-    CodeExecutorResponse,
-    CodeExecutorSecretInput,
-    CompilePromptDeploymentExpandMetaRequest,
-    CompilePromptMeta,
-    ComponentsSchemasPdfSearchResultMetaSource,
-    ComponentsSchemasPdfSearchResultMetaSourceRequest,
-    ConditionCombinator,
-    ConditionalNodeResult,
-    ConditionalNodeResultData,
-    ContainerImageRead,
-    CreateTestSuiteTestCaseRequest,
-    DeploymentHistoryItem,
-    DeploymentProviderPayloadResponse,
-    DeploymentProviderPayloadResponsePayload,
-    DeploymentRead,
-    DeploymentReleaseTagDeploymentHistoryItem,
-    DeploymentReleaseTagRead,
-    DockerServiceToken,
-    DocumentDocumentToDocumentIndex,
-    DocumentIndexChunking,
-    DocumentIndexChunkingRequest,
-    DocumentIndexIndexingConfig,
-    DocumentIndexIndexingConfigRequest,
-    DocumentIndexRead,
-    DocumentProcessingState,
-    DocumentRead,
-    DocumentStatus,
-    EnrichedNormalizedCompletion,
-    EntityStatus,
-    EntityVisibility,
-    EnvironmentEnum,
-    EphemeralPromptCacheConfig,
-    EphemeralPromptCacheConfigTypeEnum,
-    ErrorInput,
-    ErrorVariableValue,
-    ErrorVellumValue,
-    ErrorVellumValueRequest,
-    ExecutePromptEvent,
-    ExecutePromptResponse,
-    ExecuteWorkflowResponse,
-    ExecuteWorkflowWorkflowResultEvent,
-    ExecutionArrayVellumValue,
-    ExecutionChatHistoryVellumValue,
-    ExecutionErrorVellumValue,
-    ExecutionFunctionCallVellumValue,
-    ExecutionJsonVellumValue,
-    ExecutionNumberVellumValue,
-    ExecutionSearchResultsVellumValue,
-    ExecutionStringVellumValue,
-    ExecutionVellumValue,
-    ExternalTestCaseExecution,
-    ExternalTestCaseExecutionRequest,
-    FinishReasonEnum,
-    FolderEntity,
-    FolderEntityDocumentIndex,
-    FolderEntityDocumentIndexData,
-    FolderEntityFolder,
-    FolderEntityFolderData,
-    FolderEntityPromptSandbox,
-    FolderEntityPromptSandboxData,
-    FolderEntityTestSuite,
-    FolderEntityTestSuiteData,
-    FolderEntityWorkflowSandbox,
-    FolderEntityWorkflowSandboxData,
-    FulfilledAdHocExecutePromptEvent,
-    FulfilledEnum,
-    FulfilledExecutePromptEvent,
-    FulfilledExecutePromptResponse,
-    FulfilledExecuteWorkflowWorkflowResultEvent,
-    FulfilledPromptExecutionMeta,
-    FulfilledWorkflowNodeResultEvent,
-    FunctionCall,
-    FunctionCallChatMessageContent,
-    FunctionCallChatMessageContentRequest,
-    FunctionCallChatMessageContentValue,
-    FunctionCallChatMessageContentValueRequest,
-    FunctionCallInput,
-    FunctionCallRequest,
-    FunctionCallVariableValue,
-    FunctionCallVellumValue,
-    FunctionCallVellumValueRequest,
-    FunctionDefinition,
-    GenerateOptionsRequest,
-    GenerateRequest,
-    GenerateResponse,
-    GenerateResult,
-    GenerateResultData,
-    GenerateResultError,
-    GenerateStreamResponse,
-    GenerateStreamResult,
-    GenerateStreamResultData,
-    GoogleVertexAiVectorizerConfig,
-    GoogleVertexAiVectorizerConfigRequest,
-    GoogleVertexAiVectorizerTextEmbedding004,
-    GoogleVertexAiVectorizerTextEmbedding004Request,
-    GoogleVertexAiVectorizerTextMultilingualEmbedding002,
-    GoogleVertexAiVectorizerTextMultilingualEmbedding002Request,
-    HkunlpInstructorXlVectorizer,
-    HkunlpInstructorXlVectorizerRequest,
-    ImageChatMessageContent,
-    ImageChatMessageContentRequest,
-    ImageVariableValue,
-    ImageVellumValue,
-    ImageVellumValueRequest,
-    IndexingConfigVectorizer,
-    IndexingConfigVectorizerRequest,
-    IndexingStateEnum,
-    InitiatedAdHocExecutePromptEvent,
-    InitiatedExecutePromptEvent,
-    InitiatedPromptExecutionMeta,
-    InitiatedWorkflowNodeResultEvent,
-    InstructorVectorizerConfig,
-    InstructorVectorizerConfigRequest,
-    IterationStateEnum,
-    JinjaPromptBlock,
-    JsonInput,
-    JsonInputRequest,
-    JsonVariableValue,
-    JsonVellumValue,
-    JsonVellumValueRequest,
-    LogicalOperator,
-    LogprobsEnum,
-    MapNodeResult,
-    MapNodeResultData,
-    MergeNodeResult,
-    MergeNodeResultData,
-    MetadataFilterConfigRequest,
-    MetadataFilterRuleCombinator,
-    MetadataFilterRuleRequest,
-    MetadataFiltersRequest,
-    MetricDefinitionExecution,
-    MetricDefinitionHistoryItem,
-    MetricDefinitionInput,
-    MetricNodeResult,
-    MlModelRead,
-    MlModelUsage,
-    NamedScenarioInputChatHistoryVariableValueRequest,
-    NamedScenarioInputJsonVariableValueRequest,
-    NamedScenarioInputRequest,
-    NamedScenarioInputStringVariableValueRequest,
-    NamedTestCaseArrayVariableValue,
-    NamedTestCaseArrayVariableValueRequest,
-    NamedTestCaseChatHistoryVariableValue,
-    NamedTestCaseChatHistoryVariableValueRequest,
-    NamedTestCaseErrorVariableValue,
-    NamedTestCaseErrorVariableValueRequest,
-    NamedTestCaseFunctionCallVariableValue,
-    NamedTestCaseFunctionCallVariableValueRequest,
-    NamedTestCaseJsonVariableValue,
-    NamedTestCaseJsonVariableValueRequest,
-    NamedTestCaseNumberVariableValue,
-    NamedTestCaseNumberVariableValueRequest,
-    NamedTestCaseSearchResultsVariableValue,
-    NamedTestCaseSearchResultsVariableValueRequest,
-    NamedTestCaseStringVariableValue,
-    NamedTestCaseStringVariableValueRequest,
-    NamedTestCaseVariableValue,
-    NamedTestCaseVariableValueRequest,
-    NodeInputCompiledArrayValue,
-    NodeInputCompiledChatHistoryValue,
-    NodeInputCompiledErrorValue,
-    NodeInputCompiledFunctionCallValue,
-    NodeInputCompiledJsonValue,
-    NodeInputCompiledNumberValue,
-    NodeInputCompiledSearchResultsValue,
-    NodeInputCompiledStringValue,
-    NodeInputVariableCompiledValue,
-    NodeOutputCompiledArrayValue,
-    NodeOutputCompiledChatHistoryValue,
-    NodeOutputCompiledErrorValue,
-    NodeOutputCompiledFunctionCallValue,
-    NodeOutputCompiledJsonValue,
-    NodeOutputCompiledNumberValue,
-    NodeOutputCompiledSearchResultsValue,
-    NodeOutputCompiledStringValue,
-    NodeOutputCompiledValue,
-    NormalizedLogProbs,
-    NormalizedTokenLogProbs,
-    NumberInput,
-    NumberVariableValue,
-    NumberVellumValue,
-    NumberVellumValueRequest,
-    OpenAiVectorizerConfig,
-    OpenAiVectorizerConfigRequest,
-    OpenAiVectorizerTextEmbedding3Large,
-    OpenAiVectorizerTextEmbedding3LargeRequest,
-    OpenAiVectorizerTextEmbedding3Small,
-    OpenAiVectorizerTextEmbedding3SmallRequest,
-    OpenAiVectorizerTextEmbeddingAda002,
-    OpenAiVectorizerTextEmbeddingAda002Request,
-    PaginatedContainerImageReadList,
-    PaginatedDeploymentReleaseTagReadList,
-    PaginatedDocumentIndexReadList,
-    PaginatedFolderEntityList,
-    PaginatedSlimDeploymentReadList,
-    PaginatedSlimDocumentList,
-    PaginatedSlimWorkflowDeploymentList,
-    PaginatedTestSuiteRunExecutionList,
-    PaginatedTestSuiteTestCaseList,
-    PaginatedWorkflowReleaseTagReadList,
-    PdfSearchResultMetaSource,
-    PdfSearchResultMetaSourceRequest,
-    PlainTextPromptBlock,
-    Price,
-    ProcessingFailureReasonEnum,
-    PromptBlock,
-    PromptBlockState,
-    PromptDeploymentExpandMetaRequest,
-    PromptDeploymentInputRequest,
-    PromptExecutionMeta,
-    PromptNodeExecutionMeta,
-    PromptNodeResult,
-    PromptNodeResultData,
-    PromptOutput,
-    PromptParameters,
-    PromptRequestChatHistoryInput,
-    PromptRequestInput,
-    PromptRequestJsonInput,
-    PromptRequestStringInput,
-    PromptSettings,
-    RawPromptExecutionOverridesRequest,
-    ReductoChunkerConfig,
-    ReductoChunkerConfigRequest,
-    ReductoChunking,
-    ReductoChunkingRequest,
-    RejectedAdHocExecutePromptEvent,
-    RejectedExecutePromptEvent,
-    RejectedExecutePromptResponse,
-    RejectedExecuteWorkflowWorkflowResultEvent,
-    RejectedPromptExecutionMeta,
-    RejectedWorkflowNodeResultEvent,
-    ReleaseTagSource,
-    ReplaceTestSuiteTestCaseRequest,
-    RichTextChildBlock,
-    RichTextPromptBlock,
-    SandboxScenario,
-    ScenarioInput,
-    ScenarioInputChatHistoryVariableValue,
-    ScenarioInputJsonVariableValue,
-    ScenarioInputStringVariableValue,
-    SearchFiltersRequest,
-    SearchNodeResult,
-    SearchNodeResultData,
-    SearchRequestOptionsRequest,
-    SearchResponse,
-    SearchResult,
-    SearchResultDocument,
-    SearchResultDocumentRequest,
-    SearchResultMergingRequest,
-    SearchResultMeta,
-    SearchResultMetaRequest,
-    SearchResultRequest,
-    SearchResultsInput,
-    SearchResultsVariableValue,
-    SearchResultsVellumValue,
-    SearchResultsVellumValueRequest,
-    SearchWeightsRequest,
-    SecretTypeEnum,
-    SentenceChunkerConfig,
-    SentenceChunkerConfigRequest,
-    SentenceChunking,
-    SentenceChunkingRequest,
-    SlimDeploymentRead,
-    SlimDocument,
-    SlimDocumentDocumentToDocumentIndex,
-    SlimWorkflowDeployment,
-    StreamingAdHocExecutePromptEvent,
-    StreamingExecutePromptEvent,
-    StreamingPromptExecutionMeta,
-    StreamingWorkflowNodeResultEvent,
-    StringChatMessageContent,
-    StringChatMessageContentRequest,
-    StringInput,
-    StringInputRequest,
-    StringVariableValue,
-    StringVellumValue,
-    StringVellumValueRequest,
-    SubmitCompletionActualRequest,
-    SubmitWorkflowExecutionActualRequest,
-    SubworkflowNodeResult,
-    SubworkflowNodeResultData,
-    TemplatingNodeArrayResult,
-    TemplatingNodeChatHistoryResult,
-    TemplatingNodeErrorResult,
-    TemplatingNodeFunctionCallResult,
-    TemplatingNodeJsonResult,
-    TemplatingNodeNumberResult,
-    TemplatingNodeResult,
-    TemplatingNodeResultData,
-    TemplatingNodeResultOutput,
-    TemplatingNodeSearchResultsResult,
-    TemplatingNodeStringResult,
-    TerminalNodeArrayResult,
-    TerminalNodeChatHistoryResult,
-    TerminalNodeErrorResult,
-    TerminalNodeFunctionCallResult,
-    TerminalNodeJsonResult,
-    TerminalNodeNumberResult,
-    TerminalNodeResult,
-    TerminalNodeResultData,
-    TerminalNodeResultOutput,
-    TerminalNodeSearchResultsResult,
-    TerminalNodeStringResult,
-    TestCaseArrayVariableValue,
-    TestCaseChatHistoryVariableValue,
-    TestCaseErrorVariableValue,
-    TestCaseFunctionCallVariableValue,
-    TestCaseJsonVariableValue,
-    TestCaseNumberVariableValue,
-    TestCaseSearchResultsVariableValue,
-    TestCaseStringVariableValue,
-    TestCaseVariableValue,
-    TestSuiteRunDeploymentReleaseTagExecConfig,
-    TestSuiteRunDeploymentReleaseTagExecConfigData,
-    TestSuiteRunDeploymentReleaseTagExecConfigDataRequest,
-    TestSuiteRunDeploymentReleaseTagExecConfigRequest,
-    TestSuiteRunExecConfig,
-    TestSuiteRunExecConfigRequest,
-    TestSuiteRunExecution,
-    TestSuiteRunExecutionArrayOutput,
-    TestSuiteRunExecutionChatHistoryOutput,
-    TestSuiteRunExecutionErrorOutput,
-    TestSuiteRunExecutionFunctionCallOutput,
-    TestSuiteRunExecutionJsonOutput,
-    TestSuiteRunExecutionMetricDefinition,
-    TestSuiteRunExecutionMetricResult,
-    TestSuiteRunExecutionNumberOutput,
-    TestSuiteRunExecutionOutput,
-    TestSuiteRunExecutionSearchResultsOutput,
-    TestSuiteRunExecutionStringOutput,
-    TestSuiteRunExternalExecConfig,
-    TestSuiteRunExternalExecConfigData,
-    TestSuiteRunExternalExecConfigDataRequest,
-    TestSuiteRunExternalExecConfigRequest,
-    TestSuiteRunMetricErrorOutput,
-    TestSuiteRunMetricJsonOutput,
-    TestSuiteRunMetricNumberOutput,
-    TestSuiteRunMetricOutput,
-    TestSuiteRunMetricStringOutput,
-    TestSuiteRunPromptSandboxHistoryItemExecConfig,
-    TestSuiteRunPromptSandboxHistoryItemExecConfigData,
-    TestSuiteRunPromptSandboxHistoryItemExecConfigDataRequest,
-    TestSuiteRunPromptSandboxHistoryItemExecConfigRequest,
-    TestSuiteRunRead,
-    TestSuiteRunState,
-    TestSuiteRunTestSuite,
-    TestSuiteRunWorkflowReleaseTagExecConfig,
-    TestSuiteRunWorkflowReleaseTagExecConfigData,
-    TestSuiteRunWorkflowReleaseTagExecConfigDataRequest,
-    TestSuiteRunWorkflowReleaseTagExecConfigRequest,
-    TestSuiteRunWorkflowSandboxHistoryItemExecConfig,
-    TestSuiteRunWorkflowSandboxHistoryItemExecConfigData,
-    TestSuiteRunWorkflowSandboxHistoryItemExecConfigDataRequest,
-    TestSuiteRunWorkflowSandboxHistoryItemExecConfigRequest,
-    TestSuiteTestCase,
-    TestSuiteTestCaseBulkOperationRequest,
-    TestSuiteTestCaseBulkResult,
-    TestSuiteTestCaseCreateBulkOperationRequest,
-    TestSuiteTestCaseCreatedBulkResult,
-    TestSuiteTestCaseCreatedBulkResultData,
-    TestSuiteTestCaseDeleteBulkOperationDataRequest,
-    TestSuiteTestCaseDeleteBulkOperationRequest,
-    TestSuiteTestCaseDeletedBulkResult,
-    TestSuiteTestCaseDeletedBulkResultData,
-    TestSuiteTestCaseRejectedBulkResult,
-    TestSuiteTestCaseReplaceBulkOperationRequest,
-    TestSuiteTestCaseReplacedBulkResult,
-    TestSuiteTestCaseReplacedBulkResultData,
-    TestSuiteTestCaseUpsertBulkOperationRequest,
-    TokenOverlappingWindowChunkerConfig,
-    TokenOverlappingWindowChunkerConfigRequest,
-    TokenOverlappingWindowChunking,
-    TokenOverlappingWindowChunkingRequest,
-    UnitEnum,
-    UploadDocumentResponse,
-    UpsertTestSuiteTestCaseRequest,
-    VariablePromptBlock,
-    VellumAudio,
-    VellumAudioRequest,
-    VellumError,
-    VellumErrorCodeEnum,
-    VellumErrorRequest,
-    VellumImage,
-    VellumImageRequest,
-    VellumValue,
-    VellumValueLogicalConditionGroupRequest,
-    VellumValueLogicalConditionRequest,
-    VellumValueLogicalExpressionRequest,
-    VellumValueRequest,
-    VellumVariable,
-    VellumVariableExtensions,
-    VellumVariableType,
-    WorkflowDeploymentHistoryItem,
-    WorkflowDeploymentRead,
-    WorkflowEventError,
-    WorkflowExecutionActualChatHistoryRequest,
-    WorkflowExecutionActualJsonRequest,
-    WorkflowExecutionActualStringRequest,
-    WorkflowExecutionEventErrorCode,
-    WorkflowExecutionEventType,
-    WorkflowExecutionNodeResultEvent,
-    WorkflowExecutionWorkflowResultEvent,
-    WorkflowExpandMetaRequest,
-    WorkflowNodeResultData,
-    WorkflowNodeResultEvent,
-    WorkflowNodeResultEventState,
-    WorkflowOutput,
-    WorkflowOutputArray,
-    WorkflowOutputChatHistory,
-    WorkflowOutputError,
-    WorkflowOutputFunctionCall,
-    WorkflowOutputImage,
-    WorkflowOutputJson,
-    WorkflowOutputNumber,
-    WorkflowOutputSearchResults,
-    WorkflowOutputString,
-    WorkflowPushDeploymentConfigRequest,
-    WorkflowPushExecConfig,
-    WorkflowPushResponse,
-    WorkflowReleaseTagRead,
-    WorkflowReleaseTagWorkflowDeploymentHistoryItem,
-    WorkflowRequestChatHistoryInputRequest,
-    WorkflowRequestInputRequest,
-    WorkflowRequestJsonInputRequest,
-    WorkflowRequestNumberInputRequest,
-    WorkflowRequestStringInputRequest,
-    WorkflowResultEvent,
-    WorkflowResultEventOutputData,
-    WorkflowResultEventOutputDataArray,
-    WorkflowResultEventOutputDataChatHistory,
-    WorkflowResultEventOutputDataError,
-    WorkflowResultEventOutputDataFunctionCall,
-    WorkflowResultEventOutputDataJson,
-    WorkflowResultEventOutputDataNumber,
-    WorkflowResultEventOutputDataSearchResults,
-    WorkflowResultEventOutputDataString,
-    WorkflowStreamEvent,
-    WorkspaceSecretRead,
-)
-from .errors import BadRequestError, ForbiddenError, InternalServerError, NotFoundError
-from .resources import (
-    DeploymentsListRequestStatus,
-    DocumentIndexesListRequestStatus,
-    FolderEntitiesListRequestEntityStatus,
-    ListDeploymentReleaseTagsRequestSource,
-    ListWorkflowReleaseTagsRequestSource,
-    WorkflowDeploymentsListRequestStatus,
-    WorkflowsPullRequestFormat,
-    ad_hoc,
-    container_images,
-    deployments,
-    document_indexes,
-    documents,
-    folder_entities,
-    metric_definitions,
-    ml_models,
-    sandboxes,
-    test_suite_runs,
-    test_suites,
-    workflow_deployments,
-    workflow_sandboxes,
-    workflows,
-    workspace_secrets,
-)
-from .client import AsyncVellum, Vellum
-from .environment import VellumEnvironment
-from .version import __version__
+import importlib
+import typing
 
-__all__ = [
+if typing.TYPE_CHECKING:
+    from .types import (
+        AdHocExecutePromptEvent,
+        AdHocExpandMeta,
+        AdHocFulfilledPromptExecutionMeta,
+        AdHocInitiatedPromptExecutionMeta,
+        AdHocRejectedPromptExecutionMeta,
+        AdHocStreamingPromptExecutionMeta,
+        AddOpenaiApiKeyEnum,
+        ApiNodeResult,
+        ApiNodeResultData,
+        ArrayChatMessageContent,
+        ArrayChatMessageContentItem,
+        ArrayChatMessageContentItemRequest,
+        ArrayChatMessageContentRequest,
+        ArrayInput,
+        ArrayVariableValue,
+        ArrayVariableValueItem,
+        ArrayVellumValue,
+        ArrayVellumValueRequest,
+        AudioChatMessageContent,
+        AudioChatMessageContentRequest,
+        AudioVariableValue,
+        AudioVellumValue,
+        AudioVellumValueRequest,
+        BasicVectorizerIntfloatMultilingualE5Large,
+        BasicVectorizerIntfloatMultilingualE5LargeRequest,
+        BasicVectorizerSentenceTransformersMultiQaMpnetBaseCosV1,
+        BasicVectorizerSentenceTransformersMultiQaMpnetBaseCosV1Request,
+        BasicVectorizerSentenceTransformersMultiQaMpnetBaseDotV1,
+        BasicVectorizerSentenceTransformersMultiQaMpnetBaseDotV1Request,
+        ChatHistoryInput,
+        ChatHistoryInputRequest,
+        ChatHistoryVariableValue,
+        ChatHistoryVellumValue,
+        ChatHistoryVellumValueRequest,
+        ChatMessage,
+        ChatMessageContent,
+        ChatMessageContentRequest,
+        ChatMessagePromptBlock,
+        ChatMessageRequest,
+        ChatMessageRole,
+        CodeExecutionNodeArrayResult,
+        CodeExecutionNodeChatHistoryResult,
+        CodeExecutionNodeErrorResult,
+        CodeExecutionNodeFunctionCallResult,
+        CodeExecutionNodeJsonResult,
+        CodeExecutionNodeNumberResult,
+        CodeExecutionNodeResult,
+        CodeExecutionNodeResultData,
+        CodeExecutionNodeResultOutput,
+        CodeExecutionNodeSearchResultsResult,
+        CodeExecutionNodeStringResult,
+        CodeExecutionPackage,
+        CodeExecutionRuntime,
+        CodeExecutorInput,
+        CodeExecutorResponse,
+        CodeExecutorSecretInput,
+        CompilePromptDeploymentExpandMetaRequest,
+        CompilePromptMeta,
+        ComponentsSchemasPdfSearchResultMetaSource,
+        ComponentsSchemasPdfSearchResultMetaSourceRequest,
+        ConditionCombinator,
+        ConditionalNodeResult,
+        ConditionalNodeResultData,
+        ContainerImageRead,
+        CreateTestSuiteTestCaseRequest,
+        DeploymentHistoryItem,
+        DeploymentProviderPayloadResponse,
+        DeploymentProviderPayloadResponsePayload,
+        DeploymentRead,
+        DeploymentReleaseTagDeploymentHistoryItem,
+        DeploymentReleaseTagRead,
+        DockerServiceToken,
+        DocumentDocumentToDocumentIndex,
+        DocumentIndexChunking,
+        DocumentIndexChunkingRequest,
+        DocumentIndexIndexingConfig,
+        DocumentIndexIndexingConfigRequest,
+        DocumentIndexRead,
+        DocumentProcessingState,
+        DocumentRead,
+        DocumentStatus,
+        EnrichedNormalizedCompletion,
+        EntityStatus,
+        EntityVisibility,
+        EnvironmentEnum,
+        EphemeralPromptCacheConfig,
+        EphemeralPromptCacheConfigTypeEnum,
+        ErrorInput,
+        ErrorVariableValue,
+        ErrorVellumValue,
+        ErrorVellumValueRequest,
+        ExecutePromptEvent,
+        ExecutePromptResponse,
+        ExecuteWorkflowResponse,
+        ExecuteWorkflowWorkflowResultEvent,
+        ExecutionArrayVellumValue,
+        ExecutionChatHistoryVellumValue,
+        ExecutionErrorVellumValue,
+        ExecutionFunctionCallVellumValue,
+        ExecutionJsonVellumValue,
+        ExecutionNumberVellumValue,
+        ExecutionSearchResultsVellumValue,
+        ExecutionStringVellumValue,
+        ExecutionVellumValue,
+        ExternalTestCaseExecution,
+        ExternalTestCaseExecutionRequest,
+        FinishReasonEnum,
+        FolderEntity,
+        FolderEntityDocumentIndex,
+        FolderEntityDocumentIndexData,
+        FolderEntityFolder,
+        FolderEntityFolderData,
+        FolderEntityPromptSandbox,
+        FolderEntityPromptSandboxData,
+        FolderEntityTestSuite,
+        FolderEntityTestSuiteData,
+        FolderEntityWorkflowSandbox,
+        FolderEntityWorkflowSandboxData,
+        FulfilledAdHocExecutePromptEvent,
+        FulfilledEnum,
+        FulfilledExecutePromptEvent,
+        FulfilledExecutePromptResponse,
+        FulfilledExecuteWorkflowWorkflowResultEvent,
+        FulfilledPromptExecutionMeta,
+        FulfilledWorkflowNodeResultEvent,
+        FunctionCall,
+        FunctionCallChatMessageContent,
+        FunctionCallChatMessageContentRequest,
+        FunctionCallChatMessageContentValue,
+        FunctionCallChatMessageContentValueRequest,
+        FunctionCallInput,
+        FunctionCallRequest,
+        FunctionCallVariableValue,
+        FunctionCallVellumValue,
+        FunctionCallVellumValueRequest,
+        FunctionDefinition,
+        GenerateOptionsRequest,
+        GenerateRequest,
+        GenerateResponse,
+        GenerateResult,
+        GenerateResultData,
+        GenerateResultError,
+        GenerateStreamResponse,
+        GenerateStreamResult,
+        GenerateStreamResultData,
+        GoogleVertexAiVectorizerConfig,
+        GoogleVertexAiVectorizerConfigRequest,
+        GoogleVertexAiVectorizerTextEmbedding004,
+        GoogleVertexAiVectorizerTextEmbedding004Request,
+        GoogleVertexAiVectorizerTextMultilingualEmbedding002,
+        GoogleVertexAiVectorizerTextMultilingualEmbedding002Request,
+        HkunlpInstructorXlVectorizer,
+        HkunlpInstructorXlVectorizerRequest,
+        ImageChatMessageContent,
+        ImageChatMessageContentRequest,
+        ImageVariableValue,
+        ImageVellumValue,
+        ImageVellumValueRequest,
+        IndexingConfigVectorizer,
+        IndexingConfigVectorizerRequest,
+        IndexingStateEnum,
+        InitiatedAdHocExecutePromptEvent,
+        InitiatedExecutePromptEvent,
+        InitiatedPromptExecutionMeta,
+        InitiatedWorkflowNodeResultEvent,
+        InstructorVectorizerConfig,
+        InstructorVectorizerConfigRequest,
+        IterationStateEnum,
+        JinjaPromptBlock,
+        JsonInput,
+        JsonInputRequest,
+        JsonVariableValue,
+        JsonVellumValue,
+        JsonVellumValueRequest,
+        LogicalOperator,
+        LogprobsEnum,
+        MapNodeResult,
+        MapNodeResultData,
+        MergeNodeResult,
+        MergeNodeResultData,
+        MetadataFilterConfigRequest,
+        MetadataFilterRuleCombinator,
+        MetadataFilterRuleRequest,
+        MetadataFiltersRequest,
+        MetricDefinitionExecution,
+        MetricDefinitionHistoryItem,
+        MetricDefinitionInput,
+        MetricNodeResult,
+        MlModelRead,
+        MlModelUsage,
+        NamedScenarioInputChatHistoryVariableValueRequest,
+        NamedScenarioInputJsonVariableValueRequest,
+        NamedScenarioInputRequest,
+        NamedScenarioInputStringVariableValueRequest,
+        NamedTestCaseArrayVariableValue,
+        NamedTestCaseArrayVariableValueRequest,
+        NamedTestCaseChatHistoryVariableValue,
+        NamedTestCaseChatHistoryVariableValueRequest,
+        NamedTestCaseErrorVariableValue,
+        NamedTestCaseErrorVariableValueRequest,
+        NamedTestCaseFunctionCallVariableValue,
+        NamedTestCaseFunctionCallVariableValueRequest,
+        NamedTestCaseJsonVariableValue,
+        NamedTestCaseJsonVariableValueRequest,
+        NamedTestCaseNumberVariableValue,
+        NamedTestCaseNumberVariableValueRequest,
+        NamedTestCaseSearchResultsVariableValue,
+        NamedTestCaseSearchResultsVariableValueRequest,
+        NamedTestCaseStringVariableValue,
+        NamedTestCaseStringVariableValueRequest,
+        NamedTestCaseVariableValue,
+        NamedTestCaseVariableValueRequest,
+        NodeInputCompiledArrayValue,
+        NodeInputCompiledChatHistoryValue,
+        NodeInputCompiledErrorValue,
+        NodeInputCompiledFunctionCallValue,
+        NodeInputCompiledJsonValue,
+        NodeInputCompiledNumberValue,
+        NodeInputCompiledSearchResultsValue,
+        NodeInputCompiledStringValue,
+        NodeInputVariableCompiledValue,
+        NodeOutputCompiledArrayValue,
+        NodeOutputCompiledChatHistoryValue,
+        NodeOutputCompiledErrorValue,
+        NodeOutputCompiledFunctionCallValue,
+        NodeOutputCompiledJsonValue,
+        NodeOutputCompiledNumberValue,
+        NodeOutputCompiledSearchResultsValue,
+        NodeOutputCompiledStringValue,
+        NodeOutputCompiledValue,
+        NormalizedLogProbs,
+        NormalizedTokenLogProbs,
+        NumberInput,
+        NumberVariableValue,
+        NumberVellumValue,
+        NumberVellumValueRequest,
+        OpenAiVectorizerConfig,
+        OpenAiVectorizerConfigRequest,
+        OpenAiVectorizerTextEmbedding3Large,
+        OpenAiVectorizerTextEmbedding3LargeRequest,
+        OpenAiVectorizerTextEmbedding3Small,
+        OpenAiVectorizerTextEmbedding3SmallRequest,
+        OpenAiVectorizerTextEmbeddingAda002,
+        OpenAiVectorizerTextEmbeddingAda002Request,
+        PaginatedContainerImageReadList,
+        PaginatedDeploymentReleaseTagReadList,
+        PaginatedDocumentIndexReadList,
+        PaginatedFolderEntityList,
+        PaginatedSlimDeploymentReadList,
+        PaginatedSlimDocumentList,
+        PaginatedSlimWorkflowDeploymentList,
+        PaginatedTestSuiteRunExecutionList,
+        PaginatedTestSuiteTestCaseList,
+        PaginatedWorkflowReleaseTagReadList,
+        PdfSearchResultMetaSource,
+        PdfSearchResultMetaSourceRequest,
+        PlainTextPromptBlock,
+        Price,
+        ProcessingFailureReasonEnum,
+        PromptBlock,
+        PromptBlockState,
+        PromptDeploymentExpandMetaRequest,
+        PromptDeploymentInputRequest,
+        PromptExecutionMeta,
+        PromptNodeExecutionMeta,
+        PromptNodeResult,
+        PromptNodeResultData,
+        PromptOutput,
+        PromptParameters,
+        PromptRequestChatHistoryInput,
+        PromptRequestInput,
+        PromptRequestJsonInput,
+        PromptRequestStringInput,
+        PromptSettings,
+        RawPromptExecutionOverridesRequest,
+        ReductoChunkerConfig,
+        ReductoChunkerConfigRequest,
+        ReductoChunking,
+        ReductoChunkingRequest,
+        RejectedAdHocExecutePromptEvent,
+        RejectedExecutePromptEvent,
+        RejectedExecutePromptResponse,
+        RejectedExecuteWorkflowWorkflowResultEvent,
+        RejectedPromptExecutionMeta,
+        RejectedWorkflowNodeResultEvent,
+        ReleaseTagSource,
+        ReplaceTestSuiteTestCaseRequest,
+        RichTextChildBlock,
+        RichTextPromptBlock,
+        SandboxScenario,
+        ScenarioInput,
+        ScenarioInputChatHistoryVariableValue,
+        ScenarioInputJsonVariableValue,
+        ScenarioInputStringVariableValue,
+        SearchFiltersRequest,
+        SearchNodeResult,
+        SearchNodeResultData,
+        SearchRequestOptionsRequest,
+        SearchResponse,
+        SearchResult,
+        SearchResultDocument,
+        SearchResultDocumentRequest,
+        SearchResultMergingRequest,
+        SearchResultMeta,
+        SearchResultMetaRequest,
+        SearchResultRequest,
+        SearchResultsInput,
+        SearchResultsVariableValue,
+        SearchResultsVellumValue,
+        SearchResultsVellumValueRequest,
+        SearchWeightsRequest,
+        SecretTypeEnum,
+        SentenceChunkerConfig,
+        SentenceChunkerConfigRequest,
+        SentenceChunking,
+        SentenceChunkingRequest,
+        SlimDeploymentRead,
+        SlimDocument,
+        SlimDocumentDocumentToDocumentIndex,
+        SlimWorkflowDeployment,
+        StreamingAdHocExecutePromptEvent,
+        StreamingExecutePromptEvent,
+        StreamingPromptExecutionMeta,
+        StreamingWorkflowNodeResultEvent,
+        StringChatMessageContent,
+        StringChatMessageContentRequest,
+        StringInput,
+        StringInputRequest,
+        StringVariableValue,
+        StringVellumValue,
+        StringVellumValueRequest,
+        SubmitCompletionActualRequest,
+        SubmitWorkflowExecutionActualRequest,
+        SubworkflowNodeResult,
+        SubworkflowNodeResultData,
+        TemplatingNodeArrayResult,
+        TemplatingNodeChatHistoryResult,
+        TemplatingNodeErrorResult,
+        TemplatingNodeFunctionCallResult,
+        TemplatingNodeJsonResult,
+        TemplatingNodeNumberResult,
+        TemplatingNodeResult,
+        TemplatingNodeResultData,
+        TemplatingNodeResultOutput,
+        TemplatingNodeSearchResultsResult,
+        TemplatingNodeStringResult,
+        TerminalNodeArrayResult,
+        TerminalNodeChatHistoryResult,
+        TerminalNodeErrorResult,
+        TerminalNodeFunctionCallResult,
+        TerminalNodeJsonResult,
+        TerminalNodeNumberResult,
+        TerminalNodeResult,
+        TerminalNodeResultData,
+        TerminalNodeResultOutput,
+        TerminalNodeSearchResultsResult,
+        TerminalNodeStringResult,
+        TestCaseArrayVariableValue,
+        TestCaseChatHistoryVariableValue,
+        TestCaseErrorVariableValue,
+        TestCaseFunctionCallVariableValue,
+        TestCaseJsonVariableValue,
+        TestCaseNumberVariableValue,
+        TestCaseSearchResultsVariableValue,
+        TestCaseStringVariableValue,
+        TestCaseVariableValue,
+        TestSuiteRunDeploymentReleaseTagExecConfig,
+        TestSuiteRunDeploymentReleaseTagExecConfigData,
+        TestSuiteRunDeploymentReleaseTagExecConfigDataRequest,
+        TestSuiteRunDeploymentReleaseTagExecConfigRequest,
+        TestSuiteRunExecConfig,
+        TestSuiteRunExecConfigRequest,
+        TestSuiteRunExecution,
+        TestSuiteRunExecutionArrayOutput,
+        TestSuiteRunExecutionChatHistoryOutput,
+        TestSuiteRunExecutionErrorOutput,
+        TestSuiteRunExecutionFunctionCallOutput,
+        TestSuiteRunExecutionJsonOutput,
+        TestSuiteRunExecutionMetricDefinition,
+        TestSuiteRunExecutionMetricResult,
+        TestSuiteRunExecutionNumberOutput,
+        TestSuiteRunExecutionOutput,
+        TestSuiteRunExecutionSearchResultsOutput,
+        TestSuiteRunExecutionStringOutput,
+        TestSuiteRunExternalExecConfig,
+        TestSuiteRunExternalExecConfigData,
+        TestSuiteRunExternalExecConfigDataRequest,
+        TestSuiteRunExternalExecConfigRequest,
+        TestSuiteRunMetricErrorOutput,
+        TestSuiteRunMetricJsonOutput,
+        TestSuiteRunMetricNumberOutput,
+        TestSuiteRunMetricOutput,
+        TestSuiteRunMetricStringOutput,
+        TestSuiteRunPromptSandboxHistoryItemExecConfig,
+        TestSuiteRunPromptSandboxHistoryItemExecConfigData,
+        TestSuiteRunPromptSandboxHistoryItemExecConfigDataRequest,
+        TestSuiteRunPromptSandboxHistoryItemExecConfigRequest,
+        TestSuiteRunRead,
+        TestSuiteRunState,
+        TestSuiteRunTestSuite,
+        TestSuiteRunWorkflowReleaseTagExecConfig,
+        TestSuiteRunWorkflowReleaseTagExecConfigData,
+        TestSuiteRunWorkflowReleaseTagExecConfigDataRequest,
+        TestSuiteRunWorkflowReleaseTagExecConfigRequest,
+        TestSuiteRunWorkflowSandboxHistoryItemExecConfig,
+        TestSuiteRunWorkflowSandboxHistoryItemExecConfigData,
+        TestSuiteRunWorkflowSandboxHistoryItemExecConfigDataRequest,
+        TestSuiteRunWorkflowSandboxHistoryItemExecConfigRequest,
+        TestSuiteTestCase,
+        TestSuiteTestCaseBulkOperationRequest,
+        TestSuiteTestCaseBulkResult,
+        TestSuiteTestCaseCreateBulkOperationRequest,
+        TestSuiteTestCaseCreatedBulkResult,
+        TestSuiteTestCaseCreatedBulkResultData,
+        TestSuiteTestCaseDeleteBulkOperationDataRequest,
+        TestSuiteTestCaseDeleteBulkOperationRequest,
+        TestSuiteTestCaseDeletedBulkResult,
+        TestSuiteTestCaseDeletedBulkResultData,
+        TestSuiteTestCaseRejectedBulkResult,
+        TestSuiteTestCaseReplaceBulkOperationRequest,
+        TestSuiteTestCaseReplacedBulkResult,
+        TestSuiteTestCaseReplacedBulkResultData,
+        TestSuiteTestCaseUpsertBulkOperationRequest,
+        TokenOverlappingWindowChunkerConfig,
+        TokenOverlappingWindowChunkerConfigRequest,
+        TokenOverlappingWindowChunking,
+        TokenOverlappingWindowChunkingRequest,
+        UnitEnum,
+        UploadDocumentResponse,
+        UpsertTestSuiteTestCaseRequest,
+        VariablePromptBlock,
+        VellumAudio,
+        VellumAudioRequest,
+        VellumError,
+        VellumErrorCodeEnum,
+        VellumErrorRequest,
+        VellumImage,
+        VellumImageRequest,
+        VellumValue,
+        VellumValueLogicalConditionGroupRequest,
+        VellumValueLogicalConditionRequest,
+        VellumValueLogicalExpressionRequest,
+        VellumValueRequest,
+        VellumVariable,
+        VellumVariableExtensions,
+        VellumVariableType,
+        WorkflowDeploymentHistoryItem,
+        WorkflowDeploymentRead,
+        WorkflowEventError,
+        WorkflowExecutionActualChatHistoryRequest,
+        WorkflowExecutionActualJsonRequest,
+        WorkflowExecutionActualStringRequest,
+        WorkflowExecutionEventErrorCode,
+        WorkflowExecutionEventType,
+        WorkflowExecutionNodeResultEvent,
+        WorkflowExecutionWorkflowResultEvent,
+        WorkflowExpandMetaRequest,
+        WorkflowNodeResultData,
+        WorkflowNodeResultEvent,
+        WorkflowNodeResultEventState,
+        WorkflowOutput,
+        WorkflowOutputArray,
+        WorkflowOutputChatHistory,
+        WorkflowOutputError,
+        WorkflowOutputFunctionCall,
+        WorkflowOutputImage,
+        WorkflowOutputJson,
+        WorkflowOutputNumber,
+        WorkflowOutputSearchResults,
+        WorkflowOutputString,
+        WorkflowPushDeploymentConfigRequest,
+        WorkflowPushExecConfig,
+        WorkflowPushResponse,
+        WorkflowReleaseTagRead,
+        WorkflowReleaseTagWorkflowDeploymentHistoryItem,
+        WorkflowRequestChatHistoryInputRequest,
+        WorkflowRequestInputRequest,
+        WorkflowRequestJsonInputRequest,
+        WorkflowRequestNumberInputRequest,
+        WorkflowRequestStringInputRequest,
+        WorkflowResultEvent,
+        WorkflowResultEventOutputData,
+        WorkflowResultEventOutputDataArray,
+        WorkflowResultEventOutputDataChatHistory,
+        WorkflowResultEventOutputDataError,
+        WorkflowResultEventOutputDataFunctionCall,
+        WorkflowResultEventOutputDataJson,
+        WorkflowResultEventOutputDataNumber,
+        WorkflowResultEventOutputDataSearchResults,
+        WorkflowResultEventOutputDataString,
+        WorkflowStreamEvent,
+        WorkspaceSecretRead,
+    )
+    from .errors import BadRequestError, ForbiddenError, InternalServerError, NotFoundError
+    from .resources import (
+        DeploymentsListRequestStatus,
+        DocumentIndexesListRequestStatus,
+        FolderEntitiesListRequestEntityStatus,
+        ListDeploymentReleaseTagsRequestSource,
+        ListWorkflowReleaseTagsRequestSource,
+        WorkflowDeploymentsListRequestStatus,
+        WorkflowsPullRequestFormat,
+        ad_hoc,
+        container_images,
+        deployments,
+        document_indexes,
+        documents,
+        folder_entities,
+        metric_definitions,
+        ml_models,
+        sandboxes,
+        test_suite_runs,
+        test_suites,
+        workflow_deployments,
+        workflow_sandboxes,
+        workflows,
+        workspace_secrets,
+    )
+    from .client import AsyncVellum, Vellum
+    from .environment import VellumEnvironment
+    from .version import __version__
+
+_LAZY_IMPORTS: typing.Dict[str, str] = {
+    "AdHocExecutePromptEvent": ".types",
+    "AdHocExpandMeta": ".types",
+    "AdHocFulfilledPromptExecutionMeta": ".types",
+    "AdHocInitiatedPromptExecutionMeta": ".types",
+    "AdHocRejectedPromptExecutionMeta": ".types",
+    "AdHocStreamingPromptExecutionMeta": ".types",
+    "AddOpenaiApiKeyEnum": ".types",
+    "ApiNodeResult": ".types",
+    "ApiNodeResultData": ".types",
+    "ArrayChatMessageContent": ".types",
+    "ArrayChatMessageContentItem": ".types",
+    "ArrayChatMessageContentItemRequest": ".types",
+    "ArrayChatMessageContentRequest": ".types",
+    "ArrayInput": ".types",
+    "ArrayVariableValue": ".types",
+    "ArrayVariableValueItem": ".types",
+    "ArrayVellumValue": ".types",
+    "ArrayVellumValueRequest": ".types",
+    "AudioChatMessageContent": ".types",
+    "AudioChatMessageContentRequest": ".types",
+    "AudioVariableValue": ".types",
+    "AudioVellumValue": ".types",
+    "AudioVellumValueRequest": ".types",
+    "BasicVectorizerIntfloatMultilingualE5Large": ".types",
+    "BasicVectorizerIntfloatMultilingualE5LargeRequest": ".types",
+    "BasicVectorizerSentenceTransformersMultiQaMpnetBaseCosV1": ".types",
+    "BasicVectorizerSentenceTransformersMultiQaMpnetBaseCosV1Request": ".types",
+    "BasicVectorizerSentenceTransformersMultiQaMpnetBaseDotV1": ".types",
+    "BasicVectorizerSentenceTransformersMultiQaMpnetBaseDotV1Request": ".types",
+    "ChatHistoryInput": ".types",
+    "ChatHistoryInputRequest": ".types",
+    "ChatHistoryVariableValue": ".types",
+    "ChatHistoryVellumValue": ".types",
+    "ChatHistoryVellumValueRequest": ".types",
+    "ChatMessage": ".types",
+    "ChatMessageContent": ".types",
+    "ChatMessageContentRequest": ".types",
+    "ChatMessagePromptBlock": ".types",
+    "ChatMessageRequest": ".types",
+    "ChatMessageRole": ".types",
+    "CodeExecutionNodeArrayResult": ".types",
+    "CodeExecutionNodeChatHistoryResult": ".types",
+    "CodeExecutionNodeErrorResult": ".types",
+    "CodeExecutionNodeFunctionCallResult": ".types",
+    "CodeExecutionNodeJsonResult": ".types",
+    "CodeExecutionNodeNumberResult": ".types",
+    "CodeExecutionNodeResult": ".types",
+    "CodeExecutionNodeResultData": ".types",
+    "CodeExecutionNodeResultOutput": ".types",
+    "CodeExecutionNodeSearchResultsResult": ".types",
+    "CodeExecutionNodeStringResult": ".types",
+    "CodeExecutionPackage": ".types",
+    "CodeExecutionRuntime": ".types",
+    "CodeExecutorInput": ".types",
+    "CodeExecutorResponse": ".types",
+    "CodeExecutorSecretInput": ".types",
+    "CompilePromptDeploymentExpandMetaRequest": ".types",
+    "CompilePromptMeta": ".types",
+    "ComponentsSchemasPdfSearchResultMetaSource": ".types",
+    "ComponentsSchemasPdfSearchResultMetaSourceRequest": ".types",
+    "ConditionCombinator": ".types",
+    "ConditionalNodeResult": ".types",
+    "ConditionalNodeResultData": ".types",
+    "ContainerImageRead": ".types",
+    "CreateTestSuiteTestCaseRequest": ".types",
+    "DeploymentHistoryItem": ".types",
+    "DeploymentProviderPayloadResponse": ".types",
+    "DeploymentProviderPayloadResponsePayload": ".types",
+    "DeploymentRead": ".types",
+    "DeploymentReleaseTagDeploymentHistoryItem": ".types",
+    "DeploymentReleaseTagRead": ".types",
+    "DockerServiceToken": ".types",
+    "DocumentDocumentToDocumentIndex": ".types",
+    "DocumentIndexChunking": ".types",
+    "DocumentIndexChunkingRequest": ".types",
+    "DocumentIndexIndexingConfig": ".types",
+    "DocumentIndexIndexingConfigRequest": ".types",
+    "DocumentIndexRead": ".types",
+    "DocumentProcessingState": ".types",
+    "DocumentRead": ".types",
+    "DocumentStatus": ".types",
+    "EnrichedNormalizedCompletion": ".types",
+    "EntityStatus": ".types",
+    "EntityVisibility": ".types",
+    "EnvironmentEnum": ".types",
+    "EphemeralPromptCacheConfig": ".types",
+    "EphemeralPromptCacheConfigTypeEnum": ".types",
+    "ErrorInput": ".types",
+    "ErrorVariableValue": ".types",
+    "ErrorVellumValue": ".types",
+    "ErrorVellumValueRequest": ".types",
+    "ExecutePromptEvent": ".types",
+    "ExecutePromptResponse": ".types",
+    "ExecuteWorkflowResponse": ".types",
+    "ExecuteWorkflowWorkflowResultEvent": ".types",
+    "ExecutionArrayVellumValue": ".types",
+    "ExecutionChatHistoryVellumValue": ".types",
+    "ExecutionErrorVellumValue": ".types",
+    "ExecutionFunctionCallVellumValue": ".types",
+    "ExecutionJsonVellumValue": ".types",
+    "ExecutionNumberVellumValue": ".types",
+    "ExecutionSearchResultsVellumValue": ".types",
+    "ExecutionStringVellumValue": ".types",
+    "ExecutionVellumValue": ".types",
+    "ExternalTestCaseExecution": ".types",
+    "ExternalTestCaseExecutionRequest": ".types",
+    "FinishReasonEnum": ".types",
+    "FolderEntity": ".types",
+    "FolderEntityDocumentIndex": ".types",
+    "FolderEntityDocumentIndexData": ".types",
+    "FolderEntityFolder": ".types",
+    "FolderEntityFolderData": ".types",
+    "FolderEntityPromptSandbox": ".types",
+    "FolderEntityPromptSandboxData": ".types",
+    "FolderEntityTestSuite": ".types",
+    "FolderEntityTestSuiteData": ".types",
+    "FolderEntityWorkflowSandbox": ".types",
+    "FolderEntityWorkflowSandboxData": ".types",
+    "FulfilledAdHocExecutePromptEvent": ".types",
+    "FulfilledEnum": ".types",
+    "FulfilledExecutePromptEvent": ".types",
+    "FulfilledExecutePromptResponse": ".types",
+    "FulfilledExecuteWorkflowWorkflowResultEvent": ".types",
+    "FulfilledPromptExecutionMeta": ".types",
+    "FulfilledWorkflowNodeResultEvent": ".types",
+    "FunctionCall": ".types",
+    "FunctionCallChatMessageContent": ".types",
+    "FunctionCallChatMessageContentRequest": ".types",
+    "FunctionCallChatMessageContentValue": ".types",
+    "FunctionCallChatMessageContentValueRequest": ".types",
+    "FunctionCallInput": ".types",
+    "FunctionCallRequest": ".types",
+    "FunctionCallVariableValue": ".types",
+    "FunctionCallVellumValue": ".types",
+    "FunctionCallVellumValueRequest": ".types",
+    "FunctionDefinition": ".types",
+    "GenerateOptionsRequest": ".types",
+    "GenerateRequest": ".types",
+    "GenerateResponse": ".types",
+    "GenerateResult": ".types",
+    "GenerateResultData": ".types",
+    "GenerateResultError": ".types",
+    "GenerateStreamResponse": ".types",
+    "GenerateStreamResult": ".types",
+    "GenerateStreamResultData": ".types",
+    "GoogleVertexAiVectorizerConfig": ".types",
+    "GoogleVertexAiVectorizerConfigRequest": ".types",
+    "GoogleVertexAiVectorizerTextEmbedding004": ".types",
+    "GoogleVertexAiVectorizerTextEmbedding004Request": ".types",
+    "GoogleVertexAiVectorizerTextMultilingualEmbedding002": ".types",
+    "GoogleVertexAiVectorizerTextMultilingualEmbedding002Request": ".types",
+    "HkunlpInstructorXlVectorizer": ".types",
+    "HkunlpInstructorXlVectorizerRequest": ".types",
+    "ImageChatMessageContent": ".types",
+    "ImageChatMessageContentRequest": ".types",
+    "ImageVariableValue": ".types",
+    "ImageVellumValue": ".types",
+    "ImageVellumValueRequest": ".types",
+    "IndexingConfigVectorizer": ".types",
+    "IndexingConfigVectorizerRequest": ".types",
+    "IndexingStateEnum": ".types",
+    "InitiatedAdHocExecutePromptEvent": ".types",
+    "InitiatedExecutePromptEvent": ".types",
+    "InitiatedPromptExecutionMeta": ".types",
+    "InitiatedWorkflowNodeResultEvent": ".types",
+    "InstructorVectorizerConfig": ".types",
+    "InstructorVectorizerConfigRequest": ".types",
+    "IterationStateEnum": ".types",
+    "JinjaPromptBlock": ".types",
+    "JsonInput": ".types",
+    "JsonInputRequest": ".types",
+    "JsonVariableValue": ".types",
+    "JsonVellumValue": ".types",
+    "JsonVellumValueRequest": ".types",
+    "LogicalOperator": ".types",
+    "LogprobsEnum": ".types",
+    "MapNodeResult": ".types",
+    "MapNodeResultData": ".types",
+    "MergeNodeResult": ".types",
+    "MergeNodeResultData": ".types",
+    "MetadataFilterConfigRequest": ".types",
+    "MetadataFilterRuleCombinator": ".types",
+    "MetadataFilterRuleRequest": ".types",
+    "MetadataFiltersRequest": ".types",
+    "MetricDefinitionExecution": ".types",
+    "MetricDefinitionHistoryItem": ".types",
+    "MetricDefinitionInput": ".types",
+    "MetricNodeResult": ".types",
+    "MlModelRead": ".types",
+    "MlModelUsage": ".types",
+    "NamedScenarioInputChatHistoryVariableValueRequest": ".types",
+    "NamedScenarioInputJsonVariableValueRequest": ".types",
+    "NamedScenarioInputRequest": ".types",
+    "NamedScenarioInputStringVariableValueRequest": ".types",
+    "NamedTestCaseArrayVariableValue": ".types",
+    "NamedTestCaseArrayVariableValueRequest": ".types",
+    "NamedTestCaseChatHistoryVariableValue": ".types",
+    "NamedTestCaseChatHistoryVariableValueRequest": ".types",
+    "NamedTestCaseErrorVariableValue": ".types",
+    "NamedTestCaseErrorVariableValueRequest": ".types",
+    "NamedTestCaseFunctionCallVariableValue": ".types",
+    "NamedTestCaseFunctionCallVariableValueRequest": ".types",
+    "NamedTestCaseJsonVariableValue": ".types",
+    "NamedTestCaseJsonVariableValueRequest": ".types",
+    "NamedTestCaseNumberVariableValue": ".types",
+    "NamedTestCaseNumberVariableValueRequest": ".types",
+    "NamedTestCaseSearchResultsVariableValue": ".types",
+    "NamedTestCaseSearchResultsVariableValueRequest": ".types",
+    "NamedTestCaseStringVariableValue": ".types",
+    "NamedTestCaseStringVariableValueRequest": ".types",
+    "NamedTestCaseVariableValue": ".types",
+    "NamedTestCaseVariableValueRequest": ".types",
+    "NodeInputCompiledArrayValue": ".types",
+    "NodeInputCompiledChatHistoryValue": ".types",
+    "NodeInputCompiledErrorValue": ".types",
+    "NodeInputCompiledFunctionCallValue": ".types",
+    "NodeInputCompiledJsonValue": ".types",
+    "NodeInputCompiledNumberValue": ".types",
+    "NodeInputCompiledSearchResultsValue": ".types",
+    "NodeInputCompiledStringValue": ".types",
+    "NodeInputVariableCompiledValue": ".types",
+    "NodeOutputCompiledArrayValue": ".types",
+    "NodeOutputCompiledChatHistoryValue": ".types",
+    "NodeOutputCompiledErrorValue": ".types",
+    "NodeOutputCompiledFunctionCallValue": ".types",
+    "NodeOutputCompiledJsonValue": ".types",
+    "NodeOutputCompiledNumberValue": ".types",
+    "NodeOutputCompiledSearchResultsValue": ".types",
+    "NodeOutputCompiledStringValue": ".types",
+    "NodeOutputCompiledValue": ".types",
+    "NormalizedLogProbs": ".types",
+    "NormalizedTokenLogProbs": ".types",
+    "NumberInput": ".types",
+    "NumberVariableValue": ".types",
+    "NumberVellumValue": ".types",
+    "NumberVellumValueRequest": ".types",
+    "OpenAiVectorizerConfig": ".types",
+    "OpenAiVectorizerConfigRequest": ".types",
+    "OpenAiVectorizerTextEmbedding3Large": ".types",
+    "OpenAiVectorizerTextEmbedding3LargeRequest": ".types",
+    "OpenAiVectorizerTextEmbedding3Small": ".types",
+    "OpenAiVectorizerTextEmbedding3SmallRequest": ".types",
+    "OpenAiVectorizerTextEmbeddingAda002": ".types",
+    "OpenAiVectorizerTextEmbeddingAda002Request": ".types",
+    "PaginatedContainerImageReadList": ".types",
+    "PaginatedDeploymentReleaseTagReadList": ".types",
+    "PaginatedDocumentIndexReadList": ".types",
+    "PaginatedFolderEntityList": ".types",
+    "PaginatedSlimDeploymentReadList": ".types",
+    "PaginatedSlimDocumentList": ".types",
+    "PaginatedSlimWorkflowDeploymentList": ".types",
+    "PaginatedTestSuiteRunExecutionList": ".types",
+    "PaginatedTestSuiteTestCaseList": ".types",
+    "PaginatedWorkflowReleaseTagReadList": ".types",
+    "PdfSearchResultMetaSource": ".types",
+    "PdfSearchResultMetaSourceRequest": ".types",
+    "PlainTextPromptBlock": ".types",
+    "Price": ".types",
+    "ProcessingFailureReasonEnum": ".types",
+    "PromptBlock": ".types",
+    "PromptBlockState": ".types",
+    "PromptDeploymentExpandMetaRequest": ".types",
+    "PromptDeploymentInputRequest": ".types",
+    "PromptExecutionMeta": ".types",
+    "PromptNodeExecutionMeta": ".types",
+    "PromptNodeResult": ".types",
+    "PromptNodeResultData": ".types",
+    "PromptOutput": ".types",
+    "PromptParameters": ".types",
+    "PromptRequestChatHistoryInput": ".types",
+    "PromptRequestInput": ".types",
+    "PromptRequestJsonInput": ".types",
+    "PromptRequestStringInput": ".types",
+    "PromptSettings": ".types",
+    "RawPromptExecutionOverridesRequest": ".types",
+    "ReductoChunkerConfig": ".types",
+    "ReductoChunkerConfigRequest": ".types",
+    "ReductoChunking": ".types",
+    "ReductoChunkingRequest": ".types",
+    "RejectedAdHocExecutePromptEvent": ".types",
+    "RejectedExecutePromptEvent": ".types",
+    "RejectedExecutePromptResponse": ".types",
+    "RejectedExecuteWorkflowWorkflowResultEvent": ".types",
+    "RejectedPromptExecutionMeta": ".types",
+    "RejectedWorkflowNodeResultEvent": ".types",
+    "ReleaseTagSource": ".types",
+    "ReplaceTestSuiteTestCaseRequest": ".types",
+    "RichTextChildBlock": ".types",
+    "RichTextPromptBlock": ".types",
+    "SandboxScenario": ".types",
+    "ScenarioInput": ".types",
+    "ScenarioInputChatHistoryVariableValue": ".types",
+    "ScenarioInputJsonVariableValue": ".types",
+    "ScenarioInputStringVariableValue": ".types",
+    "SearchFiltersRequest": ".types",
+    "SearchNodeResult": ".types",
+    "SearchNodeResultData": ".types",
+    "SearchRequestOptionsRequest": ".types",
+    "SearchResponse": ".types",
+    "SearchResult": ".types",
+    "SearchResultDocument": ".types",
+    "SearchResultDocumentRequest": ".types",
+    "SearchResultMergingRequest": ".types",
+    "SearchResultMeta": ".types",
+    "SearchResultMetaRequest": ".types",
+    "SearchResultRequest": ".types",
+    "SearchResultsInput": ".types",
+    "SearchResultsVariableValue": ".types",
+    "SearchResultsVellumValue": ".types",
+    "SearchResultsVellumValueRequest": ".types",
+    "SearchWeightsRequest": ".types",
+    "SecretTypeEnum": ".types",
+    "SentenceChunkerConfig": ".types",
+    "SentenceChunkerConfigRequest": ".types",
+    "SentenceChunking": ".types",
+    "SentenceChunkingRequest": ".types",
+    "SlimDeploymentRead": ".types",
+    "SlimDocument": ".types",
+    "SlimDocumentDocumentToDocumentIndex": ".types",
+    "SlimWorkflowDeployment": ".types",
+    "StreamingAdHocExecutePromptEvent": ".types",
+    "StreamingExecutePromptEvent": ".types",
+    "StreamingPromptExecutionMeta": ".types",
+    "StreamingWorkflowNodeResultEvent": ".types",
+    "StringChatMessageContent": ".types",
+    "StringChatMessageContentRequest": ".types",
+    "StringInput": ".types",
+    "StringInputRequest": ".types",
+    "StringVariableValue": ".types",
+    "StringVellumValue": ".types",
+    "StringVellumValueRequest": ".types",
+    "SubmitCompletionActualRequest": ".types",
+    "SubmitWorkflowExecutionActualRequest": ".types",
+    "SubworkflowNodeResult": ".types",
+    "SubworkflowNodeResultData": ".types",
+    "TemplatingNodeArrayResult": ".types",
+    "TemplatingNodeChatHistoryResult": ".types",
+    "TemplatingNodeErrorResult": ".types",
+    "TemplatingNodeFunctionCallResult": ".types",
+    "TemplatingNodeJsonResult": ".types",
+    "TemplatingNodeNumberResult": ".types",
+    "TemplatingNodeResult": ".types",
+    "TemplatingNodeResultData": ".types",
+    "TemplatingNodeResultOutput": ".types",
+    "TemplatingNodeSearchResultsResult": ".types",
+    "TemplatingNodeStringResult": ".types",
+    "TerminalNodeArrayResult": ".types",
+    "TerminalNodeChatHistoryResult": ".types",
+    "TerminalNodeErrorResult": ".types",
+    "TerminalNodeFunctionCallResult": ".types",
+    "TerminalNodeJsonResult": ".types",
+    "TerminalNodeNumberResult": ".types",
+    "TerminalNodeResult": ".types",
+    "TerminalNodeResultData": ".types",
+    "TerminalNodeResultOutput": ".types",
+    "TerminalNodeSearchResultsResult": ".types",
+    "TerminalNodeStringResult": ".types",
+    "TestCaseArrayVariableValue": ".types",
+    "TestCaseChatHistoryVariableValue": ".types",
+    "TestCaseErrorVariableValue": ".types",
+    "TestCaseFunctionCallVariableValue": ".types",
+    "TestCaseJsonVariableValue": ".types",
+    "TestCaseNumberVariableValue": ".types",
+    "TestCaseSearchResultsVariableValue": ".types",
+    "TestCaseStringVariableValue": ".types",
+    "TestCaseVariableValue": ".types",
+    "TestSuiteRunDeploymentReleaseTagExecConfig": ".types",
+    "TestSuiteRunDeploymentReleaseTagExecConfigData": ".types",
+    "TestSuiteRunDeploymentReleaseTagExecConfigDataRequest": ".types",
+    "TestSuiteRunDeploymentReleaseTagExecConfigRequest": ".types",
+    "TestSuiteRunExecConfig": ".types",
+    "TestSuiteRunExecConfigRequest": ".types",
+    "TestSuiteRunExecution": ".types",
+    "TestSuiteRunExecutionArrayOutput": ".types",
+    "TestSuiteRunExecutionChatHistoryOutput": ".types",
+    "TestSuiteRunExecutionErrorOutput": ".types",
+    "TestSuiteRunExecutionFunctionCallOutput": ".types",
+    "TestSuiteRunExecutionJsonOutput": ".types",
+    "TestSuiteRunExecutionMetricDefinition": ".types",
+    "TestSuiteRunExecutionMetricResult": ".types",
+    "TestSuiteRunExecutionNumberOutput": ".types",
+    "TestSuiteRunExecutionOutput": ".types",
+    "TestSuiteRunExecutionSearchResultsOutput": ".types",
+    "TestSuiteRunExecutionStringOutput": ".types",
+    "TestSuiteRunExternalExecConfig": ".types",
+    "TestSuiteRunExternalExecConfigData": ".types",
+    "TestSuiteRunExternalExecConfigDataRequest": ".types",
+    "TestSuiteRunExternalExecConfigRequest": ".types",
+    "TestSuiteRunMetricErrorOutput": ".types",
+    "TestSuiteRunMetricJsonOutput": ".types",
+    "TestSuiteRunMetricNumberOutput": ".types",
+    "TestSuiteRunMetricOutput": ".types",
+    "TestSuiteRunMetricStringOutput": ".types",
+    "TestSuiteRunPromptSandboxHistoryItemExecConfig": ".types",
+    "TestSuiteRunPromptSandboxHistoryItemExecConfigData": ".types",
+    "TestSuiteRunPromptSandboxHistoryItemExecConfigDataRequest": ".types",
+    "TestSuiteRunPromptSandboxHistoryItemExecConfigRequest": ".types",
+    "TestSuiteRunRead": ".types",
+    "TestSuiteRunState": ".types",
+    "TestSuiteRunTestSuite": ".types",
+    "TestSuiteRunWorkflowReleaseTagExecConfig": ".types",
+    "TestSuiteRunWorkflowReleaseTagExecConfigData": ".types",
+    "TestSuiteRunWorkflowReleaseTagExecConfigDataRequest": ".types",
+    "TestSuiteRunWorkflowReleaseTagExecConfigRequest": ".types",
+    "TestSuiteRunWorkflowSandboxHistoryItemExecConfig": ".types",
+    "TestSuiteRunWorkflowSandboxHistoryItemExecConfigData": ".types",
+    "TestSuiteRunWorkflowSandboxHistoryItemExecConfigDataRequest": ".types",
+    "TestSuiteRunWorkflowSandboxHistoryItemExecConfigRequest": ".types",
+    "TestSuiteTestCase": ".types",
+    "TestSuiteTestCaseBulkOperationRequest": ".types",
+    "TestSuiteTestCaseBulkResult": ".types",
+    "TestSuiteTestCaseCreateBulkOperationRequest": ".types",
+    "TestSuiteTestCaseCreatedBulkResult": ".types",
+    "TestSuiteTestCaseCreatedBulkResultData": ".types",
+    "TestSuiteTestCaseDeleteBulkOperationDataRequest": ".types",
+    "TestSuiteTestCaseDeleteBulkOperationRequest": ".types",
+    "TestSuiteTestCaseDeletedBulkResult": ".types",
+    "TestSuiteTestCaseDeletedBulkResultData": ".types",
+    "TestSuiteTestCaseRejectedBulkResult": ".types",
+    "TestSuiteTestCaseReplaceBulkOperationRequest": ".types",
+    "TestSuiteTestCaseReplacedBulkResult": ".types",
+    "TestSuiteTestCaseReplacedBulkResultData": ".types",
+    "TestSuiteTestCaseUpsertBulkOperationRequest": ".types",
+    "TokenOverlappingWindowChunkerConfig": ".types",
+    "TokenOverlappingWindowChunkerConfigRequest": ".types",
+    "TokenOverlappingWindowChunking": ".types",
+    "TokenOverlappingWindowChunkingRequest": ".types",
+    "UnitEnum": ".types",
+    "UploadDocumentResponse": ".types",
+    "UpsertTestSuiteTestCaseRequest": ".types",
+    "VariablePromptBlock": ".types",
+    "VellumAudio": ".types",
+    "VellumAudioRequest": ".types",
+    "VellumError": ".types",
+    "VellumErrorCodeEnum": ".types",
+    "VellumErrorRequest": ".types",
+    "VellumImage": ".types",
+    "VellumImageRequest": ".types",
+    "VellumValue": ".types",
+    "VellumValueLogicalConditionGroupRequest": ".types",
+    "VellumValueLogicalConditionRequest": ".types",
+    "VellumValueLogicalExpressionRequest": ".types",
+    "VellumValueRequest": ".types",
+    "VellumVariable": ".types",
+    "VellumVariableExtensions": ".types",
+    "VellumVariableType": ".types",
+    "WorkflowDeploymentHistoryItem": ".types",
+    "WorkflowDeploymentRead": ".types",
+    "WorkflowEventError": ".types",
+    "WorkflowExecutionActualChatHistoryRequest": ".types",
+    "WorkflowExecutionActualJsonRequest": ".types",
+    "WorkflowExecutionActualStringRequest": ".types",
+    "WorkflowExecutionEventErrorCode": ".types",
+    "WorkflowExecutionEventType": ".types",
+    "WorkflowExecutionNodeResultEvent": ".types",
+    "WorkflowExecutionWorkflowResultEvent": ".types",
+    "WorkflowExpandMetaRequest": ".types",
+    "WorkflowNodeResultData": ".types",
+    "WorkflowNodeResultEvent": ".types",
+    "WorkflowNodeResultEventState": ".types",
+    "WorkflowOutput": ".types",
+    "WorkflowOutputArray": ".types",
+    "WorkflowOutputChatHistory": ".types",
+    "WorkflowOutputError": ".types",
+    "WorkflowOutputFunctionCall": ".types",
+    "WorkflowOutputImage": ".types",
+    "WorkflowOutputJson": ".types",
+    "WorkflowOutputNumber": ".types",
+    "WorkflowOutputSearchResults": ".types",
+    "WorkflowOutputString": ".types",
+    "WorkflowPushDeploymentConfigRequest": ".types",
+    "WorkflowPushExecConfig": ".types",
+    "WorkflowPushResponse": ".types",
+    "WorkflowReleaseTagRead": ".types",
+    "WorkflowReleaseTagWorkflowDeploymentHistoryItem": ".types",
+    "WorkflowRequestChatHistoryInputRequest": ".types",
+    "WorkflowRequestInputRequest": ".types",
+    "WorkflowRequestJsonInputRequest": ".types",
+    "WorkflowRequestNumberInputRequest": ".types",
+    "WorkflowRequestStringInputRequest": ".types",
+    "WorkflowResultEvent": ".types",
+    "WorkflowResultEventOutputData": ".types",
+    "WorkflowResultEventOutputDataArray": ".types",
+    "WorkflowResultEventOutputDataChatHistory": ".types",
+    "WorkflowResultEventOutputDataError": ".types",
+    "WorkflowResultEventOutputDataFunctionCall": ".types",
+    "WorkflowResultEventOutputDataJson": ".types",
+    "WorkflowResultEventOutputDataNumber": ".types",
+    "WorkflowResultEventOutputDataSearchResults": ".types",
+    "WorkflowResultEventOutputDataString": ".types",
+    "WorkflowStreamEvent": ".types",
+    "WorkspaceSecretRead": ".types",
+    "BadRequestError": ".errors",
+    "ForbiddenError": ".errors",
+    "InternalServerError": ".errors",
+    "NotFoundError": ".errors",
+    "DeploymentsListRequestStatus": ".resources",
+    "DocumentIndexesListRequestStatus": ".resources",
+    "FolderEntitiesListRequestEntityStatus": ".resources",
+    "ListDeploymentReleaseTagsRequestSource": ".resources",
+    "ListWorkflowReleaseTagsRequestSource": ".resources",
+    "WorkflowDeploymentsListRequestStatus": ".resources",
+    "WorkflowsPullRequestFormat": ".resources",
+    "ad_hoc": ".resources",
+    "container_images": ".resources",
+    "deployments": ".resources",
+    "document_indexes": ".resources",
+    "documents": ".resources",
+    "folder_entities": ".resources",
+    "metric_definitions": ".resources",
+    "ml_models": ".resources",
+    "sandboxes": ".resources",
+    "test_suite_runs": ".resources",
+    "test_suites": ".resources",
+    "workflow_deployments": ".resources",
+    "workflow_sandboxes": ".resources",
+    "workflows": ".resources",
+    "workspace_secrets": ".resources",
+    "AsyncVellum": ".client",
+    "Vellum": ".client",
+    "VellumEnvironment": ".environment",
+    "__version__": ".version",
+}
+
+
+def __getattr__(name: str) -> typing.Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+
+    # Cache the resolved value so that __getattr__ is only hit once per name
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> typing.List[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+__all__: typing.List[str] = [
     "AdHocExecutePromptEvent",
     "AdHocExpandMeta",
     "AdHocFulfilledPromptExecutionMeta",
@@ -0,0 +1,151 @@
+import asyncio
+import dataclasses
+import typing
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
+from .json_body_encoder import encode_json_body
+
+T = typing.TypeVar("T")
+R = typing.TypeVar("R")
+
+DEFAULT_BATCH_MAX_CONCURRENCY = 8
+DEFAULT_BATCH_MAX_RETRIES = 2
+
+
+@dataclasses.dataclass(frozen=True)
+class BatchResult(typing.Generic[T, R]):
+    """
+    The outcome of one item of a batch. Exactly one of `result` and `error` is set.
+
+    index: int - The position of the item in the batch.
+    item: T - The item itself.
+    result: typing.Optional[R] = None - The result of the item, if it succeeded.
+    error: typing.Optional[Exception] = None - The error the item failed with, once any retries were exhausted.
+    """
+
+    index: int
+    item: T
+    result: typing.Optional[R] = None
+    error: typing.Optional[Exception] = None
+
+
+def create_json_body_encoder(
+    shared_fields: typing.Dict[str, typing.Any],
+) -> typing.Callable[[typing.Dict[str, typing.Any]], bytes]:
+    """
+    Serializes the fields shared by every request of a batch once, and returns a function that only serializes the
+    fields specific to each request before splicing the two together. The two sets of fields must not overlap.
+    """
+
+    shared_json = encode_json_body(shared_fields)[1:-1]
+
+    def encode(fields: typing.Dict[str, typing.Any]) -> bytes:
+        fields_json = encode_json_body(fields)[1:-1]
+        separator = b"," if fields_json and shared_json else b""
+        return b"{" + fields_json + separator + shared_json + b"}"
+
+    return encode
+
+
+def _get_result(index: int, item: T, future: typing.Union["Future[R]", "asyncio.Future[R]"]) -> BatchResult[T, R]:
+    try:
+        return BatchResult(index=index, item=item, result=future.result())
+    except Exception as error:
+        return BatchResult(index=index, item=item, error=error)
+
+
+def execute_batch(
+    func: typing.Callable[[T], R],
+    items: typing.Iterable[T],
+    *,
+    max_concurrency: int = DEFAULT_BATCH_MAX_CONCURRENCY,
+    ordered: bool = True,
+) -> typing.Iterator[BatchResult[T, R]]:
+    """
+    Calls `func` on every item from a pool of `max_concurrency` threads, yielding each result in the order of the
+    items, or as soon as it completes if `ordered` is False. Items are read lazily, and no more than twice
+    `max_concurrency` are held at once, so that arbitrarily large batches can be streamed through.
+    """
+
+    max_pending = max_concurrency * 2
+    indexed_items = enumerate(items)
+    pending: typing.Dict["Future[R]", typing.Tuple[int, T]] = {}
+    completed: typing.Dict[int, BatchResult[T, R]] = {}
+    next_index = 0
+
+    executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="vellum-batch")
+
+    def submit_items() -> None:
+        # Results that complete out of order count against the limit, so that a slow item can't make the buffer of
+        # results waiting behind it grow without bound
+        while len(pending) + len(completed) < max_pending:
+            indexed_item = next(indexed_items, None)
+            if indexed_item is None:
+                return
+            pending[executor.submit(func, indexed_item[1])] = indexed_item
+
+    try:
+        submit_items()
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                index, item = pending.pop(future)
+                result = _get_result(index, item, future)
+                if ordered:
+                    completed[index] = result
+                else:
+                    yield result
+
+            while next_index in completed:
+                yield completed.pop(next_index)
+                next_index += 1
+
+            submit_items()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+async def aexecute_batch(
+    func: typing.Callable[[T], typing.Awaitable[R]],
+    items: typing.Iterable[T],
+    *,
+    max_concurrency: int = DEFAULT_BATCH_MAX_CONCURRENCY,
+    ordered: bool = True,
+) -> typing.AsyncIterator[BatchResult[T, R]]:
+    """
+    Awaits `func` on every item with no more than `max_concurrency` running at once, yielding each result in the
+    order of the items, or as soon as it completes if `ordered` is False.
+    """
+
+    indexed_items = enumerate(items)
+    pending: typing.Dict["asyncio.Future[R]", typing.Tuple[int, T]] = {}
+    completed: typing.Dict[int, BatchResult[T, R]] = {}
+    next_index = 0
+
+    def submit_items() -> None:
+        while len(pending) < max_concurrency and len(pending) + len(completed) < max_concurrency * 2:
+            indexed_item = next(indexed_items, None)
+            if indexed_item is None:
+                return
+            pending[asyncio.ensure_future(func(indexed_item[1]))] = indexed_item
+
+    try:
+        submit_items()
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                index, item = pending.pop(future)
+                result = _get_result(index, item, future)
+                if ordered:
+                    completed[index] = result
+                else:
+                    yield result
+
+            while next_index in completed:
+                yield completed.pop(next_index)
+                next_index += 1
+
+            submit_items()
+    finally:
+        for future in pending:
+            future.cancel()
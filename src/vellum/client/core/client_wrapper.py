@@ -3,8 +3,10 @@
 from ..environment import VellumEnvironment
 import typing
 import httpx
-from .http_client import HttpClient
-from .http_client import AsyncHttpClient
+from .retrying_http_client import RetryingHttpClient as HttpClient
+from .retrying_http_client import AsyncRetryingHttpClient as AsyncHttpClient
+from .rate_limiter import RateLimiter
+from .retries import RetryBudget
 
 
 class BaseClientWrapper:
@@ -37,10 +39,17 @@ class SyncClientWrapper(BaseClientWrapper):
         environment: VellumEnvironment,
         timeout: typing.Optional[float] = None,
         httpx_client: httpx.Client,
+        rate_limiter: typing.Optional[RateLimiter] = None,
+        retry_budget: typing.Optional[RetryBudget] = None,
     ):
         super().__init__(api_key=api_key, environment=environment, timeout=timeout)
         self.httpx_client = HttpClient(
-            httpx_client=httpx_client, base_headers=self.get_headers, base_timeout=self.get_timeout
+            httpx_client=httpx_client,
+            base_headers=self.get_headers,
+            base_timeout=self.get_timeout,
+            rate_limiter=rate_limiter,
+            retry_budget=retry_budget,
+            get_environment=self.get_environment,
         )
 
 
@@ -52,8 +61,15 @@ class AsyncClientWrapper(BaseClientWrapper):
         environment: VellumEnvironment,
         timeout: typing.Optional[float] = None,
         httpx_client: httpx.AsyncClient,
+        rate_limiter: typing.Optional[RateLimiter] = None,
+        retry_budget: typing.Optional[RetryBudget] = None,
     ):
         super().__init__(api_key=api_key, environment=environment, timeout=timeout)
         self.httpx_client = AsyncHttpClient(
-            httpx_client=httpx_client, base_headers=self.get_headers, base_timeout=self.get_timeout
+            httpx_client=httpx_client,
+            base_headers=self.get_headers,
+            base_timeout=self.get_timeout,
+            rate_limiter=rate_limiter,
+            retry_budget=retry_budget,
+            get_environment=self.get_environment,
         )
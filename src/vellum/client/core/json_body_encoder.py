@@ -0,0 +1,101 @@
+import contextvars
+import datetime as dt
+import json
+import typing
+
+import pydantic
+
+from .datetime_utils import serialize_datetime
+from .serialization import FieldMetadata
+
+# Set while serializing a request body to have models serialize themselves the way `.dict()` does, see
+# `serialize_request_body_model`
+is_serializing_request_body: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "is_serializing_request_body", default=False
+)
+
+
+def encode_json_body(obj: typing.Any) -> bytes:
+    """
+    Serializes a request body straight to JSON bytes, encoding it the same way as `jsonable_encoder`.
+
+    With Pydantic v2, the whole body is serialized by pydantic-core in a single pass, rather than dumping each model
+    to a dict twice, walking the result with `jsonable_encoder` and then serializing it with `json.dumps`. Values
+    pydantic-core doesn't know how to serialize fall back to `jsonable_encoder`.
+    """
+    # Imported here since `pydantic_utilities` imports this module to hook into the serialization of models
+    from .jsonable_encoder import jsonable_encoder
+    from .pydantic_utilities import IS_PYDANTIC_V2
+
+    if IS_PYDANTIC_V2:
+        from pydantic_core import to_json
+
+        token = is_serializing_request_body.set(True)
+        try:
+            return to_json(_serialize_datetimes(obj), by_alias=True, fallback=jsonable_encoder)
+        finally:
+            is_serializing_request_body.reset(token)
+
+    return json.dumps(jsonable_encoder(obj), separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def serialize_request_body_model(model: pydantic.BaseModel, serialized: typing.Any) -> typing.Any:
+    """
+    Applies the rules of `.dict()` to a model already serialized in JSON mode by alias, so that a request body can be
+    serialized in a single pass: fields that are None are dropped unless they were set explicitly, datetimes are
+    serialized with `serialize_datetime`, and `FieldMetadata` aliases are respected.
+
+    Nested models have already been through their own serializer by the time this runs, so only this model's own
+    fields, and the plain containers within them, are looked at.
+    """
+    if not isinstance(serialized, dict):
+        return serialized
+
+    fields_set = model.model_fields_set  # type: ignore # Pydantic v2
+    aliases: typing.Dict[str, str] = {}
+    for name, field in model.__class__.model_fields.items():  # type: ignore # Pydantic v2
+        key = field.serialization_alias or field.alias or name
+        if key not in serialized:
+            continue
+
+        value = getattr(model, name, None)
+        if value is None and name not in fields_set:
+            del serialized[key]
+            continue
+
+        serialized[key] = _serialize_nested_datetimes(value, serialized[key])
+        alias = next((item.alias for item in field.metadata if isinstance(item, FieldMetadata)), None)
+        if alias is not None:
+            aliases[key] = alias
+
+    if aliases:
+        return {aliases.get(key, key): value for key, value in serialized.items()}
+    return serialized
+
+
+def _serialize_nested_datetimes(value: typing.Any, serialized: typing.Any) -> typing.Any:
+    """
+    Walks a value alongside its JSON mode serialization, replacing the datetimes pydantic-core serialized natively with
+    `serialize_datetime`, the way `jsonable_encoder` would. Models are skipped, since they serialize their own fields.
+    """
+    if isinstance(value, dt.datetime):
+        return serialize_datetime(value)
+    if isinstance(value, dict) and isinstance(serialized, dict):
+        for item, key in zip(value.values(), list(serialized)):
+            serialized[key] = _serialize_nested_datetimes(item, serialized[key])
+    elif isinstance(value, (list, tuple, set, frozenset)) and isinstance(serialized, list):
+        for index, item in zip(range(len(serialized)), value):
+            serialized[index] = _serialize_nested_datetimes(item, serialized[index])
+    return serialized
+
+
+def _serialize_datetimes(obj: typing.Any) -> typing.Any:
+    # pydantic-core serializes datetimes natively, so those outside of models are serialized with `serialize_datetime`
+    # up front, the way `jsonable_encoder` would. Models take care of their own.
+    if isinstance(obj, dt.datetime):
+        return serialize_datetime(obj)
+    if isinstance(obj, dict):
+        return {key: _serialize_datetimes(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return [_serialize_datetimes(item) for item in obj]
+    return obj
@@ -10,7 +10,9 @@ import typing_extensions
 import pydantic
 
 from .datetime_utils import serialize_datetime
+from .json_body_encoder import is_serializing_request_body, serialize_request_body_model
 from .serialization import convert_and_respect_annotation_metadata
+from .type_caches import get_type_adapter, has_annotation_metadata
 
 IS_PYDANTIC_V2 = pydantic.VERSION.startswith("2.")
 
@@ -57,12 +59,13 @@ Model = typing.TypeVar("Model", bound=pydantic.BaseModel)
 
 
 def parse_obj_as(type_: typing.Type[T], object_: typing.Any) -> T:
-    dealiased_object = convert_and_respect_annotation_metadata(object_=object_, annotation=type_, direction="read")
+    if has_annotation_metadata(type_):
+        object_ = convert_and_respect_annotation_metadata(object_=object_, annotation=type_, direction="read")
     if IS_PYDANTIC_V2:
-        adapter = pydantic.TypeAdapter(type_)  # type: ignore # Pydantic v2
-        return adapter.validate_python(dealiased_object)
+        adapter = get_type_adapter(type_)
+        return adapter.validate_python(object_)
     else:
-        return pydantic.parse_obj_as(type_, dealiased_object)
+        return pydantic.parse_obj_as(type_, object_)
 
 
 def to_jsonable_with_fallback(
@@ -86,6 +89,8 @@ class UniversalBaseModel(pydantic.BaseModel):
         @pydantic.model_serializer(mode="wrap", when_used="json")  # type: ignore # Pydantic v2
         def serialize_model(self, handler: pydantic.SerializerFunctionWrapHandler) -> typing.Any:  # type: ignore # Pydantic v2
             serialized = handler(self)
+            if is_serializing_request_body.get():
+                return serialize_request_body_model(self, serialized)
             data = {k: serialize_datetime(v) if isinstance(v, dt.datetime) else v for k, v in serialized.items()}
             return data
 
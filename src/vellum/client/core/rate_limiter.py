@@ -0,0 +1,250 @@
+import asyncio
+import collections
+import contextlib
+import dataclasses
+import threading
+import time
+import typing
+
+from ..environment import VellumEnvironment
+
+DEFAULT_ENDPOINT_GROUP = "default"
+
+
+@dataclasses.dataclass(frozen=True)
+class RateLimit:
+    """
+    The limits applied to the requests sent to one of the endpoint groups of a `VellumEnvironment`.
+
+    requests_per_second: typing.Optional[float] = None - How many requests may be started per second, on average.
+    burst: typing.Optional[int] = None - How many requests may be started at once after a quiet period. Defaults to
+        one second's worth of requests.
+    max_in_flight: typing.Optional[int] = None - How many requests may be awaiting or streaming a response at once,
+        counting those sent by both sync and async clients.
+    """
+
+    requests_per_second: typing.Optional[float] = None
+    burst: typing.Optional[int] = None
+    max_in_flight: typing.Optional[int] = None
+
+
+class _ThreadWaiter:
+    """
+    A sync request waiting on its thread for its turn to be in flight.
+    """
+
+    def __init__(self) -> None:
+        self.event = threading.Event()
+
+    def wake(self) -> bool:
+        self.event.set()
+        return True
+
+
+class _LoopWaiter:
+    """
+    An async request waiting on its event loop for its turn to be in flight.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self.loop = loop
+        self.future: "asyncio.Future[None]" = loop.create_future()
+
+    def wake(self) -> bool:
+        """
+        Hands the request its turn, returning False if it can no longer take it because its event loop was closed.
+        """
+
+        try:
+            self.loop.call_soon_threadsafe(self._set_result)
+        except RuntimeError:
+            return False
+
+        return True
+
+    def _set_result(self) -> None:
+        if not self.future.done():
+            self.future.set_result(None)
+
+
+class _InFlightLimit:
+    """
+    Caps how many requests may be in flight at once. Sync and async requests share a single count, so that a Vellum
+    and an AsyncVellum client sharing a RateLimiter also share its cap, and waiting requests are let through in the
+    order they arrived, whichever thread or event loop they're waiting on.
+    """
+
+    def __init__(self, max_in_flight: int) -> None:
+        self._max_in_flight = max_in_flight
+        self._in_flight = 0
+        self._waiters: typing.Deque[typing.Union[_ThreadWaiter, _LoopWaiter]] = collections.deque()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        with self._lock:
+            if self._in_flight < self._max_in_flight and not self._waiters:
+                self._in_flight += 1
+                return
+
+            waiter = _ThreadWaiter()
+            self._waiters.append(waiter)
+
+        waiter.event.wait()
+
+    async def async_acquire(self) -> None:
+        with self._lock:
+            if self._in_flight < self._max_in_flight and not self._waiters:
+                self._in_flight += 1
+                return
+
+            loop_waiter = _LoopWaiter(asyncio.get_running_loop())
+            self._waiters.append(loop_waiter)
+
+        try:
+            await loop_waiter.future
+        except asyncio.CancelledError:
+            with self._lock:
+                if loop_waiter in self._waiters:
+                    self._waiters.remove(loop_waiter)
+                    raise
+
+            # We were handed a turn as we were cancelled, so we pass it on
+            self.release()
+            raise
+
+    def release(self) -> None:
+        with self._lock:
+            # The turn is handed straight to the next waiter, so the count only drops once no one is waiting
+            while self._waiters:
+                if self._waiters.popleft().wake():
+                    return
+
+            self._in_flight -= 1
+
+
+class _EndpointGroupLimiter:
+    def __init__(self, rate_limit: RateLimit) -> None:
+        self._requests_per_second = rate_limit.requests_per_second
+        self._burst = float(
+            rate_limit.burst if rate_limit.burst is not None else max(1, int(rate_limit.requests_per_second or 1))
+        )
+        self._tokens = self._burst
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+        self._in_flight = _InFlightLimit(rate_limit.max_in_flight) if rate_limit.max_in_flight is not None else None
+
+    def reserve(self) -> float:
+        """
+        Takes a token for a request, and returns how long to wait before sending it. Tokens may be borrowed against
+        future refills, so that waiting requests are let through in the order they arrived.
+        """
+
+        with self._lock:
+            now = time.monotonic()
+            delay = max(self._paused_until - now, 0.0)
+            if self._requests_per_second is not None:
+                self._tokens = min(self._burst, self._tokens + (now - self._updated_at) * self._requests_per_second)
+                self._updated_at = now
+                self._tokens -= 1
+                if self._tokens < 0:
+                    delay = max(delay, -self._tokens / self._requests_per_second)
+
+            return delay
+
+    def pause(self, seconds: float) -> None:
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    @contextlib.contextmanager
+    def acquire(self) -> typing.Iterator[None]:
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+        if self._in_flight is None:
+            yield
+            return
+
+        self._in_flight.acquire()
+        try:
+            yield
+        finally:
+            self._in_flight.release()
+
+    @contextlib.asynccontextmanager
+    async def async_acquire(self) -> typing.AsyncIterator[None]:
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        if self._in_flight is None:
+            yield
+            return
+
+        await self._in_flight.async_acquire()
+        try:
+            yield
+        finally:
+            self._in_flight.release()
+
+
+class RateLimiter:
+    """
+    Limits the requests a Vellum client sends to each endpoint group of its `VellumEnvironment`, with a token bucket
+    of requests per second and a cap on how many requests may be in flight at once. Whenever a response asks us to
+    slow down with a `Retry-After` or `retry-after-ms` header, every request to that group waits it out, rather than
+    only the request being retried.
+
+    Share a single RateLimiter between clients to have them share its limits.
+
+    default: typing.Optional[RateLimit] = None - The limits of requests to the `default` endpoints.
+    documents: typing.Optional[RateLimit] = None - The limits of requests to the `documents` endpoints.
+    predict: typing.Optional[RateLimit] = None - The limits of requests to the `predict` endpoints, which execute
+        prompts and workflows.
+    """
+
+    def __init__(
+        self,
+        *,
+        default: typing.Optional[RateLimit] = None,
+        documents: typing.Optional[RateLimit] = None,
+        predict: typing.Optional[RateLimit] = None,
+    ) -> None:
+        rate_limits = {"default": default, "documents": documents, "predict": predict}
+        self._limiters = {
+            group: _EndpointGroupLimiter(rate_limit or RateLimit()) for group, rate_limit in rate_limits.items()
+        }
+
+    def _get_limiter(self, group: str) -> _EndpointGroupLimiter:
+        return self._limiters.get(group, self._limiters[DEFAULT_ENDPOINT_GROUP])
+
+    def acquire(self, group: str) -> typing.ContextManager[None]:
+        """
+        Waits until a request may be sent to the endpoint group, and holds its place in flight until exited.
+        """
+
+        return self._get_limiter(group).acquire()
+
+    def async_acquire(self, group: str) -> typing.AsyncContextManager[None]:
+        return self._get_limiter(group).async_acquire()
+
+    def pause(self, group: str, seconds: float) -> None:
+        """
+        Holds back every request to the endpoint group for the given number of seconds.
+        """
+
+        self._get_limiter(group).pause(seconds)
+
+
+def get_endpoint_group(environment: VellumEnvironment, base_url: str) -> str:
+    """
+    Returns the endpoint group of the environment that a request to the given base URL is sent to.
+    """
+
+    # Environments that point several groups at the same URL share the limits of the first group that matches
+    for group in ("predict", "documents", "default"):
+        if base_url == getattr(environment, group):
+            return group
+
+    return DEFAULT_ENDPOINT_GROUP
@@ -2,6 +2,8 @@
 
 import typing
 
+from .retries import RetryAttempt
+
 try:
     from typing import NotRequired  # type: ignore
 except ImportError:
@@ -18,6 +20,10 @@ class RequestOptions(typing.TypedDict, total=False):
 
         - max_retries: int. The max number of retries to attempt if the API call fails.
 
+        - deadline_in_seconds: float. The max number of seconds to spend on an API call across all of its attempts and the backoff between them. No retry is attempted once it would end past the deadline.
+
+        - on_retry: typing.Callable[[RetryAttempt], None]. A hook that's called before each retry, with the number of retries so far and the backoff before this one.
+
         - additional_headers: typing.Dict[str, typing.Any]. A dictionary containing additional parameters to spread into the request's header dict
 
         - additional_query_parameters: typing.Dict[str, typing.Any]. A dictionary containing additional parameters to spread into the request's query parameters dict
@@ -27,6 +33,8 @@ class RequestOptions(typing.TypedDict, total=False):
 
     timeout_in_seconds: NotRequired[int]
     max_retries: NotRequired[int]
+    deadline_in_seconds: NotRequired[float]
+    on_retry: NotRequired[typing.Callable[[RetryAttempt], None]]
     additional_headers: NotRequired[typing.Dict[str, typing.Any]]
     additional_query_parameters: NotRequired[typing.Dict[str, typing.Any]]
     additional_body_parameters: NotRequired[typing.Dict[str, typing.Any]]
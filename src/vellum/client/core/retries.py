@@ -0,0 +1,72 @@
+import dataclasses
+import threading
+import typing
+
+DEFAULT_RETRY_BUDGET_MAX_TOKENS = 10.0
+DEFAULT_RETRY_BUDGET_TOKEN_RATIO = 0.1
+
+
+@dataclasses.dataclass(frozen=True)
+class RetryAttempt:
+    """
+    Describes a retry that's about to be made, and is passed to the `on_retry` hook of `RequestOptions`.
+
+    path: typing.Optional[str] - The path of the request being retried.
+    retries: int - How many times the request will have been retried, including this retry.
+    backoff_seconds: float - How long we'll wait before re-sending the request.
+    total_backoff_seconds: float - How long we'll have waited across every retry of the request, including this one.
+    status_code: typing.Optional[int] - The status code of the response being retried, if there was one.
+    error: typing.Optional[Exception] - The error being retried, if the request couldn't be sent.
+    """
+
+    path: typing.Optional[str]
+    retries: int
+    backoff_seconds: float
+    total_backoff_seconds: float
+    status_code: typing.Optional[int] = None
+    error: typing.Optional[Exception] = None
+
+
+class RetryBudget:
+    """
+    A token bucket that stops retries once too many requests are failing, so that a struggling server isn't sent even
+    more traffic. Every retry withdraws a token and every successful attempt deposits a fraction of one, and requests
+    are only retried while the bucket would still be more than half full afterwards.
+
+    Retries aren't budgeted unless a RetryBudget is passed to the Vellum client. Share a single RetryBudget between
+    clients to have them share its tokens.
+
+    max_tokens: float = DEFAULT_RETRY_BUDGET_MAX_TOKENS - How many tokens the bucket starts with and can hold.
+    token_ratio: float = DEFAULT_RETRY_BUDGET_TOKEN_RATIO - How many tokens each successful attempt deposits.
+    """
+
+    def __init__(
+        self,
+        max_tokens: float = DEFAULT_RETRY_BUDGET_MAX_TOKENS,
+        token_ratio: float = DEFAULT_RETRY_BUDGET_TOKEN_RATIO,
+    ) -> None:
+        self.max_tokens = max_tokens
+        self.token_ratio = token_ratio
+        self._tokens = max_tokens
+        self._lock = threading.Lock()
+
+    @property
+    def tokens(self) -> float:
+        return self._tokens
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.token_ratio)
+
+    def acquire_retry(self) -> bool:
+        """
+        Withdraws a token for a retry if there's enough budget left for it, and returns whether it was withdrawn.
+        Failed attempts that won't be retried anyway shouldn't call this, so that they don't use up the budget.
+        """
+
+        with self._lock:
+            if self._tokens - 1 <= self.max_tokens / 2:
+                return False
+
+            self._tokens -= 1
+            return True
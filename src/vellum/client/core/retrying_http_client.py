@@ -0,0 +1,581 @@
+import asyncio
+from contextlib import AsyncExitStack, ExitStack, asynccontextmanager, contextmanager
+from random import random
+import time
+import urllib.parse
+import typing
+
+import httpx
+
+from . import http_client
+from ..environment import VellumEnvironment
+from .file import File, convert_file_dict_to_httpx_tuples
+from .http_client import AsyncHttpClient, HttpClient, get_request_body, remove_omit_from_dict
+from .json_body_encoder import encode_json_body
+from .jsonable_encoder import jsonable_encoder
+from .pydantic_utilities import IS_PYDANTIC_V2
+from .query_encoder import encode_query
+from .rate_limiter import DEFAULT_ENDPOINT_GROUP, RateLimiter, get_endpoint_group
+from .remove_none_from_dict import remove_none_from_dict
+from .request_options import RequestOptions
+from .retries import RetryAttempt, RetryBudget
+from .stream_metrics import record_connection_retry, record_status_retry
+
+# Streams that fail to connect are retried even without `max_retries`, since the request never reached the server
+DEFAULT_STREAM_CONNECTION_RETRIES = 2
+_CONNECTION_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout)
+
+
+def _parse_retry_after(response_headers: httpx.Headers) -> typing.Optional[float]:
+    # The generated parser compares the `retry-after-ms` header to an int before parsing it, and so always ignores it
+    retry_after_ms = response_headers.get("retry-after-ms")
+    if retry_after_ms is not None:
+        try:
+            return max(int(retry_after_ms) / 1000, 0)
+        except ValueError:
+            pass
+
+    return http_client._parse_retry_after(response_headers)
+
+
+def _retry_timeout(response: httpx.Response, retries: int) -> float:
+    # If the API asks us to wait a certain amount of time (and it's a reasonable amount), just do what it says.
+    retry_after = _parse_retry_after(response.headers)
+    if retry_after is not None and retry_after <= http_client.MAX_RETRY_DELAY_SECONDS_FROM_HEADER:
+        return retry_after
+
+    return _backoff_timeout(retries)
+
+
+def _backoff_timeout(retries: int) -> float:
+    # Apply exponential backoff, capped at MAX_RETRY_DELAY_SECONDS.
+    retry_delay = min(http_client.INITIAL_RETRY_DELAY_SECONDS * pow(2.0, retries), http_client.MAX_RETRY_DELAY_SECONDS)
+
+    # Add a randomness / jitter to the retry delay to avoid overwhelming the server with retries.
+    timeout = retry_delay * (1 - 0.25 * random())
+    return timeout if timeout >= 0 else 0
+
+
+def get_json_request_body(
+    *,
+    json: typing.Optional[typing.Any],
+    request_options: typing.Optional[RequestOptions],
+    omit: typing.Optional[typing.Any],
+) -> typing.Optional[bytes]:
+    """
+    Builds the same JSON body as `get_request_body`, but serializes it straight to bytes in a single pass.
+    """
+
+    additional_body_parameters = (
+        request_options.get("additional_body_parameters", {}) or {} if request_options is not None else None
+    )
+    if json is None:
+        body = additional_body_parameters
+    elif not isinstance(json, typing.Mapping):
+        body = json
+    else:
+        body = {**remove_omit_from_dict(json, omit), **(additional_body_parameters or {})}  # type: ignore
+
+    # If you have an empty JSON body, you should just send None
+    if body is None or body == {}:
+        return None
+    return encode_json_body(body)
+
+
+class _Retrier:
+    """
+    Decides whether, and after how long, to re-send a request, keeping track of how many times it's been retried, the
+    retry budget of its client and its deadline.
+    """
+
+    def __init__(
+        self,
+        *,
+        path: typing.Optional[str],
+        request_options: typing.Optional[RequestOptions],
+        retry_budget: typing.Optional[RetryBudget],
+        retries: int,
+        max_connection_retries: int = 0,
+    ) -> None:
+        request_options = request_options if request_options is not None else RequestOptions()
+        max_retries = request_options.get("max_retries")
+        deadline_in_seconds = request_options.get("deadline_in_seconds")
+
+        self.retries = retries
+        self._path = path
+        self._retry_budget = retry_budget
+        self._max_retries = max_retries if max_retries is not None else 0
+        self._max_connection_retries = max_retries if max_retries is not None else max_connection_retries
+        self._on_retry = request_options.get("on_retry")
+        self._deadline = time.monotonic() + deadline_in_seconds if deadline_in_seconds is not None else None
+        self._total_backoff_seconds = 0.0
+
+    def get_timeout(self, timeout: typing.Optional[float]) -> typing.Optional[float]:
+        if self._deadline is None:
+            return timeout
+
+        remaining = max(self._deadline - time.monotonic(), 0.0)
+        return remaining if timeout is None else min(timeout, remaining)
+
+    def get_backoff(
+        self,
+        response: typing.Optional[httpx.Response] = None,
+        error: typing.Optional[Exception] = None,
+    ) -> typing.Optional[float]:
+        """
+        Returns how long to wait before re-sending the request after it failed to connect or received a response, or
+        None if it shouldn't be retried.
+        """
+
+        if response is not None and not http_client._should_retry(response=response):
+            if self._retry_budget is not None:
+                self._retry_budget.record_success()
+            return None
+
+        max_retries = self._max_connection_retries if error is not None else self._max_retries
+        if self.retries >= max_retries:
+            return None
+
+        backoff = (
+            _retry_timeout(response=response, retries=self.retries)
+            if response is not None
+            else _backoff_timeout(self.retries)
+        )
+        if self._deadline is not None and time.monotonic() + backoff >= self._deadline:
+            return None
+
+        # Only checked once we know the request would otherwise be retried, since it withdraws from the budget
+        if self._retry_budget is not None and not self._retry_budget.acquire_retry():
+            return None
+
+        self.retries += 1
+        self._total_backoff_seconds += backoff
+        if self._on_retry is not None:
+            self._on_retry(
+                RetryAttempt(
+                    path=self._path,
+                    retries=self.retries,
+                    backoff_seconds=backoff,
+                    total_backoff_seconds=self._total_backoff_seconds,
+                    status_code=response.status_code if response is not None else None,
+                    error=error,
+                )
+            )
+
+        return backoff
+
+
+def _build_request(
+    httpx_client: typing.Union[httpx.Client, httpx.AsyncClient],
+    *,
+    url: str,
+    method: str,
+    base_headers: typing.Dict[str, str],
+    params: typing.Optional[typing.Dict[str, typing.Any]],
+    json: typing.Optional[typing.Any],
+    data: typing.Optional[typing.Any],
+    content: typing.Optional[typing.Union[bytes, typing.Iterator[bytes], typing.AsyncIterator[bytes]]],
+    files: typing.Optional[typing.Dict[str, typing.Optional[typing.Union[File, typing.List[File]]]]],
+    headers: typing.Optional[typing.Dict[str, typing.Any]],
+    request_options: typing.Optional[RequestOptions],
+    omit: typing.Optional[typing.Any],
+) -> httpx.Request:
+    """
+    Encodes a request once, so that it can be re-sent as is on every retry.
+    """
+
+    json_body: typing.Optional[typing.Any] = None
+    data_body: typing.Optional[typing.Any] = None
+    is_json_content = False
+    if IS_PYDANTIC_V2 and data is None and content is None and files is None:
+        content = get_json_request_body(json=json, request_options=request_options, omit=omit)
+        is_json_content = content is not None
+    else:
+        json_body, data_body = get_request_body(json=json, data=data, request_options=request_options, omit=omit)
+
+    request = httpx_client.build_request(
+        method=method,
+        url=url,
+        headers=jsonable_encoder(
+            remove_none_from_dict(
+                {
+                    **base_headers,
+                    **(headers if headers is not None else {}),
+                    **(request_options.get("additional_headers", {}) or {} if request_options is not None else {}),
+                }
+            )
+        ),
+        params=encode_query(
+            jsonable_encoder(
+                remove_none_from_dict(
+                    remove_omit_from_dict(
+                        {
+                            **(params if params is not None else {}),
+                            **(
+                                request_options.get("additional_query_parameters", {}) or {}
+                                if request_options is not None
+                                else {}
+                            ),
+                        },
+                        omit,
+                    )
+                )
+            )
+        ),
+        json=json_body,
+        data=data_body,
+        content=content,
+        files=(
+            convert_file_dict_to_httpx_tuples(remove_none_from_dict(files))
+            if (files is not None and files is not omit)
+            else None
+        ),
+    )
+    if is_json_content:
+        request.headers.setdefault("Content-Type", "application/json")
+    return request
+
+
+def _set_request_timeout(request: httpx.Request, timeout: typing.Optional[float]) -> None:
+    request.extensions["timeout"] = httpx.Timeout(timeout).as_dict()
+
+
+def _pause_for_retry_after(rate_limiter: typing.Optional[RateLimiter], group: str, response: httpx.Response) -> None:
+    """
+    Holds back every request to the endpoint group when the server asks us to slow down, so that requests other than
+    the one being retried don't keep running into the same limit.
+    """
+
+    if rate_limiter is None or response.status_code not in (429, 503):
+        return
+
+    retry_after = _parse_retry_after(response.headers)
+    if retry_after is not None and retry_after <= http_client.MAX_RETRY_DELAY_SECONDS_FROM_HEADER:
+        rate_limiter.pause(group, retry_after)
+
+
+class RetryingHttpClient(HttpClient):
+    """
+    The HttpClient that the Vellum client sends its requests through, installed over the generated one by a hook in
+    `client_wrapper.py`. Each request is encoded once and re-sent in a loop, rather than re-encoded on every recursive
+    retry, and is subject to the client's rate limiter and retry budget, and to its own deadline. Streams are also
+    retried when they fail before any of their response has been read.
+
+    retry_budget: typing.Optional[RetryBudget] = None - Stops retries once too many requests are failing. Retries
+        aren't budgeted without one.
+    rate_limiter: typing.Optional[RateLimiter] = None - Limits the rate and concurrency of requests.
+    get_environment: typing.Optional[typing.Callable[[], VellumEnvironment]] = None - Returns the environment whose
+        endpoint groups the rate limiter's limits apply to.
+    """
+
+    def __init__(
+        self,
+        *,
+        httpx_client: httpx.Client,
+        base_timeout: typing.Callable[[], typing.Optional[float]],
+        base_headers: typing.Callable[[], typing.Dict[str, str]],
+        base_url: typing.Optional[typing.Callable[[], str]] = None,
+        retry_budget: typing.Optional[RetryBudget] = None,
+        rate_limiter: typing.Optional[RateLimiter] = None,
+        get_environment: typing.Optional[typing.Callable[[], VellumEnvironment]] = None,
+    ):
+        super().__init__(
+            httpx_client=httpx_client, base_timeout=base_timeout, base_headers=base_headers, base_url=base_url
+        )
+        self.retry_budget = retry_budget
+        self.rate_limiter = rate_limiter
+        self.get_environment = get_environment
+
+    def request(
+        self,
+        path: typing.Optional[str] = None,
+        *,
+        method: str,
+        base_url: typing.Optional[str] = None,
+        params: typing.Optional[typing.Dict[str, typing.Any]] = None,
+        json: typing.Optional[typing.Any] = None,
+        data: typing.Optional[typing.Any] = None,
+        content: typing.Optional[typing.Union[bytes, typing.Iterator[bytes], typing.AsyncIterator[bytes]]] = None,
+        files: typing.Optional[typing.Dict[str, typing.Optional[typing.Union[File, typing.List[File]]]]] = None,
+        headers: typing.Optional[typing.Dict[str, typing.Any]] = None,
+        request_options: typing.Optional[RequestOptions] = None,
+        retries: int = 0,
+        omit: typing.Optional[typing.Any] = None,
+    ) -> httpx.Response:
+        base_url = self.get_base_url(base_url)
+        group = self._get_endpoint_group(base_url)
+        timeout = self._get_timeout(request_options)
+        request = _build_request(
+            self.httpx_client,
+            url=urllib.parse.urljoin(f"{base_url}/", path),
+            method=method,
+            base_headers=self.base_headers(),
+            params=params,
+            json=json,
+            data=data,
+            content=content,
+            files=files,
+            headers=headers,
+            request_options=request_options,
+            omit=omit,
+        )
+        retrier = _Retrier(path=path, request_options=request_options, retry_budget=self.retry_budget, retries=retries)
+
+        while True:
+            _set_request_timeout(request, retrier.get_timeout(timeout))
+            with self._limit(group):
+                response = self.httpx_client.send(request)
+
+            _pause_for_retry_after(self.rate_limiter, group, response)
+            backoff = retrier.get_backoff(response=response)
+            if backoff is None:
+                return response
+
+            time.sleep(backoff)
+
+    @contextmanager
+    def stream(
+        self,
+        path: typing.Optional[str] = None,
+        *,
+        method: str,
+        base_url: typing.Optional[str] = None,
+        params: typing.Optional[typing.Dict[str, typing.Any]] = None,
+        json: typing.Optional[typing.Any] = None,
+        data: typing.Optional[typing.Any] = None,
+        content: typing.Optional[typing.Union[bytes, typing.Iterator[bytes], typing.AsyncIterator[bytes]]] = None,
+        files: typing.Optional[typing.Dict[str, typing.Optional[typing.Union[File, typing.List[File]]]]] = None,
+        headers: typing.Optional[typing.Dict[str, typing.Any]] = None,
+        request_options: typing.Optional[RequestOptions] = None,
+        retries: int = 0,
+        omit: typing.Optional[typing.Any] = None,
+    ) -> typing.Iterator[httpx.Response]:
+        base_url = self.get_base_url(base_url)
+        group = self._get_endpoint_group(base_url)
+        timeout = self._get_timeout(request_options)
+        request = _build_request(
+            self.httpx_client,
+            url=urllib.parse.urljoin(f"{base_url}/", path),
+            method=method,
+            base_headers=self.base_headers(),
+            params=params,
+            json=json,
+            data=data,
+            content=content,
+            files=files,
+            headers=headers,
+            request_options=request_options,
+            omit=omit,
+        )
+        retrier = _Retrier(
+            path=path,
+            request_options=request_options,
+            retry_budget=self.retry_budget,
+            retries=retries,
+            max_connection_retries=DEFAULT_STREAM_CONNECTION_RETRIES,
+        )
+
+        while True:
+            _set_request_timeout(request, retrier.get_timeout(timeout))
+            # The response holds its place in flight until it's been streamed in full
+            with ExitStack() as exit_stack:
+                exit_stack.enter_context(self._limit(group))
+                try:
+                    response = self.httpx_client.send(request, stream=True)
+                except _CONNECTION_ERRORS as error:
+                    backoff = retrier.get_backoff(error=error)
+                    if backoff is None:
+                        raise
+                    record_connection_retry(path, error)
+                else:
+                    exit_stack.callback(response.close)
+                    _pause_for_retry_after(self.rate_limiter, group, response)
+                    backoff = retrier.get_backoff(response=response)
+                    if backoff is None:
+                        yield response
+                        return
+
+                    record_status_retry(path, response.status_code)
+
+            time.sleep(backoff)
+
+    @contextmanager
+    def _limit(self, group: str) -> typing.Iterator[None]:
+        if self.rate_limiter is None:
+            yield
+            return
+
+        with self.rate_limiter.acquire(group):
+            yield
+
+    def _get_endpoint_group(self, base_url: str) -> str:
+        if self.get_environment is None:
+            return DEFAULT_ENDPOINT_GROUP
+
+        return get_endpoint_group(self.get_environment(), base_url)
+
+    def _get_timeout(self, request_options: typing.Optional[RequestOptions]) -> typing.Optional[float]:
+        return (
+            request_options.get("timeout_in_seconds")
+            if request_options is not None and request_options.get("timeout_in_seconds") is not None
+            else self.base_timeout()
+        )
+
+
+class AsyncRetryingHttpClient(AsyncHttpClient):
+    """
+    The async counterpart of `RetryingHttpClient`.
+    """
+
+    def __init__(
+        self,
+        *,
+        httpx_client: httpx.AsyncClient,
+        base_timeout: typing.Callable[[], typing.Optional[float]],
+        base_headers: typing.Callable[[], typing.Dict[str, str]],
+        base_url: typing.Optional[typing.Callable[[], str]] = None,
+        retry_budget: typing.Optional[RetryBudget] = None,
+        rate_limiter: typing.Optional[RateLimiter] = None,
+        get_environment: typing.Optional[typing.Callable[[], VellumEnvironment]] = None,
+    ):
+        super().__init__(
+            httpx_client=httpx_client, base_timeout=base_timeout, base_headers=base_headers, base_url=base_url
+        )
+        self.retry_budget = retry_budget
+        self.rate_limiter = rate_limiter
+        self.get_environment = get_environment
+
+    async def request(
+        self,
+        path: typing.Optional[str] = None,
+        *,
+        method: str,
+        base_url: typing.Optional[str] = None,
+        params: typing.Optional[typing.Dict[str, typing.Any]] = None,
+        json: typing.Optional[typing.Any] = None,
+        data: typing.Optional[typing.Any] = None,
+        content: typing.Optional[typing.Union[bytes, typing.Iterator[bytes], typing.AsyncIterator[bytes]]] = None,
+        files: typing.Optional[typing.Dict[str, typing.Optional[typing.Union[File, typing.List[File]]]]] = None,
+        headers: typing.Optional[typing.Dict[str, typing.Any]] = None,
+        request_options: typing.Optional[RequestOptions] = None,
+        retries: int = 0,
+        omit: typing.Optional[typing.Any] = None,
+    ) -> httpx.Response:
+        base_url = self.get_base_url(base_url)
+        group = self._get_endpoint_group(base_url)
+        timeout = self._get_timeout(request_options)
+        request = _build_request(
+            self.httpx_client,
+            url=urllib.parse.urljoin(f"{base_url}/", path),
+            method=method,
+            base_headers=self.base_headers(),
+            params=params,
+            json=json,
+            data=data,
+            content=content,
+            files=files,
+            headers=headers,
+            request_options=request_options,
+            omit=omit,
+        )
+        retrier = _Retrier(path=path, request_options=request_options, retry_budget=self.retry_budget, retries=retries)
+
+        while True:
+            _set_request_timeout(request, retrier.get_timeout(timeout))
+            async with self._limit(group):
+                response = await self.httpx_client.send(request)
+
+            _pause_for_retry_after(self.rate_limiter, group, response)
+            backoff = retrier.get_backoff(response=response)
+            if backoff is None:
+                return response
+
+            await asyncio.sleep(backoff)
+
+    @asynccontextmanager
+    async def stream(
+        self,
+        path: typing.Optional[str] = None,
+        *,
+        method: str,
+        base_url: typing.Optional[str] = None,
+        params: typing.Optional[typing.Dict[str, typing.Any]] = None,
+        json: typing.Optional[typing.Any] = None,
+        data: typing.Optional[typing.Any] = None,
+        content: typing.Optional[typing.Union[bytes, typing.Iterator[bytes], typing.AsyncIterator[bytes]]] = None,
+        files: typing.Optional[typing.Dict[str, typing.Optional[typing.Union[File, typing.List[File]]]]] = None,
+        headers: typing.Optional[typing.Dict[str, typing.Any]] = None,
+        request_options: typing.Optional[RequestOptions] = None,
+        retries: int = 0,
+        omit: typing.Optional[typing.Any] = None,
+    ) -> typing.AsyncIterator[httpx.Response]:
+        base_url = self.get_base_url(base_url)
+        group = self._get_endpoint_group(base_url)
+        timeout = self._get_timeout(request_options)
+        request = _build_request(
+            self.httpx_client,
+            url=urllib.parse.urljoin(f"{base_url}/", path),
+            method=method,
+            base_headers=self.base_headers(),
+            params=params,
+            json=json,
+            data=data,
+            content=content,
+            files=files,
+            headers=headers,
+            request_options=request_options,
+            omit=omit,
+        )
+        retrier = _Retrier(
+            path=path,
+            request_options=request_options,
+            retry_budget=self.retry_budget,
+            retries=retries,
+            max_connection_retries=DEFAULT_STREAM_CONNECTION_RETRIES,
+        )
+
+        while True:
+            _set_request_timeout(request, retrier.get_timeout(timeout))
+            # The response holds its place in flight until it's been streamed in full
+            async with AsyncExitStack() as exit_stack:
+                await exit_stack.enter_async_context(self._limit(group))
+                try:
+                    response = await self.httpx_client.send(request, stream=True)
+                except _CONNECTION_ERRORS as error:
+                    backoff = retrier.get_backoff(error=error)
+                    if backoff is None:
+                        raise
+                    record_connection_retry(path, error)
+                else:
+                    exit_stack.push_async_callback(response.aclose)
+                    _pause_for_retry_after(self.rate_limiter, group, response)
+                    backoff = retrier.get_backoff(response=response)
+                    if backoff is None:
+                        yield response
+                        return
+
+                    record_status_retry(path, response.status_code)
+
+            await asyncio.sleep(typing.cast(float, backoff))
+
+    @asynccontextmanager
+    async def _limit(self, group: str) -> typing.AsyncIterator[None]:
+        if self.rate_limiter is None:
+            yield
+            return
+
+        async with self.rate_limiter.async_acquire(group):
+            yield
+
+    def _get_endpoint_group(self, base_url: str) -> str:
+        if self.get_environment is None:
+            return DEFAULT_ENDPOINT_GROUP
+
+        return get_endpoint_group(self.get_environment(), base_url)
+
+    def _get_timeout(self, request_options: typing.Optional[RequestOptions]) -> typing.Optional[float]:
+        return (
+            request_options.get("timeout_in_seconds")
+            if request_options is not None and request_options.get("timeout_in_seconds") is not None
+            else self.base_timeout()
+        )
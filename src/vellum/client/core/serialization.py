@@ -8,6 +8,8 @@ import typing_extensions
 
 import pydantic
 
+from .type_caches import has_annotation_metadata
+
 
 class FieldMetadata:
     """
@@ -57,6 +59,9 @@ def convert_and_respect_annotation_metadata(
     if object_ is None:
         return None
     if inner_type is None:
+        # Nothing to convert if no field within the type is annotated, so skip walking the object entirely
+        if not has_annotation_metadata(annotation):
+            return object_
         inner_type = annotation
 
     clean_type = _remove_annotations(inner_type)
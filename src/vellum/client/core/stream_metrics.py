@@ -0,0 +1,56 @@
+import dataclasses
+import logging
+import threading
+import typing
+
+logger = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass(frozen=True)
+class StreamMetrics:
+    """
+    A point-in-time view of how streaming requests have fared across every client in the process.
+
+    connection_retries: int - Streams that were re-sent because a connection couldn't be established.
+    status_retries: int - Streams that were re-sent because they were rejected with a retriable status code.
+    dropped_lines: int - Lines of a successful stream that were skipped because they couldn't be parsed.
+    """
+
+    connection_retries: int = 0
+    status_retries: int = 0
+    dropped_lines: int = 0
+
+
+_stream_metrics = StreamMetrics()
+_stream_metrics_lock = threading.Lock()
+
+
+def _increment(field: str) -> None:
+    global _stream_metrics
+    with _stream_metrics_lock:
+        _stream_metrics = dataclasses.replace(_stream_metrics, **{field: getattr(_stream_metrics, field) + 1})
+
+
+def record_connection_retry(path: typing.Optional[str], error: Exception) -> None:
+    _increment("connection_retries")
+    logger.debug("Retrying stream to %s after failing to connect: %s", path, error)
+
+
+def record_status_retry(path: typing.Optional[str], status_code: int) -> None:
+    _increment("status_retries")
+    logger.debug("Retrying stream to %s after a %s response", path, status_code)
+
+
+def record_dropped_stream_line(path: typing.Optional[str]) -> None:
+    _increment("dropped_lines")
+    logger.debug("Dropped a line from the stream to %s that couldn't be parsed", path, exc_info=True)
+
+
+def get_stream_metrics() -> StreamMetrics:
+    return _stream_metrics
+
+
+def reset_stream_metrics() -> None:
+    global _stream_metrics
+    with _stream_metrics_lock:
+        _stream_metrics = StreamMetrics()
@@ -0,0 +1,73 @@
+import inspect
+import typing
+import typing_extensions
+
+import pydantic
+
+T = typing.TypeVar("T")
+
+_TYPE_ADAPTER_CACHE: typing.Dict[typing.Any, typing.Any] = {}
+
+_HAS_ANNOTATION_METADATA_CACHE: typing.Dict[typing.Any, bool] = {}
+
+
+def get_type_adapter(type_: typing.Type[T]) -> "pydantic.TypeAdapter[T]":
+    """
+    Returns a TypeAdapter for the given type, building it at most once per type since doing so means
+    generating a full validation schema.
+    """
+    try:
+        return _TYPE_ADAPTER_CACHE[type_]
+    except KeyError:
+        adapter = pydantic.TypeAdapter(type_)  # type: ignore # Pydantic v2
+        _TYPE_ADAPTER_CACHE[type_] = adapter
+        return adapter
+    except TypeError:
+        # Unhashable annotations can't be cached
+        return pydantic.TypeAdapter(type_)  # type: ignore # Pydantic v2
+
+
+def has_annotation_metadata(type_: typing.Any) -> bool:
+    """
+    Whether any field within the given type tree is annotated with `FieldMetadata`. When it isn't,
+    `convert_and_respect_annotation_metadata` is a no-op for that type and can be skipped entirely.
+
+    Results are cached per type. Types whose hints can't be resolved yet are conservatively assumed to
+    have annotation metadata and are not cached.
+    """
+    try:
+        return _HAS_ANNOTATION_METADATA_CACHE[type_]
+    except KeyError:
+        pass
+    except TypeError:
+        # Unhashable annotations can't be cached, so always take the slow path for them
+        return True
+
+    try:
+        result = _type_tree_has_annotation_metadata(type_, visited=set())
+    except Exception:
+        return True
+
+    _HAS_ANNOTATION_METADATA_CACHE[type_] = result
+    return result
+
+
+def _type_tree_has_annotation_metadata(type_: typing.Any, visited: typing.Set[int]) -> bool:
+    # Imported here since `serialization` imports this module to skip the types it has nothing to convert in
+    from .serialization import _get_alias_from_type, _remove_annotations
+
+    if _get_alias_from_type(type_) is not None:
+        return True
+
+    clean_type = _remove_annotations(type_)
+    if typing_extensions.get_origin(clean_type) is typing.ClassVar or id(clean_type) in visited:
+        return False
+    visited.add(id(clean_type))
+
+    if inspect.isclass(clean_type) and (
+        issubclass(clean_type, pydantic.BaseModel) or typing_extensions.is_typeddict(clean_type)
+    ):
+        annotations = typing_extensions.get_type_hints(clean_type, include_extras=True)
+        return any(_type_tree_has_annotation_metadata(hint, visited) for hint in annotations.values())
+
+    return any(_type_tree_has_annotation_metadata(arg, visited) for arg in typing_extensions.get_args(clean_type))
@@ -0,0 +1,361 @@
+from json.decoder import JSONDecodeError
+import typing
+
+import httpx
+
+from .core.api_error import ApiError
+from .core.batch import (
+    DEFAULT_BATCH_MAX_CONCURRENCY,
+    DEFAULT_BATCH_MAX_RETRIES,
+    BatchResult,
+    aexecute_batch,
+    create_json_body_encoder,
+    execute_batch,
+)
+from .core.client_wrapper import AsyncClientWrapper, SyncClientWrapper
+from .core.http_client import remove_omit_from_dict
+from .core.pydantic_utilities import parse_obj_as
+from .core.request_options import RequestOptions
+from .core.serialization import convert_and_respect_annotation_metadata
+from .errors.bad_request_error import BadRequestError
+from .errors.forbidden_error import ForbiddenError
+from .errors.internal_server_error import InternalServerError
+from .errors.not_found_error import NotFoundError
+from .types.execute_prompt_response import ExecutePromptResponse
+from .types.prompt_deployment_expand_meta_request import PromptDeploymentExpandMetaRequest
+from .types.prompt_deployment_input_request import PromptDeploymentInputRequest
+from .types.raw_prompt_execution_overrides_request import RawPromptExecutionOverridesRequest
+
+# this is used as the default value for optional parameters
+OMIT = typing.cast(typing.Any, ...)
+
+
+def _parse_execute_prompt_response(_response: httpx.Response) -> ExecutePromptResponse:
+    try:
+        if 200 <= _response.status_code < 300:
+            return typing.cast(
+                ExecutePromptResponse,
+                parse_obj_as(
+                    type_=ExecutePromptResponse,  # type: ignore
+                    object_=_response.json(),
+                ),
+            )
+        if _response.status_code == 400:
+            raise BadRequestError(
+                typing.cast(
+                    typing.Optional[typing.Any],
+                    parse_obj_as(
+                        type_=typing.Optional[typing.Any],  # type: ignore
+                        object_=_response.json(),
+                    ),
+                )
+            )
+        if _response.status_code == 403:
+            raise ForbiddenError(
+                typing.cast(
+                    typing.Optional[typing.Any],
+                    parse_obj_as(
+                        type_=typing.Optional[typing.Any],  # type: ignore
+                        object_=_response.json(),
+                    ),
+                )
+            )
+        if _response.status_code == 404:
+            raise NotFoundError(
+                typing.cast(
+                    typing.Optional[typing.Any],
+                    parse_obj_as(
+                        type_=typing.Optional[typing.Any],  # type: ignore
+                        object_=_response.json(),
+                    ),
+                )
+            )
+        if _response.status_code == 500:
+            raise InternalServerError(
+                typing.cast(
+                    typing.Optional[typing.Any],
+                    parse_obj_as(
+                        type_=typing.Optional[typing.Any],  # type: ignore
+                        object_=_response.json(),
+                    ),
+                )
+            )
+        _response_json = _response.json()
+    except JSONDecodeError:
+        raise ApiError(status_code=_response.status_code, body=_response.text)
+    raise ApiError(status_code=_response.status_code, body=_response_json)
+
+
+def _create_execute_prompt_body_encoder(
+    *,
+    prompt_deployment_id: typing.Optional[str],
+    prompt_deployment_name: typing.Optional[str],
+    release_tag: typing.Optional[str],
+    expand_meta: typing.Optional[PromptDeploymentExpandMetaRequest],
+    raw_overrides: typing.Optional[RawPromptExecutionOverridesRequest],
+    expand_raw: typing.Optional[typing.Sequence[str]],
+    metadata: typing.Optional[typing.Dict[str, typing.Optional[typing.Any]]],
+    request_options: RequestOptions,
+) -> typing.Callable[[typing.Sequence[PromptDeploymentInputRequest]], bytes]:
+    encode_body = create_json_body_encoder(
+        remove_omit_from_dict(
+            {
+                "prompt_deployment_id": prompt_deployment_id,
+                "prompt_deployment_name": prompt_deployment_name,
+                "release_tag": release_tag,
+                "expand_meta": convert_and_respect_annotation_metadata(
+                    object_=expand_meta, annotation=PromptDeploymentExpandMetaRequest, direction="write"
+                ),
+                "raw_overrides": convert_and_respect_annotation_metadata(
+                    object_=raw_overrides, annotation=RawPromptExecutionOverridesRequest, direction="write"
+                ),
+                "expand_raw": expand_raw,
+                "metadata": metadata,
+                **(request_options.get("additional_body_parameters") or {}),
+            },
+            OMIT,
+        )
+    )
+
+    def encode(inputs: typing.Sequence[PromptDeploymentInputRequest]) -> bytes:
+        return encode_body(
+            {
+                "inputs": convert_and_respect_annotation_metadata(
+                    object_=inputs, annotation=typing.Sequence[PromptDeploymentInputRequest], direction="write"
+                )
+            }
+        )
+
+    return encode
+
+
+class PromptBatchMixin:
+    """
+    Adds `execute_prompt_batch` to the `Vellum` client, which it's mixed into by a hook in the generated `client.py`.
+    """
+
+    _client_wrapper: SyncClientWrapper
+
+    def execute_prompt_batch(
+        self,
+        *,
+        input_sets: typing.Iterable[typing.Sequence[PromptDeploymentInputRequest]],
+        prompt_deployment_id: typing.Optional[str] = OMIT,
+        prompt_deployment_name: typing.Optional[str] = OMIT,
+        release_tag: typing.Optional[str] = OMIT,
+        expand_meta: typing.Optional[PromptDeploymentExpandMetaRequest] = OMIT,
+        raw_overrides: typing.Optional[RawPromptExecutionOverridesRequest] = OMIT,
+        expand_raw: typing.Optional[typing.Sequence[str]] = OMIT,
+        metadata: typing.Optional[typing.Dict[str, typing.Optional[typing.Any]]] = OMIT,
+        max_concurrency: int = DEFAULT_BATCH_MAX_CONCURRENCY,
+        ordered: bool = True,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.Iterator[BatchResult[typing.Sequence[PromptDeploymentInputRequest], ExecutePromptResponse]]:
+        """
+        Executes a deployed Prompt once for each of a batch of input sets, sending up to `max_concurrency` requests at
+        once over the client's pooled connections. The fields shared by every request are only encoded once.
+
+        Parameters
+        ----------
+        input_sets : typing.Iterable[typing.Sequence[PromptDeploymentInputRequest]]
+            The input variables of each execution. They're read lazily, so this may be a generator over a large dataset.
+
+        prompt_deployment_id : typing.Optional[str]
+            The ID of the Prompt Deployment. Must provide either this or prompt_deployment_name.
+
+        prompt_deployment_name : typing.Optional[str]
+            The unique name of the Prompt Deployment. Must provide either this or prompt_deployment_id.
+
+        release_tag : typing.Optional[str]
+            Optionally specify a release tag if you want to pin to a specific release of the Prompt Deployment
+
+        expand_meta : typing.Optional[PromptDeploymentExpandMetaRequest]
+            An optionally specified configuration used to opt in to including additional metadata about each prompt execution in its response.
+
+        raw_overrides : typing.Optional[RawPromptExecutionOverridesRequest]
+            Overrides for the raw API request sent to the model host.
+
+        expand_raw : typing.Optional[typing.Sequence[str]]
+            A list of keys whose values you'd like to directly return from the JSON response of the model provider.
+
+        metadata : typing.Optional[typing.Dict[str, typing.Optional[typing.Any]]]
+            Arbitrary JSON metadata associated with every execution of the batch.
+
+        max_concurrency : int
+            The max number of executions to run at once.
+
+        ordered : bool
+            Whether to yield results in the order of `input_sets`, rather than as soon as each one completes.
+
+        request_options : typing.Optional[RequestOptions]
+            Request-specific configuration, applied to each execution. Failed executions are retried up to `max_retries` times, which defaults to 2.
+
+        Returns
+        -------
+        typing.Iterator[BatchResult[typing.Sequence[PromptDeploymentInputRequest], ExecutePromptResponse]]
+            The result of each execution, with the error it failed with in place of a response if it couldn't be executed.
+
+        Examples
+        --------
+        from vellum import StringInputRequest, Vellum
+
+        client = Vellum(
+            api_key="YOUR_API_KEY",
+        )
+        for result in client.execute_prompt_batch(
+            input_sets=[
+                [StringInputRequest(name="question", value=question)]
+                for question in ["Why?", "How?"]
+            ],
+            prompt_deployment_name="my-deployment",
+        ):
+            print(result.index, result.result or result.error)
+        """
+        request_options = {"max_retries": DEFAULT_BATCH_MAX_RETRIES, **(request_options or {})}
+        encode_body = _create_execute_prompt_body_encoder(
+            prompt_deployment_id=prompt_deployment_id,
+            prompt_deployment_name=prompt_deployment_name,
+            release_tag=release_tag,
+            expand_meta=expand_meta,
+            raw_overrides=raw_overrides,
+            expand_raw=expand_raw,
+            metadata=metadata,
+            request_options=request_options,
+        )
+        # The additional body parameters have been encoded into the shared fields of every body
+        request_options = {**request_options, "additional_body_parameters": {}}
+
+        def execute(inputs: typing.Sequence[PromptDeploymentInputRequest]) -> ExecutePromptResponse:
+            _response = self._client_wrapper.httpx_client.request(
+                "v1/execute-prompt",
+                base_url=self._client_wrapper.get_environment().predict,
+                method="POST",
+                content=encode_body(inputs),
+                headers={"Content-Type": "application/json"},
+                request_options=request_options,
+                omit=OMIT,
+            )
+            return _parse_execute_prompt_response(_response)
+
+        return execute_batch(execute, input_sets, max_concurrency=max_concurrency, ordered=ordered)
+
+
+class AsyncPromptBatchMixin:
+    """
+    Adds `execute_prompt_batch` to the `AsyncVellum` client, which it's mixed into by a hook in the generated
+    `client.py`.
+    """
+
+    _client_wrapper: AsyncClientWrapper
+
+    async def execute_prompt_batch(
+        self,
+        *,
+        input_sets: typing.Iterable[typing.Sequence[PromptDeploymentInputRequest]],
+        prompt_deployment_id: typing.Optional[str] = OMIT,
+        prompt_deployment_name: typing.Optional[str] = OMIT,
+        release_tag: typing.Optional[str] = OMIT,
+        expand_meta: typing.Optional[PromptDeploymentExpandMetaRequest] = OMIT,
+        raw_overrides: typing.Optional[RawPromptExecutionOverridesRequest] = OMIT,
+        expand_raw: typing.Optional[typing.Sequence[str]] = OMIT,
+        metadata: typing.Optional[typing.Dict[str, typing.Optional[typing.Any]]] = OMIT,
+        max_concurrency: int = DEFAULT_BATCH_MAX_CONCURRENCY,
+        ordered: bool = True,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.AsyncIterator[BatchResult[typing.Sequence[PromptDeploymentInputRequest], ExecutePromptResponse]]:
+        """
+        Executes a deployed Prompt once for each of a batch of input sets, sending up to `max_concurrency` requests at
+        once over the client's pooled connections. The fields shared by every request are only encoded once.
+
+        Parameters
+        ----------
+        input_sets : typing.Iterable[typing.Sequence[PromptDeploymentInputRequest]]
+            The input variables of each execution. They're read lazily, so this may be a generator over a large dataset.
+
+        prompt_deployment_id : typing.Optional[str]
+            The ID of the Prompt Deployment. Must provide either this or prompt_deployment_name.
+
+        prompt_deployment_name : typing.Optional[str]
+            The unique name of the Prompt Deployment. Must provide either this or prompt_deployment_id.
+
+        release_tag : typing.Optional[str]
+            Optionally specify a release tag if you want to pin to a specific release of the Prompt Deployment
+
+        expand_meta : typing.Optional[PromptDeploymentExpandMetaRequest]
+            An optionally specified configuration used to opt in to including additional metadata about each prompt execution in its response.
+
+        raw_overrides : typing.Optional[RawPromptExecutionOverridesRequest]
+            Overrides for the raw API request sent to the model host.
+
+        expand_raw : typing.Optional[typing.Sequence[str]]
+            A list of keys whose values you'd like to directly return from the JSON response of the model provider.
+
+        metadata : typing.Optional[typing.Dict[str, typing.Optional[typing.Any]]]
+            Arbitrary JSON metadata associated with every execution of the batch.
+
+        max_concurrency : int
+            The max number of executions to run at once.
+
+        ordered : bool
+            Whether to yield results in the order of `input_sets`, rather than as soon as each one completes.
+
+        request_options : typing.Optional[RequestOptions]
+            Request-specific configuration, applied to each execution. Failed executions are retried up to `max_retries` times, which defaults to 2.
+
+        Returns
+        -------
+        typing.AsyncIterator[BatchResult[typing.Sequence[PromptDeploymentInputRequest], ExecutePromptResponse]]
+            The result of each execution, with the error it failed with in place of a response if it couldn't be executed.
+
+        Examples
+        --------
+        import asyncio
+
+        from vellum import AsyncVellum, StringInputRequest
+
+        client = AsyncVellum(
+            api_key="YOUR_API_KEY",
+        )
+
+
+        async def main() -> None:
+            async for result in client.execute_prompt_batch(
+                input_sets=[
+                    [StringInputRequest(name="question", value=question)]
+                    for question in ["Why?", "How?"]
+                ],
+                prompt_deployment_name="my-deployment",
+            ):
+                print(result.index, result.result or result.error)
+
+
+        asyncio.run(main())
+        """
+        request_options = {"max_retries": DEFAULT_BATCH_MAX_RETRIES, **(request_options or {})}
+        encode_body = _create_execute_prompt_body_encoder(
+            prompt_deployment_id=prompt_deployment_id,
+            prompt_deployment_name=prompt_deployment_name,
+            release_tag=release_tag,
+            expand_meta=expand_meta,
+            raw_overrides=raw_overrides,
+            expand_raw=expand_raw,
+            metadata=metadata,
+            request_options=request_options,
+        )
+        # The additional body parameters have been encoded into the shared fields of every body
+        request_options = {**request_options, "additional_body_parameters": {}}
+
+        async def execute(inputs: typing.Sequence[PromptDeploymentInputRequest]) -> ExecutePromptResponse:
+            _response = await self._client_wrapper.httpx_client.request(
+                "v1/execute-prompt",
+                base_url=self._client_wrapper.get_environment().predict,
+                method="POST",
+                content=encode_body(inputs),
+                headers={"Content-Type": "application/json"},
+                request_options=request_options,
+                omit=OMIT,
+            )
+            return _parse_execute_prompt_response(_response)
+
+        async for result in aexecute_batch(execute, input_sets, max_concurrency=max_concurrency, ordered=ordered):
+            yield result
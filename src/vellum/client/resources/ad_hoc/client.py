@@ -13,6 +13,7 @@ from ...core.request_options import RequestOptions
 from ...types.ad_hoc_execute_prompt_event import AdHocExecutePromptEvent
 from ...core.serialization import convert_and_respect_annotation_metadata
 from ...core.pydantic_utilities import parse_obj_as
+from ...core.stream_metrics import record_dropped_stream_line
 import json
 from ...errors.bad_request_error import BadRequestError
 from ...errors.forbidden_error import ForbiddenError
@@ -153,8 +154,8 @@ class AdHocClient:
                                     object_=json.loads(_text),
                                 ),
                             )
-                        except:
-                            pass
+                        except Exception:
+                            record_dropped_stream_line("v1/ad-hoc/execute-prompt-stream")
                     return
                 _response.read()
                 if _response.status_code == 400:
@@ -329,8 +330,8 @@ class AsyncAdHocClient:
                                     object_=json.loads(_text),
                                 ),
                             )
-                        except:
-                            pass
+                        except Exception:
+                            record_dropped_stream_line("v1/ad-hoc/execute-prompt-stream")
                     return
                 await _response.aread()
                 if _response.status_code == 400:
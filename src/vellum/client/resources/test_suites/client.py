@@ -6,6 +6,7 @@ from ...core.request_options import RequestOptions
 from ...types.paginated_test_suite_test_case_list import PaginatedTestSuiteTestCaseList
 from ...core.jsonable_encoder import jsonable_encoder
 from ...core.pydantic_utilities import parse_obj_as
+from ...core.stream_metrics import record_dropped_stream_line
 from json.decoder import JSONDecodeError
 from ...core.api_error import ApiError
 from ...types.named_test_case_variable_value_request import NamedTestCaseVariableValueRequest
@@ -277,8 +278,8 @@ class TestSuitesClient:
                                     object_=json.loads(_text),
                                 ),
                             )
-                        except:
-                            pass
+                        except Exception:
+                            record_dropped_stream_line(f"v1/test-suites/{jsonable_encoder(id)}/test-cases-bulk")
                     return
                 _response.read()
                 _response_json = _response.json()
@@ -615,8 +616,8 @@ class AsyncTestSuitesClient:
                                     object_=json.loads(_text),
                                 ),
                             )
-                        except:
-                            pass
+                        except Exception:
+                            record_dropped_stream_line(f"v1/test-suites/{jsonable_encoder(id)}/test-cases-bulk")
                     return
                 await _response.aread()
                 _response_json = _response.json()
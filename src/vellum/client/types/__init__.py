@@ -1,527 +1,1044 @@
 # This file was auto-generated by Fern from our API Definition.
+# Names are imported lazily, see scripts/generate_lazy_imports.py
 
-from .ad_hoc_execute_prompt_event import AdHocExecutePromptEvent
-from .ad_hoc_expand_meta import AdHocExpandMeta
-from .ad_hoc_fulfilled_prompt_execution_meta import AdHocFulfilledPromptExecutionMeta
-from .ad_hoc_initiated_prompt_execution_meta import AdHocInitiatedPromptExecutionMeta
-from .ad_hoc_rejected_prompt_execution_meta import AdHocRejectedPromptExecutionMeta
-from .ad_hoc_streaming_prompt_execution_meta import AdHocStreamingPromptExecutionMeta
-from .add_openai_api_key_enum import AddOpenaiApiKeyEnum
-from .api_node_result import ApiNodeResult
-from .api_node_result_data import ApiNodeResultData
-from .array_chat_message_content import ArrayChatMessageContent
-from .array_chat_message_content_item import ArrayChatMessageContentItem
-from .array_chat_message_content_item_request import ArrayChatMessageContentItemRequest
-from .array_chat_message_content_request import ArrayChatMessageContentRequest
-from .array_input import ArrayInput
-from .array_variable_value import ArrayVariableValue
-from .array_variable_value_item import ArrayVariableValueItem
-from .array_vellum_value import ArrayVellumValue
-from .array_vellum_value_request import ArrayVellumValueRequest
-from .audio_chat_message_content import AudioChatMessageContent
-from .audio_chat_message_content_request import AudioChatMessageContentRequest
-from .audio_variable_value import AudioVariableValue
-from .audio_vellum_value import AudioVellumValue
-from .audio_vellum_value_request import AudioVellumValueRequest
-from .basic_vectorizer_intfloat_multilingual_e_5_large import BasicVectorizerIntfloatMultilingualE5Large
-from .basic_vectorizer_intfloat_multilingual_e_5_large_request import BasicVectorizerIntfloatMultilingualE5LargeRequest
-from .basic_vectorizer_sentence_transformers_multi_qa_mpnet_base_cos_v_1 import (
-    BasicVectorizerSentenceTransformersMultiQaMpnetBaseCosV1,
-)
-from .basic_vectorizer_sentence_transformers_multi_qa_mpnet_base_cos_v_1_request import (
-    BasicVectorizerSentenceTransformersMultiQaMpnetBaseCosV1Request,
-)
-from .basic_vectorizer_sentence_transformers_multi_qa_mpnet_base_dot_v_1 import (
-    BasicVectorizerSentenceTransformersMultiQaMpnetBaseDotV1,
-)
-from .basic_vectorizer_sentence_transformers_multi_qa_mpnet_base_dot_v_1_request import (
-    BasicVectorizerSentenceTransformersMultiQaMpnetBaseDotV1Request,
-)
-from .chat_history_input import ChatHistoryInput
-from .chat_history_input_request import ChatHistoryInputRequest
-from .chat_history_variable_value import ChatHistoryVariableValue
-from .chat_history_vellum_value import ChatHistoryVellumValue
-from .chat_history_vellum_value_request import ChatHistoryVellumValueRequest
-from .chat_message import ChatMessage
-from .chat_message_content import ChatMessageContent
-from .chat_message_content_request import ChatMessageContentRequest
-from .chat_message_prompt_block import ChatMessagePromptBlock
-from .chat_message_request import ChatMessageRequest
-from .chat_message_role import ChatMessageRole
-from .code_execution_node_array_result import CodeExecutionNodeArrayResult
-from .code_execution_node_chat_history_result import CodeExecutionNodeChatHistoryResult
-from .code_execution_node_error_result import CodeExecutionNodeErrorResult
-from .code_execution_node_function_call_result import CodeExecutionNodeFunctionCallResult
-from .code_execution_node_json_result import CodeExecutionNodeJsonResult
-from .code_execution_node_number_result import CodeExecutionNodeNumberResult
-from .code_execution_node_result import CodeExecutionNodeResult
-from .code_execution_node_result_data import CodeExecutionNodeResultData
-from .code_execution_node_result_output import CodeExecutionNodeResultOutput
-from .code_execution_node_search_results_result import CodeExecutionNodeSearchResultsResult
-from .code_execution_node_string_result import CodeExecutionNodeStringResult
-from .code_execution_package import CodeExecutionPackage
-from .code_execution_runtime import CodeExecutionRuntime
-from .code_executor_input import CodeExecutorInput
-from .code_executor_response import CodeExecutorResponse
-from .code_executor_secret_input import CodeExecutorSecretInput
-from .compile_prompt_deployment_expand_meta_request import CompilePromptDeploymentExpandMetaRequest
-from .compile_prompt_meta import CompilePromptMeta
-from .components_schemas_pdf_search_result_meta_source import ComponentsSchemasPdfSearchResultMetaSource
-from .components_schemas_pdf_search_result_meta_source_request import ComponentsSchemasPdfSearchResultMetaSourceRequest
-from .condition_combinator import ConditionCombinator
-from .conditional_node_result import ConditionalNodeResult
-from .conditional_node_result_data import ConditionalNodeResultData
-from .container_image_read import ContainerImageRead
-from .create_test_suite_test_case_request import CreateTestSuiteTestCaseRequest
-from .deployment_history_item import DeploymentHistoryItem
-from .deployment_provider_payload_response import DeploymentProviderPayloadResponse
-from .deployment_provider_payload_response_payload import DeploymentProviderPayloadResponsePayload
-from .deployment_read import DeploymentRead
-from .deployment_release_tag_deployment_history_item import DeploymentReleaseTagDeploymentHistoryItem
-from .deployment_release_tag_read import DeploymentReleaseTagRead
-from .docker_service_token import DockerServiceToken
-from .document_document_to_document_index import DocumentDocumentToDocumentIndex
-from .document_index_chunking import DocumentIndexChunking
-from .document_index_chunking_request import DocumentIndexChunkingRequest
-from .document_index_indexing_config import DocumentIndexIndexingConfig
-from .document_index_indexing_config_request import DocumentIndexIndexingConfigRequest
-from .document_index_read import DocumentIndexRead
-from .document_processing_state import DocumentProcessingState
-from .document_read import DocumentRead
-from .document_status import DocumentStatus
-from .enriched_normalized_completion import EnrichedNormalizedCompletion
-from .entity_status import EntityStatus
-from .entity_visibility import EntityVisibility
-from .environment_enum import EnvironmentEnum
-from .ephemeral_prompt_cache_config import EphemeralPromptCacheConfig
-from .ephemeral_prompt_cache_config_type_enum import EphemeralPromptCacheConfigTypeEnum
-from .error_input import ErrorInput
-from .error_variable_value import ErrorVariableValue
-from .error_vellum_value import ErrorVellumValue
-from .error_vellum_value_request import ErrorVellumValueRequest
-from .execute_prompt_event import ExecutePromptEvent
-from .execute_prompt_response import ExecutePromptResponse
-from .execute_workflow_response import ExecuteWorkflowResponse
-from .execute_workflow_workflow_result_event import ExecuteWorkflowWorkflowResultEvent
-from .execution_array_vellum_value import ExecutionArrayVellumValue
-from .execution_chat_history_vellum_value import ExecutionChatHistoryVellumValue
-from .execution_error_vellum_value import ExecutionErrorVellumValue
-from .execution_function_call_vellum_value import ExecutionFunctionCallVellumValue
-from .execution_json_vellum_value import ExecutionJsonVellumValue
-from .execution_number_vellum_value import ExecutionNumberVellumValue
-from .execution_search_results_vellum_value import ExecutionSearchResultsVellumValue
-from .execution_string_vellum_value import ExecutionStringVellumValue
-from .execution_vellum_value import ExecutionVellumValue
-from .external_test_case_execution import ExternalTestCaseExecution
-from .external_test_case_execution_request import ExternalTestCaseExecutionRequest
-from .finish_reason_enum import FinishReasonEnum
-from .folder_entity import FolderEntity
-from .folder_entity_document_index import FolderEntityDocumentIndex
-from .folder_entity_document_index_data import FolderEntityDocumentIndexData
-from .folder_entity_folder import FolderEntityFolder
-from .folder_entity_folder_data import FolderEntityFolderData
-from .folder_entity_prompt_sandbox import FolderEntityPromptSandbox
-from .folder_entity_prompt_sandbox_data import FolderEntityPromptSandboxData
-from .folder_entity_test_suite import FolderEntityTestSuite
-from .folder_entity_test_suite_data import FolderEntityTestSuiteData
-from .folder_entity_workflow_sandbox import FolderEntityWorkflowSandbox
-from .folder_entity_workflow_sandbox_data import FolderEntityWorkflowSandboxData
-from .fulfilled_ad_hoc_execute_prompt_event import FulfilledAdHocExecutePromptEvent
-from .fulfilled_enum import FulfilledEnum
-from .fulfilled_execute_prompt_event import FulfilledExecutePromptEvent
-from .fulfilled_execute_prompt_response import FulfilledExecutePromptResponse
-from .fulfilled_execute_workflow_workflow_result_event import FulfilledExecuteWorkflowWorkflowResultEvent
-from .fulfilled_prompt_execution_meta import FulfilledPromptExecutionMeta
-from .fulfilled_workflow_node_result_event import FulfilledWorkflowNodeResultEvent
-from .function_call import FunctionCall
-from .function_call_chat_message_content import FunctionCallChatMessageContent
-from .function_call_chat_message_content_request import FunctionCallChatMessageContentRequest
-from .function_call_chat_message_content_value import FunctionCallChatMessageContentValue
-from .function_call_chat_message_content_value_request import FunctionCallChatMessageContentValueRequest
-from .function_call_input import FunctionCallInput
-from .function_call_request import FunctionCallRequest
-from .function_call_variable_value import FunctionCallVariableValue
-from .function_call_vellum_value import FunctionCallVellumValue
-from .function_call_vellum_value_request import FunctionCallVellumValueRequest
-from .function_definition import FunctionDefinition
-from .generate_options_request import GenerateOptionsRequest
-from .generate_request import GenerateRequest
-from .generate_response import GenerateResponse
-from .generate_result import GenerateResult
-from .generate_result_data import GenerateResultData
-from .generate_result_error import GenerateResultError
-from .generate_stream_response import GenerateStreamResponse
-from .generate_stream_result import GenerateStreamResult
-from .generate_stream_result_data import GenerateStreamResultData
-from .google_vertex_ai_vectorizer_config import GoogleVertexAiVectorizerConfig
-from .google_vertex_ai_vectorizer_config_request import GoogleVertexAiVectorizerConfigRequest
-from .google_vertex_ai_vectorizer_text_embedding_004 import GoogleVertexAiVectorizerTextEmbedding004
-from .google_vertex_ai_vectorizer_text_embedding_004_request import GoogleVertexAiVectorizerTextEmbedding004Request
-from .google_vertex_ai_vectorizer_text_multilingual_embedding_002 import (
-    GoogleVertexAiVectorizerTextMultilingualEmbedding002,
-)
-from .google_vertex_ai_vectorizer_text_multilingual_embedding_002_request import (
-    GoogleVertexAiVectorizerTextMultilingualEmbedding002Request,
-)
-from .hkunlp_instructor_xl_vectorizer import HkunlpInstructorXlVectorizer
-from .hkunlp_instructor_xl_vectorizer_request import HkunlpInstructorXlVectorizerRequest
-from .image_chat_message_content import ImageChatMessageContent
-from .image_chat_message_content_request import ImageChatMessageContentRequest
-from .image_variable_value import ImageVariableValue
-from .image_vellum_value import ImageVellumValue
-from .image_vellum_value_request import ImageVellumValueRequest
-from .indexing_config_vectorizer import IndexingConfigVectorizer
-from .indexing_config_vectorizer_request import IndexingConfigVectorizerRequest
-from .indexing_state_enum import IndexingStateEnum
-from .initiated_ad_hoc_execute_prompt_event import InitiatedAdHocExecutePromptEvent
-from .initiated_execute_prompt_event import InitiatedExecutePromptEvent
-from .initiated_prompt_execution_meta import InitiatedPromptExecutionMeta
-from .initiated_workflow_node_result_event import InitiatedWorkflowNodeResultEvent
-from .instructor_vectorizer_config import InstructorVectorizerConfig
-from .instructor_vectorizer_config_request import InstructorVectorizerConfigRequest
-from .iteration_state_enum import IterationStateEnum
-from .jinja_prompt_block import JinjaPromptBlock
-from .json_input import JsonInput
-from .json_input_request import JsonInputRequest
-from .json_variable_value import JsonVariableValue
-from .json_vellum_value import JsonVellumValue
-from .json_vellum_value_request import JsonVellumValueRequest
-from .logical_operator import LogicalOperator
-from .logprobs_enum import LogprobsEnum
-from .map_node_result import MapNodeResult
-from .map_node_result_data import MapNodeResultData
-from .merge_node_result import MergeNodeResult
-from .merge_node_result_data import MergeNodeResultData
-from .metadata_filter_config_request import MetadataFilterConfigRequest
-from .metadata_filter_rule_combinator import MetadataFilterRuleCombinator
-from .metadata_filter_rule_request import MetadataFilterRuleRequest
-from .metadata_filters_request import MetadataFiltersRequest
-from .metric_definition_execution import MetricDefinitionExecution
-from .metric_definition_history_item import MetricDefinitionHistoryItem
-from .metric_definition_input import MetricDefinitionInput
-from .metric_node_result import MetricNodeResult
-from .ml_model_read import MlModelRead
-from .ml_model_usage import MlModelUsage
-from .named_scenario_input_chat_history_variable_value_request import NamedScenarioInputChatHistoryVariableValueRequest
-from .named_scenario_input_json_variable_value_request import NamedScenarioInputJsonVariableValueRequest
-from .named_scenario_input_request import NamedScenarioInputRequest
-from .named_scenario_input_string_variable_value_request import NamedScenarioInputStringVariableValueRequest
-from .named_test_case_array_variable_value import NamedTestCaseArrayVariableValue
-from .named_test_case_array_variable_value_request import NamedTestCaseArrayVariableValueRequest
-from .named_test_case_chat_history_variable_value import NamedTestCaseChatHistoryVariableValue
-from .named_test_case_chat_history_variable_value_request import NamedTestCaseChatHistoryVariableValueRequest
-from .named_test_case_error_variable_value import NamedTestCaseErrorVariableValue
-from .named_test_case_error_variable_value_request import NamedTestCaseErrorVariableValueRequest
-from .named_test_case_function_call_variable_value import NamedTestCaseFunctionCallVariableValue
-from .named_test_case_function_call_variable_value_request import NamedTestCaseFunctionCallVariableValueRequest
-from .named_test_case_json_variable_value import NamedTestCaseJsonVariableValue
-from .named_test_case_json_variable_value_request import NamedTestCaseJsonVariableValueRequest
-from .named_test_case_number_variable_value import NamedTestCaseNumberVariableValue
-from .named_test_case_number_variable_value_request import NamedTestCaseNumberVariableValueRequest
-from .named_test_case_search_results_variable_value import NamedTestCaseSearchResultsVariableValue
-from .named_test_case_search_results_variable_value_request import NamedTestCaseSearchResultsVariableValueRequest
-from .named_test_case_string_variable_value import NamedTestCaseStringVariableValue
-from .named_test_case_string_variable_value_request import NamedTestCaseStringVariableValueRequest
-from .named_test_case_variable_value import NamedTestCaseVariableValue
-from .named_test_case_variable_value_request import NamedTestCaseVariableValueRequest
-from .node_input_compiled_array_value import NodeInputCompiledArrayValue
-from .node_input_compiled_chat_history_value import NodeInputCompiledChatHistoryValue
-from .node_input_compiled_error_value import NodeInputCompiledErrorValue
-from .node_input_compiled_function_call_value import NodeInputCompiledFunctionCallValue
-from .node_input_compiled_json_value import NodeInputCompiledJsonValue
-from .node_input_compiled_number_value import NodeInputCompiledNumberValue
-from .node_input_compiled_search_results_value import NodeInputCompiledSearchResultsValue
-from .node_input_compiled_string_value import NodeInputCompiledStringValue
-from .node_input_variable_compiled_value import NodeInputVariableCompiledValue
-from .node_output_compiled_array_value import NodeOutputCompiledArrayValue
-from .node_output_compiled_chat_history_value import NodeOutputCompiledChatHistoryValue
-from .node_output_compiled_error_value import NodeOutputCompiledErrorValue
-from .node_output_compiled_function_call_value import NodeOutputCompiledFunctionCallValue
-from .node_output_compiled_json_value import NodeOutputCompiledJsonValue
-from .node_output_compiled_number_value import NodeOutputCompiledNumberValue
-from .node_output_compiled_search_results_value import NodeOutputCompiledSearchResultsValue
-from .node_output_compiled_string_value import NodeOutputCompiledStringValue
-from .node_output_compiled_value import NodeOutputCompiledValue
-from .normalized_log_probs import NormalizedLogProbs
-from .normalized_token_log_probs import NormalizedTokenLogProbs
-from .number_input import NumberInput
-from .number_variable_value import NumberVariableValue
-from .number_vellum_value import NumberVellumValue
-from .number_vellum_value_request import NumberVellumValueRequest
-from .open_ai_vectorizer_config import OpenAiVectorizerConfig
-from .open_ai_vectorizer_config_request import OpenAiVectorizerConfigRequest
-from .open_ai_vectorizer_text_embedding_3_large import OpenAiVectorizerTextEmbedding3Large
-from .open_ai_vectorizer_text_embedding_3_large_request import OpenAiVectorizerTextEmbedding3LargeRequest
-from .open_ai_vectorizer_text_embedding_3_small import OpenAiVectorizerTextEmbedding3Small
-from .open_ai_vectorizer_text_embedding_3_small_request import OpenAiVectorizerTextEmbedding3SmallRequest
-from .open_ai_vectorizer_text_embedding_ada_002 import OpenAiVectorizerTextEmbeddingAda002
-from .open_ai_vectorizer_text_embedding_ada_002_request import OpenAiVectorizerTextEmbeddingAda002Request
-from .paginated_container_image_read_list import PaginatedContainerImageReadList
-from .paginated_deployment_release_tag_read_list import PaginatedDeploymentReleaseTagReadList
-from .paginated_document_index_read_list import PaginatedDocumentIndexReadList
-from .paginated_folder_entity_list import PaginatedFolderEntityList
-from .paginated_slim_deployment_read_list import PaginatedSlimDeploymentReadList
-from .paginated_slim_document_list import PaginatedSlimDocumentList
-from .paginated_slim_workflow_deployment_list import PaginatedSlimWorkflowDeploymentList
-from .paginated_test_suite_run_execution_list import PaginatedTestSuiteRunExecutionList
-from .paginated_test_suite_test_case_list import PaginatedTestSuiteTestCaseList
-from .paginated_workflow_release_tag_read_list import PaginatedWorkflowReleaseTagReadList
-from .pdf_search_result_meta_source import PdfSearchResultMetaSource
-from .pdf_search_result_meta_source_request import PdfSearchResultMetaSourceRequest
-from .plain_text_prompt_block import PlainTextPromptBlock
-from .price import Price
-from .processing_failure_reason_enum import ProcessingFailureReasonEnum
-from .prompt_block import PromptBlock
-from .prompt_block_state import PromptBlockState
-from .prompt_deployment_expand_meta_request import PromptDeploymentExpandMetaRequest
-from .prompt_deployment_input_request import PromptDeploymentInputRequest
-from .prompt_execution_meta import PromptExecutionMeta
-from .prompt_node_execution_meta import PromptNodeExecutionMeta
-from .prompt_node_result import PromptNodeResult
-from .prompt_node_result_data import PromptNodeResultData
-from .prompt_output import PromptOutput
-from .prompt_parameters import PromptParameters
-from .prompt_request_chat_history_input import PromptRequestChatHistoryInput
-from .prompt_request_input import PromptRequestInput
-from .prompt_request_json_input import PromptRequestJsonInput
-from .prompt_request_string_input import PromptRequestStringInput
-from .prompt_settings import PromptSettings
-from .raw_prompt_execution_overrides_request import RawPromptExecutionOverridesRequest
-from .reducto_chunker_config import ReductoChunkerConfig
-from .reducto_chunker_config_request import ReductoChunkerConfigRequest
-from .reducto_chunking import ReductoChunking
-from .reducto_chunking_request import ReductoChunkingRequest
-from .rejected_ad_hoc_execute_prompt_event import RejectedAdHocExecutePromptEvent
-from .rejected_execute_prompt_event import RejectedExecutePromptEvent
-from .rejected_execute_prompt_response import RejectedExecutePromptResponse
-from .rejected_execute_workflow_workflow_result_event import RejectedExecuteWorkflowWorkflowResultEvent
-from .rejected_prompt_execution_meta import RejectedPromptExecutionMeta
-from .rejected_workflow_node_result_event import RejectedWorkflowNodeResultEvent
-from .release_tag_source import ReleaseTagSource
-from .replace_test_suite_test_case_request import ReplaceTestSuiteTestCaseRequest
-from .rich_text_child_block import RichTextChildBlock
-from .rich_text_prompt_block import RichTextPromptBlock
-from .sandbox_scenario import SandboxScenario
-from .scenario_input import ScenarioInput
-from .scenario_input_chat_history_variable_value import ScenarioInputChatHistoryVariableValue
-from .scenario_input_json_variable_value import ScenarioInputJsonVariableValue
-from .scenario_input_string_variable_value import ScenarioInputStringVariableValue
-from .search_filters_request import SearchFiltersRequest
-from .search_node_result import SearchNodeResult
-from .search_node_result_data import SearchNodeResultData
-from .search_request_options_request import SearchRequestOptionsRequest
-from .search_response import SearchResponse
-from .search_result import SearchResult
-from .search_result_document import SearchResultDocument
-from .search_result_document_request import SearchResultDocumentRequest
-from .search_result_merging_request import SearchResultMergingRequest
-from .search_result_meta import SearchResultMeta
-from .search_result_meta_request import SearchResultMetaRequest
-from .search_result_request import SearchResultRequest
-from .search_results_input import SearchResultsInput
-from .search_results_variable_value import SearchResultsVariableValue
-from .search_results_vellum_value import SearchResultsVellumValue
-from .search_results_vellum_value_request import SearchResultsVellumValueRequest
-from .search_weights_request import SearchWeightsRequest
-from .secret_type_enum import SecretTypeEnum
-from .sentence_chunker_config import SentenceChunkerConfig
-from .sentence_chunker_config_request import SentenceChunkerConfigRequest
-from .sentence_chunking import SentenceChunking
-from .sentence_chunking_request import SentenceChunkingRequest
-from .slim_deployment_read import SlimDeploymentRead
-from .slim_document import SlimDocument
-from .slim_document_document_to_document_index import SlimDocumentDocumentToDocumentIndex
-from .slim_workflow_deployment import SlimWorkflowDeployment
-from .streaming_ad_hoc_execute_prompt_event import StreamingAdHocExecutePromptEvent
-from .streaming_execute_prompt_event import StreamingExecutePromptEvent
-from .streaming_prompt_execution_meta import StreamingPromptExecutionMeta
-from .streaming_workflow_node_result_event import StreamingWorkflowNodeResultEvent
-from .string_chat_message_content import StringChatMessageContent
-from .string_chat_message_content_request import StringChatMessageContentRequest
-from .string_input import StringInput
-from .string_input_request import StringInputRequest
-from .string_variable_value import StringVariableValue
-from .string_vellum_value import StringVellumValue
-from .string_vellum_value_request import StringVellumValueRequest
-from .submit_completion_actual_request import SubmitCompletionActualRequest
-from .submit_workflow_execution_actual_request import SubmitWorkflowExecutionActualRequest
-from .subworkflow_node_result import SubworkflowNodeResult
-from .subworkflow_node_result_data import SubworkflowNodeResultData
-from .templating_node_array_result import TemplatingNodeArrayResult
-from .templating_node_chat_history_result import TemplatingNodeChatHistoryResult
-from .templating_node_error_result import TemplatingNodeErrorResult
-from .templating_node_function_call_result import TemplatingNodeFunctionCallResult
-from .templating_node_json_result import TemplatingNodeJsonResult
-from .templating_node_number_result import TemplatingNodeNumberResult
-from .templating_node_result import TemplatingNodeResult
-from .templating_node_result_data import TemplatingNodeResultData
-from .templating_node_result_output import TemplatingNodeResultOutput
-from .templating_node_search_results_result import TemplatingNodeSearchResultsResult
-from .templating_node_string_result import TemplatingNodeStringResult
-from .terminal_node_array_result import TerminalNodeArrayResult
-from .terminal_node_chat_history_result import TerminalNodeChatHistoryResult
-from .terminal_node_error_result import TerminalNodeErrorResult
-from .terminal_node_function_call_result import TerminalNodeFunctionCallResult
-from .terminal_node_json_result import TerminalNodeJsonResult
-from .terminal_node_number_result import TerminalNodeNumberResult
-from .terminal_node_result import TerminalNodeResult
-from .terminal_node_result_data import TerminalNodeResultData
-from .terminal_node_result_output import TerminalNodeResultOutput
-from .terminal_node_search_results_result import TerminalNodeSearchResultsResult
-from .terminal_node_string_result import TerminalNodeStringResult
-from .test_case_array_variable_value import TestCaseArrayVariableValue
-from .test_case_chat_history_variable_value import TestCaseChatHistoryVariableValue
-from .test_case_error_variable_value import TestCaseErrorVariableValue
-from .test_case_function_call_variable_value import TestCaseFunctionCallVariableValue
-from .test_case_json_variable_value import TestCaseJsonVariableValue
-from .test_case_number_variable_value import TestCaseNumberVariableValue
-from .test_case_search_results_variable_value import TestCaseSearchResultsVariableValue
-from .test_case_string_variable_value import TestCaseStringVariableValue
-from .test_case_variable_value import TestCaseVariableValue
-from .test_suite_run_deployment_release_tag_exec_config import TestSuiteRunDeploymentReleaseTagExecConfig
-from .test_suite_run_deployment_release_tag_exec_config_data import TestSuiteRunDeploymentReleaseTagExecConfigData
-from .test_suite_run_deployment_release_tag_exec_config_data_request import (
-    TestSuiteRunDeploymentReleaseTagExecConfigDataRequest,
-)
-from .test_suite_run_deployment_release_tag_exec_config_request import TestSuiteRunDeploymentReleaseTagExecConfigRequest
-from .test_suite_run_exec_config import TestSuiteRunExecConfig
-from .test_suite_run_exec_config_request import TestSuiteRunExecConfigRequest
-from .test_suite_run_execution import TestSuiteRunExecution
-from .test_suite_run_execution_array_output import TestSuiteRunExecutionArrayOutput
-from .test_suite_run_execution_chat_history_output import TestSuiteRunExecutionChatHistoryOutput
-from .test_suite_run_execution_error_output import TestSuiteRunExecutionErrorOutput
-from .test_suite_run_execution_function_call_output import TestSuiteRunExecutionFunctionCallOutput
-from .test_suite_run_execution_json_output import TestSuiteRunExecutionJsonOutput
-from .test_suite_run_execution_metric_definition import TestSuiteRunExecutionMetricDefinition
-from .test_suite_run_execution_metric_result import TestSuiteRunExecutionMetricResult
-from .test_suite_run_execution_number_output import TestSuiteRunExecutionNumberOutput
-from .test_suite_run_execution_output import TestSuiteRunExecutionOutput
-from .test_suite_run_execution_search_results_output import TestSuiteRunExecutionSearchResultsOutput
-from .test_suite_run_execution_string_output import TestSuiteRunExecutionStringOutput
-from .test_suite_run_external_exec_config import TestSuiteRunExternalExecConfig
-from .test_suite_run_external_exec_config_data import TestSuiteRunExternalExecConfigData
-from .test_suite_run_external_exec_config_data_request import TestSuiteRunExternalExecConfigDataRequest
-from .test_suite_run_external_exec_config_request import TestSuiteRunExternalExecConfigRequest
-from .test_suite_run_metric_error_output import TestSuiteRunMetricErrorOutput
-from .test_suite_run_metric_json_output import TestSuiteRunMetricJsonOutput
-from .test_suite_run_metric_number_output import TestSuiteRunMetricNumberOutput
-from .test_suite_run_metric_output import TestSuiteRunMetricOutput
-from .test_suite_run_metric_string_output import TestSuiteRunMetricStringOutput
-from .test_suite_run_prompt_sandbox_history_item_exec_config import TestSuiteRunPromptSandboxHistoryItemExecConfig
-from .test_suite_run_prompt_sandbox_history_item_exec_config_data import (
-    TestSuiteRunPromptSandboxHistoryItemExecConfigData,
-)
-from .test_suite_run_prompt_sandbox_history_item_exec_config_data_request import (
-    TestSuiteRunPromptSandboxHistoryItemExecConfigDataRequest,
-)
-from .test_suite_run_prompt_sandbox_history_item_exec_config_request import (
-    TestSuiteRunPromptSandboxHistoryItemExecConfigRequest,
-)
-from .test_suite_run_read import TestSuiteRunRead
-from .test_suite_run_state import TestSuiteRunState
-from .test_suite_run_test_suite import TestSuiteRunTestSuite
-from .test_suite_run_workflow_release_tag_exec_config import TestSuiteRunWorkflowReleaseTagExecConfig
-from .test_suite_run_workflow_release_tag_exec_config_data import TestSuiteRunWorkflowReleaseTagExecConfigData
-from .test_suite_run_workflow_release_tag_exec_config_data_request import (
-    TestSuiteRunWorkflowReleaseTagExecConfigDataRequest,
-)
-from .test_suite_run_workflow_release_tag_exec_config_request import TestSuiteRunWorkflowReleaseTagExecConfigRequest
-from .test_suite_run_workflow_sandbox_history_item_exec_config import TestSuiteRunWorkflowSandboxHistoryItemExecConfig
-from .test_suite_run_workflow_sandbox_history_item_exec_config_data import (
-    TestSuiteRunWorkflowSandboxHistoryItemExecConfigData,
-)
-from .test_suite_run_workflow_sandbox_history_item_exec_config_data_request import (
-    TestSuiteRunWorkflowSandboxHistoryItemExecConfigDataRequest,
-)
-from .test_suite_run_workflow_sandbox_history_item_exec_config_request import (
-    TestSuiteRunWorkflowSandboxHistoryItemExecConfigRequest,
-)
-from .test_suite_test_case import TestSuiteTestCase
-from .test_suite_test_case_bulk_operation_request import TestSuiteTestCaseBulkOperationRequest
-from .test_suite_test_case_bulk_result import TestSuiteTestCaseBulkResult
-from .test_suite_test_case_create_bulk_operation_request import TestSuiteTestCaseCreateBulkOperationRequest
-from .test_suite_test_case_created_bulk_result import TestSuiteTestCaseCreatedBulkResult
-from .test_suite_test_case_created_bulk_result_data import TestSuiteTestCaseCreatedBulkResultData
-from .test_suite_test_case_delete_bulk_operation_data_request import TestSuiteTestCaseDeleteBulkOperationDataRequest
-from .test_suite_test_case_delete_bulk_operation_request import TestSuiteTestCaseDeleteBulkOperationRequest
-from .test_suite_test_case_deleted_bulk_result import TestSuiteTestCaseDeletedBulkResult
-from .test_suite_test_case_deleted_bulk_result_data import TestSuiteTestCaseDeletedBulkResultData
-from .test_suite_test_case_rejected_bulk_result import TestSuiteTestCaseRejectedBulkResult
-from .test_suite_test_case_replace_bulk_operation_request import TestSuiteTestCaseReplaceBulkOperationRequest
-from .test_suite_test_case_replaced_bulk_result import TestSuiteTestCaseReplacedBulkResult
-from .test_suite_test_case_replaced_bulk_result_data import TestSuiteTestCaseReplacedBulkResultData
-from .test_suite_test_case_upsert_bulk_operation_request import TestSuiteTestCaseUpsertBulkOperationRequest
-from .token_overlapping_window_chunker_config import TokenOverlappingWindowChunkerConfig
-from .token_overlapping_window_chunker_config_request import TokenOverlappingWindowChunkerConfigRequest
-from .token_overlapping_window_chunking import TokenOverlappingWindowChunking
-from .token_overlapping_window_chunking_request import TokenOverlappingWindowChunkingRequest
-from .unit_enum import UnitEnum
-from .upload_document_response import UploadDocumentResponse
-from .upsert_test_suite_test_case_request import UpsertTestSuiteTestCaseRequest
-from .variable_prompt_block import VariablePromptBlock
-from .vellum_audio import VellumAudio
-from .vellum_audio_request import VellumAudioRequest
-from .vellum_error import VellumError
-from .vellum_error_code_enum import VellumErrorCodeEnum
-from .vellum_error_request import VellumErrorRequest
-from .vellum_image import VellumImage
-from .vellum_image_request import VellumImageRequest
-from .vellum_value import VellumValue
-from .vellum_value_logical_condition_group_request import VellumValueLogicalConditionGroupRequest
-from .vellum_value_logical_condition_request import VellumValueLogicalConditionRequest
-from .vellum_value_logical_expression_request import VellumValueLogicalExpressionRequest
-from .vellum_value_request import VellumValueRequest
-from .vellum_variable import VellumVariable
-from .vellum_variable_extensions import VellumVariableExtensions
-from .vellum_variable_type import VellumVariableType
-from .workflow_deployment_history_item import WorkflowDeploymentHistoryItem
-from .workflow_deployment_read import WorkflowDeploymentRead
-from .workflow_event_error import WorkflowEventError
-from .workflow_execution_actual_chat_history_request import WorkflowExecutionActualChatHistoryRequest
-from .workflow_execution_actual_json_request import WorkflowExecutionActualJsonRequest
-from .workflow_execution_actual_string_request import WorkflowExecutionActualStringRequest
-from .workflow_execution_event_error_code import WorkflowExecutionEventErrorCode
-from .workflow_execution_event_type import WorkflowExecutionEventType
-from .workflow_execution_node_result_event import WorkflowExecutionNodeResultEvent
-from .workflow_execution_workflow_result_event import WorkflowExecutionWorkflowResultEvent
-from .workflow_expand_meta_request import WorkflowExpandMetaRequest
-from .workflow_node_result_data import WorkflowNodeResultData
-from .workflow_node_result_event import WorkflowNodeResultEvent
-from .workflow_node_result_event_state import WorkflowNodeResultEventState
-from .workflow_output import WorkflowOutput
-from .workflow_output_array import WorkflowOutputArray
-from .workflow_output_chat_history import WorkflowOutputChatHistory
-from .workflow_output_error import WorkflowOutputError
-from .workflow_output_function_call import WorkflowOutputFunctionCall
-from .workflow_output_image import WorkflowOutputImage
-from .workflow_output_json import WorkflowOutputJson
-from .workflow_output_number import WorkflowOutputNumber
-from .workflow_output_search_results import WorkflowOutputSearchResults
-from .workflow_output_string import WorkflowOutputString
-from .workflow_push_deployment_config_request import WorkflowPushDeploymentConfigRequest
-from .workflow_push_exec_config import WorkflowPushExecConfig
-from .workflow_push_response import WorkflowPushResponse
-from .workflow_release_tag_read import WorkflowReleaseTagRead
-from .workflow_release_tag_workflow_deployment_history_item import WorkflowReleaseTagWorkflowDeploymentHistoryItem
-from .workflow_request_chat_history_input_request import WorkflowRequestChatHistoryInputRequest
-from .workflow_request_input_request import WorkflowRequestInputRequest
-from .workflow_request_json_input_request import WorkflowRequestJsonInputRequest
-from .workflow_request_number_input_request import WorkflowRequestNumberInputRequest
-from .workflow_request_string_input_request import WorkflowRequestStringInputRequest
-from .workflow_result_event import WorkflowResultEvent
-from .workflow_result_event_output_data import WorkflowResultEventOutputData
-from .workflow_result_event_output_data_array import WorkflowResultEventOutputDataArray
-from .workflow_result_event_output_data_chat_history import WorkflowResultEventOutputDataChatHistory
-from .workflow_result_event_output_data_error import WorkflowResultEventOutputDataError
-from .workflow_result_event_output_data_function_call import WorkflowResultEventOutputDataFunctionCall
-from .workflow_result_event_output_data_json import WorkflowResultEventOutputDataJson
-from .workflow_result_event_output_data_number import WorkflowResultEventOutputDataNumber
-from .workflow_result_event_output_data_search_results import WorkflowResultEventOutputDataSearchResults
-from .workflow_result_event_output_data_string import WorkflowResultEventOutputDataString
-from .workflow_stream_event import WorkflowStreamEvent
-from .workspace_secret_read import WorkspaceSecretRead
+import importlib
+import typing
 
-__all__ = [
+if typing.TYPE_CHECKING:
+    from .ad_hoc_execute_prompt_event import AdHocExecutePromptEvent
+    from .ad_hoc_expand_meta import AdHocExpandMeta
+    from .ad_hoc_fulfilled_prompt_execution_meta import AdHocFulfilledPromptExecutionMeta
+    from .ad_hoc_initiated_prompt_execution_meta import AdHocInitiatedPromptExecutionMeta
+    from .ad_hoc_rejected_prompt_execution_meta import AdHocRejectedPromptExecutionMeta
+    from .ad_hoc_streaming_prompt_execution_meta import AdHocStreamingPromptExecutionMeta
+    from .add_openai_api_key_enum import AddOpenaiApiKeyEnum
+    from .api_node_result import ApiNodeResult
+    from .api_node_result_data import ApiNodeResultData
+    from .array_chat_message_content import ArrayChatMessageContent
+    from .array_chat_message_content_item import ArrayChatMessageContentItem
+    from .array_chat_message_content_item_request import ArrayChatMessageContentItemRequest
+    from .array_chat_message_content_request import ArrayChatMessageContentRequest
+    from .array_input import ArrayInput
+    from .array_variable_value import ArrayVariableValue
+    from .array_variable_value_item import ArrayVariableValueItem
+    from .array_vellum_value import ArrayVellumValue
+    from .array_vellum_value_request import ArrayVellumValueRequest
+    from .audio_chat_message_content import AudioChatMessageContent
+    from .audio_chat_message_content_request import AudioChatMessageContentRequest
+    from .audio_variable_value import AudioVariableValue
+    from .audio_vellum_value import AudioVellumValue
+    from .audio_vellum_value_request import AudioVellumValueRequest
+    from .basic_vectorizer_intfloat_multilingual_e_5_large import BasicVectorizerIntfloatMultilingualE5Large
+    from .basic_vectorizer_intfloat_multilingual_e_5_large_request import BasicVectorizerIntfloatMultilingualE5LargeRequest
+    from .basic_vectorizer_sentence_transformers_multi_qa_mpnet_base_cos_v_1 import (
+        BasicVectorizerSentenceTransformersMultiQaMpnetBaseCosV1,
+    )
+    from .basic_vectorizer_sentence_transformers_multi_qa_mpnet_base_cos_v_1_request import (
+        BasicVectorizerSentenceTransformersMultiQaMpnetBaseCosV1Request,
+    )
+    from .basic_vectorizer_sentence_transformers_multi_qa_mpnet_base_dot_v_1 import (
+        BasicVectorizerSentenceTransformersMultiQaMpnetBaseDotV1,
+    )
+    from .basic_vectorizer_sentence_transformers_multi_qa_mpnet_base_dot_v_1_request import (
+        BasicVectorizerSentenceTransformersMultiQaMpnetBaseDotV1Request,
+    )
+    from .chat_history_input import ChatHistoryInput
+    from .chat_history_input_request import ChatHistoryInputRequest
+    from .chat_history_variable_value import ChatHistoryVariableValue
+    from .chat_history_vellum_value import ChatHistoryVellumValue
+    from .chat_history_vellum_value_request import ChatHistoryVellumValueRequest
+    from .chat_message import ChatMessage
+    from .chat_message_content import ChatMessageContent
+    from .chat_message_content_request import ChatMessageContentRequest
+    from .chat_message_prompt_block import ChatMessagePromptBlock
+    from .chat_message_request import ChatMessageRequest
+    from .chat_message_role import ChatMessageRole
+    from .code_execution_node_array_result import CodeExecutionNodeArrayResult
+    from .code_execution_node_chat_history_result import CodeExecutionNodeChatHistoryResult
+    from .code_execution_node_error_result import CodeExecutionNodeErrorResult
+    from .code_execution_node_function_call_result import CodeExecutionNodeFunctionCallResult
+    from .code_execution_node_json_result import CodeExecutionNodeJsonResult
+    from .code_execution_node_number_result import CodeExecutionNodeNumberResult
+    from .code_execution_node_result import CodeExecutionNodeResult
+    from .code_execution_node_result_data import CodeExecutionNodeResultData
+    from .code_execution_node_result_output import CodeExecutionNodeResultOutput
+    from .code_execution_node_search_results_result import CodeExecutionNodeSearchResultsResult
+    from .code_execution_node_string_result import CodeExecutionNodeStringResult
+    from .code_execution_package import CodeExecutionPackage
+    from .code_execution_runtime import CodeExecutionRuntime
+    from .code_executor_input import CodeExecutorInput
+    from .code_executor_response import CodeExecutorResponse
+    from .code_executor_secret_input import CodeExecutorSecretInput
+    from .compile_prompt_deployment_expand_meta_request import CompilePromptDeploymentExpandMetaRequest
+    from .compile_prompt_meta import CompilePromptMeta
+    from .components_schemas_pdf_search_result_meta_source import ComponentsSchemasPdfSearchResultMetaSource
+    from .components_schemas_pdf_search_result_meta_source_request import ComponentsSchemasPdfSearchResultMetaSourceRequest
+    from .condition_combinator import ConditionCombinator
+    from .conditional_node_result import ConditionalNodeResult
+    from .conditional_node_result_data import ConditionalNodeResultData
+    from .container_image_read import ContainerImageRead
+    from .create_test_suite_test_case_request import CreateTestSuiteTestCaseRequest
+    from .deployment_history_item import DeploymentHistoryItem
+    from .deployment_provider_payload_response import DeploymentProviderPayloadResponse
+    from .deployment_provider_payload_response_payload import DeploymentProviderPayloadResponsePayload
+    from .deployment_read import DeploymentRead
+    from .deployment_release_tag_deployment_history_item import DeploymentReleaseTagDeploymentHistoryItem
+    from .deployment_release_tag_read import DeploymentReleaseTagRead
+    from .docker_service_token import DockerServiceToken
+    from .document_document_to_document_index import DocumentDocumentToDocumentIndex
+    from .document_index_chunking import DocumentIndexChunking
+    from .document_index_chunking_request import DocumentIndexChunkingRequest
+    from .document_index_indexing_config import DocumentIndexIndexingConfig
+    from .document_index_indexing_config_request import DocumentIndexIndexingConfigRequest
+    from .document_index_read import DocumentIndexRead
+    from .document_processing_state import DocumentProcessingState
+    from .document_read import DocumentRead
+    from .document_status import DocumentStatus
+    from .enriched_normalized_completion import EnrichedNormalizedCompletion
+    from .entity_status import EntityStatus
+    from .entity_visibility import EntityVisibility
+    from .environment_enum import EnvironmentEnum
+    from .ephemeral_prompt_cache_config import EphemeralPromptCacheConfig
+    from .ephemeral_prompt_cache_config_type_enum import EphemeralPromptCacheConfigTypeEnum
+    from .error_input import ErrorInput
+    from .error_variable_value import ErrorVariableValue
+    from .error_vellum_value import ErrorVellumValue
+    from .error_vellum_value_request import ErrorVellumValueRequest
+    from .execute_prompt_event import ExecutePromptEvent
+    from .execute_prompt_response import ExecutePromptResponse
+    from .execute_workflow_response import ExecuteWorkflowResponse
+    from .execute_workflow_workflow_result_event import ExecuteWorkflowWorkflowResultEvent
+    from .execution_array_vellum_value import ExecutionArrayVellumValue
+    from .execution_chat_history_vellum_value import ExecutionChatHistoryVellumValue
+    from .execution_error_vellum_value import ExecutionErrorVellumValue
+    from .execution_function_call_vellum_value import ExecutionFunctionCallVellumValue
+    from .execution_json_vellum_value import ExecutionJsonVellumValue
+    from .execution_number_vellum_value import ExecutionNumberVellumValue
+    from .execution_search_results_vellum_value import ExecutionSearchResultsVellumValue
+    from .execution_string_vellum_value import ExecutionStringVellumValue
+    from .execution_vellum_value import ExecutionVellumValue
+    from .external_test_case_execution import ExternalTestCaseExecution
+    from .external_test_case_execution_request import ExternalTestCaseExecutionRequest
+    from .finish_reason_enum import FinishReasonEnum
+    from .folder_entity import FolderEntity
+    from .folder_entity_document_index import FolderEntityDocumentIndex
+    from .folder_entity_document_index_data import FolderEntityDocumentIndexData
+    from .folder_entity_folder import FolderEntityFolder
+    from .folder_entity_folder_data import FolderEntityFolderData
+    from .folder_entity_prompt_sandbox import FolderEntityPromptSandbox
+    from .folder_entity_prompt_sandbox_data import FolderEntityPromptSandboxData
+    from .folder_entity_test_suite import FolderEntityTestSuite
+    from .folder_entity_test_suite_data import FolderEntityTestSuiteData
+    from .folder_entity_workflow_sandbox import FolderEntityWorkflowSandbox
+    from .folder_entity_workflow_sandbox_data import FolderEntityWorkflowSandboxData
+    from .fulfilled_ad_hoc_execute_prompt_event import FulfilledAdHocExecutePromptEvent
+    from .fulfilled_enum import FulfilledEnum
+    from .fulfilled_execute_prompt_event import FulfilledExecutePromptEvent
+    from .fulfilled_execute_prompt_response import FulfilledExecutePromptResponse
+    from .fulfilled_execute_workflow_workflow_result_event import FulfilledExecuteWorkflowWorkflowResultEvent
+    from .fulfilled_prompt_execution_meta import FulfilledPromptExecutionMeta
+    from .fulfilled_workflow_node_result_event import FulfilledWorkflowNodeResultEvent
+    from .function_call import FunctionCall
+    from .function_call_chat_message_content import FunctionCallChatMessageContent
+    from .function_call_chat_message_content_request import FunctionCallChatMessageContentRequest
+    from .function_call_chat_message_content_value import FunctionCallChatMessageContentValue
+    from .function_call_chat_message_content_value_request import FunctionCallChatMessageContentValueRequest
+    from .function_call_input import FunctionCallInput
+    from .function_call_request import FunctionCallRequest
+    from .function_call_variable_value import FunctionCallVariableValue
+    from .function_call_vellum_value import FunctionCallVellumValue
+    from .function_call_vellum_value_request import FunctionCallVellumValueRequest
+    from .function_definition import FunctionDefinition
+    from .generate_options_request import GenerateOptionsRequest
+    from .generate_request import GenerateRequest
+    from .generate_response import GenerateResponse
+    from .generate_result import GenerateResult
+    from .generate_result_data import GenerateResultData
+    from .generate_result_error import GenerateResultError
+    from .generate_stream_response import GenerateStreamResponse
+    from .generate_stream_result import GenerateStreamResult
+    from .generate_stream_result_data import GenerateStreamResultData
+    from .google_vertex_ai_vectorizer_config import GoogleVertexAiVectorizerConfig
+    from .google_vertex_ai_vectorizer_config_request import GoogleVertexAiVectorizerConfigRequest
+    from .google_vertex_ai_vectorizer_text_embedding_004 import GoogleVertexAiVectorizerTextEmbedding004
+    from .google_vertex_ai_vectorizer_text_embedding_004_request import GoogleVertexAiVectorizerTextEmbedding004Request
+    from .google_vertex_ai_vectorizer_text_multilingual_embedding_002 import (
+        GoogleVertexAiVectorizerTextMultilingualEmbedding002,
+    )
+    from .google_vertex_ai_vectorizer_text_multilingual_embedding_002_request import (
+        GoogleVertexAiVectorizerTextMultilingualEmbedding002Request,
+    )
+    from .hkunlp_instructor_xl_vectorizer import HkunlpInstructorXlVectorizer
+    from .hkunlp_instructor_xl_vectorizer_request import HkunlpInstructorXlVectorizerRequest
+    from .image_chat_message_content import ImageChatMessageContent
+    from .image_chat_message_content_request import ImageChatMessageContentRequest
+    from .image_variable_value import ImageVariableValue
+    from .image_vellum_value import ImageVellumValue
+    from .image_vellum_value_request import ImageVellumValueRequest
+    from .indexing_config_vectorizer import IndexingConfigVectorizer
+    from .indexing_config_vectorizer_request import IndexingConfigVectorizerRequest
+    from .indexing_state_enum import IndexingStateEnum
+    from .initiated_ad_hoc_execute_prompt_event import InitiatedAdHocExecutePromptEvent
+    from .initiated_execute_prompt_event import InitiatedExecutePromptEvent
+    from .initiated_prompt_execution_meta import InitiatedPromptExecutionMeta
+    from .initiated_workflow_node_result_event import InitiatedWorkflowNodeResultEvent
+    from .instructor_vectorizer_config import InstructorVectorizerConfig
+    from .instructor_vectorizer_config_request import InstructorVectorizerConfigRequest
+    from .iteration_state_enum import IterationStateEnum
+    from .jinja_prompt_block import JinjaPromptBlock
+    from .json_input import JsonInput
+    from .json_input_request import JsonInputRequest
+    from .json_variable_value import JsonVariableValue
+    from .json_vellum_value import JsonVellumValue
+    from .json_vellum_value_request import JsonVellumValueRequest
+    from .logical_operator import LogicalOperator
+    from .logprobs_enum import LogprobsEnum
+    from .map_node_result import MapNodeResult
+    from .map_node_result_data import MapNodeResultData
+    from .merge_node_result import MergeNodeResult
+    from .merge_node_result_data import MergeNodeResultData
+    from .metadata_filter_config_request import MetadataFilterConfigRequest
+    from .metadata_filter_rule_combinator import MetadataFilterRuleCombinator
+    from .metadata_filter_rule_request import MetadataFilterRuleRequest
+    from .metadata_filters_request import MetadataFiltersRequest
+    from .metric_definition_execution import MetricDefinitionExecution
+    from .metric_definition_history_item import MetricDefinitionHistoryItem
+    from .metric_definition_input import MetricDefinitionInput
+    from .metric_node_result import MetricNodeResult
+    from .ml_model_read import MlModelRead
+    from .ml_model_usage import MlModelUsage
+    from .named_scenario_input_chat_history_variable_value_request import NamedScenarioInputChatHistoryVariableValueRequest
+    from .named_scenario_input_json_variable_value_request import NamedScenarioInputJsonVariableValueRequest
+    from .named_scenario_input_request import NamedScenarioInputRequest
+    from .named_scenario_input_string_variable_value_request import NamedScenarioInputStringVariableValueRequest
+    from .named_test_case_array_variable_value import NamedTestCaseArrayVariableValue
+    from .named_test_case_array_variable_value_request import NamedTestCaseArrayVariableValueRequest
+    from .named_test_case_chat_history_variable_value import NamedTestCaseChatHistoryVariableValue
+    from .named_test_case_chat_history_variable_value_request import NamedTestCaseChatHistoryVariableValueRequest
+    from .named_test_case_error_variable_value import NamedTestCaseErrorVariableValue
+    from .named_test_case_error_variable_value_request import NamedTestCaseErrorVariableValueRequest
+    from .named_test_case_function_call_variable_value import NamedTestCaseFunctionCallVariableValue
+    from .named_test_case_function_call_variable_value_request import NamedTestCaseFunctionCallVariableValueRequest
+    from .named_test_case_json_variable_value import NamedTestCaseJsonVariableValue
+    from .named_test_case_json_variable_value_request import NamedTestCaseJsonVariableValueRequest
+    from .named_test_case_number_variable_value import NamedTestCaseNumberVariableValue
+    from .named_test_case_number_variable_value_request import NamedTestCaseNumberVariableValueRequest
+    from .named_test_case_search_results_variable_value import NamedTestCaseSearchResultsVariableValue
+    from .named_test_case_search_results_variable_value_request import NamedTestCaseSearchResultsVariableValueRequest
+    from .named_test_case_string_variable_value import NamedTestCaseStringVariableValue
+    from .named_test_case_string_variable_value_request import NamedTestCaseStringVariableValueRequest
+    from .named_test_case_variable_value import NamedTestCaseVariableValue
+    from .named_test_case_variable_value_request import NamedTestCaseVariableValueRequest
+    from .node_input_compiled_array_value import NodeInputCompiledArrayValue
+    from .node_input_compiled_chat_history_value import NodeInputCompiledChatHistoryValue
+    from .node_input_compiled_error_value import NodeInputCompiledErrorValue
+    from .node_input_compiled_function_call_value import NodeInputCompiledFunctionCallValue
+    from .node_input_compiled_json_value import NodeInputCompiledJsonValue
+    from .node_input_compiled_number_value import NodeInputCompiledNumberValue
+    from .node_input_compiled_search_results_value import NodeInputCompiledSearchResultsValue
+    from .node_input_compiled_string_value import NodeInputCompiledStringValue
+    from .node_input_variable_compiled_value import NodeInputVariableCompiledValue
+    from .node_output_compiled_array_value import NodeOutputCompiledArrayValue
+    from .node_output_compiled_chat_history_value import NodeOutputCompiledChatHistoryValue
+    from .node_output_compiled_error_value import NodeOutputCompiledErrorValue
+    from .node_output_compiled_function_call_value import NodeOutputCompiledFunctionCallValue
+    from .node_output_compiled_json_value import NodeOutputCompiledJsonValue
+    from .node_output_compiled_number_value import NodeOutputCompiledNumberValue
+    from .node_output_compiled_search_results_value import NodeOutputCompiledSearchResultsValue
+    from .node_output_compiled_string_value import NodeOutputCompiledStringValue
+    from .node_output_compiled_value import NodeOutputCompiledValue
+    from .normalized_log_probs import NormalizedLogProbs
+    from .normalized_token_log_probs import NormalizedTokenLogProbs
+    from .number_input import NumberInput
+    from .number_variable_value import NumberVariableValue
+    from .number_vellum_value import NumberVellumValue
+    from .number_vellum_value_request import NumberVellumValueRequest
+    from .open_ai_vectorizer_config import OpenAiVectorizerConfig
+    from .open_ai_vectorizer_config_request import OpenAiVectorizerConfigRequest
+    from .open_ai_vectorizer_text_embedding_3_large import OpenAiVectorizerTextEmbedding3Large
+    from .open_ai_vectorizer_text_embedding_3_large_request import OpenAiVectorizerTextEmbedding3LargeRequest
+    from .open_ai_vectorizer_text_embedding_3_small import OpenAiVectorizerTextEmbedding3Small
+    from .open_ai_vectorizer_text_embedding_3_small_request import OpenAiVectorizerTextEmbedding3SmallRequest
+    from .open_ai_vectorizer_text_embedding_ada_002 import OpenAiVectorizerTextEmbeddingAda002
+    from .open_ai_vectorizer_text_embedding_ada_002_request import OpenAiVectorizerTextEmbeddingAda002Request
+    from .paginated_container_image_read_list import PaginatedContainerImageReadList
+    from .paginated_deployment_release_tag_read_list import PaginatedDeploymentReleaseTagReadList
+    from .paginated_document_index_read_list import PaginatedDocumentIndexReadList
+    from .paginated_folder_entity_list import PaginatedFolderEntityList
+    from .paginated_slim_deployment_read_list import PaginatedSlimDeploymentReadList
+    from .paginated_slim_document_list import PaginatedSlimDocumentList
+    from .paginated_slim_workflow_deployment_list import PaginatedSlimWorkflowDeploymentList
+    from .paginated_test_suite_run_execution_list import PaginatedTestSuiteRunExecutionList
+    from .paginated_test_suite_test_case_list import PaginatedTestSuiteTestCaseList
+    from .paginated_workflow_release_tag_read_list import PaginatedWorkflowReleaseTagReadList
+    from .pdf_search_result_meta_source import PdfSearchResultMetaSource
+    from .pdf_search_result_meta_source_request import PdfSearchResultMetaSourceRequest
+    from .plain_text_prompt_block import PlainTextPromptBlock
+    from .price import Price
+    from .processing_failure_reason_enum import ProcessingFailureReasonEnum
+    from .prompt_block import PromptBlock
+    from .prompt_block_state import PromptBlockState
+    from .prompt_deployment_expand_meta_request import PromptDeploymentExpandMetaRequest
+    from .prompt_deployment_input_request import PromptDeploymentInputRequest
+    from .prompt_execution_meta import PromptExecutionMeta
+    from .prompt_node_execution_meta import PromptNodeExecutionMeta
+    from .prompt_node_result import PromptNodeResult
+    from .prompt_node_result_data import PromptNodeResultData
+    from .prompt_output import PromptOutput
+    from .prompt_parameters import PromptParameters
+    from .prompt_request_chat_history_input import PromptRequestChatHistoryInput
+    from .prompt_request_input import PromptRequestInput
+    from .prompt_request_json_input import PromptRequestJsonInput
+    from .prompt_request_string_input import PromptRequestStringInput
+    from .prompt_settings import PromptSettings
+    from .raw_prompt_execution_overrides_request import RawPromptExecutionOverridesRequest
+    from .reducto_chunker_config import ReductoChunkerConfig
+    from .reducto_chunker_config_request import ReductoChunkerConfigRequest
+    from .reducto_chunking import ReductoChunking
+    from .reducto_chunking_request import ReductoChunkingRequest
+    from .rejected_ad_hoc_execute_prompt_event import RejectedAdHocExecutePromptEvent
+    from .rejected_execute_prompt_event import RejectedExecutePromptEvent
+    from .rejected_execute_prompt_response import RejectedExecutePromptResponse
+    from .rejected_execute_workflow_workflow_result_event import RejectedExecuteWorkflowWorkflowResultEvent
+    from .rejected_prompt_execution_meta import RejectedPromptExecutionMeta
+    from .rejected_workflow_node_result_event import RejectedWorkflowNodeResultEvent
+    from .release_tag_source import ReleaseTagSource
+    from .replace_test_suite_test_case_request import ReplaceTestSuiteTestCaseRequest
+    from .rich_text_child_block import RichTextChildBlock
+    from .rich_text_prompt_block import RichTextPromptBlock
+    from .sandbox_scenario import SandboxScenario
+    from .scenario_input import ScenarioInput
+    from .scenario_input_chat_history_variable_value import ScenarioInputChatHistoryVariableValue
+    from .scenario_input_json_variable_value import ScenarioInputJsonVariableValue
+    from .scenario_input_string_variable_value import ScenarioInputStringVariableValue
+    from .search_filters_request import SearchFiltersRequest
+    from .search_node_result import SearchNodeResult
+    from .search_node_result_data import SearchNodeResultData
+    from .search_request_options_request import SearchRequestOptionsRequest
+    from .search_response import SearchResponse
+    from .search_result import SearchResult
+    from .search_result_document import SearchResultDocument
+    from .search_result_document_request import SearchResultDocumentRequest
+    from .search_result_merging_request import SearchResultMergingRequest
+    from .search_result_meta import SearchResultMeta
+    from .search_result_meta_request import SearchResultMetaRequest
+    from .search_result_request import SearchResultRequest
+    from .search_results_input import SearchResultsInput
+    from .search_results_variable_value import SearchResultsVariableValue
+    from .search_results_vellum_value import SearchResultsVellumValue
+    from .search_results_vellum_value_request import SearchResultsVellumValueRequest
+    from .search_weights_request import SearchWeightsRequest
+    from .secret_type_enum import SecretTypeEnum
+    from .sentence_chunker_config import SentenceChunkerConfig
+    from .sentence_chunker_config_request import SentenceChunkerConfigRequest
+    from .sentence_chunking import SentenceChunking
+    from .sentence_chunking_request import SentenceChunkingRequest
+    from .slim_deployment_read import SlimDeploymentRead
+    from .slim_document import SlimDocument
+    from .slim_document_document_to_document_index import SlimDocumentDocumentToDocumentIndex
+    from .slim_workflow_deployment import SlimWorkflowDeployment
+    from .streaming_ad_hoc_execute_prompt_event import StreamingAdHocExecutePromptEvent
+    from .streaming_execute_prompt_event import StreamingExecutePromptEvent
+    from .streaming_prompt_execution_meta import StreamingPromptExecutionMeta
+    from .streaming_workflow_node_result_event import StreamingWorkflowNodeResultEvent
+    from .string_chat_message_content import StringChatMessageContent
+    from .string_chat_message_content_request import StringChatMessageContentRequest
+    from .string_input import StringInput
+    from .string_input_request import StringInputRequest
+    from .string_variable_value import StringVariableValue
+    from .string_vellum_value import StringVellumValue
+    from .string_vellum_value_request import StringVellumValueRequest
+    from .submit_completion_actual_request import SubmitCompletionActualRequest
+    from .submit_workflow_execution_actual_request import SubmitWorkflowExecutionActualRequest
+    from .subworkflow_node_result import SubworkflowNodeResult
+    from .subworkflow_node_result_data import SubworkflowNodeResultData
+    from .templating_node_array_result import TemplatingNodeArrayResult
+    from .templating_node_chat_history_result import TemplatingNodeChatHistoryResult
+    from .templating_node_error_result import TemplatingNodeErrorResult
+    from .templating_node_function_call_result import TemplatingNodeFunctionCallResult
+    from .templating_node_json_result import TemplatingNodeJsonResult
+    from .templating_node_number_result import TemplatingNodeNumberResult
+    from .templating_node_result import TemplatingNodeResult
+    from .templating_node_result_data import TemplatingNodeResultData
+    from .templating_node_result_output import TemplatingNodeResultOutput
+    from .templating_node_search_results_result import TemplatingNodeSearchResultsResult
+    from .templating_node_string_result import TemplatingNodeStringResult
+    from .terminal_node_array_result import TerminalNodeArrayResult
+    from .terminal_node_chat_history_result import TerminalNodeChatHistoryResult
+    from .terminal_node_error_result import TerminalNodeErrorResult
+    from .terminal_node_function_call_result import TerminalNodeFunctionCallResult
+    from .terminal_node_json_result import TerminalNodeJsonResult
+    from .terminal_node_number_result import TerminalNodeNumberResult
+    from .terminal_node_result import TerminalNodeResult
+    from .terminal_node_result_data import TerminalNodeResultData
+    from .terminal_node_result_output import TerminalNodeResultOutput
+    from .terminal_node_search_results_result import TerminalNodeSearchResultsResult
+    from .terminal_node_string_result import TerminalNodeStringResult
+    from .test_case_array_variable_value import TestCaseArrayVariableValue
+    from .test_case_chat_history_variable_value import TestCaseChatHistoryVariableValue
+    from .test_case_error_variable_value import TestCaseErrorVariableValue
+    from .test_case_function_call_variable_value import TestCaseFunctionCallVariableValue
+    from .test_case_json_variable_value import TestCaseJsonVariableValue
+    from .test_case_number_variable_value import TestCaseNumberVariableValue
+    from .test_case_search_results_variable_value import TestCaseSearchResultsVariableValue
+    from .test_case_string_variable_value import TestCaseStringVariableValue
+    from .test_case_variable_value import TestCaseVariableValue
+    from .test_suite_run_deployment_release_tag_exec_config import TestSuiteRunDeploymentReleaseTagExecConfig
+    from .test_suite_run_deployment_release_tag_exec_config_data import TestSuiteRunDeploymentReleaseTagExecConfigData
+    from .test_suite_run_deployment_release_tag_exec_config_data_request import (
+        TestSuiteRunDeploymentReleaseTagExecConfigDataRequest,
+    )
+    from .test_suite_run_deployment_release_tag_exec_config_request import TestSuiteRunDeploymentReleaseTagExecConfigRequest
+    from .test_suite_run_exec_config import TestSuiteRunExecConfig
+    from .test_suite_run_exec_config_request import TestSuiteRunExecConfigRequest
+    from .test_suite_run_execution import TestSuiteRunExecution
+    from .test_suite_run_execution_array_output import TestSuiteRunExecutionArrayOutput
+    from .test_suite_run_execution_chat_history_output import TestSuiteRunExecutionChatHistoryOutput
+    from .test_suite_run_execution_error_output import TestSuiteRunExecutionErrorOutput
+    from .test_suite_run_execution_function_call_output import TestSuiteRunExecutionFunctionCallOutput
+    from .test_suite_run_execution_json_output import TestSuiteRunExecutionJsonOutput
+    from .test_suite_run_execution_metric_definition import TestSuiteRunExecutionMetricDefinition
+    from .test_suite_run_execution_metric_result import TestSuiteRunExecutionMetricResult
+    from .test_suite_run_execution_number_output import TestSuiteRunExecutionNumberOutput
+    from .test_suite_run_execution_output import TestSuiteRunExecutionOutput
+    from .test_suite_run_execution_search_results_output import TestSuiteRunExecutionSearchResultsOutput
+    from .test_suite_run_execution_string_output import TestSuiteRunExecutionStringOutput
+    from .test_suite_run_external_exec_config import TestSuiteRunExternalExecConfig
+    from .test_suite_run_external_exec_config_data import TestSuiteRunExternalExecConfigData
+    from .test_suite_run_external_exec_config_data_request import TestSuiteRunExternalExecConfigDataRequest
+    from .test_suite_run_external_exec_config_request import TestSuiteRunExternalExecConfigRequest
+    from .test_suite_run_metric_error_output import TestSuiteRunMetricErrorOutput
+    from .test_suite_run_metric_json_output import TestSuiteRunMetricJsonOutput
+    from .test_suite_run_metric_number_output import TestSuiteRunMetricNumberOutput
+    from .test_suite_run_metric_output import TestSuiteRunMetricOutput
+    from .test_suite_run_metric_string_output import TestSuiteRunMetricStringOutput
+    from .test_suite_run_prompt_sandbox_history_item_exec_config import TestSuiteRunPromptSandboxHistoryItemExecConfig
+    from .test_suite_run_prompt_sandbox_history_item_exec_config_data import (
+        TestSuiteRunPromptSandboxHistoryItemExecConfigData,
+    )
+    from .test_suite_run_prompt_sandbox_history_item_exec_config_data_request import (
+        TestSuiteRunPromptSandboxHistoryItemExecConfigDataRequest,
+    )
+    from .test_suite_run_prompt_sandbox_history_item_exec_config_request import (
+        TestSuiteRunPromptSandboxHistoryItemExecConfigRequest,
+    )
+    from .test_suite_run_read import TestSuiteRunRead
+    from .test_suite_run_state import TestSuiteRunState
+    from .test_suite_run_test_suite import TestSuiteRunTestSuite
+    from .test_suite_run_workflow_release_tag_exec_config import TestSuiteRunWorkflowReleaseTagExecConfig
+    from .test_suite_run_workflow_release_tag_exec_config_data import TestSuiteRunWorkflowReleaseTagExecConfigData
+    from .test_suite_run_workflow_release_tag_exec_config_data_request import (
+        TestSuiteRunWorkflowReleaseTagExecConfigDataRequest,
+    )
+    from .test_suite_run_workflow_release_tag_exec_config_request import TestSuiteRunWorkflowReleaseTagExecConfigRequest
+    from .test_suite_run_workflow_sandbox_history_item_exec_config import TestSuiteRunWorkflowSandboxHistoryItemExecConfig
+    from .test_suite_run_workflow_sandbox_history_item_exec_config_data import (
+        TestSuiteRunWorkflowSandboxHistoryItemExecConfigData,
+    )
+    from .test_suite_run_workflow_sandbox_history_item_exec_config_data_request import (
+        TestSuiteRunWorkflowSandboxHistoryItemExecConfigDataRequest,
+    )
+    from .test_suite_run_workflow_sandbox_history_item_exec_config_request import (
+        TestSuiteRunWorkflowSandboxHistoryItemExecConfigRequest,
+    )
+    from .test_suite_test_case import TestSuiteTestCase
+    from .test_suite_test_case_bulk_operation_request import TestSuiteTestCaseBulkOperationRequest
+    from .test_suite_test_case_bulk_result import TestSuiteTestCaseBulkResult
+    from .test_suite_test_case_create_bulk_operation_request import TestSuiteTestCaseCreateBulkOperationRequest
+    from .test_suite_test_case_created_bulk_result import TestSuiteTestCaseCreatedBulkResult
+    from .test_suite_test_case_created_bulk_result_data import TestSuiteTestCaseCreatedBulkResultData
+    from .test_suite_test_case_delete_bulk_operation_data_request import TestSuiteTestCaseDeleteBulkOperationDataRequest
+    from .test_suite_test_case_delete_bulk_operation_request import TestSuiteTestCaseDeleteBulkOperationRequest
+    from .test_suite_test_case_deleted_bulk_result import TestSuiteTestCaseDeletedBulkResult
+    from .test_suite_test_case_deleted_bulk_result_data import TestSuiteTestCaseDeletedBulkResultData
+    from .test_suite_test_case_rejected_bulk_result import TestSuiteTestCaseRejectedBulkResult
+    from .test_suite_test_case_replace_bulk_operation_request import TestSuiteTestCaseReplaceBulkOperationRequest
+    from .test_suite_test_case_replaced_bulk_result import TestSuiteTestCaseReplacedBulkResult
+    from .test_suite_test_case_replaced_bulk_result_data import TestSuiteTestCaseReplacedBulkResultData
+    from .test_suite_test_case_upsert_bulk_operation_request import TestSuiteTestCaseUpsertBulkOperationRequest
+    from .token_overlapping_window_chunker_config import TokenOverlappingWindowChunkerConfig
+    from .token_overlapping_window_chunker_config_request import TokenOverlappingWindowChunkerConfigRequest
+    from .token_overlapping_window_chunking import TokenOverlappingWindowChunking
+    from .token_overlapping_window_chunking_request import TokenOverlappingWindowChunkingRequest
+    from .unit_enum import UnitEnum
+    from .upload_document_response import UploadDocumentResponse
+    from .upsert_test_suite_test_case_request import UpsertTestSuiteTestCaseRequest
+    from .variable_prompt_block import VariablePromptBlock
+    from .vellum_audio import VellumAudio
+    from .vellum_audio_request import VellumAudioRequest
+    from .vellum_error import VellumError
+    from .vellum_error_code_enum import VellumErrorCodeEnum
+    from .vellum_error_request import VellumErrorRequest
+    from .vellum_image import VellumImage
+    from .vellum_image_request import VellumImageRequest
+    from .vellum_value import VellumValue
+    from .vellum_value_logical_condition_group_request import VellumValueLogicalConditionGroupRequest
+    from .vellum_value_logical_condition_request import VellumValueLogicalConditionRequest
+    from .vellum_value_logical_expression_request import VellumValueLogicalExpressionRequest
+    from .vellum_value_request import VellumValueRequest
+    from .vellum_variable import VellumVariable
+    from .vellum_variable_extensions import VellumVariableExtensions
+    from .vellum_variable_type import VellumVariableType
+    from .workflow_deployment_history_item import WorkflowDeploymentHistoryItem
+    from .workflow_deployment_read import WorkflowDeploymentRead
+    from .workflow_event_error import WorkflowEventError
+    from .workflow_execution_actual_chat_history_request import WorkflowExecutionActualChatHistoryRequest
+    from .workflow_execution_actual_json_request import WorkflowExecutionActualJsonRequest
+    from .workflow_execution_actual_string_request import WorkflowExecutionActualStringRequest
+    from .workflow_execution_event_error_code import WorkflowExecutionEventErrorCode
+    from .workflow_execution_event_type import WorkflowExecutionEventType
+    from .workflow_execution_node_result_event import WorkflowExecutionNodeResultEvent
+    from .workflow_execution_workflow_result_event import WorkflowExecutionWorkflowResultEvent
+    from .workflow_expand_meta_request import WorkflowExpandMetaRequest
+    from .workflow_node_result_data import WorkflowNodeResultData
+    from .workflow_node_result_event import WorkflowNodeResultEvent
+    from .workflow_node_result_event_state import WorkflowNodeResultEventState
+    from .workflow_output import WorkflowOutput
+    from .workflow_output_array import WorkflowOutputArray
+    from .workflow_output_chat_history import WorkflowOutputChatHistory
+    from .workflow_output_error import WorkflowOutputError
+    from .workflow_output_function_call import WorkflowOutputFunctionCall
+    from .workflow_output_image import WorkflowOutputImage
+    from .workflow_output_json import WorkflowOutputJson
+    from .workflow_output_number import WorkflowOutputNumber
+    from .workflow_output_search_results import WorkflowOutputSearchResults
+    from .workflow_output_string import WorkflowOutputString
+    from .workflow_push_deployment_config_request import WorkflowPushDeploymentConfigRequest
+    from .workflow_push_exec_config import WorkflowPushExecConfig
+    from .workflow_push_response import WorkflowPushResponse
+    from .workflow_release_tag_read import WorkflowReleaseTagRead
+    from .workflow_release_tag_workflow_deployment_history_item import WorkflowReleaseTagWorkflowDeploymentHistoryItem
+    from .workflow_request_chat_history_input_request import WorkflowRequestChatHistoryInputRequest
+    from .workflow_request_input_request import WorkflowRequestInputRequest
+    from .workflow_request_json_input_request import WorkflowRequestJsonInputRequest
+    from .workflow_request_number_input_request import WorkflowRequestNumberInputRequest
+    from .workflow_request_string_input_request import WorkflowRequestStringInputRequest
+    from .workflow_result_event import WorkflowResultEvent
+    from .workflow_result_event_output_data import WorkflowResultEventOutputData
+    from .workflow_result_event_output_data_array import WorkflowResultEventOutputDataArray
+    from .workflow_result_event_output_data_chat_history import WorkflowResultEventOutputDataChatHistory
+    from .workflow_result_event_output_data_error import WorkflowResultEventOutputDataError
+    from .workflow_result_event_output_data_function_call import WorkflowResultEventOutputDataFunctionCall
+    from .workflow_result_event_output_data_json import WorkflowResultEventOutputDataJson
+    from .workflow_result_event_output_data_number import WorkflowResultEventOutputDataNumber
+    from .workflow_result_event_output_data_search_results import WorkflowResultEventOutputDataSearchResults
+    from .workflow_result_event_output_data_string import WorkflowResultEventOutputDataString
+    from .workflow_stream_event import WorkflowStreamEvent
+    from .workspace_secret_read import WorkspaceSecretRead
+
+_LAZY_IMPORTS: typing.Dict[str, str] = {
+    "AdHocExecutePromptEvent": ".ad_hoc_execute_prompt_event",
+    "AdHocExpandMeta": ".ad_hoc_expand_meta",
+    "AdHocFulfilledPromptExecutionMeta": ".ad_hoc_fulfilled_prompt_execution_meta",
+    "AdHocInitiatedPromptExecutionMeta": ".ad_hoc_initiated_prompt_execution_meta",
+    "AdHocRejectedPromptExecutionMeta": ".ad_hoc_rejected_prompt_execution_meta",
+    "AdHocStreamingPromptExecutionMeta": ".ad_hoc_streaming_prompt_execution_meta",
+    "AddOpenaiApiKeyEnum": ".add_openai_api_key_enum",
+    "ApiNodeResult": ".api_node_result",
+    "ApiNodeResultData": ".api_node_result_data",
+    "ArrayChatMessageContent": ".array_chat_message_content",
+    "ArrayChatMessageContentItem": ".array_chat_message_content_item",
+    "ArrayChatMessageContentItemRequest": ".array_chat_message_content_item_request",
+    "ArrayChatMessageContentRequest": ".array_chat_message_content_request",
+    "ArrayInput": ".array_input",
+    "ArrayVariableValue": ".array_variable_value",
+    "ArrayVariableValueItem": ".array_variable_value_item",
+    "ArrayVellumValue": ".array_vellum_value",
+    "ArrayVellumValueRequest": ".array_vellum_value_request",
+    "AudioChatMessageContent": ".audio_chat_message_content",
+    "AudioChatMessageContentRequest": ".audio_chat_message_content_request",
+    "AudioVariableValue": ".audio_variable_value",
+    "AudioVellumValue": ".audio_vellum_value",
+    "AudioVellumValueRequest": ".audio_vellum_value_request",
+    "BasicVectorizerIntfloatMultilingualE5Large": ".basic_vectorizer_intfloat_multilingual_e_5_large",
+    "BasicVectorizerIntfloatMultilingualE5LargeRequest": ".basic_vectorizer_intfloat_multilingual_e_5_large_request",
+    "BasicVectorizerSentenceTransformersMultiQaMpnetBaseCosV1": ".basic_vectorizer_sentence_transformers_multi_qa_mpnet_base_cos_v_1",
+    "BasicVectorizerSentenceTransformersMultiQaMpnetBaseCosV1Request": ".basic_vectorizer_sentence_transformers_multi_qa_mpnet_base_cos_v_1_request",
+    "BasicVectorizerSentenceTransformersMultiQaMpnetBaseDotV1": ".basic_vectorizer_sentence_transformers_multi_qa_mpnet_base_dot_v_1",
+    "BasicVectorizerSentenceTransformersMultiQaMpnetBaseDotV1Request": ".basic_vectorizer_sentence_transformers_multi_qa_mpnet_base_dot_v_1_request",
+    "ChatHistoryInput": ".chat_history_input",
+    "ChatHistoryInputRequest": ".chat_history_input_request",
+    "ChatHistoryVariableValue": ".chat_history_variable_value",
+    "ChatHistoryVellumValue": ".chat_history_vellum_value",
+    "ChatHistoryVellumValueRequest": ".chat_history_vellum_value_request",
+    "ChatMessage": ".chat_message",
+    "ChatMessageContent": ".chat_message_content",
+    "ChatMessageContentRequest": ".chat_message_content_request",
+    "ChatMessagePromptBlock": ".chat_message_prompt_block",
+    "ChatMessageRequest": ".chat_message_request",
+    "ChatMessageRole": ".chat_message_role",
+    "CodeExecutionNodeArrayResult": ".code_execution_node_array_result",
+    "CodeExecutionNodeChatHistoryResult": ".code_execution_node_chat_history_result",
+    "CodeExecutionNodeErrorResult": ".code_execution_node_error_result",
+    "CodeExecutionNodeFunctionCallResult": ".code_execution_node_function_call_result",
+    "CodeExecutionNodeJsonResult": ".code_execution_node_json_result",
+    "CodeExecutionNodeNumberResult": ".code_execution_node_number_result",
+    "CodeExecutionNodeResult": ".code_execution_node_result",
+    "CodeExecutionNodeResultData": ".code_execution_node_result_data",
+    "CodeExecutionNodeResultOutput": ".code_execution_node_result_output",
+    "CodeExecutionNodeSearchResultsResult": ".code_execution_node_search_results_result",
+    "CodeExecutionNodeStringResult": ".code_execution_node_string_result",
+    "CodeExecutionPackage": ".code_execution_package",
+    "CodeExecutionRuntime": ".code_execution_runtime",
+    "CodeExecutorInput": ".code_executor_input",
+    "CodeExecutorResponse": ".code_executor_response",
+    "CodeExecutorSecretInput": ".code_executor_secret_input",
+    "CompilePromptDeploymentExpandMetaRequest": ".compile_prompt_deployment_expand_meta_request",
+    "CompilePromptMeta": ".compile_prompt_meta",
+    "ComponentsSchemasPdfSearchResultMetaSource": ".components_schemas_pdf_search_result_meta_source",
+    "ComponentsSchemasPdfSearchResultMetaSourceRequest": ".components_schemas_pdf_search_result_meta_source_request",
+    "ConditionCombinator": ".condition_combinator",
+    "ConditionalNodeResult": ".conditional_node_result",
+    "ConditionalNodeResultData": ".conditional_node_result_data",
+    "ContainerImageRead": ".container_image_read",
+    "CreateTestSuiteTestCaseRequest": ".create_test_suite_test_case_request",
+    "DeploymentHistoryItem": ".deployment_history_item",
+    "DeploymentProviderPayloadResponse": ".deployment_provider_payload_response",
+    "DeploymentProviderPayloadResponsePayload": ".deployment_provider_payload_response_payload",
+    "DeploymentRead": ".deployment_read",
+    "DeploymentReleaseTagDeploymentHistoryItem": ".deployment_release_tag_deployment_history_item",
+    "DeploymentReleaseTagRead": ".deployment_release_tag_read",
+    "DockerServiceToken": ".docker_service_token",
+    "DocumentDocumentToDocumentIndex": ".document_document_to_document_index",
+    "DocumentIndexChunking": ".document_index_chunking",
+    "DocumentIndexChunkingRequest": ".document_index_chunking_request",
+    "DocumentIndexIndexingConfig": ".document_index_indexing_config",
+    "DocumentIndexIndexingConfigRequest": ".document_index_indexing_config_request",
+    "DocumentIndexRead": ".document_index_read",
+    "DocumentProcessingState": ".document_processing_state",
+    "DocumentRead": ".document_read",
+    "DocumentStatus": ".document_status",
+    "EnrichedNormalizedCompletion": ".enriched_normalized_completion",
+    "EntityStatus": ".entity_status",
+    "EntityVisibility": ".entity_visibility",
+    "EnvironmentEnum": ".environment_enum",
+    "EphemeralPromptCacheConfig": ".ephemeral_prompt_cache_config",
+    "EphemeralPromptCacheConfigTypeEnum": ".ephemeral_prompt_cache_config_type_enum",
+    "ErrorInput": ".error_input",
+    "ErrorVariableValue": ".error_variable_value",
+    "ErrorVellumValue": ".error_vellum_value",
+    "ErrorVellumValueRequest": ".error_vellum_value_request",
+    "ExecutePromptEvent": ".execute_prompt_event",
+    "ExecutePromptResponse": ".execute_prompt_response",
+    "ExecuteWorkflowResponse": ".execute_workflow_response",
+    "ExecuteWorkflowWorkflowResultEvent": ".execute_workflow_workflow_result_event",
+    "ExecutionArrayVellumValue": ".execution_array_vellum_value",
+    "ExecutionChatHistoryVellumValue": ".execution_chat_history_vellum_value",
+    "ExecutionErrorVellumValue": ".execution_error_vellum_value",
+    "ExecutionFunctionCallVellumValue": ".execution_function_call_vellum_value",
+    "ExecutionJsonVellumValue": ".execution_json_vellum_value",
+    "ExecutionNumberVellumValue": ".execution_number_vellum_value",
+    "ExecutionSearchResultsVellumValue": ".execution_search_results_vellum_value",
+    "ExecutionStringVellumValue": ".execution_string_vellum_value",
+    "ExecutionVellumValue": ".execution_vellum_value",
+    "ExternalTestCaseExecution": ".external_test_case_execution",
+    "ExternalTestCaseExecutionRequest": ".external_test_case_execution_request",
+    "FinishReasonEnum": ".finish_reason_enum",
+    "FolderEntity": ".folder_entity",
+    "FolderEntityDocumentIndex": ".folder_entity_document_index",
+    "FolderEntityDocumentIndexData": ".folder_entity_document_index_data",
+    "FolderEntityFolder": ".folder_entity_folder",
+    "FolderEntityFolderData": ".folder_entity_folder_data",
+    "FolderEntityPromptSandbox": ".folder_entity_prompt_sandbox",
+    "FolderEntityPromptSandboxData": ".folder_entity_prompt_sandbox_data",
+    "FolderEntityTestSuite": ".folder_entity_test_suite",
+    "FolderEntityTestSuiteData": ".folder_entity_test_suite_data",
+    "FolderEntityWorkflowSandbox": ".folder_entity_workflow_sandbox",
+    "FolderEntityWorkflowSandboxData": ".folder_entity_workflow_sandbox_data",
+    "FulfilledAdHocExecutePromptEvent": ".fulfilled_ad_hoc_execute_prompt_event",
+    "FulfilledEnum": ".fulfilled_enum",
+    "FulfilledExecutePromptEvent": ".fulfilled_execute_prompt_event",
+    "FulfilledExecutePromptResponse": ".fulfilled_execute_prompt_response",
+    "FulfilledExecuteWorkflowWorkflowResultEvent": ".fulfilled_execute_workflow_workflow_result_event",
+    "FulfilledPromptExecutionMeta": ".fulfilled_prompt_execution_meta",
+    "FulfilledWorkflowNodeResultEvent": ".fulfilled_workflow_node_result_event",
+    "FunctionCall": ".function_call",
+    "FunctionCallChatMessageContent": ".function_call_chat_message_content",
+    "FunctionCallChatMessageContentRequest": ".function_call_chat_message_content_request",
+    "FunctionCallChatMessageContentValue": ".function_call_chat_message_content_value",
+    "FunctionCallChatMessageContentValueRequest": ".function_call_chat_message_content_value_request",
+    "FunctionCallInput": ".function_call_input",
+    "FunctionCallRequest": ".function_call_request",
+    "FunctionCallVariableValue": ".function_call_variable_value",
+    "FunctionCallVellumValue": ".function_call_vellum_value",
+    "FunctionCallVellumValueRequest": ".function_call_vellum_value_request",
+    "FunctionDefinition": ".function_definition",
+    "GenerateOptionsRequest": ".generate_options_request",
+    "GenerateRequest": ".generate_request",
+    "GenerateResponse": ".generate_response",
+    "GenerateResult": ".generate_result",
+    "GenerateResultData": ".generate_result_data",
+    "GenerateResultError": ".generate_result_error",
+    "GenerateStreamResponse": ".generate_stream_response",
+    "GenerateStreamResult": ".generate_stream_result",
+    "GenerateStreamResultData": ".generate_stream_result_data",
+    "GoogleVertexAiVectorizerConfig": ".google_vertex_ai_vectorizer_config",
+    "GoogleVertexAiVectorizerConfigRequest": ".google_vertex_ai_vectorizer_config_request",
+    "GoogleVertexAiVectorizerTextEmbedding004": ".google_vertex_ai_vectorizer_text_embedding_004",
+    "GoogleVertexAiVectorizerTextEmbedding004Request": ".google_vertex_ai_vectorizer_text_embedding_004_request",
+    "GoogleVertexAiVectorizerTextMultilingualEmbedding002": ".google_vertex_ai_vectorizer_text_multilingual_embedding_002",
+    "GoogleVertexAiVectorizerTextMultilingualEmbedding002Request": ".google_vertex_ai_vectorizer_text_multilingual_embedding_002_request",
+    "HkunlpInstructorXlVectorizer": ".hkunlp_instructor_xl_vectorizer",
+    "HkunlpInstructorXlVectorizerRequest": ".hkunlp_instructor_xl_vectorizer_request",
+    "ImageChatMessageContent": ".image_chat_message_content",
+    "ImageChatMessageContentRequest": ".image_chat_message_content_request",
+    "ImageVariableValue": ".image_variable_value",
+    "ImageVellumValue": ".image_vellum_value",
+    "ImageVellumValueRequest": ".image_vellum_value_request",
+    "IndexingConfigVectorizer": ".indexing_config_vectorizer",
+    "IndexingConfigVectorizerRequest": ".indexing_config_vectorizer_request",
+    "IndexingStateEnum": ".indexing_state_enum",
+    "InitiatedAdHocExecutePromptEvent": ".initiated_ad_hoc_execute_prompt_event",
+    "InitiatedExecutePromptEvent": ".initiated_execute_prompt_event",
+    "InitiatedPromptExecutionMeta": ".initiated_prompt_execution_meta",
+    "InitiatedWorkflowNodeResultEvent": ".initiated_workflow_node_result_event",
+    "InstructorVectorizerConfig": ".instructor_vectorizer_config",
+    "InstructorVectorizerConfigRequest": ".instructor_vectorizer_config_request",
+    "IterationStateEnum": ".iteration_state_enum",
+    "JinjaPromptBlock": ".jinja_prompt_block",
+    "JsonInput": ".json_input",
+    "JsonInputRequest": ".json_input_request",
+    "JsonVariableValue": ".json_variable_value",
+    "JsonVellumValue": ".json_vellum_value",
+    "JsonVellumValueRequest": ".json_vellum_value_request",
+    "LogicalOperator": ".logical_operator",
+    "LogprobsEnum": ".logprobs_enum",
+    "MapNodeResult": ".map_node_result",
+    "MapNodeResultData": ".map_node_result_data",
+    "MergeNodeResult": ".merge_node_result",
+    "MergeNodeResultData": ".merge_node_result_data",
+    "MetadataFilterConfigRequest": ".metadata_filter_config_request",
+    "MetadataFilterRuleCombinator": ".metadata_filter_rule_combinator",
+    "MetadataFilterRuleRequest": ".metadata_filter_rule_request",
+    "MetadataFiltersRequest": ".metadata_filters_request",
+    "MetricDefinitionExecution": ".metric_definition_execution",
+    "MetricDefinitionHistoryItem": ".metric_definition_history_item",
+    "MetricDefinitionInput": ".metric_definition_input",
+    "MetricNodeResult": ".metric_node_result",
+    "MlModelRead": ".ml_model_read",
+    "MlModelUsage": ".ml_model_usage",
+    "NamedScenarioInputChatHistoryVariableValueRequest": ".named_scenario_input_chat_history_variable_value_request",
+    "NamedScenarioInputJsonVariableValueRequest": ".named_scenario_input_json_variable_value_request",
+    "NamedScenarioInputRequest": ".named_scenario_input_request",
+    "NamedScenarioInputStringVariableValueRequest": ".named_scenario_input_string_variable_value_request",
+    "NamedTestCaseArrayVariableValue": ".named_test_case_array_variable_value",
+    "NamedTestCaseArrayVariableValueRequest": ".named_test_case_array_variable_value_request",
+    "NamedTestCaseChatHistoryVariableValue": ".named_test_case_chat_history_variable_value",
+    "NamedTestCaseChatHistoryVariableValueRequest": ".named_test_case_chat_history_variable_value_request",
+    "NamedTestCaseErrorVariableValue": ".named_test_case_error_variable_value",
+    "NamedTestCaseErrorVariableValueRequest": ".named_test_case_error_variable_value_request",
+    "NamedTestCaseFunctionCallVariableValue": ".named_test_case_function_call_variable_value",
+    "NamedTestCaseFunctionCallVariableValueRequest": ".named_test_case_function_call_variable_value_request",
+    "NamedTestCaseJsonVariableValue": ".named_test_case_json_variable_value",
+    "NamedTestCaseJsonVariableValueRequest": ".named_test_case_json_variable_value_request",
+    "NamedTestCaseNumberVariableValue": ".named_test_case_number_variable_value",
+    "NamedTestCaseNumberVariableValueRequest": ".named_test_case_number_variable_value_request",
+    "NamedTestCaseSearchResultsVariableValue": ".named_test_case_search_results_variable_value",
+    "NamedTestCaseSearchResultsVariableValueRequest": ".named_test_case_search_results_variable_value_request",
+    "NamedTestCaseStringVariableValue": ".named_test_case_string_variable_value",
+    "NamedTestCaseStringVariableValueRequest": ".named_test_case_string_variable_value_request",
+    "NamedTestCaseVariableValue": ".named_test_case_variable_value",
+    "NamedTestCaseVariableValueRequest": ".named_test_case_variable_value_request",
+    "NodeInputCompiledArrayValue": ".node_input_compiled_array_value",
+    "NodeInputCompiledChatHistoryValue": ".node_input_compiled_chat_history_value",
+    "NodeInputCompiledErrorValue": ".node_input_compiled_error_value",
+    "NodeInputCompiledFunctionCallValue": ".node_input_compiled_function_call_value",
+    "NodeInputCompiledJsonValue": ".node_input_compiled_json_value",
+    "NodeInputCompiledNumberValue": ".node_input_compiled_number_value",
+    "NodeInputCompiledSearchResultsValue": ".node_input_compiled_search_results_value",
+    "NodeInputCompiledStringValue": ".node_input_compiled_string_value",
+    "NodeInputVariableCompiledValue": ".node_input_variable_compiled_value",
+    "NodeOutputCompiledArrayValue": ".node_output_compiled_array_value",
+    "NodeOutputCompiledChatHistoryValue": ".node_output_compiled_chat_history_value",
+    "NodeOutputCompiledErrorValue": ".node_output_compiled_error_value",
+    "NodeOutputCompiledFunctionCallValue": ".node_output_compiled_function_call_value",
+    "NodeOutputCompiledJsonValue": ".node_output_compiled_json_value",
+    "NodeOutputCompiledNumberValue": ".node_output_compiled_number_value",
+    "NodeOutputCompiledSearchResultsValue": ".node_output_compiled_search_results_value",
+    "NodeOutputCompiledStringValue": ".node_output_compiled_string_value",
+    "NodeOutputCompiledValue": ".node_output_compiled_value",
+    "NormalizedLogProbs": ".normalized_log_probs",
+    "NormalizedTokenLogProbs": ".normalized_token_log_probs",
+    "NumberInput": ".number_input",
+    "NumberVariableValue": ".number_variable_value",
+    "NumberVellumValue": ".number_vellum_value",
+    "NumberVellumValueRequest": ".number_vellum_value_request",
+    "OpenAiVectorizerConfig": ".open_ai_vectorizer_config",
+    "OpenAiVectorizerConfigRequest": ".open_ai_vectorizer_config_request",
+    "OpenAiVectorizerTextEmbedding3Large": ".open_ai_vectorizer_text_embedding_3_large",
+    "OpenAiVectorizerTextEmbedding3LargeRequest": ".open_ai_vectorizer_text_embedding_3_large_request",
+    "OpenAiVectorizerTextEmbedding3Small": ".open_ai_vectorizer_text_embedding_3_small",
+    "OpenAiVectorizerTextEmbedding3SmallRequest": ".open_ai_vectorizer_text_embedding_3_small_request",
+    "OpenAiVectorizerTextEmbeddingAda002": ".open_ai_vectorizer_text_embedding_ada_002",
+    "OpenAiVectorizerTextEmbeddingAda002Request": ".open_ai_vectorizer_text_embedding_ada_002_request",
+    "PaginatedContainerImageReadList": ".paginated_container_image_read_list",
+    "PaginatedDeploymentReleaseTagReadList": ".paginated_deployment_release_tag_read_list",
+    "PaginatedDocumentIndexReadList": ".paginated_document_index_read_list",
+    "PaginatedFolderEntityList": ".paginated_folder_entity_list",
+    "PaginatedSlimDeploymentReadList": ".paginated_slim_deployment_read_list",
+    "PaginatedSlimDocumentList": ".paginated_slim_document_list",
+    "PaginatedSlimWorkflowDeploymentList": ".paginated_slim_workflow_deployment_list",
+    "PaginatedTestSuiteRunExecutionList": ".paginated_test_suite_run_execution_list",
+    "PaginatedTestSuiteTestCaseList": ".paginated_test_suite_test_case_list",
+    "PaginatedWorkflowReleaseTagReadList": ".paginated_workflow_release_tag_read_list",
+    "PdfSearchResultMetaSource": ".pdf_search_result_meta_source",
+    "PdfSearchResultMetaSourceRequest": ".pdf_search_result_meta_source_request",
+    "PlainTextPromptBlock": ".plain_text_prompt_block",
+    "Price": ".price",
+    "ProcessingFailureReasonEnum": ".processing_failure_reason_enum",
+    "PromptBlock": ".prompt_block",
+    "PromptBlockState": ".prompt_block_state",
+    "PromptDeploymentExpandMetaRequest": ".prompt_deployment_expand_meta_request",
+    "PromptDeploymentInputRequest": ".prompt_deployment_input_request",
+    "PromptExecutionMeta": ".prompt_execution_meta",
+    "PromptNodeExecutionMeta": ".prompt_node_execution_meta",
+    "PromptNodeResult": ".prompt_node_result",
+    "PromptNodeResultData": ".prompt_node_result_data",
+    "PromptOutput": ".prompt_output",
+    "PromptParameters": ".prompt_parameters",
+    "PromptRequestChatHistoryInput": ".prompt_request_chat_history_input",
+    "PromptRequestInput": ".prompt_request_input",
+    "PromptRequestJsonInput": ".prompt_request_json_input",
+    "PromptRequestStringInput": ".prompt_request_string_input",
+    "PromptSettings": ".prompt_settings",
+    "RawPromptExecutionOverridesRequest": ".raw_prompt_execution_overrides_request",
+    "ReductoChunkerConfig": ".reducto_chunker_config",
+    "ReductoChunkerConfigRequest": ".reducto_chunker_config_request",
+    "ReductoChunking": ".reducto_chunking",
+    "ReductoChunkingRequest": ".reducto_chunking_request",
+    "RejectedAdHocExecutePromptEvent": ".rejected_ad_hoc_execute_prompt_event",
+    "RejectedExecutePromptEvent": ".rejected_execute_prompt_event",
+    "RejectedExecutePromptResponse": ".rejected_execute_prompt_response",
+    "RejectedExecuteWorkflowWorkflowResultEvent": ".rejected_execute_workflow_workflow_result_event",
+    "RejectedPromptExecutionMeta": ".rejected_prompt_execution_meta",
+    "RejectedWorkflowNodeResultEvent": ".rejected_workflow_node_result_event",
+    "ReleaseTagSource": ".release_tag_source",
+    "ReplaceTestSuiteTestCaseRequest": ".replace_test_suite_test_case_request",
+    "RichTextChildBlock": ".rich_text_child_block",
+    "RichTextPromptBlock": ".rich_text_prompt_block",
+    "SandboxScenario": ".sandbox_scenario",
+    "ScenarioInput": ".scenario_input",
+    "ScenarioInputChatHistoryVariableValue": ".scenario_input_chat_history_variable_value",
+    "ScenarioInputJsonVariableValue": ".scenario_input_json_variable_value",
+    "ScenarioInputStringVariableValue": ".scenario_input_string_variable_value",
+    "SearchFiltersRequest": ".search_filters_request",
+    "SearchNodeResult": ".search_node_result",
+    "SearchNodeResultData": ".search_node_result_data",
+    "SearchRequestOptionsRequest": ".search_request_options_request",
+    "SearchResponse": ".search_response",
+    "SearchResult": ".search_result",
+    "SearchResultDocument": ".search_result_document",
+    "SearchResultDocumentRequest": ".search_result_document_request",
+    "SearchResultMergingRequest": ".search_result_merging_request",
+    "SearchResultMeta": ".search_result_meta",
+    "SearchResultMetaRequest": ".search_result_meta_request",
+    "SearchResultRequest": ".search_result_request",
+    "SearchResultsInput": ".search_results_input",
+    "SearchResultsVariableValue": ".search_results_variable_value",
+    "SearchResultsVellumValue": ".search_results_vellum_value",
+    "SearchResultsVellumValueRequest": ".search_results_vellum_value_request",
+    "SearchWeightsRequest": ".search_weights_request",
+    "SecretTypeEnum": ".secret_type_enum",
+    "SentenceChunkerConfig": ".sentence_chunker_config",
+    "SentenceChunkerConfigRequest": ".sentence_chunker_config_request",
+    "SentenceChunking": ".sentence_chunking",
+    "SentenceChunkingRequest": ".sentence_chunking_request",
+    "SlimDeploymentRead": ".slim_deployment_read",
+    "SlimDocument": ".slim_document",
+    "SlimDocumentDocumentToDocumentIndex": ".slim_document_document_to_document_index",
+    "SlimWorkflowDeployment": ".slim_workflow_deployment",
+    "StreamingAdHocExecutePromptEvent": ".streaming_ad_hoc_execute_prompt_event",
+    "StreamingExecutePromptEvent": ".streaming_execute_prompt_event",
+    "StreamingPromptExecutionMeta": ".streaming_prompt_execution_meta",
+    "StreamingWorkflowNodeResultEvent": ".streaming_workflow_node_result_event",
+    "StringChatMessageContent": ".string_chat_message_content",
+    "StringChatMessageContentRequest": ".string_chat_message_content_request",
+    "StringInput": ".string_input",
+    "StringInputRequest": ".string_input_request",
+    "StringVariableValue": ".string_variable_value",
+    "StringVellumValue": ".string_vellum_value",
+    "StringVellumValueRequest": ".string_vellum_value_request",
+    "SubmitCompletionActualRequest": ".submit_completion_actual_request",
+    "SubmitWorkflowExecutionActualRequest": ".submit_workflow_execution_actual_request",
+    "SubworkflowNodeResult": ".subworkflow_node_result",
+    "SubworkflowNodeResultData": ".subworkflow_node_result_data",
+    "TemplatingNodeArrayResult": ".templating_node_array_result",
+    "TemplatingNodeChatHistoryResult": ".templating_node_chat_history_result",
+    "TemplatingNodeErrorResult": ".templating_node_error_result",
+    "TemplatingNodeFunctionCallResult": ".templating_node_function_call_result",
+    "TemplatingNodeJsonResult": ".templating_node_json_result",
+    "TemplatingNodeNumberResult": ".templating_node_number_result",
+    "TemplatingNodeResult": ".templating_node_result",
+    "TemplatingNodeResultData": ".templating_node_result_data",
+    "TemplatingNodeResultOutput": ".templating_node_result_output",
+    "TemplatingNodeSearchResultsResult": ".templating_node_search_results_result",
+    "TemplatingNodeStringResult": ".templating_node_string_result",
+    "TerminalNodeArrayResult": ".terminal_node_array_result",
+    "TerminalNodeChatHistoryResult": ".terminal_node_chat_history_result",
+    "TerminalNodeErrorResult": ".terminal_node_error_result",
+    "TerminalNodeFunctionCallResult": ".terminal_node_function_call_result",
+    "TerminalNodeJsonResult": ".terminal_node_json_result",
+    "TerminalNodeNumberResult": ".terminal_node_number_result",
+    "TerminalNodeResult": ".terminal_node_result",
+    "TerminalNodeResultData": ".terminal_node_result_data",
+    "TerminalNodeResultOutput": ".terminal_node_result_output",
+    "TerminalNodeSearchResultsResult": ".terminal_node_search_results_result",
+    "TerminalNodeStringResult": ".terminal_node_string_result",
+    "TestCaseArrayVariableValue": ".test_case_array_variable_value",
+    "TestCaseChatHistoryVariableValue": ".test_case_chat_history_variable_value",
+    "TestCaseErrorVariableValue": ".test_case_error_variable_value",
+    "TestCaseFunctionCallVariableValue": ".test_case_function_call_variable_value",
+    "TestCaseJsonVariableValue": ".test_case_json_variable_value",
+    "TestCaseNumberVariableValue": ".test_case_number_variable_value",
+    "TestCaseSearchResultsVariableValue": ".test_case_search_results_variable_value",
+    "TestCaseStringVariableValue": ".test_case_string_variable_value",
+    "TestCaseVariableValue": ".test_case_variable_value",
+    "TestSuiteRunDeploymentReleaseTagExecConfig": ".test_suite_run_deployment_release_tag_exec_config",
+    "TestSuiteRunDeploymentReleaseTagExecConfigData": ".test_suite_run_deployment_release_tag_exec_config_data",
+    "TestSuiteRunDeploymentReleaseTagExecConfigDataRequest": ".test_suite_run_deployment_release_tag_exec_config_data_request",
+    "TestSuiteRunDeploymentReleaseTagExecConfigRequest": ".test_suite_run_deployment_release_tag_exec_config_request",
+    "TestSuiteRunExecConfig": ".test_suite_run_exec_config",
+    "TestSuiteRunExecConfigRequest": ".test_suite_run_exec_config_request",
+    "TestSuiteRunExecution": ".test_suite_run_execution",
+    "TestSuiteRunExecutionArrayOutput": ".test_suite_run_execution_array_output",
+    "TestSuiteRunExecutionChatHistoryOutput": ".test_suite_run_execution_chat_history_output",
+    "TestSuiteRunExecutionErrorOutput": ".test_suite_run_execution_error_output",
+    "TestSuiteRunExecutionFunctionCallOutput": ".test_suite_run_execution_function_call_output",
+    "TestSuiteRunExecutionJsonOutput": ".test_suite_run_execution_json_output",
+    "TestSuiteRunExecutionMetricDefinition": ".test_suite_run_execution_metric_definition",
+    "TestSuiteRunExecutionMetricResult": ".test_suite_run_execution_metric_result",
+    "TestSuiteRunExecutionNumberOutput": ".test_suite_run_execution_number_output",
+    "TestSuiteRunExecutionOutput": ".test_suite_run_execution_output",
+    "TestSuiteRunExecutionSearchResultsOutput": ".test_suite_run_execution_search_results_output",
+    "TestSuiteRunExecutionStringOutput": ".test_suite_run_execution_string_output",
+    "TestSuiteRunExternalExecConfig": ".test_suite_run_external_exec_config",
+    "TestSuiteRunExternalExecConfigData": ".test_suite_run_external_exec_config_data",
+    "TestSuiteRunExternalExecConfigDataRequest": ".test_suite_run_external_exec_config_data_request",
+    "TestSuiteRunExternalExecConfigRequest": ".test_suite_run_external_exec_config_request",
+    "TestSuiteRunMetricErrorOutput": ".test_suite_run_metric_error_output",
+    "TestSuiteRunMetricJsonOutput": ".test_suite_run_metric_json_output",
+    "TestSuiteRunMetricNumberOutput": ".test_suite_run_metric_number_output",
+    "TestSuiteRunMetricOutput": ".test_suite_run_metric_output",
+    "TestSuiteRunMetricStringOutput": ".test_suite_run_metric_string_output",
+    "TestSuiteRunPromptSandboxHistoryItemExecConfig": ".test_suite_run_prompt_sandbox_history_item_exec_config",
+    "TestSuiteRunPromptSandboxHistoryItemExecConfigData": ".test_suite_run_prompt_sandbox_history_item_exec_config_data",
+    "TestSuiteRunPromptSandboxHistoryItemExecConfigDataRequest": ".test_suite_run_prompt_sandbox_history_item_exec_config_data_request",
+    "TestSuiteRunPromptSandboxHistoryItemExecConfigRequest": ".test_suite_run_prompt_sandbox_history_item_exec_config_request",
+    "TestSuiteRunRead": ".test_suite_run_read",
+    "TestSuiteRunState": ".test_suite_run_state",
+    "TestSuiteRunTestSuite": ".test_suite_run_test_suite",
+    "TestSuiteRunWorkflowReleaseTagExecConfig": ".test_suite_run_workflow_release_tag_exec_config",
+    "TestSuiteRunWorkflowReleaseTagExecConfigData": ".test_suite_run_workflow_release_tag_exec_config_data",
+    "TestSuiteRunWorkflowReleaseTagExecConfigDataRequest": ".test_suite_run_workflow_release_tag_exec_config_data_request",
+    "TestSuiteRunWorkflowReleaseTagExecConfigRequest": ".test_suite_run_workflow_release_tag_exec_config_request",
+    "TestSuiteRunWorkflowSandboxHistoryItemExecConfig": ".test_suite_run_workflow_sandbox_history_item_exec_config",
+    "TestSuiteRunWorkflowSandboxHistoryItemExecConfigData": ".test_suite_run_workflow_sandbox_history_item_exec_config_data",
+    "TestSuiteRunWorkflowSandboxHistoryItemExecConfigDataRequest": ".test_suite_run_workflow_sandbox_history_item_exec_config_data_request",
+    "TestSuiteRunWorkflowSandboxHistoryItemExecConfigRequest": ".test_suite_run_workflow_sandbox_history_item_exec_config_request",
+    "TestSuiteTestCase": ".test_suite_test_case",
+    "TestSuiteTestCaseBulkOperationRequest": ".test_suite_test_case_bulk_operation_request",
+    "TestSuiteTestCaseBulkResult": ".test_suite_test_case_bulk_result",
+    "TestSuiteTestCaseCreateBulkOperationRequest": ".test_suite_test_case_create_bulk_operation_request",
+    "TestSuiteTestCaseCreatedBulkResult": ".test_suite_test_case_created_bulk_result",
+    "TestSuiteTestCaseCreatedBulkResultData": ".test_suite_test_case_created_bulk_result_data",
+    "TestSuiteTestCaseDeleteBulkOperationDataRequest": ".test_suite_test_case_delete_bulk_operation_data_request",
+    "TestSuiteTestCaseDeleteBulkOperationRequest": ".test_suite_test_case_delete_bulk_operation_request",
+    "TestSuiteTestCaseDeletedBulkResult": ".test_suite_test_case_deleted_bulk_result",
+    "TestSuiteTestCaseDeletedBulkResultData": ".test_suite_test_case_deleted_bulk_result_data",
+    "TestSuiteTestCaseRejectedBulkResult": ".test_suite_test_case_rejected_bulk_result",
+    "TestSuiteTestCaseReplaceBulkOperationRequest": ".test_suite_test_case_replace_bulk_operation_request",
+    "TestSuiteTestCaseReplacedBulkResult": ".test_suite_test_case_replaced_bulk_result",
+    "TestSuiteTestCaseReplacedBulkResultData": ".test_suite_test_case_replaced_bulk_result_data",
+    "TestSuiteTestCaseUpsertBulkOperationRequest": ".test_suite_test_case_upsert_bulk_operation_request",
+    "TokenOverlappingWindowChunkerConfig": ".token_overlapping_window_chunker_config",
+    "TokenOverlappingWindowChunkerConfigRequest": ".token_overlapping_window_chunker_config_request",
+    "TokenOverlappingWindowChunking": ".token_overlapping_window_chunking",
+    "TokenOverlappingWindowChunkingRequest": ".token_overlapping_window_chunking_request",
+    "UnitEnum": ".unit_enum",
+    "UploadDocumentResponse": ".upload_document_response",
+    "UpsertTestSuiteTestCaseRequest": ".upsert_test_suite_test_case_request",
+    "VariablePromptBlock": ".variable_prompt_block",
+    "VellumAudio": ".vellum_audio",
+    "VellumAudioRequest": ".vellum_audio_request",
+    "VellumError": ".vellum_error",
+    "VellumErrorCodeEnum": ".vellum_error_code_enum",
+    "VellumErrorRequest": ".vellum_error_request",
+    "VellumImage": ".vellum_image",
+    "VellumImageRequest": ".vellum_image_request",
+    "VellumValue": ".vellum_value",
+    "VellumValueLogicalConditionGroupRequest": ".vellum_value_logical_condition_group_request",
+    "VellumValueLogicalConditionRequest": ".vellum_value_logical_condition_request",
+    "VellumValueLogicalExpressionRequest": ".vellum_value_logical_expression_request",
+    "VellumValueRequest": ".vellum_value_request",
+    "VellumVariable": ".vellum_variable",
+    "VellumVariableExtensions": ".vellum_variable_extensions",
+    "VellumVariableType": ".vellum_variable_type",
+    "WorkflowDeploymentHistoryItem": ".workflow_deployment_history_item",
+    "WorkflowDeploymentRead": ".workflow_deployment_read",
+    "WorkflowEventError": ".workflow_event_error",
+    "WorkflowExecutionActualChatHistoryRequest": ".workflow_execution_actual_chat_history_request",
+    "WorkflowExecutionActualJsonRequest": ".workflow_execution_actual_json_request",
+    "WorkflowExecutionActualStringRequest": ".workflow_execution_actual_string_request",
+    "WorkflowExecutionEventErrorCode": ".workflow_execution_event_error_code",
+    "WorkflowExecutionEventType": ".workflow_execution_event_type",
+    "WorkflowExecutionNodeResultEvent": ".workflow_execution_node_result_event",
+    "WorkflowExecutionWorkflowResultEvent": ".workflow_execution_workflow_result_event",
+    "WorkflowExpandMetaRequest": ".workflow_expand_meta_request",
+    "WorkflowNodeResultData": ".workflow_node_result_data",
+    "WorkflowNodeResultEvent": ".workflow_node_result_event",
+    "WorkflowNodeResultEventState": ".workflow_node_result_event_state",
+    "WorkflowOutput": ".workflow_output",
+    "WorkflowOutputArray": ".workflow_output_array",
+    "WorkflowOutputChatHistory": ".workflow_output_chat_history",
+    "WorkflowOutputError": ".workflow_output_error",
+    "WorkflowOutputFunctionCall": ".workflow_output_function_call",
+    "WorkflowOutputImage": ".workflow_output_image",
+    "WorkflowOutputJson": ".workflow_output_json",
+    "WorkflowOutputNumber": ".workflow_output_number",
+    "WorkflowOutputSearchResults": ".workflow_output_search_results",
+    "WorkflowOutputString": ".workflow_output_string",
+    "WorkflowPushDeploymentConfigRequest": ".workflow_push_deployment_config_request",
+    "WorkflowPushExecConfig": ".workflow_push_exec_config",
+    "WorkflowPushResponse": ".workflow_push_response",
+    "WorkflowReleaseTagRead": ".workflow_release_tag_read",
+    "WorkflowReleaseTagWorkflowDeploymentHistoryItem": ".workflow_release_tag_workflow_deployment_history_item",
+    "WorkflowRequestChatHistoryInputRequest": ".workflow_request_chat_history_input_request",
+    "WorkflowRequestInputRequest": ".workflow_request_input_request",
+    "WorkflowRequestJsonInputRequest": ".workflow_request_json_input_request",
+    "WorkflowRequestNumberInputRequest": ".workflow_request_number_input_request",
+    "WorkflowRequestStringInputRequest": ".workflow_request_string_input_request",
+    "WorkflowResultEvent": ".workflow_result_event",
+    "WorkflowResultEventOutputData": ".workflow_result_event_output_data",
+    "WorkflowResultEventOutputDataArray": ".workflow_result_event_output_data_array",
+    "WorkflowResultEventOutputDataChatHistory": ".workflow_result_event_output_data_chat_history",
+    "WorkflowResultEventOutputDataError": ".workflow_result_event_output_data_error",
+    "WorkflowResultEventOutputDataFunctionCall": ".workflow_result_event_output_data_function_call",
+    "WorkflowResultEventOutputDataJson": ".workflow_result_event_output_data_json",
+    "WorkflowResultEventOutputDataNumber": ".workflow_result_event_output_data_number",
+    "WorkflowResultEventOutputDataSearchResults": ".workflow_result_event_output_data_search_results",
+    "WorkflowResultEventOutputDataString": ".workflow_result_event_output_data_string",
+    "WorkflowStreamEvent": ".workflow_stream_event",
+    "WorkspaceSecretRead": ".workspace_secret_read",
+}
+
+
+def __getattr__(name: str) -> typing.Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+
+    # Cache the resolved value so that __getattr__ is only hit once per name
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> typing.List[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+__all__: typing.List[str] = [
     "AdHocExecutePromptEvent",
     "AdHocExpandMeta",
     "AdHocFulfilledPromptExecutionMeta",
@@ -468,7 +468,10 @@ class VellumMypyPlugin(Plugin):
         if fullname.endswith(".run"):
             return self._run_method_hook
 
-        if fullname.endswith(".stream"):
+        if fullname.endswith(".arun"):
+            return self._arun_method_hook
+
+        if fullname.endswith(".stream") or fullname.endswith(".astream"):
             return self._stream_method_hook
 
         return None
@@ -516,10 +519,26 @@ class VellumMypyPlugin(Plugin):
             column=ctx.default_return_type.column,
         )
 
+    def _arun_method_hook(self, ctx: MethodContext) -> MypyType:
+        """
+        We use this to target `Workflow.arun()` the same way as `Workflow.run()`, typing the event it resolves to.
+        """
+
+        default_return_type = ctx.default_return_type
+        if (
+            not isinstance(default_return_type, Instance)
+            or default_return_type.type.fullname != "typing.Coroutine"
+            or not default_return_type.args
+        ):
+            return default_return_type
+
+        terminal_event = self._run_method_hook(ctx._replace(default_return_type=default_return_type.args[-1]))
+        return default_return_type.copy_modified(args=[*default_return_type.args[:-1], terminal_event])
+
     def _stream_method_hook(self, ctx: MethodContext) -> MypyType:
         """
-        We use this to target `Workflow.stream()` so that the WorkflowExecutionFulfilledEvent is properly typed
-        using the `Outputs` class defined on the user-defined subclass of `Workflow`.
+        We use this to target `Workflow.stream()` and `Workflow.astream()` so that the WorkflowExecutionFulfilledEvent
+        is properly typed using the `Outputs` class defined on the user-defined subclass of `Workflow`.
         """
 
         if not isinstance(ctx.default_return_type, TypeAliasType):
@@ -532,7 +551,10 @@ class VellumMypyPlugin(Plugin):
         alias_target = alias.target
         if (
             not isinstance(alias_target, Instance)
-            or not _is_subclass(alias_target.type, "typing.Iterator")
+            or not (
+                _is_subclass(alias_target.type, "typing.Iterator")
+                or _is_subclass(alias_target.type, "typing.AsyncIterator")
+            )
             or not alias_target.args
         ):
             return ctx.default_return_type
@@ -1,3 +1,1015 @@
 # WARNING: This file will be removed in a future release. Please import from "vellum.client" instead.
+# Names are imported lazily, see scripts/generate_lazy_imports.py
 
-from vellum.client.types import *
+import importlib
+import typing
+
+if typing.TYPE_CHECKING:
+    from vellum.client.types import *
+
+_LAZY_IMPORTS: typing.Dict[str, str] = {
+    "AdHocExecutePromptEvent": "vellum.client.types",
+    "AdHocExpandMeta": "vellum.client.types",
+    "AdHocFulfilledPromptExecutionMeta": "vellum.client.types",
+    "AdHocInitiatedPromptExecutionMeta": "vellum.client.types",
+    "AdHocRejectedPromptExecutionMeta": "vellum.client.types",
+    "AdHocStreamingPromptExecutionMeta": "vellum.client.types",
+    "AddOpenaiApiKeyEnum": "vellum.client.types",
+    "ApiNodeResult": "vellum.client.types",
+    "ApiNodeResultData": "vellum.client.types",
+    "ArrayChatMessageContent": "vellum.client.types",
+    "ArrayChatMessageContentItem": "vellum.client.types",
+    "ArrayChatMessageContentItemRequest": "vellum.client.types",
+    "ArrayChatMessageContentRequest": "vellum.client.types",
+    "ArrayInput": "vellum.client.types",
+    "ArrayVariableValue": "vellum.client.types",
+    "ArrayVariableValueItem": "vellum.client.types",
+    "ArrayVellumValue": "vellum.client.types",
+    "ArrayVellumValueRequest": "vellum.client.types",
+    "AudioChatMessageContent": "vellum.client.types",
+    "AudioChatMessageContentRequest": "vellum.client.types",
+    "AudioVariableValue": "vellum.client.types",
+    "AudioVellumValue": "vellum.client.types",
+    "AudioVellumValueRequest": "vellum.client.types",
+    "BasicVectorizerIntfloatMultilingualE5Large": "vellum.client.types",
+    "BasicVectorizerIntfloatMultilingualE5LargeRequest": "vellum.client.types",
+    "BasicVectorizerSentenceTransformersMultiQaMpnetBaseCosV1": "vellum.client.types",
+    "BasicVectorizerSentenceTransformersMultiQaMpnetBaseCosV1Request": "vellum.client.types",
+    "BasicVectorizerSentenceTransformersMultiQaMpnetBaseDotV1": "vellum.client.types",
+    "BasicVectorizerSentenceTransformersMultiQaMpnetBaseDotV1Request": "vellum.client.types",
+    "ChatHistoryInput": "vellum.client.types",
+    "ChatHistoryInputRequest": "vellum.client.types",
+    "ChatHistoryVariableValue": "vellum.client.types",
+    "ChatHistoryVellumValue": "vellum.client.types",
+    "ChatHistoryVellumValueRequest": "vellum.client.types",
+    "ChatMessage": "vellum.client.types",
+    "ChatMessageContent": "vellum.client.types",
+    "ChatMessageContentRequest": "vellum.client.types",
+    "ChatMessagePromptBlock": "vellum.client.types",
+    "ChatMessageRequest": "vellum.client.types",
+    "ChatMessageRole": "vellum.client.types",
+    "CodeExecutionNodeArrayResult": "vellum.client.types",
+    "CodeExecutionNodeChatHistoryResult": "vellum.client.types",
+    "CodeExecutionNodeErrorResult": "vellum.client.types",
+    "CodeExecutionNodeFunctionCallResult": "vellum.client.types",
+    "CodeExecutionNodeJsonResult": "vellum.client.types",
+    "CodeExecutionNodeNumberResult": "vellum.client.types",
+    "CodeExecutionNodeResult": "vellum.client.types",
+    "CodeExecutionNodeResultData": "vellum.client.types",
+    "CodeExecutionNodeResultOutput": "vellum.client.types",
+    "CodeExecutionNodeSearchResultsResult": "vellum.client.types",
+    "CodeExecutionNodeStringResult": "vellum.client.types",
+    "CodeExecutionPackage": "vellum.client.types",
+    "CodeExecutionRuntime": "vellum.client.types",
+    "CodeExecutorInput": "vellum.client.types",
+    "CodeExecutorResponse": "vellum.client.types",
+    "CodeExecutorSecretInput": "vellum.client.types",
+    "CompilePromptDeploymentExpandMetaRequest": "vellum.client.types",
+    "CompilePromptMeta": "vellum.client.types",
+    "ComponentsSchemasPdfSearchResultMetaSource": "vellum.client.types",
+    "ComponentsSchemasPdfSearchResultMetaSourceRequest": "vellum.client.types",
+    "ConditionCombinator": "vellum.client.types",
+    "ConditionalNodeResult": "vellum.client.types",
+    "ConditionalNodeResultData": "vellum.client.types",
+    "ContainerImageRead": "vellum.client.types",
+    "CreateTestSuiteTestCaseRequest": "vellum.client.types",
+    "DeploymentHistoryItem": "vellum.client.types",
+    "DeploymentProviderPayloadResponse": "vellum.client.types",
+    "DeploymentProviderPayloadResponsePayload": "vellum.client.types",
+    "DeploymentRead": "vellum.client.types",
+    "DeploymentReleaseTagDeploymentHistoryItem": "vellum.client.types",
+    "DeploymentReleaseTagRead": "vellum.client.types",
+    "DockerServiceToken": "vellum.client.types",
+    "DocumentDocumentToDocumentIndex": "vellum.client.types",
+    "DocumentIndexChunking": "vellum.client.types",
+    "DocumentIndexChunkingRequest": "vellum.client.types",
+    "DocumentIndexIndexingConfig": "vellum.client.types",
+    "DocumentIndexIndexingConfigRequest": "vellum.client.types",
+    "DocumentIndexRead": "vellum.client.types",
+    "DocumentProcessingState": "vellum.client.types",
+    "DocumentRead": "vellum.client.types",
+    "DocumentStatus": "vellum.client.types",
+    "EnrichedNormalizedCompletion": "vellum.client.types",
+    "EntityStatus": "vellum.client.types",
+    "EntityVisibility": "vellum.client.types",
+    "EnvironmentEnum": "vellum.client.types",
+    "EphemeralPromptCacheConfig": "vellum.client.types",
+    "EphemeralPromptCacheConfigTypeEnum": "vellum.client.types",
+    "ErrorInput": "vellum.client.types",
+    "ErrorVariableValue": "vellum.client.types",
+    "ErrorVellumValue": "vellum.client.types",
+    "ErrorVellumValueRequest": "vellum.client.types",
+    "ExecutePromptEvent": "vellum.client.types",
+    "ExecutePromptResponse": "vellum.client.types",
+    "ExecuteWorkflowResponse": "vellum.client.types",
+    "ExecuteWorkflowWorkflowResultEvent": "vellum.client.types",
+    "ExecutionArrayVellumValue": "vellum.client.types",
+    "ExecutionChatHistoryVellumValue": "vellum.client.types",
+    "ExecutionErrorVellumValue": "vellum.client.types",
+    "ExecutionFunctionCallVellumValue": "vellum.client.types",
+    "ExecutionJsonVellumValue": "vellum.client.types",
+    "ExecutionNumberVellumValue": "vellum.client.types",
+    "ExecutionSearchResultsVellumValue": "vellum.client.types",
+    "ExecutionStringVellumValue": "vellum.client.types",
+    "ExecutionVellumValue": "vellum.client.types",
+    "ExternalTestCaseExecution": "vellum.client.types",
+    "ExternalTestCaseExecutionRequest": "vellum.client.types",
+    "FinishReasonEnum": "vellum.client.types",
+    "FolderEntity": "vellum.client.types",
+    "FolderEntityDocumentIndex": "vellum.client.types",
+    "FolderEntityDocumentIndexData": "vellum.client.types",
+    "FolderEntityFolder": "vellum.client.types",
+    "FolderEntityFolderData": "vellum.client.types",
+    "FolderEntityPromptSandbox": "vellum.client.types",
+    "FolderEntityPromptSandboxData": "vellum.client.types",
+    "FolderEntityTestSuite": "vellum.client.types",
+    "FolderEntityTestSuiteData": "vellum.client.types",
+    "FolderEntityWorkflowSandbox": "vellum.client.types",
+    "FolderEntityWorkflowSandboxData": "vellum.client.types",
+    "FulfilledAdHocExecutePromptEvent": "vellum.client.types",
+    "FulfilledEnum": "vellum.client.types",
+    "FulfilledExecutePromptEvent": "vellum.client.types",
+    "FulfilledExecutePromptResponse": "vellum.client.types",
+    "FulfilledExecuteWorkflowWorkflowResultEvent": "vellum.client.types",
+    "FulfilledPromptExecutionMeta": "vellum.client.types",
+    "FulfilledWorkflowNodeResultEvent": "vellum.client.types",
+    "FunctionCall": "vellum.client.types",
+    "FunctionCallChatMessageContent": "vellum.client.types",
+    "FunctionCallChatMessageContentRequest": "vellum.client.types",
+    "FunctionCallChatMessageContentValue": "vellum.client.types",
+    "FunctionCallChatMessageContentValueRequest": "vellum.client.types",
+    "FunctionCallInput": "vellum.client.types",
+    "FunctionCallRequest": "vellum.client.types",
+    "FunctionCallVariableValue": "vellum.client.types",
+    "FunctionCallVellumValue": "vellum.client.types",
+    "FunctionCallVellumValueRequest": "vellum.client.types",
+    "FunctionDefinition": "vellum.client.types",
+    "GenerateOptionsRequest": "vellum.client.types",
+    "GenerateRequest": "vellum.client.types",
+    "GenerateResponse": "vellum.client.types",
+    "GenerateResult": "vellum.client.types",
+    "GenerateResultData": "vellum.client.types",
+    "GenerateResultError": "vellum.client.types",
+    "GenerateStreamResponse": "vellum.client.types",
+    "GenerateStreamResult": "vellum.client.types",
+    "GenerateStreamResultData": "vellum.client.types",
+    "GoogleVertexAiVectorizerConfig": "vellum.client.types",
+    "GoogleVertexAiVectorizerConfigRequest": "vellum.client.types",
+    "GoogleVertexAiVectorizerTextEmbedding004": "vellum.client.types",
+    "GoogleVertexAiVectorizerTextEmbedding004Request": "vellum.client.types",
+    "GoogleVertexAiVectorizerTextMultilingualEmbedding002": "vellum.client.types",
+    "GoogleVertexAiVectorizerTextMultilingualEmbedding002Request": "vellum.client.types",
+    "HkunlpInstructorXlVectorizer": "vellum.client.types",
+    "HkunlpInstructorXlVectorizerRequest": "vellum.client.types",
+    "ImageChatMessageContent": "vellum.client.types",
+    "ImageChatMessageContentRequest": "vellum.client.types",
+    "ImageVariableValue": "vellum.client.types",
+    "ImageVellumValue": "vellum.client.types",
+    "ImageVellumValueRequest": "vellum.client.types",
+    "IndexingConfigVectorizer": "vellum.client.types",
+    "IndexingConfigVectorizerRequest": "vellum.client.types",
+    "IndexingStateEnum": "vellum.client.types",
+    "InitiatedAdHocExecutePromptEvent": "vellum.client.types",
+    "InitiatedExecutePromptEvent": "vellum.client.types",
+    "InitiatedPromptExecutionMeta": "vellum.client.types",
+    "InitiatedWorkflowNodeResultEvent": "vellum.client.types",
+    "InstructorVectorizerConfig": "vellum.client.types",
+    "InstructorVectorizerConfigRequest": "vellum.client.types",
+    "IterationStateEnum": "vellum.client.types",
+    "JinjaPromptBlock": "vellum.client.types",
+    "JsonInput": "vellum.client.types",
+    "JsonInputRequest": "vellum.client.types",
+    "JsonVariableValue": "vellum.client.types",
+    "JsonVellumValue": "vellum.client.types",
+    "JsonVellumValueRequest": "vellum.client.types",
+    "LogicalOperator": "vellum.client.types",
+    "LogprobsEnum": "vellum.client.types",
+    "MapNodeResult": "vellum.client.types",
+    "MapNodeResultData": "vellum.client.types",
+    "MergeNodeResult": "vellum.client.types",
+    "MergeNodeResultData": "vellum.client.types",
+    "MetadataFilterConfigRequest": "vellum.client.types",
+    "MetadataFilterRuleCombinator": "vellum.client.types",
+    "MetadataFilterRuleRequest": "vellum.client.types",
+    "MetadataFiltersRequest": "vellum.client.types",
+    "MetricDefinitionExecution": "vellum.client.types",
+    "MetricDefinitionHistoryItem": "vellum.client.types",
+    "MetricDefinitionInput": "vellum.client.types",
+    "MetricNodeResult": "vellum.client.types",
+    "MlModelRead": "vellum.client.types",
+    "MlModelUsage": "vellum.client.types",
+    "NamedScenarioInputChatHistoryVariableValueRequest": "vellum.client.types",
+    "NamedScenarioInputJsonVariableValueRequest": "vellum.client.types",
+    "NamedScenarioInputRequest": "vellum.client.types",
+    "NamedScenarioInputStringVariableValueRequest": "vellum.client.types",
+    "NamedTestCaseArrayVariableValue": "vellum.client.types",
+    "NamedTestCaseArrayVariableValueRequest": "vellum.client.types",
+    "NamedTestCaseChatHistoryVariableValue": "vellum.client.types",
+    "NamedTestCaseChatHistoryVariableValueRequest": "vellum.client.types",
+    "NamedTestCaseErrorVariableValue": "vellum.client.types",
+    "NamedTestCaseErrorVariableValueRequest": "vellum.client.types",
+    "NamedTestCaseFunctionCallVariableValue": "vellum.client.types",
+    "NamedTestCaseFunctionCallVariableValueRequest": "vellum.client.types",
+    "NamedTestCaseJsonVariableValue": "vellum.client.types",
+    "NamedTestCaseJsonVariableValueRequest": "vellum.client.types",
+    "NamedTestCaseNumberVariableValue": "vellum.client.types",
+    "NamedTestCaseNumberVariableValueRequest": "vellum.client.types",
+    "NamedTestCaseSearchResultsVariableValue": "vellum.client.types",
+    "NamedTestCaseSearchResultsVariableValueRequest": "vellum.client.types",
+    "NamedTestCaseStringVariableValue": "vellum.client.types",
+    "NamedTestCaseStringVariableValueRequest": "vellum.client.types",
+    "NamedTestCaseVariableValue": "vellum.client.types",
+    "NamedTestCaseVariableValueRequest": "vellum.client.types",
+    "NodeInputCompiledArrayValue": "vellum.client.types",
+    "NodeInputCompiledChatHistoryValue": "vellum.client.types",
+    "NodeInputCompiledErrorValue": "vellum.client.types",
+    "NodeInputCompiledFunctionCallValue": "vellum.client.types",
+    "NodeInputCompiledJsonValue": "vellum.client.types",
+    "NodeInputCompiledNumberValue": "vellum.client.types",
+    "NodeInputCompiledSearchResultsValue": "vellum.client.types",
+    "NodeInputCompiledStringValue": "vellum.client.types",
+    "NodeInputVariableCompiledValue": "vellum.client.types",
+    "NodeOutputCompiledArrayValue": "vellum.client.types",
+    "NodeOutputCompiledChatHistoryValue": "vellum.client.types",
+    "NodeOutputCompiledErrorValue": "vellum.client.types",
+    "NodeOutputCompiledFunctionCallValue": "vellum.client.types",
+    "NodeOutputCompiledJsonValue": "vellum.client.types",
+    "NodeOutputCompiledNumberValue": "vellum.client.types",
+    "NodeOutputCompiledSearchResultsValue": "vellum.client.types",
+    "NodeOutputCompiledStringValue": "vellum.client.types",
+    "NodeOutputCompiledValue": "vellum.client.types",
+    "NormalizedLogProbs": "vellum.client.types",
+    "NormalizedTokenLogProbs": "vellum.client.types",
+    "NumberInput": "vellum.client.types",
+    "NumberVariableValue": "vellum.client.types",
+    "NumberVellumValue": "vellum.client.types",
+    "NumberVellumValueRequest": "vellum.client.types",
+    "OpenAiVectorizerConfig": "vellum.client.types",
+    "OpenAiVectorizerConfigRequest": "vellum.client.types",
+    "OpenAiVectorizerTextEmbedding3Large": "vellum.client.types",
+    "OpenAiVectorizerTextEmbedding3LargeRequest": "vellum.client.types",
+    "OpenAiVectorizerTextEmbedding3Small": "vellum.client.types",
+    "OpenAiVectorizerTextEmbedding3SmallRequest": "vellum.client.types",
+    "OpenAiVectorizerTextEmbeddingAda002": "vellum.client.types",
+    "OpenAiVectorizerTextEmbeddingAda002Request": "vellum.client.types",
+    "PaginatedContainerImageReadList": "vellum.client.types",
+    "PaginatedDeploymentReleaseTagReadList": "vellum.client.types",
+    "PaginatedDocumentIndexReadList": "vellum.client.types",
+    "PaginatedFolderEntityList": "vellum.client.types",
+    "PaginatedSlimDeploymentReadList": "vellum.client.types",
+    "PaginatedSlimDocumentList": "vellum.client.types",
+    "PaginatedSlimWorkflowDeploymentList": "vellum.client.types",
+    "PaginatedTestSuiteRunExecutionList": "vellum.client.types",
+    "PaginatedTestSuiteTestCaseList": "vellum.client.types",
+    "PaginatedWorkflowReleaseTagReadList": "vellum.client.types",
+    "PdfSearchResultMetaSource": "vellum.client.types",
+    "PdfSearchResultMetaSourceRequest": "vellum.client.types",
+    "PlainTextPromptBlock": "vellum.client.types",
+    "Price": "vellum.client.types",
+    "ProcessingFailureReasonEnum": "vellum.client.types",
+    "PromptBlock": "vellum.client.types",
+    "PromptBlockState": "vellum.client.types",
+    "PromptDeploymentExpandMetaRequest": "vellum.client.types",
+    "PromptDeploymentInputRequest": "vellum.client.types",
+    "PromptExecutionMeta": "vellum.client.types",
+    "PromptNodeExecutionMeta": "vellum.client.types",
+    "PromptNodeResult": "vellum.client.types",
+    "PromptNodeResultData": "vellum.client.types",
+    "PromptOutput": "vellum.client.types",
+    "PromptParameters": "vellum.client.types",
+    "PromptRequestChatHistoryInput": "vellum.client.types",
+    "PromptRequestInput": "vellum.client.types",
+    "PromptRequestJsonInput": "vellum.client.types",
+    "PromptRequestStringInput": "vellum.client.types",
+    "PromptSettings": "vellum.client.types",
+    "RawPromptExecutionOverridesRequest": "vellum.client.types",
+    "ReductoChunkerConfig": "vellum.client.types",
+    "ReductoChunkerConfigRequest": "vellum.client.types",
+    "ReductoChunking": "vellum.client.types",
+    "ReductoChunkingRequest": "vellum.client.types",
+    "RejectedAdHocExecutePromptEvent": "vellum.client.types",
+    "RejectedExecutePromptEvent": "vellum.client.types",
+    "RejectedExecutePromptResponse": "vellum.client.types",
+    "RejectedExecuteWorkflowWorkflowResultEvent": "vellum.client.types",
+    "RejectedPromptExecutionMeta": "vellum.client.types",
+    "RejectedWorkflowNodeResultEvent": "vellum.client.types",
+    "ReleaseTagSource": "vellum.client.types",
+    "ReplaceTestSuiteTestCaseRequest": "vellum.client.types",
+    "RichTextChildBlock": "vellum.client.types",
+    "RichTextPromptBlock": "vellum.client.types",
+    "SandboxScenario": "vellum.client.types",
+    "ScenarioInput": "vellum.client.types",
+    "ScenarioInputChatHistoryVariableValue": "vellum.client.types",
+    "ScenarioInputJsonVariableValue": "vellum.client.types",
+    "ScenarioInputStringVariableValue": "vellum.client.types",
+    "SearchFiltersRequest": "vellum.client.types",
+    "SearchNodeResult": "vellum.client.types",
+    "SearchNodeResultData": "vellum.client.types",
+    "SearchRequestOptionsRequest": "vellum.client.types",
+    "SearchResponse": "vellum.client.types",
+    "SearchResult": "vellum.client.types",
+    "SearchResultDocument": "vellum.client.types",
+    "SearchResultDocumentRequest": "vellum.client.types",
+    "SearchResultMergingRequest": "vellum.client.types",
+    "SearchResultMeta": "vellum.client.types",
+    "SearchResultMetaRequest": "vellum.client.types",
+    "SearchResultRequest": "vellum.client.types",
+    "SearchResultsInput": "vellum.client.types",
+    "SearchResultsVariableValue": "vellum.client.types",
+    "SearchResultsVellumValue": "vellum.client.types",
+    "SearchResultsVellumValueRequest": "vellum.client.types",
+    "SearchWeightsRequest": "vellum.client.types",
+    "SecretTypeEnum": "vellum.client.types",
+    "SentenceChunkerConfig": "vellum.client.types",
+    "SentenceChunkerConfigRequest": "vellum.client.types",
+    "SentenceChunking": "vellum.client.types",
+    "SentenceChunkingRequest": "vellum.client.types",
+    "SlimDeploymentRead": "vellum.client.types",
+    "SlimDocument": "vellum.client.types",
+    "SlimDocumentDocumentToDocumentIndex": "vellum.client.types",
+    "SlimWorkflowDeployment": "vellum.client.types",
+    "StreamingAdHocExecutePromptEvent": "vellum.client.types",
+    "StreamingExecutePromptEvent": "vellum.client.types",
+    "StreamingPromptExecutionMeta": "vellum.client.types",
+    "StreamingWorkflowNodeResultEvent": "vellum.client.types",
+    "StringChatMessageContent": "vellum.client.types",
+    "StringChatMessageContentRequest": "vellum.client.types",
+    "StringInput": "vellum.client.types",
+    "StringInputRequest": "vellum.client.types",
+    "StringVariableValue": "vellum.client.types",
+    "StringVellumValue": "vellum.client.types",
+    "StringVellumValueRequest": "vellum.client.types",
+    "SubmitCompletionActualRequest": "vellum.client.types",
+    "SubmitWorkflowExecutionActualRequest": "vellum.client.types",
+    "SubworkflowNodeResult": "vellum.client.types",
+    "SubworkflowNodeResultData": "vellum.client.types",
+    "TemplatingNodeArrayResult": "vellum.client.types",
+    "TemplatingNodeChatHistoryResult": "vellum.client.types",
+    "TemplatingNodeErrorResult": "vellum.client.types",
+    "TemplatingNodeFunctionCallResult": "vellum.client.types",
+    "TemplatingNodeJsonResult": "vellum.client.types",
+    "TemplatingNodeNumberResult": "vellum.client.types",
+    "TemplatingNodeResult": "vellum.client.types",
+    "TemplatingNodeResultData": "vellum.client.types",
+    "TemplatingNodeResultOutput": "vellum.client.types",
+    "TemplatingNodeSearchResultsResult": "vellum.client.types",
+    "TemplatingNodeStringResult": "vellum.client.types",
+    "TerminalNodeArrayResult": "vellum.client.types",
+    "TerminalNodeChatHistoryResult": "vellum.client.types",
+    "TerminalNodeErrorResult": "vellum.client.types",
+    "TerminalNodeFunctionCallResult": "vellum.client.types",
+    "TerminalNodeJsonResult": "vellum.client.types",
+    "TerminalNodeNumberResult": "vellum.client.types",
+    "TerminalNodeResult": "vellum.client.types",
+    "TerminalNodeResultData": "vellum.client.types",
+    "TerminalNodeResultOutput": "vellum.client.types",
+    "TerminalNodeSearchResultsResult": "vellum.client.types",
+    "TerminalNodeStringResult": "vellum.client.types",
+    "TestCaseArrayVariableValue": "vellum.client.types",
+    "TestCaseChatHistoryVariableValue": "vellum.client.types",
+    "TestCaseErrorVariableValue": "vellum.client.types",
+    "TestCaseFunctionCallVariableValue": "vellum.client.types",
+    "TestCaseJsonVariableValue": "vellum.client.types",
+    "TestCaseNumberVariableValue": "vellum.client.types",
+    "TestCaseSearchResultsVariableValue": "vellum.client.types",
+    "TestCaseStringVariableValue": "vellum.client.types",
+    "TestCaseVariableValue": "vellum.client.types",
+    "TestSuiteRunDeploymentReleaseTagExecConfig": "vellum.client.types",
+    "TestSuiteRunDeploymentReleaseTagExecConfigData": "vellum.client.types",
+    "TestSuiteRunDeploymentReleaseTagExecConfigDataRequest": "vellum.client.types",
+    "TestSuiteRunDeploymentReleaseTagExecConfigRequest": "vellum.client.types",
+    "TestSuiteRunExecConfig": "vellum.client.types",
+    "TestSuiteRunExecConfigRequest": "vellum.client.types",
+    "TestSuiteRunExecution": "vellum.client.types",
+    "TestSuiteRunExecutionArrayOutput": "vellum.client.types",
+    "TestSuiteRunExecutionChatHistoryOutput": "vellum.client.types",
+    "TestSuiteRunExecutionErrorOutput": "vellum.client.types",
+    "TestSuiteRunExecutionFunctionCallOutput": "vellum.client.types",
+    "TestSuiteRunExecutionJsonOutput": "vellum.client.types",
+    "TestSuiteRunExecutionMetricDefinition": "vellum.client.types",
+    "TestSuiteRunExecutionMetricResult": "vellum.client.types",
+    "TestSuiteRunExecutionNumberOutput": "vellum.client.types",
+    "TestSuiteRunExecutionOutput": "vellum.client.types",
+    "TestSuiteRunExecutionSearchResultsOutput": "vellum.client.types",
+    "TestSuiteRunExecutionStringOutput": "vellum.client.types",
+    "TestSuiteRunExternalExecConfig": "vellum.client.types",
+    "TestSuiteRunExternalExecConfigData": "vellum.client.types",
+    "TestSuiteRunExternalExecConfigDataRequest": "vellum.client.types",
+    "TestSuiteRunExternalExecConfigRequest": "vellum.client.types",
+    "TestSuiteRunMetricErrorOutput": "vellum.client.types",
+    "TestSuiteRunMetricJsonOutput": "vellum.client.types",
+    "TestSuiteRunMetricNumberOutput": "vellum.client.types",
+    "TestSuiteRunMetricOutput": "vellum.client.types",
+    "TestSuiteRunMetricStringOutput": "vellum.client.types",
+    "TestSuiteRunPromptSandboxHistoryItemExecConfig": "vellum.client.types",
+    "TestSuiteRunPromptSandboxHistoryItemExecConfigData": "vellum.client.types",
+    "TestSuiteRunPromptSandboxHistoryItemExecConfigDataRequest": "vellum.client.types",
+    "TestSuiteRunPromptSandboxHistoryItemExecConfigRequest": "vellum.client.types",
+    "TestSuiteRunRead": "vellum.client.types",
+    "TestSuiteRunState": "vellum.client.types",
+    "TestSuiteRunTestSuite": "vellum.client.types",
+    "TestSuiteRunWorkflowReleaseTagExecConfig": "vellum.client.types",
+    "TestSuiteRunWorkflowReleaseTagExecConfigData": "vellum.client.types",
+    "TestSuiteRunWorkflowReleaseTagExecConfigDataRequest": "vellum.client.types",
+    "TestSuiteRunWorkflowReleaseTagExecConfigRequest": "vellum.client.types",
+    "TestSuiteRunWorkflowSandboxHistoryItemExecConfig": "vellum.client.types",
+    "TestSuiteRunWorkflowSandboxHistoryItemExecConfigData": "vellum.client.types",
+    "TestSuiteRunWorkflowSandboxHistoryItemExecConfigDataRequest": "vellum.client.types",
+    "TestSuiteRunWorkflowSandboxHistoryItemExecConfigRequest": "vellum.client.types",
+    "TestSuiteTestCase": "vellum.client.types",
+    "TestSuiteTestCaseBulkOperationRequest": "vellum.client.types",
+    "TestSuiteTestCaseBulkResult": "vellum.client.types",
+    "TestSuiteTestCaseCreateBulkOperationRequest": "vellum.client.types",
+    "TestSuiteTestCaseCreatedBulkResult": "vellum.client.types",
+    "TestSuiteTestCaseCreatedBulkResultData": "vellum.client.types",
+    "TestSuiteTestCaseDeleteBulkOperationDataRequest": "vellum.client.types",
+    "TestSuiteTestCaseDeleteBulkOperationRequest": "vellum.client.types",
+    "TestSuiteTestCaseDeletedBulkResult": "vellum.client.types",
+    "TestSuiteTestCaseDeletedBulkResultData": "vellum.client.types",
+    "TestSuiteTestCaseRejectedBulkResult": "vellum.client.types",
+    "TestSuiteTestCaseReplaceBulkOperationRequest": "vellum.client.types",
+    "TestSuiteTestCaseReplacedBulkResult": "vellum.client.types",
+    "TestSuiteTestCaseReplacedBulkResultData": "vellum.client.types",
+    "TestSuiteTestCaseUpsertBulkOperationRequest": "vellum.client.types",
+    "TokenOverlappingWindowChunkerConfig": "vellum.client.types",
+    "TokenOverlappingWindowChunkerConfigRequest": "vellum.client.types",
+    "TokenOverlappingWindowChunking": "vellum.client.types",
+    "TokenOverlappingWindowChunkingRequest": "vellum.client.types",
+    "UnitEnum": "vellum.client.types",
+    "UploadDocumentResponse": "vellum.client.types",
+    "UpsertTestSuiteTestCaseRequest": "vellum.client.types",
+    "VariablePromptBlock": "vellum.client.types",
+    "VellumAudio": "vellum.client.types",
+    "VellumAudioRequest": "vellum.client.types",
+    "VellumError": "vellum.client.types",
+    "VellumErrorCodeEnum": "vellum.client.types",
+    "VellumErrorRequest": "vellum.client.types",
+    "VellumImage": "vellum.client.types",
+    "VellumImageRequest": "vellum.client.types",
+    "VellumValue": "vellum.client.types",
+    "VellumValueLogicalConditionGroupRequest": "vellum.client.types",
+    "VellumValueLogicalConditionRequest": "vellum.client.types",
+    "VellumValueLogicalExpressionRequest": "vellum.client.types",
+    "VellumValueRequest": "vellum.client.types",
+    "VellumVariable": "vellum.client.types",
+    "VellumVariableExtensions": "vellum.client.types",
+    "VellumVariableType": "vellum.client.types",
+    "WorkflowDeploymentHistoryItem": "vellum.client.types",
+    "WorkflowDeploymentRead": "vellum.client.types",
+    "WorkflowEventError": "vellum.client.types",
+    "WorkflowExecutionActualChatHistoryRequest": "vellum.client.types",
+    "WorkflowExecutionActualJsonRequest": "vellum.client.types",
+    "WorkflowExecutionActualStringRequest": "vellum.client.types",
+    "WorkflowExecutionEventErrorCode": "vellum.client.types",
+    "WorkflowExecutionEventType": "vellum.client.types",
+    "WorkflowExecutionNodeResultEvent": "vellum.client.types",
+    "WorkflowExecutionWorkflowResultEvent": "vellum.client.types",
+    "WorkflowExpandMetaRequest": "vellum.client.types",
+    "WorkflowNodeResultData": "vellum.client.types",
+    "WorkflowNodeResultEvent": "vellum.client.types",
+    "WorkflowNodeResultEventState": "vellum.client.types",
+    "WorkflowOutput": "vellum.client.types",
+    "WorkflowOutputArray": "vellum.client.types",
+    "WorkflowOutputChatHistory": "vellum.client.types",
+    "WorkflowOutputError": "vellum.client.types",
+    "WorkflowOutputFunctionCall": "vellum.client.types",
+    "WorkflowOutputImage": "vellum.client.types",
+    "WorkflowOutputJson": "vellum.client.types",
+    "WorkflowOutputNumber": "vellum.client.types",
+    "WorkflowOutputSearchResults": "vellum.client.types",
+    "WorkflowOutputString": "vellum.client.types",
+    "WorkflowPushDeploymentConfigRequest": "vellum.client.types",
+    "WorkflowPushExecConfig": "vellum.client.types",
+    "WorkflowPushResponse": "vellum.client.types",
+    "WorkflowReleaseTagRead": "vellum.client.types",
+    "WorkflowReleaseTagWorkflowDeploymentHistoryItem": "vellum.client.types",
+    "WorkflowRequestChatHistoryInputRequest": "vellum.client.types",
+    "WorkflowRequestInputRequest": "vellum.client.types",
+    "WorkflowRequestJsonInputRequest": "vellum.client.types",
+    "WorkflowRequestNumberInputRequest": "vellum.client.types",
+    "WorkflowRequestStringInputRequest": "vellum.client.types",
+    "WorkflowResultEvent": "vellum.client.types",
+    "WorkflowResultEventOutputData": "vellum.client.types",
+    "WorkflowResultEventOutputDataArray": "vellum.client.types",
+    "WorkflowResultEventOutputDataChatHistory": "vellum.client.types",
+    "WorkflowResultEventOutputDataError": "vellum.client.types",
+    "WorkflowResultEventOutputDataFunctionCall": "vellum.client.types",
+    "WorkflowResultEventOutputDataJson": "vellum.client.types",
+    "WorkflowResultEventOutputDataNumber": "vellum.client.types",
+    "WorkflowResultEventOutputDataSearchResults": "vellum.client.types",
+    "WorkflowResultEventOutputDataString": "vellum.client.types",
+    "WorkflowStreamEvent": "vellum.client.types",
+    "WorkspaceSecretRead": "vellum.client.types",
+}
+
+
+def __getattr__(name: str) -> typing.Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+
+    # Cache the resolved value so that __getattr__ is only hit once per name
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> typing.List[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+__all__: typing.List[str] = [
+    "AdHocExecutePromptEvent",
+    "AdHocExpandMeta",
+    "AdHocFulfilledPromptExecutionMeta",
+    "AdHocInitiatedPromptExecutionMeta",
+    "AdHocRejectedPromptExecutionMeta",
+    "AdHocStreamingPromptExecutionMeta",
+    "AddOpenaiApiKeyEnum",
+    "ApiNodeResult",
+    "ApiNodeResultData",
+    "ArrayChatMessageContent",
+    "ArrayChatMessageContentItem",
+    "ArrayChatMessageContentItemRequest",
+    "ArrayChatMessageContentRequest",
+    "ArrayInput",
+    "ArrayVariableValue",
+    "ArrayVariableValueItem",
+    "ArrayVellumValue",
+    "ArrayVellumValueRequest",
+    "AudioChatMessageContent",
+    "AudioChatMessageContentRequest",
+    "AudioVariableValue",
+    "AudioVellumValue",
+    "AudioVellumValueRequest",
+    "BasicVectorizerIntfloatMultilingualE5Large",
+    "BasicVectorizerIntfloatMultilingualE5LargeRequest",
+    "BasicVectorizerSentenceTransformersMultiQaMpnetBaseCosV1",
+    "BasicVectorizerSentenceTransformersMultiQaMpnetBaseCosV1Request",
+    "BasicVectorizerSentenceTransformersMultiQaMpnetBaseDotV1",
+    "BasicVectorizerSentenceTransformersMultiQaMpnetBaseDotV1Request",
+    "ChatHistoryInput",
+    "ChatHistoryInputRequest",
+    "ChatHistoryVariableValue",
+    "ChatHistoryVellumValue",
+    "ChatHistoryVellumValueRequest",
+    "ChatMessage",
+    "ChatMessageContent",
+    "ChatMessageContentRequest",
+    "ChatMessagePromptBlock",
+    "ChatMessageRequest",
+    "ChatMessageRole",
+    "CodeExecutionNodeArrayResult",
+    "CodeExecutionNodeChatHistoryResult",
+    "CodeExecutionNodeErrorResult",
+    "CodeExecutionNodeFunctionCallResult",
+    "CodeExecutionNodeJsonResult",
+    "CodeExecutionNodeNumberResult",
+    "CodeExecutionNodeResult",
+    "CodeExecutionNodeResultData",
+    "CodeExecutionNodeResultOutput",
+    "CodeExecutionNodeSearchResultsResult",
+    "CodeExecutionNodeStringResult",
+    "CodeExecutionPackage",
+    "CodeExecutionRuntime",
+    "CodeExecutorInput",
+    "CodeExecutorResponse",
+    "CodeExecutorSecretInput",
+    "CompilePromptDeploymentExpandMetaRequest",
+    "CompilePromptMeta",
+    "ComponentsSchemasPdfSearchResultMetaSource",
+    "ComponentsSchemasPdfSearchResultMetaSourceRequest",
+    "ConditionCombinator",
+    "ConditionalNodeResult",
+    "ConditionalNodeResultData",
+    "ContainerImageRead",
+    "CreateTestSuiteTestCaseRequest",
+    "DeploymentHistoryItem",
+    "DeploymentProviderPayloadResponse",
+    "DeploymentProviderPayloadResponsePayload",
+    "DeploymentRead",
+    "DeploymentReleaseTagDeploymentHistoryItem",
+    "DeploymentReleaseTagRead",
+    "DockerServiceToken",
+    "DocumentDocumentToDocumentIndex",
+    "DocumentIndexChunking",
+    "DocumentIndexChunkingRequest",
+    "DocumentIndexIndexingConfig",
+    "DocumentIndexIndexingConfigRequest",
+    "DocumentIndexRead",
+    "DocumentProcessingState",
+    "DocumentRead",
+    "DocumentStatus",
+    "EnrichedNormalizedCompletion",
+    "EntityStatus",
+    "EntityVisibility",
+    "EnvironmentEnum",
+    "EphemeralPromptCacheConfig",
+    "EphemeralPromptCacheConfigTypeEnum",
+    "ErrorInput",
+    "ErrorVariableValue",
+    "ErrorVellumValue",
+    "ErrorVellumValueRequest",
+    "ExecutePromptEvent",
+    "ExecutePromptResponse",
+    "ExecuteWorkflowResponse",
+    "ExecuteWorkflowWorkflowResultEvent",
+    "ExecutionArrayVellumValue",
+    "ExecutionChatHistoryVellumValue",
+    "ExecutionErrorVellumValue",
+    "ExecutionFunctionCallVellumValue",
+    "ExecutionJsonVellumValue",
+    "ExecutionNumberVellumValue",
+    "ExecutionSearchResultsVellumValue",
+    "ExecutionStringVellumValue",
+    "ExecutionVellumValue",
+    "ExternalTestCaseExecution",
+    "ExternalTestCaseExecutionRequest",
+    "FinishReasonEnum",
+    "FolderEntity",
+    "FolderEntityDocumentIndex",
+    "FolderEntityDocumentIndexData",
+    "FolderEntityFolder",
+    "FolderEntityFolderData",
+    "FolderEntityPromptSandbox",
+    "FolderEntityPromptSandboxData",
+    "FolderEntityTestSuite",
+    "FolderEntityTestSuiteData",
+    "FolderEntityWorkflowSandbox",
+    "FolderEntityWorkflowSandboxData",
+    "FulfilledAdHocExecutePromptEvent",
+    "FulfilledEnum",
+    "FulfilledExecutePromptEvent",
+    "FulfilledExecutePromptResponse",
+    "FulfilledExecuteWorkflowWorkflowResultEvent",
+    "FulfilledPromptExecutionMeta",
+    "FulfilledWorkflowNodeResultEvent",
+    "FunctionCall",
+    "FunctionCallChatMessageContent",
+    "FunctionCallChatMessageContentRequest",
+    "FunctionCallChatMessageContentValue",
+    "FunctionCallChatMessageContentValueRequest",
+    "FunctionCallInput",
+    "FunctionCallRequest",
+    "FunctionCallVariableValue",
+    "FunctionCallVellumValue",
+    "FunctionCallVellumValueRequest",
+    "FunctionDefinition",
+    "GenerateOptionsRequest",
+    "GenerateRequest",
+    "GenerateResponse",
+    "GenerateResult",
+    "GenerateResultData",
+    "GenerateResultError",
+    "GenerateStreamResponse",
+    "GenerateStreamResult",
+    "GenerateStreamResultData",
+    "GoogleVertexAiVectorizerConfig",
+    "GoogleVertexAiVectorizerConfigRequest",
+    "GoogleVertexAiVectorizerTextEmbedding004",
+    "GoogleVertexAiVectorizerTextEmbedding004Request",
+    "GoogleVertexAiVectorizerTextMultilingualEmbedding002",
+    "GoogleVertexAiVectorizerTextMultilingualEmbedding002Request",
+    "HkunlpInstructorXlVectorizer",
+    "HkunlpInstructorXlVectorizerRequest",
+    "ImageChatMessageContent",
+    "ImageChatMessageContentRequest",
+    "ImageVariableValue",
+    "ImageVellumValue",
+    "ImageVellumValueRequest",
+    "IndexingConfigVectorizer",
+    "IndexingConfigVectorizerRequest",
+    "IndexingStateEnum",
+    "InitiatedAdHocExecutePromptEvent",
+    "InitiatedExecutePromptEvent",
+    "InitiatedPromptExecutionMeta",
+    "InitiatedWorkflowNodeResultEvent",
+    "InstructorVectorizerConfig",
+    "InstructorVectorizerConfigRequest",
+    "IterationStateEnum",
+    "JinjaPromptBlock",
+    "JsonInput",
+    "JsonInputRequest",
+    "JsonVariableValue",
+    "JsonVellumValue",
+    "JsonVellumValueRequest",
+    "LogicalOperator",
+    "LogprobsEnum",
+    "MapNodeResult",
+    "MapNodeResultData",
+    "MergeNodeResult",
+    "MergeNodeResultData",
+    "MetadataFilterConfigRequest",
+    "MetadataFilterRuleCombinator",
+    "MetadataFilterRuleRequest",
+    "MetadataFiltersRequest",
+    "MetricDefinitionExecution",
+    "MetricDefinitionHistoryItem",
+    "MetricDefinitionInput",
+    "MetricNodeResult",
+    "MlModelRead",
+    "MlModelUsage",
+    "NamedScenarioInputChatHistoryVariableValueRequest",
+    "NamedScenarioInputJsonVariableValueRequest",
+    "NamedScenarioInputRequest",
+    "NamedScenarioInputStringVariableValueRequest",
+    "NamedTestCaseArrayVariableValue",
+    "NamedTestCaseArrayVariableValueRequest",
+    "NamedTestCaseChatHistoryVariableValue",
+    "NamedTestCaseChatHistoryVariableValueRequest",
+    "NamedTestCaseErrorVariableValue",
+    "NamedTestCaseErrorVariableValueRequest",
+    "NamedTestCaseFunctionCallVariableValue",
+    "NamedTestCaseFunctionCallVariableValueRequest",
+    "NamedTestCaseJsonVariableValue",
+    "NamedTestCaseJsonVariableValueRequest",
+    "NamedTestCaseNumberVariableValue",
+    "NamedTestCaseNumberVariableValueRequest",
+    "NamedTestCaseSearchResultsVariableValue",
+    "NamedTestCaseSearchResultsVariableValueRequest",
+    "NamedTestCaseStringVariableValue",
+    "NamedTestCaseStringVariableValueRequest",
+    "NamedTestCaseVariableValue",
+    "NamedTestCaseVariableValueRequest",
+    "NodeInputCompiledArrayValue",
+    "NodeInputCompiledChatHistoryValue",
+    "NodeInputCompiledErrorValue",
+    "NodeInputCompiledFunctionCallValue",
+    "NodeInputCompiledJsonValue",
+    "NodeInputCompiledNumberValue",
+    "NodeInputCompiledSearchResultsValue",
+    "NodeInputCompiledStringValue",
+    "NodeInputVariableCompiledValue",
+    "NodeOutputCompiledArrayValue",
+    "NodeOutputCompiledChatHistoryValue",
+    "NodeOutputCompiledErrorValue",
+    "NodeOutputCompiledFunctionCallValue",
+    "NodeOutputCompiledJsonValue",
+    "NodeOutputCompiledNumberValue",
+    "NodeOutputCompiledSearchResultsValue",
+    "NodeOutputCompiledStringValue",
+    "NodeOutputCompiledValue",
+    "NormalizedLogProbs",
+    "NormalizedTokenLogProbs",
+    "NumberInput",
+    "NumberVariableValue",
+    "NumberVellumValue",
+    "NumberVellumValueRequest",
+    "OpenAiVectorizerConfig",
+    "OpenAiVectorizerConfigRequest",
+    "OpenAiVectorizerTextEmbedding3Large",
+    "OpenAiVectorizerTextEmbedding3LargeRequest",
+    "OpenAiVectorizerTextEmbedding3Small",
+    "OpenAiVectorizerTextEmbedding3SmallRequest",
+    "OpenAiVectorizerTextEmbeddingAda002",
+    "OpenAiVectorizerTextEmbeddingAda002Request",
+    "PaginatedContainerImageReadList",
+    "PaginatedDeploymentReleaseTagReadList",
+    "PaginatedDocumentIndexReadList",
+    "PaginatedFolderEntityList",
+    "PaginatedSlimDeploymentReadList",
+    "PaginatedSlimDocumentList",
+    "PaginatedSlimWorkflowDeploymentList",
+    "PaginatedTestSuiteRunExecutionList",
+    "PaginatedTestSuiteTestCaseList",
+    "PaginatedWorkflowReleaseTagReadList",
+    "PdfSearchResultMetaSource",
+    "PdfSearchResultMetaSourceRequest",
+    "PlainTextPromptBlock",
+    "Price",
+    "ProcessingFailureReasonEnum",
+    "PromptBlock",
+    "PromptBlockState",
+    "PromptDeploymentExpandMetaRequest",
+    "PromptDeploymentInputRequest",
+    "PromptExecutionMeta",
+    "PromptNodeExecutionMeta",
+    "PromptNodeResult",
+    "PromptNodeResultData",
+    "PromptOutput",
+    "PromptParameters",
+    "PromptRequestChatHistoryInput",
+    "PromptRequestInput",
+    "PromptRequestJsonInput",
+    "PromptRequestStringInput",
+    "PromptSettings",
+    "RawPromptExecutionOverridesRequest",
+    "ReductoChunkerConfig",
+    "ReductoChunkerConfigRequest",
+    "ReductoChunking",
+    "ReductoChunkingRequest",
+    "RejectedAdHocExecutePromptEvent",
+    "RejectedExecutePromptEvent",
+    "RejectedExecutePromptResponse",
+    "RejectedExecuteWorkflowWorkflowResultEvent",
+    "RejectedPromptExecutionMeta",
+    "RejectedWorkflowNodeResultEvent",
+    "ReleaseTagSource",
+    "ReplaceTestSuiteTestCaseRequest",
+    "RichTextChildBlock",
+    "RichTextPromptBlock",
+    "SandboxScenario",
+    "ScenarioInput",
+    "ScenarioInputChatHistoryVariableValue",
+    "ScenarioInputJsonVariableValue",
+    "ScenarioInputStringVariableValue",
+    "SearchFiltersRequest",
+    "SearchNodeResult",
+    "SearchNodeResultData",
+    "SearchRequestOptionsRequest",
+    "SearchResponse",
+    "SearchResult",
+    "SearchResultDocument",
+    "SearchResultDocumentRequest",
+    "SearchResultMergingRequest",
+    "SearchResultMeta",
+    "SearchResultMetaRequest",
+    "SearchResultRequest",
+    "SearchResultsInput",
+    "SearchResultsVariableValue",
+    "SearchResultsVellumValue",
+    "SearchResultsVellumValueRequest",
+    "SearchWeightsRequest",
+    "SecretTypeEnum",
+    "SentenceChunkerConfig",
+    "SentenceChunkerConfigRequest",
+    "SentenceChunking",
+    "SentenceChunkingRequest",
+    "SlimDeploymentRead",
+    "SlimDocument",
+    "SlimDocumentDocumentToDocumentIndex",
+    "SlimWorkflowDeployment",
+    "StreamingAdHocExecutePromptEvent",
+    "StreamingExecutePromptEvent",
+    "StreamingPromptExecutionMeta",
+    "StreamingWorkflowNodeResultEvent",
+    "StringChatMessageContent",
+    "StringChatMessageContentRequest",
+    "StringInput",
+    "StringInputRequest",
+    "StringVariableValue",
+    "StringVellumValue",
+    "StringVellumValueRequest",
+    "SubmitCompletionActualRequest",
+    "SubmitWorkflowExecutionActualRequest",
+    "SubworkflowNodeResult",
+    "SubworkflowNodeResultData",
+    "TemplatingNodeArrayResult",
+    "TemplatingNodeChatHistoryResult",
+    "TemplatingNodeErrorResult",
+    "TemplatingNodeFunctionCallResult",
+    "TemplatingNodeJsonResult",
+    "TemplatingNodeNumberResult",
+    "TemplatingNodeResult",
+    "TemplatingNodeResultData",
+    "TemplatingNodeResultOutput",
+    "TemplatingNodeSearchResultsResult",
+    "TemplatingNodeStringResult",
+    "TerminalNodeArrayResult",
+    "TerminalNodeChatHistoryResult",
+    "TerminalNodeErrorResult",
+    "TerminalNodeFunctionCallResult",
+    "TerminalNodeJsonResult",
+    "TerminalNodeNumberResult",
+    "TerminalNodeResult",
+    "TerminalNodeResultData",
+    "TerminalNodeResultOutput",
+    "TerminalNodeSearchResultsResult",
+    "TerminalNodeStringResult",
+    "TestCaseArrayVariableValue",
+    "TestCaseChatHistoryVariableValue",
+    "TestCaseErrorVariableValue",
+    "TestCaseFunctionCallVariableValue",
+    "TestCaseJsonVariableValue",
+    "TestCaseNumberVariableValue",
+    "TestCaseSearchResultsVariableValue",
+    "TestCaseStringVariableValue",
+    "TestCaseVariableValue",
+    "TestSuiteRunDeploymentReleaseTagExecConfig",
+    "TestSuiteRunDeploymentReleaseTagExecConfigData",
+    "TestSuiteRunDeploymentReleaseTagExecConfigDataRequest",
+    "TestSuiteRunDeploymentReleaseTagExecConfigRequest",
+    "TestSuiteRunExecConfig",
+    "TestSuiteRunExecConfigRequest",
+    "TestSuiteRunExecution",
+    "TestSuiteRunExecutionArrayOutput",
+    "TestSuiteRunExecutionChatHistoryOutput",
+    "TestSuiteRunExecutionErrorOutput",
+    "TestSuiteRunExecutionFunctionCallOutput",
+    "TestSuiteRunExecutionJsonOutput",
+    "TestSuiteRunExecutionMetricDefinition",
+    "TestSuiteRunExecutionMetricResult",
+    "TestSuiteRunExecutionNumberOutput",
+    "TestSuiteRunExecutionOutput",
+    "TestSuiteRunExecutionSearchResultsOutput",
+    "TestSuiteRunExecutionStringOutput",
+    "TestSuiteRunExternalExecConfig",
+    "TestSuiteRunExternalExecConfigData",
+    "TestSuiteRunExternalExecConfigDataRequest",
+    "TestSuiteRunExternalExecConfigRequest",
+    "TestSuiteRunMetricErrorOutput",
+    "TestSuiteRunMetricJsonOutput",
+    "TestSuiteRunMetricNumberOutput",
+    "TestSuiteRunMetricOutput",
+    "TestSuiteRunMetricStringOutput",
+    "TestSuiteRunPromptSandboxHistoryItemExecConfig",
+    "TestSuiteRunPromptSandboxHistoryItemExecConfigData",
+    "TestSuiteRunPromptSandboxHistoryItemExecConfigDataRequest",
+    "TestSuiteRunPromptSandboxHistoryItemExecConfigRequest",
+    "TestSuiteRunRead",
+    "TestSuiteRunState",
+    "TestSuiteRunTestSuite",
+    "TestSuiteRunWorkflowReleaseTagExecConfig",
+    "TestSuiteRunWorkflowReleaseTagExecConfigData",
+    "TestSuiteRunWorkflowReleaseTagExecConfigDataRequest",
+    "TestSuiteRunWorkflowReleaseTagExecConfigRequest",
+    "TestSuiteRunWorkflowSandboxHistoryItemExecConfig",
+    "TestSuiteRunWorkflowSandboxHistoryItemExecConfigData",
+    "TestSuiteRunWorkflowSandboxHistoryItemExecConfigDataRequest",
+    "TestSuiteRunWorkflowSandboxHistoryItemExecConfigRequest",
+    "TestSuiteTestCase",
+    "TestSuiteTestCaseBulkOperationRequest",
+    "TestSuiteTestCaseBulkResult",
+    "TestSuiteTestCaseCreateBulkOperationRequest",
+    "TestSuiteTestCaseCreatedBulkResult",
+    "TestSuiteTestCaseCreatedBulkResultData",
+    "TestSuiteTestCaseDeleteBulkOperationDataRequest",
+    "TestSuiteTestCaseDeleteBulkOperationRequest",
+    "TestSuiteTestCaseDeletedBulkResult",
+    "TestSuiteTestCaseDeletedBulkResultData",
+    "TestSuiteTestCaseRejectedBulkResult",
+    "TestSuiteTestCaseReplaceBulkOperationRequest",
+    "TestSuiteTestCaseReplacedBulkResult",
+    "TestSuiteTestCaseReplacedBulkResultData",
+    "TestSuiteTestCaseUpsertBulkOperationRequest",
+    "TokenOverlappingWindowChunkerConfig",
+    "TokenOverlappingWindowChunkerConfigRequest",
+    "TokenOverlappingWindowChunking",
+    "TokenOverlappingWindowChunkingRequest",
+    "UnitEnum",
+    "UploadDocumentResponse",
+    "UpsertTestSuiteTestCaseRequest",
+    "VariablePromptBlock",
+    "VellumAudio",
+    "VellumAudioRequest",
+    "VellumError",
+    "VellumErrorCodeEnum",
+    "VellumErrorRequest",
+    "VellumImage",
+    "VellumImageRequest",
+    "VellumValue",
+    "VellumValueLogicalConditionGroupRequest",
+    "VellumValueLogicalConditionRequest",
+    "VellumValueLogicalExpressionRequest",
+    "VellumValueRequest",
+    "VellumVariable",
+    "VellumVariableExtensions",
+    "VellumVariableType",
+    "WorkflowDeploymentHistoryItem",
+    "WorkflowDeploymentRead",
+    "WorkflowEventError",
+    "WorkflowExecutionActualChatHistoryRequest",
+    "WorkflowExecutionActualJsonRequest",
+    "WorkflowExecutionActualStringRequest",
+    "WorkflowExecutionEventErrorCode",
+    "WorkflowExecutionEventType",
+    "WorkflowExecutionNodeResultEvent",
+    "WorkflowExecutionWorkflowResultEvent",
+    "WorkflowExpandMetaRequest",
+    "WorkflowNodeResultData",
+    "WorkflowNodeResultEvent",
+    "WorkflowNodeResultEventState",
+    "WorkflowOutput",
+    "WorkflowOutputArray",
+    "WorkflowOutputChatHistory",
+    "WorkflowOutputError",
+    "WorkflowOutputFunctionCall",
+    "WorkflowOutputImage",
+    "WorkflowOutputJson",
+    "WorkflowOutputNumber",
+    "WorkflowOutputSearchResults",
+    "WorkflowOutputString",
+    "WorkflowPushDeploymentConfigRequest",
+    "WorkflowPushExecConfig",
+    "WorkflowPushResponse",
+    "WorkflowReleaseTagRead",
+    "WorkflowReleaseTagWorkflowDeploymentHistoryItem",
+    "WorkflowRequestChatHistoryInputRequest",
+    "WorkflowRequestInputRequest",
+    "WorkflowRequestJsonInputRequest",
+    "WorkflowRequestNumberInputRequest",
+    "WorkflowRequestStringInputRequest",
+    "WorkflowResultEvent",
+    "WorkflowResultEventOutputData",
+    "WorkflowResultEventOutputDataArray",
+    "WorkflowResultEventOutputDataChatHistory",
+    "WorkflowResultEventOutputDataError",
+    "WorkflowResultEventOutputDataFunctionCall",
+    "WorkflowResultEventOutputDataJson",
+    "WorkflowResultEventOutputDataNumber",
+    "WorkflowResultEventOutputDataSearchResults",
+    "WorkflowResultEventOutputDataString",
+    "WorkflowStreamEvent",
+    "WorkspaceSecretRead",
+]
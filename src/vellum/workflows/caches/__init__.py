@@ -0,0 +1,9 @@
+from .base import BaseCache
+from .disk import DiskCache
+from .in_memory import InMemoryCache
+
+__all__ = [
+    "BaseCache",
+    "DiskCache",
+    "InMemoryCache",
+]
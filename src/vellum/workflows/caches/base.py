@@ -0,0 +1,25 @@
+from abc import ABC, abstractmethod
+from typing import Any, Optional
+
+
+class BaseCache(ABC):
+    """
+    A key value store for results that are expensive to compute. Keys are strings, typically hashes produced by
+    `get_cache_key`, and a missing or expired key reads as `None`.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: Any) -> None:
+        pass
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        pass
@@ -0,0 +1,75 @@
+import logging
+import os
+import pickle
+import tempfile
+import time
+from typing import Any, Optional
+
+from vellum.workflows.caches.base import BaseCache
+
+logger = logging.getLogger(__name__)
+
+
+class DiskCache(BaseCache):
+    """
+    Pickles each result to its own file in a directory, so that results outlive the process that computed them and
+    can be shared by every process that points at the same directory.
+
+    Results are read back with `pickle`, which can run arbitrary code, so the directory must only be writable by
+    processes you trust, the same as the code of the Workflow itself. Never point it at a shared or world-writable
+    location.
+
+    directory: str - Where results are stored. It's created if it doesn't exist yet.
+    ttl: Optional[float] = None - How long, in seconds, a result may be read after it was set. Results never expire
+        if this is `None`.
+    """
+
+    def __init__(self, directory: str, ttl: Optional[float] = None) -> None:
+        self.directory = directory
+        self.ttl = ttl
+        os.makedirs(directory, exist_ok=True)
+
+    def get(self, key: str) -> Optional[Any]:
+        path = self._get_path(key)
+        try:
+            with open(path, "rb") as file:
+                expires_at, value = pickle.load(file)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            logger.warning(f"Failed to read cached result {key}, ignoring it", exc_info=True)
+            return None
+
+        if expires_at is not None and expires_at <= time.time():
+            self.delete(key)
+            return None
+
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        expires_at = time.time() + self.ttl if self.ttl is not None else None
+        serialized_value = pickle.dumps((expires_at, value))
+
+        # Results are written to a temporary file first, so that concurrent readers never see a partial one
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(file_descriptor, "wb") as file:
+                file.write(serialized_value)
+            os.replace(temporary_path, self._get_path(key))
+        except BaseException:
+            os.unlink(temporary_path)
+            raise
+
+    def delete(self, key: str) -> None:
+        try:
+            os.unlink(self._get_path(key))
+        except FileNotFoundError:
+            pass
+
+    def clear(self) -> None:
+        for file_name in os.listdir(self.directory):
+            if file_name.endswith(".pkl"):
+                self.delete(file_name[: -len(".pkl")])
+
+    def _get_path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.pkl")
@@ -0,0 +1,59 @@
+from collections import OrderedDict
+from copy import deepcopy
+from threading import Lock
+import time
+from typing import Any, Optional, Tuple
+
+from vellum.workflows.caches.base import BaseCache
+
+
+class InMemoryCache(BaseCache):
+    """
+    Keeps results in memory, evicting the least recently used ones once it's full. Results are copied on the way in and
+    on the way out, so that mutating a result after setting or getting it doesn't change what's cached.
+
+    max_size: int = 1024 - The most results kept at once.
+    ttl: Optional[float] = None - How long, in seconds, a result may be read after it was set. Results never expire
+        if this is `None`.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: Optional[float] = None) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[Any, Optional[float]]]" = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+
+        return deepcopy(value)
+
+    def set(self, key: str, value: Any) -> None:
+        value = deepcopy(value)
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
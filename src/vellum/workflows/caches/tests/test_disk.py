@@ -0,0 +1,56 @@
+import os
+import time
+
+from vellum.workflows.caches.disk import DiskCache
+
+
+def test_disk_cache__shares_results_across_instances(tmp_path):
+    # GIVEN a result set on a disk cache
+    DiskCache(str(tmp_path)).set("a", {"value": [1, 2, 3]})
+
+    # WHEN we read it from another cache pointing at the same directory
+    value = DiskCache(str(tmp_path)).get("a")
+
+    # THEN it should have been found
+    assert value == {"value": [1, 2, 3]}
+
+
+def test_disk_cache__expires_results(tmp_path):
+    # GIVEN a disk cache whose results expire quickly
+    cache = DiskCache(str(tmp_path), ttl=0.05)
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+
+    # WHEN we wait for the result to expire
+    time.sleep(0.1)
+
+    # THEN it should no longer be found, nor be left on disk
+    assert cache.get("a") is None
+    assert os.listdir(tmp_path) == []
+
+
+def test_disk_cache__ignores_corrupted_results(tmp_path):
+    # GIVEN a disk cache with a result that was corrupted
+    cache = DiskCache(str(tmp_path))
+    (tmp_path / "a.pkl").write_bytes(b"not a pickle")
+
+    # WHEN we read it
+    value = cache.get("a")
+
+    # THEN it should be treated as missing
+    assert value is None
+
+
+def test_disk_cache__clear(tmp_path):
+    # GIVEN a disk cache with a few results
+    cache = DiskCache(str(tmp_path))
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    # WHEN we clear it
+    cache.clear()
+
+    # THEN every result should have been removed
+    assert cache.get("a") is None
+    assert cache.get("b") is None
+    assert os.listdir(tmp_path) == []
@@ -0,0 +1,51 @@
+import time
+
+from vellum.workflows.caches.in_memory import InMemoryCache
+
+
+def test_in_memory_cache__evicts_least_recently_used():
+    # GIVEN a cache that holds at most two results
+    cache = InMemoryCache(max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    # AND the first result was read since it was set
+    assert cache.get("a") == 1
+
+    # WHEN we set a third result
+    cache.set("c", 3)
+
+    # THEN the least recently used result should have been evicted
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_in_memory_cache__expires_results():
+    # GIVEN a cache whose results expire quickly
+    cache = InMemoryCache(ttl=0.05)
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+
+    # WHEN we wait for the result to expire
+    time.sleep(0.1)
+
+    # THEN it should no longer be found
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_in_memory_cache__returns_copies():
+    # GIVEN a cache holding a mutable result
+    cache = InMemoryCache()
+    result = {"items": [1, 2]}
+    cache.set("a", result)
+
+    # WHEN both the result that was set and the one that was read are mutated
+    result["items"].append(3)
+    cached_result = cache.get("a")
+    assert cached_result is not None
+    cached_result["items"].append(4)
+
+    # THEN the cached result should have been left as it was set
+    assert cache.get("a") == {"items": [1, 2]}
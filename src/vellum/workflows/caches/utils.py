@@ -0,0 +1,41 @@
+import hashlib
+import json
+from typing import TYPE_CHECKING, Any, Optional
+
+from vellum.workflows.state.encoder import DefaultStateEncoder
+
+if TYPE_CHECKING:
+    from vellum.workflows.nodes.bases import BaseNode
+
+
+def get_cache_key(value: Any) -> str:
+    """
+    Hashes a JSON serializable value into a key that is stable across processes, raising a `TypeError` if the value
+    can't be serialized.
+    """
+
+    serialized_value = json.dumps(value, cls=DefaultStateEncoder, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(serialized_value.encode("utf-8")).hexdigest()
+
+
+def get_node_cache_key(node: "BaseNode") -> Optional[str]:
+    """
+    Returns the key a node's outputs are cached under, derived from the node's class, its `Execution.cache_version`
+    and its resolved attributes. Returns `None` if one of the attributes can't be serialized, in which case the node
+    can't be cached.
+
+    The node's code isn't part of the key, so results cached before a change to it are still used until its
+    `cache_version` is bumped.
+    """
+
+    node_class = node.__class__
+    try:
+        return get_cache_key(
+            {
+                "node": f"{node_class.__module__}.{node_class.__qualname__}",
+                "version": node_class.Execution.cache_version,
+                "attributes": {descriptor.name: getattr(node, descriptor.name) for descriptor in node_class},
+            }
+        )
+    except (TypeError, ValueError):
+        return None
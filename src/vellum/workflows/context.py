@@ -1,5 +1,5 @@
 from contextlib import contextmanager
-import threading
+from contextvars import ContextVar
 from typing import Iterator, Optional, cast
 
 from vellum.client.core import UniversalBaseModel
@@ -10,19 +10,19 @@ class ExecutionContext(UniversalBaseModel):
     parent_context: Optional[ParentContext] = None
 
 
-_CONTEXT_KEY = "_execution_context"
-
-local = threading.local()
+# A context variable is local to both the current thread and the current asyncio task, so that nodes running
+# concurrently on the same event loop don't see each other's execution context.
+_execution_context: ContextVar[Optional[ExecutionContext]] = ContextVar("_execution_context", default=None)
 
 
 def get_execution_context() -> ExecutionContext:
     """Retrieve the current execution context."""
-    return getattr(local, _CONTEXT_KEY, ExecutionContext())
+    return _execution_context.get() or ExecutionContext()
 
 
 def set_execution_context(context: ExecutionContext) -> None:
     """Set the current execution context."""
-    setattr(local, _CONTEXT_KEY, context)
+    _execution_context.set(context)
 
 
 def get_parent_context() -> ParentContext:
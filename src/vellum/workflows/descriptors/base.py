@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Any, Generic, Optional, Tuple, Type, TypeVar, Union, cast, overload
+from typing import TYPE_CHECKING, Any, Callable, Generic, Optional, Tuple, Type, TypeVar, Union, cast, overload
 
 if TYPE_CHECKING:
     from vellum.workflows.expressions.accessor import AccessorExpression
@@ -39,6 +39,7 @@ class BaseDescriptor(Generic[_T]):
     _name: str
     _types: Tuple[Type[_T], ...]
     _instance: Optional[_T]
+    _compiled: Callable[["BaseState"], _T]
 
     def __init__(self, *, name: str, types: Tuple[Type[_T], ...], instance: Optional[_T] = None) -> None:
         self._name = name
@@ -58,7 +59,29 @@ class BaseDescriptor(Generic[_T]):
         return self._instance
 
     def resolve(self, state: "BaseState") -> _T:
-        raise NotImplementedError("Descriptor must implement resolve method")
+        # Expressions only implement `_compile`, so that resolving them and their compiled form can't drift apart
+        return self.compile()(state)
+
+    def compile(self) -> Callable[["BaseState"], _T]:
+        """
+        Compiles this descriptor into a callable that is equivalent to `resolve`. The callable is only built the first
+        time, and reused on every call after that.
+        """
+
+        compiled = self.__dict__.get("_compiled")
+        if compiled is None:
+            compiled = self._compile()
+            self._compiled = compiled
+
+        return compiled
+
+    def _compile(self) -> Callable[["BaseState"], _T]:
+        # Expressions override this to compile their operands once up front, so that the returned callable doesn't
+        # walk the expression tree on every call. Other descriptors, like references, only implement `resolve`
+        if type(self).resolve is BaseDescriptor.resolve:
+            raise NotImplementedError("Descriptor must implement either resolve or _compile")
+
+        return self.resolve
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, type(self)):
@@ -1,6 +1,6 @@
 import pytest
 
-from vellum.workflows.descriptors.utils import resolve_value
+from vellum.workflows.descriptors.utils import compile_value, resolve_value
 from vellum.workflows.state.base import BaseState
 
 
@@ -81,3 +81,49 @@ class FixtureState(BaseState):
 def test_resolve_value__happy_path(descriptor, expected_value):
     actual_value = resolve_value(descriptor, FixtureState())
     assert actual_value == expected_value
+
+    # Compiling the descriptor should resolve to the same value
+    compiled_value = compile_value(descriptor)(FixtureState())
+    assert compiled_value == expected_value
+
+
+def test_compile_value__containers_are_resolved_on_every_call():
+    # GIVEN a container holding a descriptor
+    value = {"greeting": FixtureState.gamma, "count": 1}
+
+    # WHEN we compile it
+    compiled_value = compile_value(value)
+
+    # THEN each call should resolve the descriptor against the given state into a fresh container
+    first = compiled_value(FixtureState())
+    other_state = FixtureState()
+    other_state.gamma = "hi"
+    second = compiled_value(other_state)
+    assert first == {"greeting": "hello", "count": 1}
+    assert second == {"greeting": "hi", "count": 1}
+    assert first is not value
+
+
+def test_compile_value__raises_the_same_errors():
+    # GIVEN an expression that compares a string as if it were a number
+    descriptor = FixtureState.gamma.greater_than(FixtureState.alpha)
+
+    # WHEN we compile and call it
+    with pytest.raises(ValueError) as exc_info:
+        compile_value(descriptor)(FixtureState())
+
+    # THEN it should fail the same way resolving it would
+    assert str(exc_info.value) == "Expected a numeric lhs value, got: str"
+
+
+def test_compile_value__descriptors_are_compiled_once():
+    # GIVEN an expression
+    descriptor = FixtureState.alpha.less_than(FixtureState.beta)
+
+    # WHEN we compile it more than once
+    first = compile_value(descriptor)
+    second = compile_value(descriptor)
+
+    # THEN the same callable should have been returned both times
+    assert first is second
+    assert first(FixtureState()) is True
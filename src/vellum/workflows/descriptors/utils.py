@@ -1,7 +1,7 @@
 from collections.abc import Mapping
 import dataclasses
 import inspect
-from typing import Any, Dict, Optional, Sequence, Set, TypeVar, Union, cast, overload
+from typing import Any, Callable, Dict, Optional, Sequence, Set, TypeVar, Union, cast, overload
 
 from pydantic import BaseModel
 
@@ -91,6 +91,38 @@ def resolve_value(
     return value
 
 
+@overload
+def compile_value(value: BaseDescriptor[_T], path: str = "") -> Callable[[BaseState], _T]: ...
+
+
+@overload
+def compile_value(value: _T, path: str = "") -> Callable[[BaseState], _T]: ...
+
+
+def compile_value(value: Union[BaseDescriptor[_T], _T], path: str = "") -> Callable[[BaseState], _T]:
+    """
+    Compiles a value into a callable that is equivalent to calling `resolve_value` on it. Descriptors are compiled
+    into their own callables and constants are captured as is, so that the checks `resolve_value` performs to find out
+    what kind of value it was given only happen once. Containers fall back to `resolve_value`, since the Descriptors
+    they hold have to be resolved into a fresh copy on every call.
+    """
+
+    if isinstance(value, BaseDescriptor):
+        return cast(Callable[[BaseState], _T], value.compile())
+
+    if (
+        inspect.isclass(value)
+        or isinstance(value, (property, str, bytes))
+        or callable(value)
+        or not (dataclasses.is_dataclass(value) or isinstance(value, (BaseModel, Mapping, Sequence, Set)))
+    ):
+        constant = cast(_T, value)
+        return lambda state: constant
+
+    container = cast(_T, value)
+    return lambda state: resolve_value(container, state, path=path)
+
+
 def is_unresolved(value: Any) -> bool:
     """
     Recursively checks if a value has an unresolved value, represented by UNDEF.
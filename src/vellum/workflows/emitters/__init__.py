@@ -1,5 +1,10 @@
-from .base import BaseWorkflowEmitter
+from .base import BaseWorkflowEmitter, EmitterOverflowPolicy
+from .in_memory import InMemoryWorkflowEmitter
+from .jsonl_file import JsonlFileWorkflowEmitter
 
 __all__ = [
     "BaseWorkflowEmitter",
+    "EmitterOverflowPolicy",
+    "InMemoryWorkflowEmitter",
+    "JsonlFileWorkflowEmitter",
 ]
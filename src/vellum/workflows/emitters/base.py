@@ -1,10 +1,33 @@
 from abc import ABC, abstractmethod
+from enum import Enum
+from typing import List
 
 from vellum.workflows.events.workflow import WorkflowEvent
 from vellum.workflows.state.base import BaseState
 
 
+class EmitterOverflowPolicy(Enum):
+    BLOCK = "BLOCK"
+    DROP = "DROP"
+
+
 class BaseWorkflowEmitter(ABC):
+    """
+    Receives every event and state snapshot of the Workflows it's attached to. Each emitter is fed from its own
+    worker thread and bounded queue, so that a slow or failing emitter can't hold up the Workflow or other emitters.
+
+    max_batch_size: int = 1 - The most items handed to `emit_events` or `snapshot_states` at once.
+    flush_interval: float = 0.1 - How long, in seconds, a partial batch may wait to fill up before being handed off.
+    max_queue_size: int = 10000 - How many items may be waiting on the emitter before the overflow policy applies.
+    overflow_policy: EmitterOverflowPolicy = EmitterOverflowPolicy.BLOCK - Whether to block the Workflow until
+        the emitter catches up, or to drop items that don't fit in the queue.
+    """
+
+    max_batch_size: int = 1
+    flush_interval: float = 0.1
+    max_queue_size: int = 10_000
+    overflow_policy: EmitterOverflowPolicy = EmitterOverflowPolicy.BLOCK
+
     @abstractmethod
     def emit_event(self, event: WorkflowEvent) -> None:
         pass
@@ -12,3 +35,36 @@ class BaseWorkflowEmitter(ABC):
     @abstractmethod
     def snapshot_state(self, state: BaseState) -> None:
         pass
+
+    def emit_events(self, events: List[WorkflowEvent]) -> None:
+        """
+        Emits a batch of events, in the order they were emitted. Emitters that can send several events at once
+        should override this along with raising `max_batch_size`. Batches of events and of states are handed off
+        separately, so a state may arrive before events that were emitted ahead of it.
+        """
+
+        for event in events:
+            self.emit_event(event)
+
+    def snapshot_states(self, states: List[BaseState]) -> None:
+        """
+        Snapshots a batch of states, in the order they were snapshotted.
+        """
+
+        for state in states:
+            self.snapshot_state(state)
+
+    def flush(self) -> None:
+        """
+        Called once everything a Workflow run emitted has been handed to this emitter.
+        """
+
+        pass
+
+    def close(self) -> None:
+        """
+        Called after `flush`, once this emitter's worker is done with the Workflow run, to release whatever the
+        emitter holds onto for it, like open files or connections. The same emitter may still be used by later runs.
+        """
+
+        pass
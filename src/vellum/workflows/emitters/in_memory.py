@@ -0,0 +1,36 @@
+from threading import Lock
+from typing import List
+
+from vellum.workflows.emitters.base import BaseWorkflowEmitter
+from vellum.workflows.events.workflow import WorkflowEvent
+from vellum.workflows.state.base import BaseState
+
+
+class InMemoryWorkflowEmitter(BaseWorkflowEmitter):
+    """
+    Keeps every event and state snapshot it receives in memory. Mostly useful for tests and benchmarks.
+    """
+
+    def __init__(self, max_batch_size: int = 100, flush_interval: float = 0.1) -> None:
+        self.max_batch_size = max_batch_size
+        self.flush_interval = flush_interval
+        self.events: List[WorkflowEvent] = []
+        self.states: List[BaseState] = []
+        self.batch_count = 0
+        self._lock = Lock()
+
+    def emit_event(self, event: WorkflowEvent) -> None:
+        self.emit_events([event])
+
+    def snapshot_state(self, state: BaseState) -> None:
+        self.snapshot_states([state])
+
+    def emit_events(self, events: List[WorkflowEvent]) -> None:
+        with self._lock:
+            self.events.extend(events)
+            self.batch_count += 1
+
+    def snapshot_states(self, states: List[BaseState]) -> None:
+        with self._lock:
+            self.states.extend(states)
+            self.batch_count += 1
@@ -0,0 +1,55 @@
+import json
+from threading import Lock
+from typing import Any, Dict, List, Optional, TextIO
+
+from vellum.workflows.emitters.base import BaseWorkflowEmitter
+from vellum.workflows.events.workflow import WorkflowEvent
+from vellum.workflows.state.base import BaseState
+from vellum.workflows.state.encoder import DefaultStateEncoder
+
+
+class JsonlFileWorkflowEmitter(BaseWorkflowEmitter):
+    """
+    Appends every event and state snapshot it receives to a JSON Lines file, writing each batch at once.
+
+    path: str - The file to append to. Each line is an object with a `type` of either "event" or "state".
+    """
+
+    def __init__(self, path: str, max_batch_size: int = 100, flush_interval: float = 0.1) -> None:
+        self.path = path
+        self.max_batch_size = max_batch_size
+        self.flush_interval = flush_interval
+        self._file: Optional[TextIO] = None
+        self._file_lock = Lock()
+
+    def emit_event(self, event: WorkflowEvent) -> None:
+        self.emit_events([event])
+
+    def snapshot_state(self, state: BaseState) -> None:
+        self.snapshot_states([state])
+
+    def emit_events(self, events: List[WorkflowEvent]) -> None:
+        self._write_lines([{"type": "event", "data": event.model_dump()} for event in events])
+
+    def snapshot_states(self, states: List[BaseState]) -> None:
+        self._write_lines([{"type": "state", "data": state} for state in states])
+
+    def flush(self) -> None:
+        with self._file_lock:
+            if self._file:
+                self._file.flush()
+
+    def close(self) -> None:
+        with self._file_lock:
+            if self._file:
+                self._file.close()
+                self._file = None
+
+    def _write_lines(self, lines: List[Dict[str, Any]]) -> None:
+        serialized_lines = "".join(json.dumps(line, cls=DefaultStateEncoder) + "\n" for line in lines)
+        with self._file_lock:
+            if not self._file:
+                self._file = open(self.path, "a")
+
+            self._file.write(serialized_lines)
+            self._file.flush()
@@ -0,0 +1,152 @@
+import logging
+from queue import Empty, Full, Queue
+from threading import Lock, Thread
+import time
+from typing import Any, Callable, Iterable, List, Optional, Union
+
+from vellum.workflows.emitters.base import BaseWorkflowEmitter, EmitterOverflowPolicy
+from vellum.workflows.events.types import BaseEvent
+from vellum.workflows.events.workflow import WorkflowEvent
+from vellum.workflows.state.base import BaseState
+
+logger = logging.getLogger(__name__)
+
+EmitterItem = Union[BaseState, WorkflowEvent]
+
+_STOP = object()
+
+
+class EmitterWorker:
+    """
+    Feeds a single emitter from a bounded queue on a dedicated thread, handing it items in batches of up to
+    `max_batch_size`, or whatever has accumulated once `flush_interval` has elapsed since a batch was started. Once
+    the worker is closed and has drained its queue, the emitter is flushed and then closed.
+    """
+
+    def __init__(self, emitter: BaseWorkflowEmitter, thread_name: str) -> None:
+        self.emitter = emitter
+        self.dropped_count = 0
+
+        self._max_batch_size = max(1, emitter.max_batch_size)
+        self._flush_interval = max(0.0, emitter.flush_interval)
+        self._drop_on_overflow = emitter.overflow_policy == EmitterOverflowPolicy.DROP
+        self._queue: Queue = Queue(maxsize=max(0, emitter.max_queue_size))
+        self._dropped_count_lock = Lock()
+        self._closing = False
+        self._closing_lock = Lock()
+        self._thread = Thread(target=self._run, name=thread_name)
+        self._thread.start()
+
+    def put(self, item: EmitterItem) -> None:
+        if not self._drop_on_overflow:
+            self._queue.put(item)
+            return
+
+        try:
+            self._queue.put_nowait(item)
+        except Full:
+            with self._dropped_count_lock:
+                self.dropped_count += 1
+                if self.dropped_count == 1:
+                    logger.warning(f"Emitter {self.emitter.__class__.__name__} is falling behind, dropping items")
+
+    def close(self) -> None:
+        # The stop marker is never dropped, so that the worker always gets to flush what it has
+        if not self._drop_on_overflow:
+            self._queue.put(_STOP)
+            return
+
+        # Workers that may drop items must not block the Workflow on close either. If the queue is full, the worker
+        # instead stops once it has drained it
+        with self._closing_lock:
+            try:
+                self._queue.put_nowait(_STOP)
+            except Full:
+                self._closing = True
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        batch: List[EmitterItem] = []
+        deadline = 0.0
+        while True:
+            try:
+                # Only wait with a timeout while there's a partial batch to flush, so that idle workers don't poll
+                item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()) if batch else None)
+            except Empty:
+                self._flush(batch)
+                batch = []
+                continue
+
+            if item is _STOP:
+                self._flush(batch)
+                self._close_emitter()
+                return
+
+            with self._closing_lock:
+                is_last_item = self._closing and self._queue.empty()
+
+            if not batch:
+                deadline = time.monotonic() + self._flush_interval
+
+            batch.append(item)
+            if is_last_item:
+                self._flush(batch)
+                self._close_emitter()
+                return
+
+            if len(batch) >= self._max_batch_size:
+                self._flush(batch)
+                batch = []
+
+    def _flush(self, batch: List[EmitterItem]) -> None:
+        # Every state snapshot is also emitted as a snapshotted event, so the two kinds are interleaved. Handing them
+        # off separately keeps each kind in order while still batching them
+        events = [item for item in batch if isinstance(item, BaseEvent)]
+        states = [item for item in batch if not isinstance(item, BaseEvent)]
+        if events:
+            self._call_emitter(self.emitter.emit_events, events)
+        if states:
+            self._call_emitter(self.emitter.snapshot_states, states)
+
+    def _call_emitter(self, emit: Callable[[List[Any]], None], items: List[Any]) -> None:
+        try:
+            emit(items)
+        except Exception:
+            logger.exception(f"Emitter {self.emitter.__class__.__name__} failed to emit {len(items)} items")
+
+    def _close_emitter(self) -> None:
+        try:
+            self.emitter.flush()
+        except Exception:
+            logger.exception(f"Emitter {self.emitter.__class__.__name__} failed to flush")
+
+        try:
+            self.emitter.close()
+        except Exception:
+            logger.exception(f"Emitter {self.emitter.__class__.__name__} failed to close")
+
+
+class EmitterPipeline:
+    """
+    Fans the events and state snapshots of a single Workflow run out to each of its emitters' workers.
+    """
+
+    def __init__(self, emitters: Iterable[BaseWorkflowEmitter], thread_name_prefix: str) -> None:
+        self.workers = [
+            EmitterWorker(emitter, thread_name=f"{thread_name_prefix}.{emitter.__class__.__name__}")
+            for emitter in emitters
+        ]
+
+    def put(self, item: EmitterItem) -> None:
+        for worker in self.workers:
+            worker.put(item)
+
+    def close(self) -> None:
+        for worker in self.workers:
+            worker.close()
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        for worker in self.workers:
+            worker.join(timeout)
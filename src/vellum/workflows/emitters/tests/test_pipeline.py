@@ -0,0 +1,208 @@
+import json
+from threading import Event as ThreadingEvent
+import time
+from typing import List
+
+from vellum.workflows.emitters.base import BaseWorkflowEmitter, EmitterOverflowPolicy
+from vellum.workflows.emitters.in_memory import InMemoryWorkflowEmitter
+from vellum.workflows.emitters.jsonl_file import JsonlFileWorkflowEmitter
+from vellum.workflows.emitters.pipeline import EmitterPipeline
+from vellum.workflows.events.workflow import WorkflowEvent
+from vellum.workflows.inputs.base import BaseInputs
+from vellum.workflows.nodes.bases.base import BaseNode
+from vellum.workflows.runner.runner import WorkflowRunner
+from vellum.workflows.state.base import BaseState
+from vellum.workflows.workflows.base import BaseWorkflow
+
+
+class State(BaseState):
+    counter: int = 0
+
+
+class CounterNode(BaseNode[State]):
+    class Outputs(BaseNode.Outputs):
+        counter: int
+
+    def run(self) -> Outputs:
+        for _ in range(20):
+            self.state.counter += 1
+
+        return self.Outputs(counter=self.state.counter)
+
+
+class CounterWorkflow(BaseWorkflow[BaseInputs, State]):
+    graph = CounterNode
+
+    class Outputs(BaseWorkflow.Outputs):
+        counter = CounterNode.Outputs.counter
+
+
+def _stream(workflow: BaseWorkflow) -> List[WorkflowEvent]:
+    runner = WorkflowRunner(workflow)
+    events = list(runner.stream())
+    assert runner._emitter_pipeline
+    runner._emitter_pipeline.join(timeout=5)
+    return events
+
+
+def test_emitter_pipeline__batches_events_and_states():
+    # GIVEN a workflow with an emitter that accepts batches
+    emitter = InMemoryWorkflowEmitter(max_batch_size=100)
+    workflow = CounterWorkflow(emitters=[emitter])
+
+    # WHEN we stream the workflow
+    events = _stream(workflow)
+
+    # THEN the emitter should have received every event and state snapshot, in order
+    assert [event.id for event in emitter.events] == [event.id for event in events]
+    last_state = emitter.states[-1]
+    assert isinstance(last_state, State)
+    assert last_state.counter == 20
+
+    # AND they should have been handed off in far fewer calls than there were items
+    assert emitter.batch_count < (len(emitter.events) + len(emitter.states)) / 4
+
+
+class FailingEmitter(BaseWorkflowEmitter):
+    def emit_event(self, event: WorkflowEvent) -> None:
+        raise Exception("Emitter failed")
+
+    def snapshot_state(self, state: BaseState) -> None:
+        raise Exception("Emitter failed")
+
+
+def test_emitter_pipeline__failing_emitter_is_isolated():
+    # GIVEN a workflow with an emitter that always fails, alongside one that works
+    emitter = InMemoryWorkflowEmitter()
+    workflow = CounterWorkflow(emitters=[FailingEmitter(), emitter])
+
+    # WHEN we stream the workflow
+    events = _stream(workflow)
+
+    # THEN the workflow should have been fulfilled
+    assert events[-1].name == "workflow.execution.fulfilled"
+
+    # AND the working emitter should still have received every event
+    assert len(emitter.events) == len(events)
+
+
+class BlockedEmitter(BaseWorkflowEmitter):
+    max_queue_size = 2
+    overflow_policy = EmitterOverflowPolicy.DROP
+
+    def __init__(self) -> None:
+        self.unblock = ThreadingEvent()
+        self.events: List[WorkflowEvent] = []
+
+    def emit_event(self, event: WorkflowEvent) -> None:
+        self.unblock.wait()
+        self.events.append(event)
+
+    def snapshot_state(self, state: BaseState) -> None:
+        self.unblock.wait()
+
+
+def test_emitter_pipeline__drop_policy_does_not_block_the_workflow():
+    # GIVEN a workflow with an emitter that is stuck, and that prefers dropping items to blocking the workflow
+    emitter = BlockedEmitter()
+    workflow = CounterWorkflow(emitters=[emitter])
+
+    # WHEN we stream the workflow
+    runner = WorkflowRunner(workflow)
+    events = list(runner.stream())
+
+    # THEN the workflow should have completed while the emitter is still stuck
+    assert events[-1].name == "workflow.execution.fulfilled"
+    assert not emitter.unblock.is_set()
+
+    # AND the items that didn't fit in the emitter's queue should have been dropped
+    assert runner._emitter_pipeline
+    worker = runner._emitter_pipeline.workers[0]
+    assert worker.dropped_count > 0
+
+    # AND the emitter should receive whatever was kept once it catches up
+    emitter.unblock.set()
+    worker.join(timeout=5)
+    assert 0 < len(emitter.events) < len(events)
+
+
+def test_emitter_pipeline__flushes_partial_batches_after_interval():
+    # GIVEN a pipeline whose emitter waits for large batches, but only for a short while
+    emitter = InMemoryWorkflowEmitter(max_batch_size=1000, flush_interval=0.05)
+    pipeline = EmitterPipeline([emitter], thread_name_prefix="test")
+
+    # WHEN a single item is put on the pipeline
+    pipeline.put(State())
+
+    # THEN it should be flushed once the interval elapses, without waiting for the batch to fill up
+    time.sleep(0.5)
+    assert len(emitter.states) == 1
+
+    pipeline.close()
+    pipeline.join(timeout=5)
+
+
+def test_jsonl_file_emitter__writes_every_item(tmp_path):
+    # GIVEN a workflow with a JSONL file emitter
+    path = tmp_path / "events.jsonl"
+    emitter = JsonlFileWorkflowEmitter(str(path))
+    workflow = CounterWorkflow(emitters=[emitter])
+
+    # WHEN we stream the workflow
+    events = _stream(workflow)
+
+    # THEN every event and state snapshot should have been written as its own line
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [line["data"]["id"] for line in lines if line["type"] == "event"] == [str(event.id) for event in events]
+    assert [line["data"]["counter"] for line in lines if line["type"] == "state"][-1] == 20
+
+    # AND the pipeline should have closed the file once the worker drained its queue
+    assert emitter._file is None
+
+    # AND the emitter should still append to the file when the workflow is run again
+    second_run_events = _stream(workflow)
+    assert len(path.read_text().splitlines()) > len(second_run_events) + len(events)
+    assert emitter._file is None
+
+
+class SlowEmitter(BaseWorkflowEmitter):
+    def __init__(self, max_batch_size: int) -> None:
+        self.max_batch_size = max_batch_size
+        self.item_count = 0
+
+    def emit_event(self, event: WorkflowEvent) -> None:
+        self.emit_events([event])
+
+    def snapshot_state(self, state: BaseState) -> None:
+        self.snapshot_states([state])
+
+    def emit_events(self, events: List[WorkflowEvent]) -> None:
+        # Mimics the fixed per-request overhead of a remote emitter
+        time.sleep(0.005)
+        self.item_count += len(events)
+
+    def snapshot_states(self, states: List[BaseState]) -> None:
+        time.sleep(0.005)
+        self.item_count += len(states)
+
+
+def test_emitter_pipeline__batching_benchmark():
+    # GIVEN the same items sent to an emitter with a fixed per-call overhead, with and without batching
+    items = [State() for _ in range(200)]
+
+    def drain(emitter: SlowEmitter) -> float:
+        pipeline = EmitterPipeline([emitter], thread_name_prefix="benchmark")
+        start = time.perf_counter()
+        for item in items:
+            pipeline.put(item)
+        pipeline.close()
+        pipeline.join(timeout=10)
+        assert emitter.item_count == len(items)
+        return time.perf_counter() - start
+
+    # WHEN we measure how long each takes to drain
+    unbatched = drain(SlowEmitter(max_batch_size=1))
+    batched = drain(SlowEmitter(max_batch_size=50))
+
+    # THEN batching should have been considerably faster
+    assert batched * 5 < unbatched, f"batched: {batched:.3f}s, unbatched: {unbatched:.3f}s"
@@ -1,11 +1,14 @@
 from .node import (
     NodeEvent,
+    NodeExecutionCacheHitEvent,
+    NodeExecutionCacheMissEvent,
     NodeExecutionFulfilledEvent,
     NodeExecutionInitiatedEvent,
     NodeExecutionRejectedEvent,
     NodeExecutionStreamingEvent,
 )
 from .workflow import (
+    AsyncWorkflowEventStream,
     WorkflowEvent,
     WorkflowEventStream,
     WorkflowExecutionFulfilledEvent,
@@ -23,7 +26,10 @@ __all__ = [
     "NodeExecutionRejectedEvent",
     "WorkflowExecutionRejectedEvent",
     "NodeExecutionStreamingEvent",
+    "NodeExecutionCacheHitEvent",
+    "NodeExecutionCacheMissEvent",
     "WorkflowExecutionStreamingEvent",
     "WorkflowEvent",
     "WorkflowEventStream",
+    "AsyncWorkflowEventStream",
 ]
@@ -149,6 +149,32 @@ class NodeExecutionResumedEvent(_BaseNodeEvent):
     body: NodeExecutionResumedBody
 
 
+class NodeExecutionCacheHitBody(_BaseNodeExecutionBody):
+    cache_key: str
+
+
+class NodeExecutionCacheHitEvent(_BaseNodeEvent):
+    name: Literal["node.execution.cache_hit"] = "node.execution.cache_hit"
+    body: NodeExecutionCacheHitBody
+
+    @property
+    def cache_key(self) -> str:
+        return self.body.cache_key
+
+
+class NodeExecutionCacheMissBody(_BaseNodeExecutionBody):
+    cache_key: str
+
+
+class NodeExecutionCacheMissEvent(_BaseNodeEvent):
+    name: Literal["node.execution.cache_miss"] = "node.execution.cache_miss"
+    body: NodeExecutionCacheMissBody
+
+    @property
+    def cache_key(self) -> str:
+        return self.body.cache_key
+
+
 NodeEvent = Union[
     NodeExecutionInitiatedEvent,
     NodeExecutionStreamingEvent,
@@ -156,4 +182,6 @@ NodeEvent = Union[
     NodeExecutionRejectedEvent,
     NodeExecutionPausedEvent,
     NodeExecutionResumedEvent,
+    NodeExecutionCacheHitEvent,
+    NodeExecutionCacheMissEvent,
 ]
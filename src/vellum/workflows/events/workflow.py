@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Any, Dict, Generator, Generic, Iterable, Literal, Type, Union
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Dict, Generator, Generic, Iterable, Literal, Type, Union
 
 from pydantic import field_serializer
 
@@ -9,6 +9,8 @@ from vellum.workflows.references import ExternalInputReference
 from vellum.workflows.types.generics import OutputsType, StateType, WorkflowInputsType
 
 from .node import (
+    NodeExecutionCacheHitEvent,
+    NodeExecutionCacheMissEvent,
     NodeExecutionFulfilledEvent,
     NodeExecutionInitiatedEvent,
     NodeExecutionPausedEvent,
@@ -152,6 +154,8 @@ GenericWorkflowEvent = Union[
     NodeExecutionRejectedEvent,
     NodeExecutionPausedEvent,
     NodeExecutionResumedEvent,
+    NodeExecutionCacheHitEvent,
+    NodeExecutionCacheMissEvent,
 ]
 
 WorkflowEvent = Union[
@@ -162,3 +166,5 @@ WorkflowEvent = Union[
 ]
 
 WorkflowEventStream = Generator[WorkflowEvent, None, None]
+
+AsyncWorkflowEventStream = AsyncGenerator[WorkflowEvent, None]
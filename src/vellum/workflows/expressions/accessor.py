@@ -1,12 +1,12 @@
 from collections.abc import Mapping
 import dataclasses
-from typing import Any, Sequence, Type, TypeVar
+from typing import Any, Callable, Sequence, Type, TypeVar
 
 from pydantic import BaseModel, GetCoreSchemaHandler
 from pydantic_core import core_schema
 
 from vellum.workflows.descriptors.base import BaseDescriptor
-from vellum.workflows.descriptors.utils import resolve_value
+from vellum.workflows.descriptors.utils import compile_value
 from vellum.workflows.state.base import BaseState
 
 LHS = TypeVar("LHS")
@@ -27,23 +27,29 @@ class AccessorExpression(BaseDescriptor[Any]):
         self._base = base
         self._field = field
 
-    def resolve(self, state: "BaseState") -> Any:
-        base = resolve_value(self._base, state)
+    def _compile(self) -> Callable[["BaseState"], Any]:
+        compiled_base = compile_value(self._base)
+        field = self._field
 
-        if dataclasses.is_dataclass(base):
-            return getattr(base, self._field)
+        def resolve(state: "BaseState") -> Any:
+            base = compiled_base(state)
 
-        if isinstance(base, BaseModel):
-            return getattr(base, self._field)
+            if dataclasses.is_dataclass(base):
+                return getattr(base, field)
 
-        if isinstance(base, Mapping):
-            return base[self._field]
+            if isinstance(base, BaseModel):
+                return getattr(base, field)
 
-        if isinstance(base, Sequence):
-            index = int(self._field)
-            return base[index]
+            if isinstance(base, Mapping):
+                return base[field]
 
-        raise ValueError(f"Cannot get field {self._field} from {base}")
+            if isinstance(base, Sequence):
+                index = int(field)
+                return base[index]
+
+            raise ValueError(f"Cannot get field {field} from {base}")
+
+        return resolve
 
     @classmethod
     def __get_pydantic_core_schema__(
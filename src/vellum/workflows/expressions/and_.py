@@ -1,7 +1,7 @@
-from typing import TypeVar, Union
+from typing import Callable, TypeVar, Union
 
 from vellum.workflows.descriptors.base import BaseDescriptor
-from vellum.workflows.descriptors.utils import resolve_value
+from vellum.workflows.descriptors.utils import compile_value
 from vellum.workflows.state.base import BaseState
 from vellum.workflows.types.utils import resolve_combined_types
 
@@ -24,9 +24,15 @@ class AndExpression(BaseDescriptor[Union[LHS, RHS]]):
         self._lhs = lhs
         self._rhs = rhs
 
-    def resolve(self, state: "BaseState") -> Union[LHS, RHS]:
-        lhs = resolve_value(self._lhs, state)
-        if lhs:
-            return resolve_value(self._rhs, state)
+    def _compile(self) -> Callable[["BaseState"], Union[LHS, RHS]]:
+        compiled_lhs = compile_value(self._lhs)
+        compiled_rhs = compile_value(self._rhs)
 
-        return lhs
+        def resolve(state: "BaseState") -> Union[LHS, RHS]:
+            lhs = compiled_lhs(state)
+            if lhs:
+                return compiled_rhs(state)
+
+            return lhs
+
+        return resolve
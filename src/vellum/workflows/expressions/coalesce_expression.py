@@ -1,8 +1,8 @@
-from typing import TypeVar, Union
+from typing import Callable, TypeVar, Union
 
 from vellum.workflows.constants import UNDEF
 from vellum.workflows.descriptors.base import BaseDescriptor
-from vellum.workflows.descriptors.utils import resolve_value
+from vellum.workflows.descriptors.utils import compile_value
 from vellum.workflows.state.base import BaseState
 from vellum.workflows.types.utils import resolve_combined_types
 
@@ -25,12 +25,18 @@ class CoalesceExpression(BaseDescriptor[Union[LHS, RHS]]):
         self._lhs = lhs
         self._rhs = rhs
 
-    def resolve(self, state: "BaseState") -> Union[LHS, RHS]:
-        lhs = resolve_value(self._lhs, state)
-        if lhs is not UNDEF and lhs is not None:
-            return lhs
+    def _compile(self) -> Callable[["BaseState"], Union[LHS, RHS]]:
+        compiled_lhs = compile_value(self._lhs)
+        compiled_rhs = compile_value(self._rhs)
 
-        return resolve_value(self._rhs, state)
+        def resolve(state: "BaseState") -> Union[LHS, RHS]:
+            lhs = compiled_lhs(state)
+            if lhs is not UNDEF and lhs is not None:
+                return lhs
+
+            return compiled_rhs(state)
+
+        return resolve
 
     @property
     def lhs(self) -> Union[BaseDescriptor[LHS], LHS]:
@@ -1,7 +1,7 @@
-from typing import Generic, TypeVar, Union
+from typing import Callable, Generic, TypeVar, Union
 
 from vellum.workflows.descriptors.base import BaseDescriptor
-from vellum.workflows.descriptors.utils import resolve_value
+from vellum.workflows.descriptors.utils import compile_value
 from vellum.workflows.state.base import BaseState
 
 LHS = TypeVar("LHS")
@@ -19,12 +19,18 @@ class ContainsExpression(BaseDescriptor[bool], Generic[LHS, RHS]):
         self._lhs = lhs
         self._rhs = rhs
 
-    def resolve(self, state: "BaseState") -> bool:
-        # Support any type that implements the in operator
-        # https://app.shortcut.com/vellum/story/4658
-        lhs = resolve_value(self._lhs, state)
-        if not isinstance(lhs, (list, tuple, set, dict, str)):
-            raise ValueError(f"Expected a LHS that supported contains, got: {lhs.__class__.__name__}")
+    def _compile(self) -> Callable[["BaseState"], bool]:
+        compiled_lhs = compile_value(self._lhs)
+        compiled_rhs = compile_value(self._rhs)
 
-        rhs = resolve_value(self._rhs, state)
-        return rhs in lhs
+        def resolve(state: "BaseState") -> bool:
+            # Support any type that implements the in operator
+            # https://app.shortcut.com/vellum/story/4658
+            lhs = compiled_lhs(state)
+            if not isinstance(lhs, (list, tuple, set, dict, str)):
+                raise ValueError(f"Expected a LHS that supported contains, got: {lhs.__class__.__name__}")
+
+            rhs = compiled_rhs(state)
+            return rhs in lhs
+
+        return resolve
@@ -1,7 +1,7 @@
-from typing import Generic, TypeVar, Union
+from typing import Callable, Generic, TypeVar, Union
 
 from vellum.workflows.descriptors.base import BaseDescriptor
-from vellum.workflows.descriptors.utils import resolve_value
+from vellum.workflows.descriptors.utils import compile_value
 from vellum.workflows.state.base import BaseState
 
 LHS = TypeVar("LHS")
@@ -19,13 +19,19 @@ class DoesNotEndWithExpression(BaseDescriptor[bool], Generic[LHS, RHS]):
         self._lhs = lhs
         self._rhs = rhs
 
-    def resolve(self, state: "BaseState") -> bool:
-        lhs = resolve_value(self._lhs, state)
-        rhs = resolve_value(self._rhs, state)
-        if not isinstance(lhs, str):
-            raise ValueError(f"Expected LHS to be a string, got {type(lhs)}")
+    def _compile(self) -> Callable[["BaseState"], bool]:
+        compiled_lhs = compile_value(self._lhs)
+        compiled_rhs = compile_value(self._rhs)
 
-        if not isinstance(rhs, str):
-            raise ValueError(f"Expected RHS to be a string, got {type(rhs)}")
+        def resolve(state: "BaseState") -> bool:
+            lhs = compiled_lhs(state)
+            rhs = compiled_rhs(state)
+            if not isinstance(lhs, str):
+                raise ValueError(f"Expected LHS to be a string, got {type(lhs)}")
 
-        return not lhs.endswith(rhs)
+            if not isinstance(rhs, str):
+                raise ValueError(f"Expected RHS to be a string, got {type(rhs)}")
+
+            return not lhs.endswith(rhs)
+
+        return resolve
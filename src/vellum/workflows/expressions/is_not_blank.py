@@ -1,7 +1,7 @@
-from typing import Generic, TypeVar, Union
+from typing import Callable, Generic, TypeVar, Union
 
 from vellum.workflows.descriptors.base import BaseDescriptor
-from vellum.workflows.descriptors.utils import resolve_value
+from vellum.workflows.descriptors.utils import compile_value
 from vellum.workflows.state.base import BaseState
 
 _T = TypeVar("_T")
@@ -16,9 +16,14 @@ class IsNotBlankExpression(BaseDescriptor[bool], Generic[_T]):
         super().__init__(name=f"{expression} is not blank", types=(bool,))
         self._expression = expression
 
-    def resolve(self, state: "BaseState") -> bool:
-        expression = resolve_value(self._expression, state)
-        if not isinstance(expression, str):
-            raise ValueError(f"Expected a string expression, got: {expression.__class__.__name__}")
+    def _compile(self) -> Callable[["BaseState"], bool]:
+        compiled_expression = compile_value(self._expression)
 
-        return len(expression) != 0
+        def resolve(state: "BaseState") -> bool:
+            expression = compiled_expression(state)
+            if not isinstance(expression, str):
+                raise ValueError(f"Expected a string expression, got: {expression.__class__.__name__}")
+
+            return len(expression) != 0
+
+        return resolve
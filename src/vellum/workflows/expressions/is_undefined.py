@@ -1,8 +1,8 @@
-from typing import Generic, TypeVar, Union
+from typing import Callable, Generic, TypeVar, Union
 
 from vellum.workflows.constants import UNDEF
 from vellum.workflows.descriptors.base import BaseDescriptor
-from vellum.workflows.descriptors.utils import resolve_value
+from vellum.workflows.descriptors.utils import compile_value
 from vellum.workflows.state.base import BaseState
 
 _T = TypeVar("_T")
@@ -17,6 +17,11 @@ class IsUndefinedExpression(BaseDescriptor[bool], Generic[_T]):
         super().__init__(name=f"{expression} is undefined", types=(bool,))
         self._expression = expression
 
-    def resolve(self, state: "BaseState") -> bool:
-        expression = resolve_value(self._expression, state)
-        return expression is UNDEF
+    def _compile(self) -> Callable[["BaseState"], bool]:
+        compiled_expression = compile_value(self._expression)
+
+        def resolve(state: "BaseState") -> bool:
+            expression = compiled_expression(state)
+            return expression is UNDEF
+
+        return resolve
@@ -1,7 +1,7 @@
-from typing import Generic, TypeVar, Union
+from typing import Callable, Generic, TypeVar, Union
 
 from vellum.workflows.descriptors.base import BaseDescriptor
-from vellum.workflows.descriptors.utils import resolve_value
+from vellum.workflows.descriptors.utils import compile_value
 from vellum.workflows.state.base import BaseState
 
 LHS = TypeVar("LHS")
@@ -19,15 +19,21 @@ class LessThanExpression(BaseDescriptor[bool], Generic[LHS, RHS]):
         self._lhs = lhs
         self._rhs = rhs
 
-    def resolve(self, state: "BaseState") -> bool:
-        # Support any type that implements the < operator
-        # https://app.shortcut.com/vellum/story/4658
-        lhs = resolve_value(self._lhs, state)
-        if not isinstance(lhs, (int, float)):
-            raise ValueError(f"Expected a numeric lhs value, got: {lhs.__class__.__name__}")
+    def _compile(self) -> Callable[["BaseState"], bool]:
+        compiled_lhs = compile_value(self._lhs)
+        compiled_rhs = compile_value(self._rhs)
 
-        rhs = resolve_value(self._rhs, state)
-        if not isinstance(rhs, (int, float)):
-            raise ValueError(f"Expected a numeric rhs value, got: {rhs.__class__.__name__}")
+        def resolve(state: "BaseState") -> bool:
+            # Support any type that implements the < operator
+            # https://app.shortcut.com/vellum/story/4658
+            lhs = compiled_lhs(state)
+            if not isinstance(lhs, (int, float)):
+                raise ValueError(f"Expected a numeric lhs value, got: {lhs.__class__.__name__}")
 
-        return lhs < rhs
+            rhs = compiled_rhs(state)
+            if not isinstance(rhs, (int, float)):
+                raise ValueError(f"Expected a numeric rhs value, got: {rhs.__class__.__name__}")
+
+            return lhs < rhs
+
+        return resolve
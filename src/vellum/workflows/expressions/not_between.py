@@ -1,7 +1,7 @@
-from typing import Generic, TypeVar, Union
+from typing import Callable, Generic, TypeVar, Union
 
 from vellum.workflows.descriptors.base import BaseDescriptor
-from vellum.workflows.descriptors.utils import resolve_value
+from vellum.workflows.descriptors.utils import compile_value
 from vellum.workflows.state.base import BaseState
 
 _V = TypeVar("_V")
@@ -22,17 +22,24 @@ class NotBetweenExpression(BaseDescriptor[bool], Generic[_V, _S, _E]):
         self._start = start
         self._end = end
 
-    def resolve(self, state: "BaseState") -> bool:
-        value = resolve_value(self._value, state)
-        if not isinstance(value, (int, float)):
-            raise ValueError(f"Expected a numeric value, got: {value.__class__.__name__}")
+    def _compile(self) -> Callable[["BaseState"], bool]:
+        compiled_value = compile_value(self._value)
+        compiled_start = compile_value(self._start)
+        compiled_end = compile_value(self._end)
 
-        start = resolve_value(self._start, state)
-        if not isinstance(start, (int, float)):
-            raise ValueError(f"Expected a numeric start value, got: {start.__class__.__name__}")
+        def resolve(state: "BaseState") -> bool:
+            value = compiled_value(state)
+            if not isinstance(value, (int, float)):
+                raise ValueError(f"Expected a numeric value, got: {value.__class__.__name__}")
 
-        end = resolve_value(self._end, state)
-        if not isinstance(end, (int, float)):
-            raise ValueError(f"Expected a numeric end value, got: {end.__class__.__name__}")
+            start = compiled_start(state)
+            if not isinstance(start, (int, float)):
+                raise ValueError(f"Expected a numeric start value, got: {start.__class__.__name__}")
 
-        return value < start or value > end
+            end = compiled_end(state)
+            if not isinstance(end, (int, float)):
+                raise ValueError(f"Expected a numeric end value, got: {end.__class__.__name__}")
+
+            return value < start or value > end
+
+        return resolve
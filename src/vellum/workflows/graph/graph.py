@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Iterator, List, Set, Type, Union
+from typing import TYPE_CHECKING, Iterable, Iterator, Set, Type, Union
 
 from orderly_set import OrderedSet
 
@@ -26,11 +26,12 @@ GraphTarget = Union[
 
 class Graph:
     _entrypoints: Set["Port"]
-    _edges: List[Edge]
+    _edges: OrderedSet[Edge]
     _terminals: Set["Port"]
 
-    def __init__(self, entrypoints: Set["Port"], edges: List[Edge], terminals: Set["Port"]):
-        self._edges = edges
+    def __init__(self, entrypoints: Set["Port"], edges: Iterable[Edge], terminals: Set["Port"]):
+        # Edges are kept in an ordered set so that extending a graph stays linear in the number of edges
+        self._edges = OrderedSet(edges)
         self._entrypoints = entrypoints
         self._terminals = terminals
 
@@ -63,7 +64,7 @@ class Graph:
                 entrypoints.update({target})
                 terminals.update({target})
 
-        return Graph(entrypoints=entrypoints, edges=list(edges), terminals=terminals)
+        return Graph(entrypoints=entrypoints, edges=edges, terminals=terminals)
 
     @staticmethod
     def from_edge(edge: Edge) -> "Graph":
@@ -144,7 +145,6 @@ class Graph:
                 nodes.add(edge.to_node)
                 yield edge.to_node
 
-    def _extend_edges(self, edges: Iterator[Edge]) -> None:
+    def _extend_edges(self, edges: Iterable[Edge]) -> None:
         for edge in edges:
-            if edge not in self._edges:
-                self._edges.append(edge)
+            self._edges.add(edge)
@@ -1,7 +1,10 @@
+from typing import List, Type
+
 from vellum.workflows.edges.edge import Edge
 from vellum.workflows.graph.graph import Graph
 from vellum.workflows.nodes.bases.base import BaseNode
 from vellum.workflows.ports.port import Port
+from vellum.workflows.workflows.base import BaseWorkflow
 
 
 def test_graph__from_node():
@@ -460,3 +463,57 @@ def test_graph__node_to_port():
 
     # AND two edges
     assert len(list(graph.edges)) == 2
+
+
+def _generate_nodes(count: int) -> List[Type[BaseNode]]:
+    def generate_node(index: int) -> Type[BaseNode]:
+        class Outputs(BaseNode.Outputs):
+            value = index
+
+        return type(f"GeneratedNode{index}", (BaseNode,), {"Outputs": Outputs, "__module__": __name__})
+
+    return [generate_node(index) for index in range(count)]
+
+
+def test_graph__workflow_views_track_graph_changes():
+    # GIVEN a workflow whose graph is a chain of two nodes
+    first_node, second_node, third_node = _generate_nodes(3)
+    chain = first_node >> second_node
+
+    class MyWorkflow(BaseWorkflow):
+        graph = chain
+
+    assert list(MyWorkflow.get_nodes()) == [first_node, second_node]
+
+    # WHEN the graph is extended after the workflow's views have been computed
+    chain >> third_node
+
+    # THEN the workflow's views should include the new node and edge
+    assert list(MyWorkflow.get_nodes()) == [first_node, second_node, third_node]
+    assert len(list(MyWorkflow.get_edges())) == 2
+    assert list(MyWorkflow.get_entrypoints()) == [first_node]
+
+
+def test_graph__large_generated_graph():
+    # GIVEN a thousand generated nodes
+    nodes = _generate_nodes(1000)
+
+    # WHEN we build a graph that chains half of them and then fans out to the other half
+    large_graph = nodes[0] >> nodes[1]
+    for node in nodes[2:500]:
+        large_graph = large_graph >> node
+    large_graph = large_graph >> set(nodes[500:])
+
+    class LargeWorkflow(BaseWorkflow):
+        graph = large_graph
+
+    # AND run a workflow with it
+    terminal_event = LargeWorkflow().run()
+
+    # THEN every node and edge should be part of the workflow
+    assert list(LargeWorkflow.get_nodes())[:500] == nodes[:500]
+    assert set(LargeWorkflow.get_nodes()) == set(nodes)
+    assert len(list(LargeWorkflow.get_edges())) == 999
+
+    # AND the workflow should have been fulfilled
+    assert terminal_event.name == "workflow.execution.fulfilled", terminal_event
@@ -6,11 +6,11 @@ from pydantic_core import core_schema
 
 from vellum.workflows.references import ExternalInputReference, WorkflowInputReference
 from vellum.workflows.references.input import InputReference
-from vellum.workflows.types.utils import get_class_attr_names, infer_types
+from vellum.workflows.types.utils import TypeCacheMeta, get_class_attr_names, infer_types
 
 
 @dataclass_transform(kw_only_default=True)
-class _BaseInputsMeta(type):
+class _BaseInputsMeta(TypeCacheMeta):
     def __getattribute__(cls, name: str) -> Any:
         if not name.startswith("_") and name in cls.__annotations__ and issubclass(cls, BaseInputs):
             instance = vars(cls).get(name)
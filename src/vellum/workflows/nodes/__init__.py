@@ -1,4 +1,4 @@
-from vellum.workflows.nodes.bases import BaseNode
+from vellum.workflows.nodes.bases import BaseAsyncNode, BaseNode
 from vellum.workflows.nodes.core import ErrorNode, InlineSubworkflowNode, MapNode, RetryNode, TemplatingNode, TryNode
 from vellum.workflows.nodes.displayable import (
     APINode,
@@ -20,6 +20,7 @@ from vellum.workflows.nodes.displayable.bases import (
 
 __all__ = [
     # Base
+    "BaseAsyncNode",
     "BaseNode",
     # Core
     "ErrorNode",
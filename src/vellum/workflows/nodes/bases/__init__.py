@@ -1,7 +1,9 @@
 from .base import BaseNode
+from .base_async_node import BaseAsyncNode
 from .base_subworkflow_node import BaseSubworkflowNode
 
 __all__ = [
+    "BaseAsyncNode",
     "BaseNode",
     "BaseSubworkflowNode",
 ]
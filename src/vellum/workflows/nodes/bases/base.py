@@ -2,11 +2,27 @@ from functools import cached_property, reduce
 import inspect
 from types import MappingProxyType
 from uuid import UUID
-from typing import Any, Dict, Generic, Iterator, Optional, Set, Tuple, Type, TypeVar, Union, cast, get_args
-
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+    get_args,
+)
+
+from vellum.workflows.caches.base import BaseCache
 from vellum.workflows.constants import UNDEF
 from vellum.workflows.descriptors.base import BaseDescriptor
-from vellum.workflows.descriptors.utils import is_unresolved, resolve_value
+from vellum.workflows.descriptors.utils import compile_value, is_unresolved, resolve_value
 from vellum.workflows.errors.types import WorkflowErrorCode
 from vellum.workflows.exceptions import NodeException
 from vellum.workflows.graph import Graph
@@ -20,9 +36,9 @@ from vellum.workflows.references.execution_count import ExecutionCountReference
 from vellum.workflows.references.node import NodeReference
 from vellum.workflows.state.base import BaseState
 from vellum.workflows.state.context import WorkflowContext
-from vellum.workflows.types.core import MergeBehavior
+from vellum.workflows.types.core import ExecutionMode, MergeBehavior
 from vellum.workflows.types.generics import StateType
-from vellum.workflows.types.utils import get_class_attr_names, get_original_base, infer_types
+from vellum.workflows.types.utils import TypeCacheMeta, get_class_attr_names, get_original_base, infer_types
 from vellum.workflows.utils.uuids import uuid4_from_hash
 
 
@@ -37,7 +53,7 @@ def is_nested_class(nested: Any, parent: Type) -> bool:
     ) or any(is_nested_class(nested, base) for base in parent.__bases__)
 
 
-class BaseNodeMeta(type):
+class BaseNodeMeta(TypeCacheMeta):
     def __new__(mcs, name: str, bases: Tuple[Type, ...], dct: Dict[str, Any]) -> Any:
         # TODO: Inherit the inner Output classes from every base class.
         #   https://app.shortcut.com/vellum/story/4007/support-auto-inheriting-parent-node-outputs
@@ -82,7 +98,8 @@ class BaseNodeMeta(type):
             for base in reversed(bases):
                 if issubclass(base, BaseNode):
                     trigger_dct = {
-                        **base.Trigger.__dict__,
+                        # Compiled attributes are specific to the node class they were compiled for
+                        **{key: value for key, value in base.Trigger.__dict__.items() if key != "_compiled_attributes"},
                         "__module__": dct["__module__"],
                     }
                     dct["Trigger"] = type(f"{name}.Trigger", (base.Trigger,), trigger_dct)
@@ -103,6 +120,16 @@ class BaseNodeMeta(type):
         node_class.__id__ = uuid4_from_hash(node_class.__qualname__)
         return node_class
 
+    def __setattr__(cls, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if not name.startswith("_"):
+            _invalidate_compiled_trigger_attributes(cls)
+
+    def __delattr__(cls, name: str) -> None:
+        super().__delattr__(name)
+        if not name.startswith("_"):
+            _invalidate_compiled_trigger_attributes(cls)
+
     @property
     def _localns(cls) -> Dict[str, Any]:
         from vellum.workflows.workflows.base import BaseWorkflow
@@ -172,6 +199,21 @@ class BaseNodeMeta(type):
                 yielded_attr_names.add(attr_name)
 
 
+def _invalidate_compiled_trigger_attributes(node_class: Type) -> None:
+    """
+    Clears the attributes compiled by the Triggers of the given node class and all of its subclasses, since they
+    compiled whatever the node's attributes were at the time.
+    """
+
+    to_visit = [node_class]
+    while to_visit:
+        current = to_visit.pop()
+        trigger = current.__dict__.get("Trigger")
+        if trigger is not None and "_compiled_attributes" in trigger.__dict__:
+            type.__delattr__(trigger, "_compiled_attributes")
+        to_visit.extend(type.__subclasses__(current))
+
+
 class _BaseNodeTriggerMeta(type):
     def __eq__(self, other: Any) -> bool:
         """
@@ -236,6 +278,7 @@ class BaseNode(Generic[StateType], metaclass=BaseNodeMeta):
     class Trigger(metaclass=_BaseNodeTriggerMeta):
         node_class: Type["BaseNode"]
         merge_behavior = MergeBehavior.AWAIT_ANY
+        _compiled_attributes: List[Callable[[BaseState], Any]]
 
         @classmethod
         def should_initiate(
@@ -254,11 +297,8 @@ class BaseNode(Generic[StateType], metaclass=BaseNodeMeta):
                     return False
 
                 is_ready = True
-                for descriptor in cls.node_class:
-                    if not descriptor.instance:
-                        continue
-
-                    resolved_value = resolve_value(descriptor.instance, state, path=descriptor.name)
+                for resolve_attribute in cls._get_compiled_attributes():
+                    resolved_value = resolve_attribute(state)
                     if is_unresolved(resolved_value):
                         is_ready = False
                         break
@@ -290,9 +330,41 @@ class BaseNode(Generic[StateType], metaclass=BaseNodeMeta):
                 code=WorkflowErrorCode.INVALID_INPUTS,
             )
 
+        @classmethod
+        def _get_compiled_attributes(cls) -> List[Callable[[BaseState], Any]]:
+            # Compiled once per node class, since triggers are checked every time one of the node's dependencies
+            # is fulfilled. Setting or deleting one of the node's attributes clears them
+            compiled_attributes = cls.__dict__.get("_compiled_attributes")
+            if compiled_attributes is None:
+                compiled_attributes = [
+                    compile_value(descriptor.instance, path=descriptor.name)
+                    for descriptor in cls.node_class
+                    if descriptor.instance
+                ]
+                cls._compiled_attributes = compiled_attributes
+
+            return compiled_attributes
+
     class Execution(metaclass=_BaseNodeExecutionMeta):
+        """
+        mode: ExecutionMode = ExecutionMode.THREAD - Where the node's `run` method is executed. Nodes that are CPU
+            bound can opt into `ExecutionMode.PROCESS`, which runs them in a separate process that receives the
+            node's resolved attributes and a read-only copy of the state's values. The node and its outputs must be
+            picklable, and changes it makes to the state are not merged back.
+        cache: Optional[BaseCache] = None - Where to cache the node's outputs, keyed by the node's class, its
+            `cache_version` and its resolved attributes. Only nodes whose outputs depend on nothing but their
+            attributes should opt into this, since a cached node isn't run at all, which also means it doesn't update
+            the state.
+        cache_version: Optional[str] = None - Part of the cache key, since the key can't tell when the node's code
+            changed. Bump it whenever a change to the node would change its outputs, so that results cached by the
+            previous code, like those kept by a DiskCache across deploys, are no longer used.
+        """
+
         node_class: Type["BaseNode"]
         count: int
+        mode: ExecutionMode = ExecutionMode.THREAD
+        cache: Optional[BaseCache] = None
+        cache_version: Optional[str] = None
 
     def __init__(
         self,
@@ -0,0 +1,5 @@
+from .node import BaseAsyncNode
+
+__all__ = [
+    "BaseAsyncNode",
+]
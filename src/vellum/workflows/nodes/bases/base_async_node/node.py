@@ -0,0 +1,29 @@
+from typing import AsyncIterator, Awaitable, Generic, Iterator, Union
+
+from vellum.workflows.nodes.bases import BaseNode
+from vellum.workflows.outputs.base import BaseOutput, BaseOutputs
+from vellum.workflows.types.generics import StateType
+from vellum.workflows.utils.async_utils import iterate_async_generator_sync, run_coroutine_sync
+
+
+class BaseAsyncNode(BaseNode[StateType], Generic[StateType]):
+    """
+    The base class for nodes that run on an asyncio event loop. Subclasses implement `arun`, either as an `async def`
+    returning the node's Outputs, or as an async generator streaming them.
+
+    The AsyncWorkflowRunner runs `arun` as a task on its event loop. Everywhere else, `run` runs it to completion on a
+    private event loop.
+    """
+
+    def run(self) -> Union[BaseOutputs, Iterator[BaseOutput]]:
+        node_run_response = self.arun()
+        if isinstance(node_run_response, AsyncIterator):
+            return iterate_async_generator_sync(node_run_response)
+
+        return run_coroutine_sync(node_run_response)
+
+    def arun(self) -> Union[Awaitable[BaseOutputs], AsyncIterator[BaseOutput]]:
+        return self._arun_outputs()
+
+    async def _arun_outputs(self) -> BaseOutputs:
+        return self.Outputs()
@@ -1,10 +1,11 @@
-from uuid import UUID
+from uuid import UUID, uuid4
 from typing import Optional
 
 from vellum.core.pydantic_utilities import UniversalBaseModel
 from vellum.workflows.inputs.base import BaseInputs
 from vellum.workflows.nodes.bases.base import BaseNode
 from vellum.workflows.state.base import BaseState, StateMeta
+from vellum.workflows.types.core import MergeBehavior
 
 
 def test_base_node__node_resolution__unset_pydantic_fields():
@@ -135,3 +136,64 @@ def test_base_node__default_id():
 
     # THEN it should equal the hash of `test_base_node__default_id.<locals>.MyNode`
     assert my_id == UUID("8e71bea7-ce68-492f-9abe-477c788e6273")
+
+
+def test_base_node__trigger__await_attributes_compiled_per_node_class():
+    # GIVEN a node that waits on its attributes, whose trigger has already been checked
+    class State(BaseState):
+        pass
+
+    class UpstreamNode(BaseNode):
+        class Outputs(BaseNode.Outputs):
+            value: int
+
+    class ParentNode(BaseNode):
+        class Trigger(BaseNode.Trigger):
+            merge_behavior = MergeBehavior.AWAIT_ATTRIBUTES
+
+    state = State()
+    assert ParentNode.Trigger.should_initiate(state, set(), uuid4())
+
+    # AND a subclass of it with an attribute that isn't resolved yet
+    class ChildNode(ParentNode):
+        value = UpstreamNode.Outputs.value
+
+    # WHEN we check whether the subclass should be initiated
+    should_initiate = ChildNode.Trigger.should_initiate(state, set(), uuid4())
+
+    # THEN it should wait on its own attributes rather than the ones compiled for its parent
+    assert should_initiate is False
+
+    # AND it should be initiated once its attributes are resolved
+    state.meta.node_outputs[UpstreamNode.Outputs.value] = 1
+    assert ChildNode.Trigger.should_initiate(state, set(), uuid4())
+
+
+def test_base_node__trigger__await_attributes_recompiled_when_an_attribute_is_set():
+    # GIVEN a node that waits on its attributes, whose trigger has already been checked
+    class UpstreamNode(BaseNode):
+        class Outputs(BaseNode.Outputs):
+            value: int
+
+    class MyNode(BaseNode):
+        class Trigger(BaseNode.Trigger):
+            merge_behavior = MergeBehavior.AWAIT_ATTRIBUTES
+
+    class MyChildNode(MyNode):
+        pass
+
+    state = BaseState()
+    assert MyNode.Trigger.should_initiate(state, set(), uuid4())
+    assert MyChildNode.Trigger.should_initiate(state, set(), uuid4())
+
+    # WHEN an attribute that isn't resolved yet is set on the node after the fact
+    MyNode.value = UpstreamNode.Outputs.value  # type: ignore[attr-defined]
+
+    # THEN both the node and its subclass should wait on it
+    assert MyNode.Trigger.should_initiate(state, set(), uuid4()) is False
+    assert MyChildNode.Trigger.should_initiate(state, set(), uuid4()) is False
+
+    # AND they should be initiated once it's resolved
+    state.meta.node_outputs[UpstreamNode.Outputs.value] = 1
+    assert MyNode.Trigger.should_initiate(state, set(), uuid4())
+    assert MyChildNode.Trigger.should_initiate(state, set(), uuid4())
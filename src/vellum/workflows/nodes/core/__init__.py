@@ -1,4 +1,4 @@
-from vellum.workflows.nodes.displayable.bases.api_node import BaseAPINode
+from vellum.workflows.nodes.displayable.bases.api_node import BaseAPINode, BaseStreamingAPINode
 
 from .error_node import ErrorNode
 from .inline_subworkflow_node import InlineSubworkflowNode
@@ -9,6 +9,7 @@ from .try_node import TryNode
 
 __all__ = [
     "BaseAPINode",
+    "BaseStreamingAPINode",
     "ErrorNode",
     "InlineSubworkflowNode",
     "MapNode",
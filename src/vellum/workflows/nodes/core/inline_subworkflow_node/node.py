@@ -31,6 +31,9 @@ class InlineSubworkflowNode(BaseSubworkflowNode[StateType], Generic[StateType, W
                 parent_state=self.state,
                 context=WorkflowContext(
                     _vellum_client=self._context._vellum_client,
+                    _async_vellum_client=self._context._async_vellum_client,
+                    prompt_response_cache=self._context.prompt_response_cache,
+                    executor=self._context.executor,
                 ),
             )
             subworkflow_stream = subworkflow.stream(
@@ -1,16 +1,35 @@
 from collections import defaultdict
-from queue import Empty, Queue
-from threading import Thread
-from typing import TYPE_CHECKING, Callable, Dict, Generic, List, Optional, Tuple, Type, TypeVar, Union, overload
+from concurrent.futures import Future, wait
+import logging
+from queue import Queue
+from threading import Event as ThreadingEvent
+from uuid import uuid4
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Generic,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    overload,
+)
 
 from vellum.workflows.context import execution_context, get_parent_context
 from vellum.workflows.descriptors.base import BaseDescriptor
-from vellum.workflows.errors.types import WorkflowErrorCode
+from vellum.workflows.errors.types import WorkflowError, WorkflowErrorCode
 from vellum.workflows.events.types import ParentContext
+from vellum.workflows.events.workflow import WorkflowExecutionRejectedBody, WorkflowExecutionRejectedEvent
 from vellum.workflows.exceptions import NodeException
 from vellum.workflows.inputs.base import BaseInputs
 from vellum.workflows.nodes.bases import BaseNode
-from vellum.workflows.outputs import BaseOutputs
+from vellum.workflows.outputs import BaseOutput, BaseOutputs
+from vellum.workflows.runner.executor import blocking, get_default_executor
 from vellum.workflows.state.base import BaseState
 from vellum.workflows.state.context import WorkflowContext
 from vellum.workflows.types.generics import NodeType, StateType
@@ -20,12 +39,15 @@ if TYPE_CHECKING:
     from vellum.workflows import BaseWorkflow
     from vellum.workflows.events.workflow import WorkflowEvent
 
+logger = logging.getLogger(__name__)
+
 MapNodeItemType = TypeVar("MapNodeItemType")
 
 
 class MapNode(BaseNode, Generic[StateType, MapNodeItemType]):
     """
-    Used to map over a list of items and execute a Subworkflow on each iteration.
+    Used to map over a list of items and execute a Subworkflow on each iteration. As each iteration completes, its
+    outputs are streamed as `(index, value)` deltas, followed by the final, ordered list of every output.
 
     items: List[MapNodeItemType] - The items to map over
     subworkflow: Type["BaseWorkflow[SubworkflowInputs, BaseState]"] - The Subworkflow to execute on each iteration
@@ -48,34 +70,58 @@ class MapNode(BaseNode, Generic[StateType, MapNodeItemType]):
         index: int
         all_items: List[MapNodeItemType]  # type: ignore[valid-type]
 
-    def run(self) -> Outputs:
+    def run(self) -> Iterator[BaseOutput]:
         mapped_items: Dict[str, List] = defaultdict(list)
         for output_descripter in self.subworkflow.Outputs:
             mapped_items[output_descripter.name] = [None] * len(self.items)
 
+        if self.concurrency is not None and self.concurrency < 1:
+            raise NodeException(
+                code=WorkflowErrorCode.INVALID_INPUTS,
+                message=f"Expected concurrency to be a positive integer, got {self.concurrency}",
+            )
+
         self._event_queue: Queue[Tuple[int, WorkflowEvent]] = Queue()
-        fulfilled_iterations: List[bool] = []
-        for index, item in enumerate(self.items):
-            fulfilled_iterations.append(False)
-            parent_context = get_parent_context() or self._context.parent_context
-            thread = Thread(
-                target=self._context_run_subworkflow,
-                kwargs={
-                    "item": item,
-                    "index": index,
-                    "parent_context": parent_context,
-                },
+        self._terminated_iterations: Set[int] = set()
+        executor = self._context.executor or get_default_executor()
+        parent_context = get_parent_context() or self._context.parent_context
+
+        # Items are scheduled lazily, so that we only ever have `concurrency` subworkflows in flight at once
+        pending_items = iter(enumerate(self.items))
+        iterations: List[Future[None]] = []
+        cancel_signal = ThreadingEvent()
+
+        def schedule_next_item() -> None:
+            next_item = next(pending_items, None)
+            if next_item is None:
+                return
+
+            index, item = next_item
+            iterations.append(
+                executor.submit(
+                    self._context_run_subworkflow,
+                    item=item,
+                    index=index,
+                    parent_context=parent_context,
+                    cancel_signal=cancel_signal,
+                )
             )
-            thread.start()
 
+        for _ in range(self.concurrency or len(self.items)):
+            schedule_next_item()
+
+        # We should consolidate this logic with the logic workflow runner uses
+        # https://app.shortcut.com/vellum/story/4736
+        fulfilled_iterations = 0
         try:
-            # We should consolidate this logic with the logic workflow runner uses
-            # https://app.shortcut.com/vellum/story/4736
-            while map_node_event := self._event_queue.get():
-                index = map_node_event[0]
-                terminal_event = map_node_event[1]
+            while fulfilled_iterations < len(self.items):
+                with blocking():
+                    index, terminal_event = self._event_queue.get()
                 self._context._emit_subworkflow_event(terminal_event)
 
+                if not self._is_iteration_terminal_event(terminal_event):
+                    continue
+
                 if terminal_event.name == "workflow.execution.fulfilled":
                     workflow_output_vars = vars(terminal_event.outputs)
 
@@ -83,9 +129,11 @@ class MapNode(BaseNode, Generic[StateType, MapNodeItemType]):
                         output_mapped_items = mapped_items[output_name]
                         output_mapped_items[index] = workflow_output_vars[output_name]
 
-                    fulfilled_iterations[index] = True
-                    if all(fulfilled_iterations):
-                        break
+                    fulfilled_iterations += 1
+                    schedule_next_item()
+
+                    for output_name, output_value in workflow_output_vars.items():
+                        yield BaseOutput(name=output_name, delta=(index, output_value))
                 elif terminal_event.name == "workflow.execution.paused":
                     raise NodeException(
                         code=WorkflowErrorCode.INVALID_OUTPUTS,
@@ -96,45 +144,121 @@ class MapNode(BaseNode, Generic[StateType, MapNodeItemType]):
                         f"Subworkflow failed on iteration {index} with error: {terminal_event.error.message}",
                         code=terminal_event.error.code,
                     )
-        except Empty:
-            pass
-        return self.Outputs(**mapped_items)
+        finally:
+            self._stop_iterations(iterations, cancel_signal)
+
+        for output_name, output_mapped_items in mapped_items.items():
+            yield BaseOutput(name=output_name, value=output_mapped_items)
+
+    def _stop_iterations(self, iterations: List["Future[None]"], cancel_signal: ThreadingEvent) -> None:
+        """
+        Cancels any iterations still in flight, and waits for each of them to stop before the node completes.
+        """
+
+        if not all(iteration.done() for iteration in iterations):
+            cancel_signal.set()
+            for iteration in iterations:
+                iteration.cancel()
+
+        with blocking():
+            wait(iterations)
+
+        # Also releases the threads each Subworkflow waits for a cancellation on
+        cancel_signal.set()
+
+    def _is_iteration_terminal_event(self, event: "WorkflowEvent") -> bool:
+        if (
+            event.name == "workflow.execution.fulfilled"
+            or event.name == "workflow.execution.rejected"
+            or event.name == "workflow.execution.paused"
+        ):
+            return event.workflow_definition == self.subworkflow
+        return False
 
     def _context_run_subworkflow(
-        self, *, item: MapNodeItemType, index: int, parent_context: Optional[ParentContext] = None
+        self,
+        *,
+        item: MapNodeItemType,
+        index: int,
+        parent_context: Optional[ParentContext] = None,
+        cancel_signal: Optional[ThreadingEvent] = None,
     ) -> None:
+        if cancel_signal and cancel_signal.is_set():
+            return
+
         parent_context = parent_context or self._context.parent_context
-        with execution_context(parent_context=parent_context):
-            self._run_subworkflow(item=item, index=index)
+        error = WorkflowError(
+            code=WorkflowErrorCode.INTERNAL_ERROR, message="Subworkflow ended without a terminal event"
+        )
+        try:
+            with execution_context(parent_context=parent_context):
+                self._run_subworkflow(item=item, index=index, cancel_signal=cancel_signal)
+        except NodeException as e:
+            error = e.error
+        except Exception as e:
+            logger.exception(
+                f"An unexpected error occurred while running iteration {index} of {self.__class__.__name__}"
+            )
+            error = WorkflowError(code=WorkflowErrorCode.INTERNAL_ERROR, message=str(e))
+        finally:
+            # The node waits on a terminal event for every iteration, so we always queue one, even if the Subworkflow
+            # failed before it could emit its own
+            if index not in self._terminated_iterations:
+                self._event_queue.put((index, self._reject_iteration_event(error, parent_context)))
 
-    def _run_subworkflow(self, *, item: MapNodeItemType, index: int) -> None:
-        context = WorkflowContext(_vellum_client=self._context._vellum_client)
+    def _reject_iteration_event(
+        self, error: WorkflowError, parent_context: Optional[ParentContext]
+    ) -> WorkflowExecutionRejectedEvent:
+        return WorkflowExecutionRejectedEvent(
+            trace_id=self.state.meta.trace_id,
+            span_id=uuid4(),
+            body=WorkflowExecutionRejectedBody(workflow_definition=self.subworkflow, error=error),
+            parent=parent_context,
+        )
+
+    def _run_subworkflow(
+        self, *, item: MapNodeItemType, index: int, cancel_signal: Optional[ThreadingEvent] = None
+    ) -> None:
+        context = WorkflowContext(
+            _vellum_client=self._context._vellum_client,
+            _async_vellum_client=self._context._async_vellum_client,
+            prompt_response_cache=self._context.prompt_response_cache,
+            executor=self._context.executor,
+        )
         subworkflow = self.subworkflow(parent_state=self.state, context=context)
         events = subworkflow.stream(
             inputs=self.SubworkflowInputs(index=index, item=item, all_items=self.items),
             event_filter=all_workflow_event_filter,
+            cancel_signal=cancel_signal,
         )
 
         for event in events:
+            if self._is_iteration_terminal_event(event):
+                self._terminated_iterations.add(index)
             self._event_queue.put((index, event))
 
     @overload
     @classmethod
-    def wrap(cls, items: List[MapNodeItemType]) -> Callable[..., Type["MapNode[StateType, MapNodeItemType]"]]: ...
+    def wrap(
+        cls, items: List[MapNodeItemType], concurrency: Optional[int] = None
+    ) -> Callable[..., Type["MapNode[StateType, MapNodeItemType]"]]: ...
 
     # TODO: We should be able to do this overload automatically as we do with node attributes
     # https://app.shortcut.com/vellum/story/5289
     @overload
     @classmethod
     def wrap(
-        cls, items: BaseDescriptor[List[MapNodeItemType]]
+        cls, items: BaseDescriptor[List[MapNodeItemType]], concurrency: Optional[int] = None
     ) -> Callable[..., Type["MapNode[StateType, MapNodeItemType]"]]: ...
 
     @classmethod
     def wrap(
-        cls, items: Union[List[MapNodeItemType], BaseDescriptor[List[MapNodeItemType]]]
+        cls,
+        items: Union[List[MapNodeItemType], BaseDescriptor[List[MapNodeItemType]]],
+        concurrency: Optional[int] = None,
     ) -> Callable[..., Type["MapNode[StateType, MapNodeItemType]"]]:
         _items = items
+        _concurrency = concurrency
 
         def decorator(inner_cls: Type[NodeType]) -> Type["MapNode[StateType, MapNodeItemType]"]:
             # Investigate how to use dependency injection to avoid circular imports
@@ -161,6 +285,7 @@ class MapNode(BaseNode, Generic[StateType, MapNodeItemType]):
             class WrappedNode(MapNode[StateType, MapNodeItemType]):
                 items = _items
                 subworkflow = Subworkflow
+                concurrency = _concurrency
 
                 class Outputs(WrappedNodeOutputs):
                     pass
@@ -1,10 +1,16 @@
+import pytest
+from threading import Event as ThreadingEvent, Lock, Thread
 import time
+from typing import List, Optional, Tuple, cast
 
+from vellum.workflows.errors.types import WorkflowErrorCode
+from vellum.workflows.exceptions import NodeException
 from vellum.workflows.inputs.base import BaseInputs
 from vellum.workflows.nodes.bases import BaseNode
 from vellum.workflows.nodes.core.map_node.node import MapNode
-from vellum.workflows.outputs.base import BaseOutputs
+from vellum.workflows.outputs.base import BaseOutput, BaseOutputs
 from vellum.workflows.state.base import BaseState, StateMeta
+from vellum.workflows.workflows.base import BaseWorkflow
 
 
 def test_map_node__use_parent_inputs_and_state():
@@ -35,10 +41,10 @@ def test_map_node__use_parent_inputs_and_state():
             meta=StateMeta(workflow_inputs=Inputs(foo="foo")),
         )
     )
-    outputs = node.run()
+    outputs = list(node.run())
 
     # THEN the data is used successfully
-    assert outputs.value == ["foo bar 1", "foo bar 2", "foo bar 3"]
+    assert outputs[-1] == BaseOutput(name="value", value=["foo bar 1", "foo bar 2", "foo bar 3"])
 
 
 def test_map_node__use_parallelism():
@@ -57,9 +63,265 @@ def test_map_node__use_parallelism():
     # WHEN the node is run
     node = TestNode(state=BaseState())
     start_ts = time.time_ns()
-    node.run()
+    list(node.run())
     end_ts = time.time_ns()
 
     # THEN the node should have ran in parallel
     run_time = (end_ts - start_ts) / 10**9
     assert run_time < 0.1
+
+
+def test_map_node__respects_concurrency():
+    # GIVEN a map node that tracks how many iterations are running at once
+    lock = Lock()
+    in_flight = 0
+    max_in_flight = 0
+
+    # AND the node is configured to only run a few iterations at a time
+    @MapNode.wrap(items=list(range(12)), concurrency=3)
+    class TestNode(BaseNode):
+        item = MapNode.SubworkflowInputs.item
+
+        class Outputs(BaseOutputs):
+            value: int
+
+        def run(self) -> Outputs:
+            nonlocal in_flight, max_in_flight
+            with lock:
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+
+            time.sleep(0.01)
+
+            with lock:
+                in_flight -= 1
+
+            return self.Outputs(value=self.item + 1)
+
+    # WHEN the node is run
+    node = TestNode(state=BaseState())
+    outputs = list(node.run())
+
+    # THEN the outputs are in the original order
+    assert outputs[-1] == BaseOutput(name="value", value=list(range(1, 13)))
+
+    # AND we never ran more iterations at once than allowed
+    assert max_in_flight <= 3
+
+
+def test_map_node__stops_scheduling_after_failure():
+    # GIVEN a map node that only runs one iteration at a time
+    started_items: List[int] = []
+
+    # AND whose first iteration fails
+    @MapNode.wrap(items=list(range(10)), concurrency=1)
+    class TestNode(BaseNode):
+        item = MapNode.SubworkflowInputs.item
+
+        class Outputs(BaseOutputs):
+            value: int
+
+        def run(self) -> Outputs:
+            started_items.append(self.item)
+            if self.item == 0:
+                raise NodeException(message="Iteration failed", code=WorkflowErrorCode.USER_DEFINED_ERROR)
+
+            time.sleep(0.01)
+            return self.Outputs(value=self.item)
+
+    # WHEN the node is run
+    node = TestNode(state=BaseState())
+    with pytest.raises(NodeException) as exc_info:
+        list(node.run())
+
+    # THEN the failure is surfaced
+    assert exc_info.value.code == WorkflowErrorCode.USER_DEFINED_ERROR
+
+    # AND no other iterations were scheduled
+    assert started_items == [0]
+
+
+def test_map_node__cancels_in_flight_iterations_after_failure():
+    # GIVEN a map node that runs two iterations at a time
+    release = ThreadingEvent()
+
+    # AND whose first iteration fails while the second is still running
+    @MapNode.wrap(items=[0, 1], concurrency=2)
+    class TestNode(BaseNode):
+        item = MapNode.SubworkflowInputs.item
+
+        class Outputs(BaseOutputs):
+            value: int
+
+        def run(self) -> Outputs:
+            if self.item == 0:
+                raise NodeException(message="Iteration failed", code=WorkflowErrorCode.USER_DEFINED_ERROR)
+
+            release.wait(timeout=5)
+            return self.Outputs(value=self.item)
+
+    # WHEN the node is run
+    node = TestNode(state=BaseState())
+    try:
+        with pytest.raises(NodeException):
+            list(node.run())
+
+        # THEN the in-flight iteration was cancelled, and had stopped by the time the failure was raised
+        event_queue = cast(MapNode, node)._event_queue
+        remaining_events = []
+        while not event_queue.empty():
+            remaining_events.append(event_queue.get_nowait())
+
+        cancelled_iterations = [
+            index
+            for index, event in remaining_events
+            if event.name == "workflow.execution.rejected" and event.error.code == WorkflowErrorCode.WORKFLOW_CANCELLED
+        ]
+        assert cancelled_iterations == [1]
+    finally:
+        release.set()
+
+
+def test_map_node__rejects_iterations_that_fail_outside_of_their_subworkflow():
+    # GIVEN a map node over a few items
+    @MapNode.wrap(items=[0, 1, 2])
+    class TestNode(BaseNode):
+        item = MapNode.SubworkflowInputs.item
+
+        class Outputs(BaseOutputs):
+            value: int
+
+        def run(self) -> Outputs:
+            return self.Outputs(value=self.item)
+
+    # AND one of its iterations fails before its Subworkflow could emit a terminal event
+    run_subworkflow = TestNode._run_subworkflow
+
+    def _run_subworkflow(self: MapNode, *, item: int, index: int, cancel_signal: Optional[ThreadingEvent] = None):
+        if index == 1:
+            raise ValueError("Could not start the Subworkflow")
+        run_subworkflow(self, item=item, index=index, cancel_signal=cancel_signal)
+
+    setattr(TestNode, "_run_subworkflow", _run_subworkflow)
+
+    # WHEN the node is run
+    node = TestNode(state=BaseState())
+    errors: List[NodeException] = []
+
+    def run_node() -> None:
+        try:
+            list(node.run())
+        except NodeException as e:
+            errors.append(e)
+
+    thread = Thread(target=run_node, daemon=True)
+    thread.start()
+    thread.join(timeout=5)
+
+    # THEN the node completed instead of waiting forever on the failed iteration
+    assert not thread.is_alive()
+
+    # AND the iteration's failure was surfaced
+    assert len(errors) == 1
+    assert errors[0].code == WorkflowErrorCode.INTERNAL_ERROR
+    assert errors[0].message == "Subworkflow failed on iteration 1 with error: Could not start the Subworkflow"
+
+
+def test_map_node__empty_items():
+    # GIVEN a map node over no items
+    @MapNode.wrap(items=[])
+    class TestNode(BaseNode):
+        item = MapNode.SubworkflowInputs.item
+
+        class Outputs(BaseOutputs):
+            value: int
+
+    # WHEN the node is run
+    node = TestNode(state=BaseState())
+    outputs = list(node.run())
+
+    # THEN we get back an empty list
+    assert outputs == [BaseOutput(name="value", value=[])]
+
+
+def test_map_node__streams_each_iteration_as_it_completes():
+    # GIVEN a map node whose iterations only finish once they're released, starting with the last item
+    released = {item: ThreadingEvent() for item in [1, 2, 3]}
+    released[1].set()
+
+    @MapNode.wrap(items=[3, 2, 1])
+    class TestNode(BaseNode):
+        item = MapNode.SubworkflowInputs.item
+
+        class Outputs(BaseOutputs):
+            value: int
+
+        def run(self) -> Outputs:
+            # Bounded, so that a map node that holds its outputs back until every iteration finishes fails rather than
+            # hangs
+            was_released = released[self.item].wait(timeout=5)
+            return self.Outputs(value=self.item * 10 if was_released else -1)
+
+    # WHEN the node is run, releasing the next item each time an output is streamed
+    node = TestNode(state=BaseState())
+    outputs = []
+    for output in cast(MapNode, node).run():
+        outputs.append(output)
+        if output.is_streaming:
+            _, value = cast(Tuple[int, int], output.delta)
+            released.get(value // 10 + 1, ThreadingEvent()).set()
+
+    # THEN each iteration's output is streamed with its index, in the order the iterations completed
+    assert outputs[:-1] == [
+        BaseOutput(name="value", delta=(2, 10)),
+        BaseOutput(name="value", delta=(1, 20)),
+        BaseOutput(name="value", delta=(0, 30)),
+    ]
+
+    # AND the final output is still in the original order
+    assert outputs[-1] == BaseOutput(name="value", value=[30, 20, 10])
+
+
+def test_map_node__partial_results_reach_the_workflow_stream():
+    # GIVEN a map node where one iteration only finishes once the others' partial results have been streamed
+    partial_results_received = ThreadingEvent()
+
+    @MapNode.wrap(items=[0, 1, 2])
+    class TestNode(BaseNode):
+        item = MapNode.SubworkflowInputs.item
+
+        class Outputs(BaseOutputs):
+            value: int
+
+        def run(self) -> Outputs:
+            if self.item == 2:
+                # Bounded, so that a map node that holds partial results back until every iteration finishes fails
+                # rather than hangs
+                was_released = partial_results_received.wait(timeout=5)
+                return self.Outputs(value=self.item if was_released else -1)
+            return self.Outputs(value=self.item)
+
+    # AND a workflow that outputs the node's results
+    class TestWorkflow(BaseWorkflow):
+        graph = TestNode
+
+        class Outputs(BaseWorkflow.Outputs):
+            value = TestNode.Outputs.value
+
+    # WHEN we stream the workflow, releasing the slow iteration once the other two partial results have arrived
+    events = []
+    deltas = []
+    for event in TestWorkflow().stream():
+        events.append(event)
+        if event.name == "workflow.execution.streaming" and event.output.is_streaming:
+            deltas.append(event.output.delta)
+            if len(deltas) == 2:
+                partial_results_received.set()
+
+    # THEN partial results should have been streamed before the slowest iteration finished
+    assert sorted(deltas[:2]) == [(0, 0), (1, 1)]
+    assert deltas[2:] == [(2, 2)]
+
+    # AND the workflow should still be fulfilled with the ordered list
+    assert events[-1].name == "workflow.execution.fulfilled"
+    assert events[-1].outputs.value == [0, 1, 2]
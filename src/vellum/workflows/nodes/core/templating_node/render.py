@@ -1,6 +1,9 @@
+from collections import OrderedDict
 import json
-from typing import Any, Callable, Dict, Optional, Union
+from threading import Lock
+from typing import Any, Callable, Dict, FrozenSet, Hashable, Optional, Tuple, Union
 
+from jinja2 import Template
 from jinja2.sandbox import SandboxedEnvironment
 
 from vellum.workflows.nodes.core.templating_node.exceptions import JinjaTemplateError
@@ -14,29 +17,133 @@ def finalize(obj: Any) -> str:
     return str(obj)
 
 
+DEFAULT_TEMPLATE_CACHE_SIZE = 512
+
+JinjaCustomFilters = Dict[str, Callable[[Union[str, bytes]], bool]]
+
+
+class JinjaTemplateCache:
+    """
+    A process-wide LRU cache of compiled Jinja templates, so that rendering the same template repeatedly, such as
+    within a loop or across MapNode iterations, only compiles it once.
+
+    Templates are keyed by their source, their custom filters, and the identity of each of their globals. A single
+    sandboxed environment is shared by every template using the same custom filters.
+
+    maxsize: int = DEFAULT_TEMPLATE_CACHE_SIZE - The maximum number of compiled templates to keep
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_TEMPLATE_CACHE_SIZE) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._templates: "OrderedDict[Tuple[Hashable, ...], Template]" = OrderedDict()
+        self._environments: Dict[FrozenSet[Tuple[str, Any]], SandboxedEnvironment] = {}
+        self._lock = Lock()
+
+    @property
+    def size(self) -> int:
+        return len(self._templates)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        if not lookups:
+            return 0.0
+
+        return self.hits / lookups
+
+    def get_template(
+        self,
+        template: str,
+        jinja_custom_filters: Optional[JinjaCustomFilters] = None,
+        jinja_globals: Optional[Dict[str, Any]] = None,
+    ) -> Template:
+        try:
+            filters_key = frozenset((jinja_custom_filters or {}).items())
+        except TypeError:
+            # Unhashable filters can't be cached, so compile against a fresh environment instead
+            self.misses += 1
+            return _create_environment(jinja_custom_filters).from_string(template, globals=jinja_globals)
+
+        # Nodes hand us a fresh copy of their globals on every run, so key on the identity of each value instead
+        # of the dict itself. The cached template holds a reference to every value, so their ids can't be reused.
+        globals_key = frozenset((name, id(value)) for name, value in (jinja_globals or {}).items())
+        key = (template, filters_key, globals_key)
+
+        with self._lock:
+            cached_template = self._templates.get(key)
+            if cached_template is not None:
+                self._templates.move_to_end(key)
+                self.hits += 1
+                return cached_template
+
+            self.misses += 1
+            environment = self._environments.get(filters_key)
+            if environment is None:
+                environment = _create_environment(jinja_custom_filters)
+                self._environments[filters_key] = environment
+
+        # Compile outside of the lock, since this is the expensive part
+        jinja_template = environment.from_string(template, globals=dict(jinja_globals or {}))
+
+        with self._lock:
+            self._templates[key] = jinja_template
+            self._templates.move_to_end(key)
+            while len(self._templates) > self.maxsize:
+                self._templates.popitem(last=False)
+
+        return jinja_template
+
+    def clear(self) -> None:
+        with self._lock:
+            self._templates.clear()
+            self._environments.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+_template_cache = JinjaTemplateCache()
+
+
+def get_template_cache() -> JinjaTemplateCache:
+    """
+    Returns the process-wide cache of compiled Jinja templates used by `render_sandboxed_jinja_template`.
+    """
+
+    return _template_cache
+
+
+def _create_environment(jinja_custom_filters: Optional[JinjaCustomFilters]) -> SandboxedEnvironment:
+    environment = SandboxedEnvironment(
+        keep_trailing_newline=True,
+        finalize=finalize,
+        # Compiled templates are cached by JinjaTemplateCache instead
+        cache_size=0,
+    )
+
+    if jinja_custom_filters:
+        environment.filters.update(jinja_custom_filters)
+
+    return environment
+
+
 def render_sandboxed_jinja_template(
     *,
     template: str,
     input_values: Dict[str, Any],
-    jinja_custom_filters: Optional[Dict[str, Callable[[Union[str, bytes]], bool]]] = None,
+    jinja_custom_filters: Optional[JinjaCustomFilters] = None,
     jinja_globals: Optional[Dict[str, Any]] = None,
 ) -> str:
     """Render a Jinja template within a sandboxed environment."""
 
     try:
-        environment = SandboxedEnvironment(
-            keep_trailing_newline=True,
-            finalize=finalize,
+        jinja_template = _template_cache.get_template(
+            template,
+            jinja_custom_filters=jinja_custom_filters,
+            jinja_globals=jinja_globals,
         )
 
-        if jinja_custom_filters:
-            environment.filters.update(jinja_custom_filters)
-
-        jinja_template = environment.from_string(template)
-
-        if jinja_globals:
-            jinja_template.globals.update(jinja_globals)
-
         rendered_template = jinja_template.render(input_values)
     except json.JSONDecodeError as e:
         if e.msg == "Invalid control character at":
@@ -2,6 +2,7 @@ import json
 
 from vellum.workflows.nodes.bases.base import BaseNode
 from vellum.workflows.nodes.core.templating_node.node import TemplatingNode
+from vellum.workflows.nodes.core.templating_node.render import JinjaTemplateCache, get_template_cache
 
 
 def test_templating_node__dict_output():
@@ -40,3 +41,64 @@ def test_templating_node__execution_count_reference():
 
     # THEN the output is just the total
     assert outputs.result == "0"
+
+
+def test_templating_node__reuses_compiled_template():
+    # GIVEN a templating node
+    class TemplateNode(TemplatingNode):
+        template = "{{ data | upper }} {{ json.dumps(data) }}"
+        inputs = {"data": "hello"}
+
+    # AND a cold template cache
+    template_cache = get_template_cache()
+    template_cache.clear()
+
+    # WHEN the node is run many times
+    results = [TemplateNode().run().result for _ in range(10)]
+
+    # THEN every run renders the template
+    assert results == ['HELLO "hello"'] * 10
+
+    # AND the template was only compiled once
+    assert template_cache.size == 1
+    assert template_cache.misses == 1
+    assert template_cache.hits == 9
+    assert template_cache.hit_rate == 0.9
+
+
+def test_templating_node__template_cache_respects_globals():
+    # GIVEN two templating nodes with the same template but different globals
+    class FirstNode(TemplatingNode):
+        template = "{{ greeting }}"
+        inputs = {}
+        jinja_globals = {"greeting": "hello"}
+
+    class SecondNode(TemplatingNode):
+        template = "{{ greeting }}"
+        inputs = {}
+        jinja_globals = {"greeting": "goodbye"}
+
+    # WHEN both nodes are run
+    first_result = FirstNode().run().result
+    second_result = SecondNode().run().result
+
+    # THEN each node renders with its own globals
+    assert first_result == "hello"
+    assert second_result == "goodbye"
+
+
+def test_template_cache__evicts_least_recently_used():
+    # GIVEN a template cache with room for two templates
+    template_cache = JinjaTemplateCache(maxsize=2)
+
+    # WHEN three distinct templates are compiled, reusing the first one along the way
+    first = template_cache.get_template("{{ a }}")
+    template_cache.get_template("{{ b }}")
+    assert template_cache.get_template("{{ a }}") is first
+    template_cache.get_template("{{ c }}")
+
+    # THEN only the two most recently used templates are kept
+    assert template_cache.size == 2
+    assert template_cache.get_template("{{ a }}") is first
+    assert template_cache.hits == 2
+    assert template_cache.misses == 3
@@ -75,6 +75,9 @@ class TryNode(BaseNode[StateType], Generic[StateType], metaclass=_TryNodeMeta):
             parent_state=self.state,
             context=WorkflowContext(
                 _vellum_client=self._context._vellum_client,
+                _async_vellum_client=self._context._async_vellum_client,
+                prompt_response_cache=self._context.prompt_response_cache,
+                executor=self._context.executor,
             ),
         )
         subworkflow_stream = subworkflow.stream(
@@ -1,4 +1,4 @@
-from typing import Optional, Union
+from typing import Any, Dict, Optional, Union
 
 from vellum.workflows.constants import AuthorizationType
 from vellum.workflows.nodes.displayable.bases.api_node import BaseAPINode
@@ -15,6 +15,8 @@ class APINode(BaseAPINode):
     data: Optional[str] - The data to send in the request body.
     json: Optional["JsonObject"] - The JSON data to send in the request body.
     headers: Optional[Dict[str, Union[str, VellumSecret]]] - The headers to send in the request.
+    timeout: Optional[float] = None - The number of seconds to wait on the response. Defaults to the shared
+        client's timeouts.
 
     authorization_type: Optional[AuthorizationType] = None - The type of authorization to use for the API call.
     api_key_header_key: Optional[str] = None - The header key to use for the API key authorization.
@@ -28,6 +30,14 @@ class APINode(BaseAPINode):
     bearer_token_value: Optional[Union[str, VellumSecretReference]] = None
 
     def run(self) -> BaseAPINode.Outputs:
+        return self._run(method=self.method, url=self.url, data=self.data, json=self.json, headers=self._get_headers())
+
+    async def arun(self) -> BaseAPINode.Outputs:
+        return await self._arun(
+            method=self.method, url=self.url, data=self.data, json=self.json, headers=self._get_headers()
+        )
+
+    def _get_headers(self) -> Dict[str, Any]:
         headers = self.headers or {}
         header_overrides = {}
 
@@ -40,6 +50,4 @@ class APINode(BaseAPINode):
         elif self.authorization_type == AuthorizationType.BEARER_TOKEN:
             header_overrides["Authorization"] = f"Bearer {self.bearer_token_value}"
 
-        return self._run(
-            method=self.method, url=self.url, data=self.data, json=self.json, headers={**headers, **header_overrides}
-        )
+        return {**headers, **header_overrides}
@@ -0,0 +1,163 @@
+import pytest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+import time
+from typing import Iterator, List, Tuple
+
+from vellum.workflows.constants import APIRequestMethod
+from vellum.workflows.errors.types import WorkflowErrorCode
+from vellum.workflows.exceptions import NodeException
+from vellum.workflows.nodes.displayable.api_node.node import APINode
+from vellum.workflows.nodes.displayable.bases.api_node import BaseStreamingAPINode
+from vellum.workflows.nodes.displayable.bases.api_node.http_client import (
+    create_api_node_httpx_client,
+    set_default_api_node_httpx_client,
+)
+from vellum.workflows.state.base import BaseState
+from vellum.workflows.workflows.base import BaseWorkflow
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    client_ports: List[int] = []
+
+    def do_GET(self) -> None:
+        self.client_ports.append(self.client_address[1])
+        if self.path == "/slow":
+            # The client will have timed out by now, so there's no one left to respond to
+            time.sleep(0.5)
+            return
+
+        if self.path == "/chunked":
+            self.send_response(200)
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            for chunk in [b"hello ", b"world"]:
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+                self.wfile.flush()
+            self.wfile.write(b"0\r\n\r\n")
+            return
+
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("X-Custom-Header", "foo")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def local_server() -> Iterator[Tuple[str, List[int]]]:
+    client_ports: List[int] = []
+    handler = type("Handler", (_Handler,), {"client_ports": client_ports})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}", client_ports
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(autouse=True)
+def httpx_client() -> Iterator[None]:
+    httpx_client = create_api_node_httpx_client()
+    set_default_api_node_httpx_client(httpx_client)
+    yield
+    set_default_api_node_httpx_client(None)
+    httpx_client.close()
+
+
+def test_api_node__reuses_connections(local_server):
+    # GIVEN an API node targeting a local server
+    base_url, client_ports = local_server
+
+    class MyAPINode(APINode):
+        method = APIRequestMethod.GET
+        url = f"{base_url}/json"
+
+    # WHEN we run the node several times
+    outputs = [MyAPINode(state=BaseState()).run() for _ in range(3)]
+
+    # THEN each run should have received the response
+    assert outputs[0].json == {"ok": True}
+    assert outputs[0].status_code == 200
+    assert outputs[0].headers["X-Custom-Header"] == "foo"
+
+    # AND every request should have been sent over the same connection
+    assert len(client_ports) == 3
+    assert len(set(client_ports)) == 1
+
+
+async def test_api_node__arun(local_server):
+    # GIVEN an API node targeting a local server
+    base_url, client_ports = local_server
+
+    class MyAPINode(APINode):
+        method = APIRequestMethod.GET
+        url = f"{base_url}/json"
+
+    # WHEN we run the node several times on the event loop
+    outputs = [await MyAPINode(state=BaseState()).arun() for _ in range(3)]
+
+    # THEN each run should have received the response, without blocking the loop on a worker thread
+    assert outputs[0].json == {"ok": True}
+    assert outputs[0].status_code == 200
+    assert outputs[0].headers["X-Custom-Header"] == "foo"
+
+    # AND every request should have been sent over the loop's pooled connection
+    assert len(client_ports) == 3
+    assert len(set(client_ports)) == 1
+
+
+def test_api_node__streams_response(local_server):
+    # GIVEN an API node that streams its response from a local server
+    base_url, _ = local_server
+
+    class StreamingAPINode(BaseStreamingAPINode):
+        method = APIRequestMethod.GET
+        url = f"{base_url}/chunked"
+
+    class StreamingAPIWorkflow(BaseWorkflow):
+        graph = StreamingAPINode
+
+        class Outputs(BaseWorkflow.Outputs):
+            text = StreamingAPINode.Outputs.text
+            json = StreamingAPINode.Outputs.json
+
+    # WHEN we stream the workflow
+    events = list(StreamingAPIWorkflow().stream())
+
+    # THEN the response body should have been streamed as it was received
+    deltas: List[str] = []
+    for event in events:
+        if event.name == "workflow.execution.streaming" and event.output.name == "text" and event.output.is_streaming:
+            assert isinstance(event.output.delta, str)
+            deltas.append(event.output.delta)
+    assert "".join(deltas) == "hello world"
+
+    # AND the workflow should have been fulfilled with the full response body
+    assert events[-1].name == "workflow.execution.fulfilled", events[-1]
+    assert events[-1].outputs.text == "hello world"
+    assert events[-1].outputs.json is None
+
+
+def test_api_node__timeout(local_server):
+    # GIVEN an API node with a timeout shorter than the server takes to respond
+    base_url, _ = local_server
+
+    class SlowAPINode(APINode):
+        method = APIRequestMethod.GET
+        url = f"{base_url}/slow"
+        timeout = 0.1
+
+    # WHEN we run the node
+    with pytest.raises(NodeException) as exc_info:
+        SlowAPINode(state=BaseState()).run()
+
+    # THEN it should have failed with a provider error
+    assert exc_info.value.code == WorkflowErrorCode.PROVIDER_ERROR
+    assert "HTTP request failed" in exc_info.value.message
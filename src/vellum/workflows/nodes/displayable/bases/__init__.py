@@ -1,10 +1,11 @@
-from .api_node import BaseAPINode
+from .api_node import BaseAPINode, BaseStreamingAPINode
 from .inline_prompt_node import BaseInlinePromptNode
 from .prompt_deployment_node import BasePromptDeploymentNode
 from .search_node import BaseSearchNode
 
 __all__ = [
     "BaseAPINode",
+    "BaseStreamingAPINode",
     "BaseInlinePromptNode",
     "BasePromptDeploymentNode",
     "BaseSearchNode",
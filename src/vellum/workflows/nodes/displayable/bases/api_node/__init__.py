@@ -1,5 +1,6 @@
-from .node import BaseAPINode
+from .node import BaseAPINode, BaseStreamingAPINode
 
 __all__ = [
     "BaseAPINode",
+    "BaseStreamingAPINode",
 ]
@@ -0,0 +1,121 @@
+import asyncio
+from threading import Lock
+from weakref import WeakKeyDictionary
+from typing import Optional
+
+import httpx
+
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_KEEPALIVE_EXPIRY = 30.0
+
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=DEFAULT_MAX_CONNECTIONS,
+    max_keepalive_connections=DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry=DEFAULT_KEEPALIVE_EXPIRY,
+)
+
+# Only connecting is bounded by default, since API Nodes have never timed out waiting on a response
+DEFAULT_TIMEOUT = httpx.Timeout(None, connect=30.0)
+
+# Only failures to connect are retried, since the request was never sent and so can't have had side effects
+DEFAULT_RETRIES = 2
+
+
+def create_api_node_httpx_client(
+    limits: httpx.Limits = DEFAULT_LIMITS,
+    timeout: httpx.Timeout = DEFAULT_TIMEOUT,
+    retries: int = DEFAULT_RETRIES,
+) -> httpx.Client:
+    """
+    Creates a pooled httpx client for API Nodes to send their requests with.
+
+    limits: httpx.Limits = DEFAULT_LIMITS - The connection pool limits and keep-alive expiry.
+    timeout: httpx.Timeout = DEFAULT_TIMEOUT - The default timeouts, which nodes can override per request.
+    retries: int = DEFAULT_RETRIES - How many times to retry a request that failed to connect.
+    """
+
+    return httpx.Client(
+        timeout=timeout,
+        follow_redirects=True,
+        transport=httpx.HTTPTransport(limits=limits, retries=retries),
+    )
+
+
+def create_api_node_async_httpx_client(
+    limits: httpx.Limits = DEFAULT_LIMITS,
+    timeout: httpx.Timeout = DEFAULT_TIMEOUT,
+    retries: int = DEFAULT_RETRIES,
+) -> httpx.AsyncClient:
+    """
+    Creates a pooled httpx client for API Nodes to send their requests with from an event loop, see
+    `create_api_node_httpx_client`.
+    """
+
+    return httpx.AsyncClient(
+        timeout=timeout,
+        follow_redirects=True,
+        transport=httpx.AsyncHTTPTransport(limits=limits, retries=retries),
+    )
+
+
+_default_httpx_client: Optional[httpx.Client] = None
+_default_httpx_client_lock = Lock()
+
+# An async client's connections can only be used from the event loop they were opened on, so there's one per loop
+_default_async_httpx_clients: "WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = WeakKeyDictionary()
+_default_async_httpx_client_override: Optional[httpx.AsyncClient] = None
+
+
+def get_default_api_node_httpx_client() -> httpx.Client:
+    """
+    Returns the process-wide httpx client shared by every API Node, so that requests to the same host reuse
+    connections instead of paying for a new TCP and TLS handshake each time.
+    """
+
+    global _default_httpx_client
+    with _default_httpx_client_lock:
+        if _default_httpx_client is None or _default_httpx_client.is_closed:
+            _default_httpx_client = create_api_node_httpx_client()
+
+        return _default_httpx_client
+
+
+def set_default_api_node_httpx_client(httpx_client: Optional[httpx.Client]) -> None:
+    """
+    Overrides the process-wide httpx client shared by every API Node. Passing `None` restores the default, lazily
+    created client. The previous client is not closed, since requests may still be in flight on it.
+    """
+
+    global _default_httpx_client
+    with _default_httpx_client_lock:
+        _default_httpx_client = httpx_client
+
+
+def get_default_api_node_async_httpx_client() -> httpx.AsyncClient:
+    """
+    Returns the httpx client shared by every API Node running on the current event loop.
+    """
+
+    loop = asyncio.get_running_loop()
+    with _default_httpx_client_lock:
+        if _default_async_httpx_client_override is not None:
+            return _default_async_httpx_client_override
+
+        httpx_client = _default_async_httpx_clients.get(loop)
+        if httpx_client is None or httpx_client.is_closed:
+            httpx_client = create_api_node_async_httpx_client()
+            _default_async_httpx_clients[loop] = httpx_client
+
+        return httpx_client
+
+
+def set_default_api_node_async_httpx_client(httpx_client: Optional[httpx.AsyncClient]) -> None:
+    """
+    Overrides the httpx client shared by every API Node running on an event loop, no matter which loop. Passing `None`
+    restores the default, lazily created client per event loop.
+    """
+
+    global _default_async_httpx_client_override
+    with _default_httpx_client_lock:
+        _default_async_httpx_client_override = httpx_client
@@ -1,26 +1,26 @@
-from typing import Any, Dict, Generic, Optional, Union
+from json import JSONDecodeError, loads
+from typing import Any, AsyncIterator, Dict, Generic, Iterator, List, Optional, Union
 
-from requests import Request, RequestException, Session
-from requests.exceptions import JSONDecodeError
+import httpx
 
 from vellum.workflows.constants import APIRequestMethod
+from vellum.workflows.descriptors.base import BaseDescriptor
 from vellum.workflows.errors.types import WorkflowErrorCode
 from vellum.workflows.exceptions import NodeException
-from vellum.workflows.nodes.bases import BaseNode
-from vellum.workflows.outputs import BaseOutputs
+from vellum.workflows.nodes.bases import BaseAsyncNode
+from vellum.workflows.nodes.displayable.bases.api_node.http_client import (
+    get_default_api_node_async_httpx_client,
+    get_default_api_node_httpx_client,
+)
+from vellum.workflows.outputs import BaseOutput, BaseOutputs
 from vellum.workflows.types.core import Json, VellumSecret
 from vellum.workflows.types.generics import StateType
 
 
-class BaseAPINode(BaseNode, Generic[StateType]):
+class _BaseAPIRequestNode(BaseAsyncNode, Generic[StateType]):
     """
-    Used to execute an API call.
-
-    url: str - The URL to send the request to.
-    method: APIRequestMethod - The HTTP method to use for the request.
-    data: Optional[str] - The data to send in the request body.
-    json: Optional["JsonObject"] - The JSON data to send in the request body.
-    headers: Optional[Dict[str, Union[str, VellumSecret]]] - The headers to send in the request.
+    The attributes, outputs and request handling shared by the nodes that execute an API call. `run` sends the
+    request with a blocking httpx client, and `arun`, used when the Workflow runs on an event loop, with an async one.
     """
 
     url: str
@@ -28,6 +28,7 @@ class BaseAPINode(BaseNode, Generic[StateType]):
     data: Optional[str] = None
     json: Optional["Json"] = None
     headers: Optional[Dict[str, Union[str, VellumSecret]]] = None
+    timeout: Optional[float] = None
 
     class Outputs(BaseOutputs):
         json: Optional["Json"]
@@ -35,36 +36,192 @@ class BaseAPINode(BaseNode, Generic[StateType]):
         status_code: int
         text: str
 
-    def run(self) -> Outputs:
-        return self._run(method=self.method, url=self.url, data=self.data, json=self.json, headers=self.headers)
-
-    def _run(
+    def _build_request(
         self,
+        httpx_client: Union[httpx.Client, httpx.AsyncClient],
         method: APIRequestMethod,
         url: str,
         data: Optional[str] = None,
         json: Any = None,
         headers: Any = None,
-    ) -> Outputs:
+    ) -> httpx.Request:
         try:
-            prepped = Request(method=method.value, url=url, data=data, json=json, headers=headers).prepare()
+            return httpx_client.build_request(
+                method=method.value,
+                url=url,
+                content=data,
+                json=json,
+                headers=headers,
+                timeout=self.timeout if self.timeout is not None else httpx.USE_CLIENT_DEFAULT,
+            )
         except Exception as e:
             raise NodeException(f"Failed to prepare HTTP request: {e}", code=WorkflowErrorCode.PROVIDER_ERROR)
 
+    def _parse_json(self, text: str) -> Optional["Json"]:
         try:
-            with Session() as session:
-                response = session.send(prepped)
-        except RequestException as e:
-            raise NodeException(f"HTTP request failed: {e}", code=WorkflowErrorCode.PROVIDER_ERROR)
-
-        try:
-            json = response.json()
+            return loads(text)
         except JSONDecodeError:
-            json = None
+            return None
 
+    def _get_outputs(self, response: httpx.Response) -> "_BaseAPIRequestNode.Outputs":
+        response_headers: Dict[str, Union[str, BaseDescriptor[str]]] = {**self._get_response_headers(response)}
         return self.Outputs(
-            json=json,
-            headers={header: value for header, value in response.headers.items()},
+            json=self._parse_json(response.text),
+            headers=response_headers,
             status_code=response.status_code,
             text=response.text,
         )
+
+    def _get_response_headers(self, response: httpx.Response) -> Dict[str, str]:
+        # httpx lowercases header names, so we read them off of the raw headers to preserve the server's casing
+        headers: Dict[str, str] = {}
+        for raw_key, raw_value in response.headers.raw:
+            key = raw_key.decode(response.headers.encoding)
+            value = raw_value.decode(response.headers.encoding)
+            headers[key] = f"{headers[key]}, {value}" if key in headers else value
+
+        return headers
+
+
+class BaseAPINode(_BaseAPIRequestNode, Generic[StateType]):
+    """
+    Used to execute an API call.
+
+    url: str - The URL to send the request to.
+    method: APIRequestMethod - The HTTP method to use for the request.
+    data: Optional[str] - The data to send in the request body.
+    json: Optional["JsonObject"] - The JSON data to send in the request body.
+    headers: Optional[Dict[str, Union[str, VellumSecret]]] - The headers to send in the request.
+    timeout: Optional[float] = None - The number of seconds to wait on the response. Defaults to the shared
+        client's timeouts.
+    """
+
+    def run(self) -> "BaseAPINode.Outputs":
+        return self._run(method=self.method, url=self.url, data=self.data, json=self.json, headers=self.headers)
+
+    async def arun(self) -> "BaseAPINode.Outputs":
+        return await self._arun(method=self.method, url=self.url, data=self.data, json=self.json, headers=self.headers)
+
+    def _run(
+        self,
+        method: APIRequestMethod,
+        url: str,
+        data: Optional[str] = None,
+        json: Any = None,
+        headers: Any = None,
+    ) -> "BaseAPINode.Outputs":
+        httpx_client = get_default_api_node_httpx_client()
+        request = self._build_request(httpx_client, method=method, url=url, data=data, json=json, headers=headers)
+
+        try:
+            response = httpx_client.send(request)
+        except httpx.HTTPError as e:
+            raise NodeException(f"HTTP request failed: {e}", code=WorkflowErrorCode.PROVIDER_ERROR)
+
+        return self._get_outputs(response)
+
+    async def _arun(
+        self,
+        method: APIRequestMethod,
+        url: str,
+        data: Optional[str] = None,
+        json: Any = None,
+        headers: Any = None,
+    ) -> "BaseAPINode.Outputs":
+        httpx_client = get_default_api_node_async_httpx_client()
+        request = self._build_request(httpx_client, method=method, url=url, data=data, json=json, headers=headers)
+
+        try:
+            response = await httpx_client.send(request)
+        except httpx.HTTPError as e:
+            raise NodeException(f"HTTP request failed: {e}", code=WorkflowErrorCode.PROVIDER_ERROR)
+
+        return self._get_outputs(response)
+
+
+class BaseStreamingAPINode(_BaseAPIRequestNode, Generic[StateType]):
+    """
+    Used to execute an API call whose response body is streamed as `text` deltas while it's received, rather than
+    waiting on the full response. The `status_code` and `headers` outputs are fulfilled as soon as the response
+    starts, and `text` and `json` once the full body was received.
+
+    url: str - The URL to send the request to.
+    method: APIRequestMethod - The HTTP method to use for the request.
+    data: Optional[str] - The data to send in the request body.
+    json: Optional["JsonObject"] - The JSON data to send in the request body.
+    headers: Optional[Dict[str, Union[str, VellumSecret]]] - The headers to send in the request.
+    timeout: Optional[float] = None - The number of seconds to wait on the response. Defaults to the shared
+        client's timeouts.
+    """
+
+    def run(self) -> Iterator[BaseOutput]:
+        return self._stream(method=self.method, url=self.url, data=self.data, json=self.json, headers=self.headers)
+
+    def arun(self) -> AsyncIterator[BaseOutput]:
+        return self._astream(method=self.method, url=self.url, data=self.data, json=self.json, headers=self.headers)
+
+    def _stream(
+        self,
+        method: APIRequestMethod,
+        url: str,
+        data: Optional[str] = None,
+        json: Any = None,
+        headers: Any = None,
+    ) -> Iterator[BaseOutput]:
+        httpx_client = get_default_api_node_httpx_client()
+        request = self._build_request(httpx_client, method=method, url=url, data=data, json=json, headers=headers)
+
+        try:
+            response = httpx_client.send(request, stream=True)
+        except httpx.HTTPError as e:
+            raise NodeException(f"HTTP request failed: {e}", code=WorkflowErrorCode.PROVIDER_ERROR)
+
+        try:
+            yield BaseOutput(name="status_code", value=response.status_code)
+            yield BaseOutput(name="headers", value=self._get_response_headers(response))
+
+            chunks: List[str] = []
+            for chunk in response.iter_text():
+                chunks.append(chunk)
+                yield BaseOutput(name="text", delta=chunk)
+
+            text = "".join(chunks)
+            yield BaseOutput(name="text", value=text)
+            yield BaseOutput(name="json", value=self._parse_json(text))
+        except httpx.HTTPError as e:
+            raise NodeException(f"HTTP request failed: {e}", code=WorkflowErrorCode.PROVIDER_ERROR)
+        finally:
+            response.close()
+
+    async def _astream(
+        self,
+        method: APIRequestMethod,
+        url: str,
+        data: Optional[str] = None,
+        json: Any = None,
+        headers: Any = None,
+    ) -> AsyncIterator[BaseOutput]:
+        httpx_client = get_default_api_node_async_httpx_client()
+        request = self._build_request(httpx_client, method=method, url=url, data=data, json=json, headers=headers)
+
+        try:
+            response = await httpx_client.send(request, stream=True)
+        except httpx.HTTPError as e:
+            raise NodeException(f"HTTP request failed: {e}", code=WorkflowErrorCode.PROVIDER_ERROR)
+
+        try:
+            yield BaseOutput(name="status_code", value=response.status_code)
+            yield BaseOutput(name="headers", value=self._get_response_headers(response))
+
+            chunks: List[str] = []
+            async for chunk in response.aiter_text():
+                chunks.append(chunk)
+                yield BaseOutput(name="text", delta=chunk)
+
+            text = "".join(chunks)
+            yield BaseOutput(name="text", value=text)
+            yield BaseOutput(name="json", value=self._parse_json(text))
+        except httpx.HTTPError as e:
+            raise NodeException(f"HTTP request failed: {e}", code=WorkflowErrorCode.PROVIDER_ERROR)
+        finally:
+            await response.aclose()
@@ -1,29 +1,164 @@
 from abc import abstractmethod
-from typing import ClassVar, Generator, Generic, Iterator, List, Optional, Union
+import logging
+from typing import Any, AsyncIterator, ClassVar, Generator, Generic, Iterator, List, Optional, Union, cast
 
-from vellum import AdHocExecutePromptEvent, ExecutePromptEvent, PromptOutput
+from vellum import (
+    AdHocExecutePromptEvent,
+    ExecutePromptEvent,
+    FulfilledAdHocExecutePromptEvent,
+    FulfilledExecutePromptEvent,
+    PromptOutput,
+    StreamingAdHocExecutePromptEvent,
+    StreamingExecutePromptEvent,
+)
 from vellum.core import RequestOptions
+from vellum.workflows.caches.utils import get_cache_key
 from vellum.workflows.errors.types import WorkflowErrorCode, vellum_error_to_workflow_error
 from vellum.workflows.exceptions import NodeException
-from vellum.workflows.nodes.bases import BaseNode
+from vellum.workflows.nodes.bases import BaseAsyncNode
 from vellum.workflows.outputs.base import BaseOutput, BaseOutputs
 from vellum.workflows.types.core import EntityInputsInterface
 from vellum.workflows.types.generics import StateType
+from vellum.workflows.utils.async_utils import iterate_sync_iterator_async
 
+logger = logging.getLogger(__name__)
+
+
+class BasePromptNode(BaseAsyncNode, Generic[StateType]):
+    """
+    The base class of the nodes that execute a Prompt. `run` executes it with the Workflow context's `vellum_client`,
+    and `arun`, used when the Workflow runs on an event loop, with its `async_vellum_client`.
+    """
 
-class BasePromptNode(BaseNode, Generic[StateType]):
     # Inputs that are passed to the Prompt
     prompt_inputs: ClassVar[EntityInputsInterface]
 
     request_options: Optional[RequestOptions] = None
 
+    # Skips the Workflow context's `prompt_response_cache`, always executing the Prompt
+    bypass_response_cache: bool = False
+
     class Outputs(BaseOutputs):
         results: List[PromptOutput]
 
     @abstractmethod
-    def _get_prompt_event_stream(self) -> Union[Iterator[AdHocExecutePromptEvent], Iterator[ExecutePromptEvent]]:
+    def _get_prompt_event_stream(self) -> Iterator[Union[AdHocExecutePromptEvent, ExecutePromptEvent]]:
         pass
 
+    def _aget_prompt_event_stream(self) -> AsyncIterator[Union[AdHocExecutePromptEvent, ExecutePromptEvent]]:
+        """
+        Streams the Prompt's events on an event loop. Subclasses that don't override this have their blocking event
+        stream advanced on the Workflow's executor instead.
+        """
+
+        # Imported lazily, since the runner package imports the nodes package
+        from vellum.workflows.runner.executor import get_default_executor
+
+        return iterate_sync_iterator_async(
+            self._get_prompt_event_stream(), self._context.executor or get_default_executor()
+        )
+
+    def _get_prompt_response_cache_key_value(self) -> Optional[Any]:
+        """
+        Returns everything that determines the Prompt's response, from which its response cache key is derived.
+        Returning `None` opts the node out of response caching.
+        """
+
+        return None
+
+    def _get_prompt_response_cache_key(self) -> Optional[str]:
+        if self.bypass_response_cache or self._context.prompt_response_cache is None:
+            return None
+
+        try:
+            cache_key_value = self._get_prompt_response_cache_key_value()
+            if cache_key_value is None:
+                return None
+
+            return get_cache_key(cache_key_value)
+        except TypeError:
+            return None
+
+    def _get_cached_prompt_event_stream(
+        self,
+    ) -> Iterator[Union[AdHocExecutePromptEvent, ExecutePromptEvent]]:
+        cache = self._context.prompt_response_cache
+        cache_key = self._get_prompt_response_cache_key()
+        if cache is None or cache_key is None:
+            return self._get_prompt_event_stream()
+
+        try:
+            fulfilled_event = cache.get(cache_key)
+        except Exception:
+            logger.exception("Failed to read from the prompt response cache")
+            fulfilled_event = None
+
+        if fulfilled_event is not None:
+            return self._replay_prompt_event_stream(fulfilled_event)
+
+        return self._cache_prompt_event_stream(cache_key, self._get_prompt_event_stream())
+
+    async def _aget_cached_prompt_event_stream(
+        self,
+    ) -> AsyncIterator[Union[AdHocExecutePromptEvent, ExecutePromptEvent]]:
+        cache = self._context.prompt_response_cache
+        cache_key = self._get_prompt_response_cache_key()
+        if cache is None or cache_key is None:
+            async for event in self._aget_prompt_event_stream():
+                yield event
+            return
+
+        try:
+            fulfilled_event = cache.get(cache_key)
+        except Exception:
+            logger.exception("Failed to read from the prompt response cache")
+            fulfilled_event = None
+
+        if fulfilled_event is not None:
+            for event in self._replay_prompt_event_stream(fulfilled_event):
+                yield event
+            return
+
+        async for event in self._aget_prompt_event_stream():
+            self._cache_prompt_event(cache_key, event)
+            yield event
+
+    def _replay_prompt_event_stream(
+        self, fulfilled_event: Union[FulfilledAdHocExecutePromptEvent, FulfilledExecutePromptEvent]
+    ) -> Iterator[Union[AdHocExecutePromptEvent, ExecutePromptEvent]]:
+        for output_index, output in enumerate(fulfilled_event.outputs):
+            if isinstance(fulfilled_event, FulfilledAdHocExecutePromptEvent):
+                yield StreamingAdHocExecutePromptEvent(
+                    output=output,
+                    output_index=output_index,
+                    execution_id=fulfilled_event.execution_id,
+                )
+            else:
+                yield StreamingExecutePromptEvent(
+                    output=output,
+                    output_index=output_index,
+                    execution_id=fulfilled_event.execution_id,
+                )
+
+        yield fulfilled_event
+
+    def _cache_prompt_event_stream(
+        self,
+        cache_key: str,
+        prompt_event_stream: Iterator[Union[AdHocExecutePromptEvent, ExecutePromptEvent]],
+    ) -> Iterator[Union[AdHocExecutePromptEvent, ExecutePromptEvent]]:
+        for event in prompt_event_stream:
+            self._cache_prompt_event(cache_key, event)
+            yield event
+
+    def _cache_prompt_event(self, cache_key: str, event: Union[AdHocExecutePromptEvent, ExecutePromptEvent]) -> None:
+        # Only complete responses are cached, so that a rejected or interrupted Prompt is retried next time
+        if event.state == "FULFILLED" and self._context.prompt_response_cache is not None:
+            try:
+                self._context.prompt_response_cache.set(cache_key, event)
+            except Exception:
+                logger.exception("Failed to write to the prompt response cache")
+
     def run(self) -> Iterator[BaseOutput]:
         outputs = yield from self._process_prompt_event_stream()
         if outputs is None:
@@ -32,20 +167,69 @@ class BasePromptNode(BaseNode, Generic[StateType]):
                 code=WorkflowErrorCode.INTERNAL_ERROR,
             )
 
+    async def arun(self) -> AsyncIterator[BaseOutput]:
+        outputs: Optional[List[PromptOutput]] = None
+        async for output in self._aprocess_prompt_event_stream():
+            if output.is_fulfilled:
+                outputs = cast(List[PromptOutput], output.value)
+            yield output
+
+        if outputs is None:
+            raise NodeException(
+                message="Expected to receive outputs from Prompt",
+                code=WorkflowErrorCode.INTERNAL_ERROR,
+            )
+
     def _process_prompt_event_stream(self) -> Generator[BaseOutput, None, Optional[List[PromptOutput]]]:
-        prompt_event_stream = self._get_prompt_event_stream()
+        prompt_event_stream = self._get_cached_prompt_event_stream()
 
         outputs: Optional[List[PromptOutput]] = None
         for event in prompt_event_stream:
-            if event.state == "INITIATED":
+            output = self._process_prompt_event(event)
+            if output is None:
                 continue
-            elif event.state == "STREAMING":
-                yield BaseOutput(name="results", delta=event.output.value)
-            elif event.state == "FULFILLED":
+
+            if event.state == "FULFILLED":
                 outputs = event.outputs
-                yield BaseOutput(name="results", value=event.outputs)
-            elif event.state == "REJECTED":
-                workflow_error = vellum_error_to_workflow_error(event.error)
-                raise NodeException.of(workflow_error)
+            yield output
 
         return outputs
+
+    async def _aprocess_prompt_event_stream(self) -> AsyncIterator[BaseOutput]:
+        async for event in self._aget_cached_prompt_event_stream():
+            output = self._process_prompt_event(event)
+            if output is not None:
+                yield output
+
+    def _process_prompt_event(self, event: Union[AdHocExecutePromptEvent, ExecutePromptEvent]) -> Optional[BaseOutput]:
+        if event.state == "STREAMING":
+            return BaseOutput(name="results", delta=event.output.value)
+        elif event.state == "FULFILLED":
+            return BaseOutput(name="results", value=event.outputs)
+        elif event.state == "REJECTED":
+            workflow_error = vellum_error_to_workflow_error(event.error)
+            raise NodeException.of(workflow_error)
+
+        return None
+
+    def _get_string_output(self, outputs: Optional[List[PromptOutput]]) -> BaseOutput:
+        """
+        Returns the `text` output of the Prompt Nodes that surface their first string result for convenience.
+        """
+
+        if not outputs:
+            raise NodeException(
+                message="Expected to receive outputs from Prompt",
+                code=WorkflowErrorCode.INTERNAL_ERROR,
+            )
+
+        string_output = next((output for output in outputs if output.type == "STRING"), None)
+        if not string_output or string_output.value is None:
+            output_types = {output.type for output in outputs}
+            is_plural = len(output_types) > 1
+            raise NodeException(
+                message=f"Expected to receive a non-null string output from Prompt. Only found outputs of type{'s' if is_plural else ''}: {', '.join(output_types)}",  # noqa: E501
+                code=WorkflowErrorCode.INTERNAL_ERROR,
+            )
+
+        return BaseOutput(name="text", value=string_output.value)
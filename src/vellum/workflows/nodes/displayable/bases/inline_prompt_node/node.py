@@ -1,5 +1,5 @@
 from uuid import uuid4
-from typing import ClassVar, Generic, Iterator, List, Optional, Tuple, cast
+from typing import Any, AsyncIterator, ClassVar, Generic, Iterator, List, Optional, Tuple, cast
 
 from vellum import (
     AdHocExecutePromptEvent,
@@ -35,6 +35,8 @@ class BaseInlinePromptNode(BasePromptNode, Generic[StateType]):
     parameters: PromptParameters - The parameters for the Prompt
     expand_meta: Optional[AdHocExpandMeta] - Expandable execution fields to include in the response
     request_options: Optional[RequestOptions] - The request options to use for the Prompt Execution
+    bypass_response_cache: bool = False - Whether to always execute the Prompt, even if the Workflow's context
+        has a `prompt_response_cache`
     """
 
     ml_model: ClassVar[str]
@@ -49,15 +51,7 @@ class BaseInlinePromptNode(BasePromptNode, Generic[StateType]):
     expand_meta: Optional[AdHocExpandMeta] = OMIT
 
     def _get_prompt_event_stream(self) -> Iterator[AdHocExecutePromptEvent]:
-        input_variables, input_values = self._compile_prompt_inputs()
-        current_parent_context = get_parent_context()
-        parent_context = current_parent_context.model_dump_json() if current_parent_context else None
-        request_options = self.request_options or RequestOptions()
-        request_options["additional_body_parameters"] = {
-            "execution_context": {"parent_context": parent_context},
-            **request_options.get("additional_body_parameters", {}),
-        }
-
+        input_variables, input_values = self._prepare_prompt_execution()
         return self._context.vellum_client.ad_hoc.adhoc_execute_prompt_stream(
             ml_model=self.ml_model,
             input_values=input_values,
@@ -69,6 +63,43 @@ class BaseInlinePromptNode(BasePromptNode, Generic[StateType]):
             request_options=self.request_options,
         )
 
+    def _aget_prompt_event_stream(self) -> AsyncIterator[AdHocExecutePromptEvent]:
+        input_variables, input_values = self._prepare_prompt_execution()
+        return self._context.async_vellum_client.ad_hoc.adhoc_execute_prompt_stream(
+            ml_model=self.ml_model,
+            input_values=input_values,
+            input_variables=input_variables,
+            parameters=self.parameters,
+            blocks=self.blocks,
+            functions=self.functions,
+            expand_meta=self.expand_meta,
+            request_options=self.request_options,
+        )
+
+    def _prepare_prompt_execution(self) -> Tuple[List[VellumVariable], List[PromptRequestInput]]:
+        input_variables, input_values = self._compile_prompt_inputs()
+        current_parent_context = get_parent_context()
+        parent_context = current_parent_context.model_dump_json() if current_parent_context else None
+        request_options = self.request_options or RequestOptions()
+        request_options["additional_body_parameters"] = {
+            "execution_context": {"parent_context": parent_context},
+            **request_options.get("additional_body_parameters", {}),
+        }
+
+        return input_variables, input_values
+
+    def _get_prompt_response_cache_key_value(self) -> Optional[Any]:
+        # Input variable ids are generated on every execution, so only the input values are part of the key
+        _, input_values = self._compile_prompt_inputs()
+        return {
+            "ml_model": self.ml_model,
+            "blocks": self.blocks,
+            "functions": None if self.functions is OMIT else self.functions,
+            "parameters": self.parameters,
+            "input_values": input_values,
+            "expand_meta": None if self.expand_meta is OMIT else self.expand_meta,
+        }
+
     def _compile_prompt_inputs(self) -> Tuple[List[VellumVariable], List[PromptRequestInput]]:
         input_variables: List[VellumVariable] = []
         input_values: List[PromptRequestInput] = []
@@ -1,5 +1,5 @@
 from uuid import UUID
-from typing import Any, ClassVar, Dict, Generic, Iterator, List, Optional, Sequence, Union, cast
+from typing import Any, AsyncIterator, ClassVar, Dict, Generic, Iterator, List, Optional, Sequence, Union, cast
 
 from vellum import (
     ChatHistoryInputRequest,
@@ -34,6 +34,8 @@ class BasePromptDeploymentNode(BasePromptNode, Generic[StateType]):
     expand_raw: Optional[Sequence[str]] - Expandable raw fields to include in the response
     metadata: Optional[Dict[str, Optional[Any]]] - The metadata to use for the Prompt Execution
     request_options: Optional[RequestOptions] - The request options to use for the Prompt Execution
+    bypass_response_cache: bool = False - Whether to always execute the Prompt, even if the Workflow's context
+        has a `prompt_response_cache`
     """
 
     # Either the Prompt Deployment's UUID or its name.
@@ -48,13 +50,6 @@ class BasePromptDeploymentNode(BasePromptNode, Generic[StateType]):
     metadata: Optional[Dict[str, Optional[Any]]] = OMIT
 
     def _get_prompt_event_stream(self) -> Iterator[ExecutePromptEvent]:
-        current_parent_context = get_parent_context()
-        parent_context = current_parent_context.model_dump() if current_parent_context else None
-        request_options = self.request_options or RequestOptions()
-        request_options["additional_body_parameters"] = {
-            "execution_context": {"parent_context": parent_context},
-            **request_options.get("additional_body_parameters", {}),
-        }
         return self._context.vellum_client.execute_prompt_stream(
             inputs=self._compile_prompt_inputs(),
             prompt_deployment_id=str(self.deployment) if isinstance(self.deployment, UUID) else None,
@@ -65,9 +60,44 @@ class BasePromptDeploymentNode(BasePromptNode, Generic[StateType]):
             raw_overrides=self.raw_overrides,
             expand_raw=self.expand_raw,
             metadata=self.metadata,
-            request_options=request_options,
+            request_options=self._get_request_options(),
+        )
+
+    def _aget_prompt_event_stream(self) -> AsyncIterator[ExecutePromptEvent]:
+        return self._context.async_vellum_client.execute_prompt_stream(
+            inputs=self._compile_prompt_inputs(),
+            prompt_deployment_id=str(self.deployment) if isinstance(self.deployment, UUID) else None,
+            prompt_deployment_name=self.deployment if isinstance(self.deployment, str) else None,
+            release_tag=self.release_tag,
+            external_id=self.external_id,
+            expand_meta=self.expand_meta,
+            raw_overrides=self.raw_overrides,
+            expand_raw=self.expand_raw,
+            metadata=self.metadata,
+            request_options=self._get_request_options(),
         )
 
+    def _get_request_options(self) -> RequestOptions:
+        current_parent_context = get_parent_context()
+        parent_context = current_parent_context.model_dump() if current_parent_context else None
+        request_options = self.request_options or RequestOptions()
+        request_options["additional_body_parameters"] = {
+            "execution_context": {"parent_context": parent_context},
+            **request_options.get("additional_body_parameters", {}),
+        }
+        return request_options
+
+    def _get_prompt_response_cache_key_value(self) -> Optional[Any]:
+        # The external id and metadata are only used to track executions, so they don't change the response
+        return {
+            "deployment": str(self.deployment),
+            "release_tag": self.release_tag,
+            "inputs": self._compile_prompt_inputs(),
+            "expand_meta": None if self.expand_meta is OMIT else self.expand_meta,
+            "raw_overrides": None if self.raw_overrides is OMIT else self.raw_overrides,
+            "expand_raw": None if self.expand_raw is OMIT else self.expand_raw,
+        }
+
     def _compile_prompt_inputs(self) -> List[PromptDeploymentInputRequest]:
         # TODO: We may want to consolidate with subworkflow deployment input compilation
         # https://app.shortcut.com/vellum/story/4117
@@ -1,6 +1,7 @@
+from contextlib import contextmanager
 from decimal import Decimal
 from uuid import UUID
-from typing import ClassVar, Generic, List, Optional, Union
+from typing import ClassVar, Generic, Iterator, List, Optional, Union
 
 from vellum import (
     NotFoundError,
@@ -14,7 +15,7 @@ from vellum import (
 from vellum.core import ApiError, RequestOptions
 from vellum.workflows.errors import WorkflowErrorCode
 from vellum.workflows.exceptions import NodeException
-from vellum.workflows.nodes.bases import BaseNode
+from vellum.workflows.nodes.bases import BaseAsyncNode
 from vellum.workflows.outputs import BaseOutputs
 from vellum.workflows.types.generics import StateType
 
@@ -26,7 +27,7 @@ def get_default_results_merging() -> SearchResultMergingRequest:
     return SearchResultMergingRequest(enabled=True)
 
 
-class BaseSearchNode(BaseNode[StateType], Generic[StateType]):
+class BaseSearchNode(BaseAsyncNode[StateType], Generic[StateType]):
     """
     Used to perform a hybrid search against a Document Index in Vellum.
 
@@ -73,13 +74,27 @@ class BaseSearchNode(BaseNode[StateType], Generic[StateType]):
         results: List[SearchResult]
 
     def _perform_search(self) -> SearchResponse:
-        try:
+        with self._handle_search_errors():
             return self._context.vellum_client.search(
                 query=self.query,
                 index_id=str(self.document_index) if isinstance(self.document_index, UUID) else None,
                 index_name=self.document_index if isinstance(self.document_index, str) else None,
                 options=self.options,
             )
+
+    async def _aperform_search(self) -> SearchResponse:
+        with self._handle_search_errors():
+            return await self._context.async_vellum_client.search(
+                query=self.query,
+                index_id=str(self.document_index) if isinstance(self.document_index, UUID) else None,
+                index_name=self.document_index if isinstance(self.document_index, str) else None,
+                options=self.options,
+            )
+
+    @contextmanager
+    def _handle_search_errors(self) -> Iterator[None]:
+        try:
+            yield
         except NotFoundError:
             raise NodeException(
                 message=f"Document Index '{self.document_index}' not found",
@@ -94,3 +109,7 @@ class BaseSearchNode(BaseNode[StateType], Generic[StateType]):
     def run(self) -> Outputs:
         response = self._perform_search()
         return self.Outputs(results=response.results)
+
+    async def arun(self) -> Outputs:
+        response = await self._aperform_search()
+        return self.Outputs(results=response.results)
@@ -1,7 +1,6 @@
-from typing import Iterator
+from typing import AsyncIterator, Iterator, List, Optional, cast
 
-from vellum.workflows.errors import WorkflowErrorCode
-from vellum.workflows.exceptions import NodeException
+from vellum import PromptOutput
 from vellum.workflows.nodes.displayable.bases import BasePromptDeploymentNode as BasePromptDeploymentNode
 from vellum.workflows.outputs import BaseOutput
 from vellum.workflows.types.generics import StateType
@@ -21,6 +20,8 @@ class PromptDeploymentNode(BasePromptDeploymentNode[StateType]):
     expand_raw: Optional[Sequence[str]] - Expandable raw fields to include in the response
     metadata: Optional[Dict[str, Optional[Any]]] - The metadata to use for the Prompt Execution
     request_options: Optional[RequestOptions] - The request options to use for the Prompt Execution
+    bypass_response_cache: bool = False - Whether to always execute the Prompt, even if the Workflow's context
+        has a `prompt_response_cache`
     """
 
     class Outputs(BasePromptDeploymentNode.Outputs):
@@ -34,19 +35,13 @@ class PromptDeploymentNode(BasePromptDeploymentNode[StateType]):
 
     def run(self) -> Iterator[BaseOutput]:
         outputs = yield from self._process_prompt_event_stream()
-        if not outputs:
-            raise NodeException(
-                message="Expected to receive outputs from Prompt",
-                code=WorkflowErrorCode.INTERNAL_ERROR,
-            )
-
-        string_output = next((output for output in outputs if output.type == "STRING"), None)
-        if not string_output or string_output.value is None:
-            output_types = {output.type for output in outputs}
-            is_plural = len(output_types) > 1
-            raise NodeException(
-                message=f"Expected to receive a non-null string output from Prompt. Only found outputs of type{'s' if is_plural else ''}: {', '.join(output_types)}",  # noqa: E501
-                code=WorkflowErrorCode.INTERNAL_ERROR,
-            )
-
-        yield BaseOutput(name="text", value=string_output.value)
+        yield self._get_string_output(outputs)
+
+    async def arun(self) -> AsyncIterator[BaseOutput]:
+        outputs: Optional[List[PromptOutput]] = None
+        async for output in self._aprocess_prompt_event_stream():
+            if output.is_fulfilled:
+                outputs = cast(List[PromptOutput], output.value)
+            yield output
+
+        yield self._get_string_output(outputs)
@@ -32,3 +32,8 @@ class SearchNode(BaseSearchNode[StateType]):
         results = self._perform_search().results
         text = self.chunk_separator.join([r.text for r in results])
         return self.Outputs(results=results, text=text)
+
+    async def arun(self) -> Outputs:
+        results = (await self._aperform_search()).results
+        text = self.chunk_separator.join([r.text for r in results])
+        return self.Outputs(results=results, text=text)
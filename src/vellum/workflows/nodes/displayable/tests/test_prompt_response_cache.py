@@ -0,0 +1,175 @@
+from uuid import uuid4
+from typing import Any, Iterator, List
+
+from vellum import (
+    ExecutePromptEvent,
+    FulfilledExecutePromptEvent,
+    InitiatedExecutePromptEvent,
+    RejectedExecutePromptEvent,
+    StringVellumValue,
+    VellumError,
+)
+from vellum.workflows.caches.in_memory import InMemoryCache
+from vellum.workflows.inputs import BaseInputs
+from vellum.workflows.nodes import InlinePromptNode, PromptDeploymentNode
+from vellum.workflows.state import BaseState
+from vellum.workflows.state.base import StateMeta
+from vellum.workflows.state.context import WorkflowContext
+from vellum.workflows.workflows.base import BaseWorkflow
+
+
+class Inputs(BaseInputs):
+    question: str
+
+
+class MyInlinePromptNode(InlinePromptNode):
+    ml_model = "gpt-4o"
+    prompt_inputs = {"question": Inputs.question}
+    blocks = []
+
+
+class InlinePromptWorkflow(BaseWorkflow[Inputs, BaseState]):
+    graph = MyInlinePromptNode
+
+    class Outputs(BaseWorkflow.Outputs):
+        text = MyInlinePromptNode.Outputs.text
+
+
+def generate_prompt_events(*args: Any, **kwargs: Any) -> Iterator[ExecutePromptEvent]:
+    execution_id = str(uuid4())
+    question = kwargs["input_values"][0].value if "input_values" in kwargs else kwargs["inputs"][0].value
+    events: List[ExecutePromptEvent] = [
+        InitiatedExecutePromptEvent(execution_id=execution_id),
+        FulfilledExecutePromptEvent(
+            execution_id=execution_id,
+            outputs=[StringVellumValue(value=f"Answer to: {question}")],
+        ),
+    ]
+    yield from events
+
+
+def test_prompt_response_cache__skips_prompt_with_same_request(vellum_adhoc_prompt_client):
+    # GIVEN a workflow whose context caches prompt responses
+    vellum_adhoc_prompt_client.adhoc_execute_prompt_stream.side_effect = generate_prompt_events
+    context = WorkflowContext(prompt_response_cache=InMemoryCache())
+
+    # WHEN we stream it twice with the same inputs
+    first_events = list(InlinePromptWorkflow(context=context).stream(inputs=Inputs(question="Why?")))
+    second_events = list(InlinePromptWorkflow(context=context).stream(inputs=Inputs(question="Why?")))
+
+    # THEN the prompt should only have been executed the first time
+    assert vellum_adhoc_prompt_client.adhoc_execute_prompt_stream.call_count == 1
+
+    # AND both runs should have been fulfilled with the same outputs
+    assert first_events[-1].name == "workflow.execution.fulfilled", first_events[-1]
+    assert second_events[-1].name == "workflow.execution.fulfilled", second_events[-1]
+    assert first_events[-1].outputs.text == "Answer to: Why?"
+    assert second_events[-1].outputs.text == "Answer to: Why?"
+
+    # AND running the node again should replay the cached response as a stream
+    node = MyInlinePromptNode(
+        state=BaseState(meta=StateMeta(workflow_inputs=Inputs(question="Why?"))),
+        context=context,
+    )
+    outputs = list(node.run())
+    assert [output.delta for output in outputs if output.is_streaming] == ["Answer to: Why?"]
+    assert outputs[-1].name == "text"
+    assert outputs[-1].value == "Answer to: Why?"
+    assert vellum_adhoc_prompt_client.adhoc_execute_prompt_stream.call_count == 1
+
+
+def test_prompt_response_cache__executes_prompt_with_different_inputs(vellum_adhoc_prompt_client):
+    # GIVEN a workflow whose context caches prompt responses
+    vellum_adhoc_prompt_client.adhoc_execute_prompt_stream.side_effect = generate_prompt_events
+    context = WorkflowContext(prompt_response_cache=InMemoryCache())
+
+    # WHEN we run it with different inputs
+    first_event = InlinePromptWorkflow(context=context).run(inputs=Inputs(question="Why?"))
+    second_event = InlinePromptWorkflow(context=context).run(inputs=Inputs(question="How?"))
+
+    # THEN the prompt should have been executed both times
+    assert vellum_adhoc_prompt_client.adhoc_execute_prompt_stream.call_count == 2
+    assert first_event.name == "workflow.execution.fulfilled", first_event
+    assert second_event.name == "workflow.execution.fulfilled", second_event
+    assert first_event.outputs.text == "Answer to: Why?"
+    assert second_event.outputs.text == "Answer to: How?"
+
+
+def test_prompt_response_cache__bypass(vellum_adhoc_prompt_client):
+    # GIVEN a prompt node that bypasses the response cache
+    class BypassPromptNode(MyInlinePromptNode):
+        bypass_response_cache = True
+
+    class BypassWorkflow(BaseWorkflow[Inputs, BaseState]):
+        graph = BypassPromptNode
+
+        class Outputs(BaseWorkflow.Outputs):
+            text = BypassPromptNode.Outputs.text
+
+    # AND a workflow context that caches prompt responses
+    vellum_adhoc_prompt_client.adhoc_execute_prompt_stream.side_effect = generate_prompt_events
+    context = WorkflowContext(prompt_response_cache=InMemoryCache())
+
+    # WHEN we run it twice with the same inputs
+    BypassWorkflow(context=context).run(inputs=Inputs(question="Why?"))
+    terminal_event = BypassWorkflow(context=context).run(inputs=Inputs(question="Why?"))
+
+    # THEN the prompt should have been executed both times
+    assert vellum_adhoc_prompt_client.adhoc_execute_prompt_stream.call_count == 2
+    assert terminal_event.name == "workflow.execution.fulfilled", terminal_event
+    assert terminal_event.outputs.text == "Answer to: Why?"
+
+
+def test_prompt_response_cache__rejected_responses_are_not_cached(vellum_adhoc_prompt_client):
+    # GIVEN a prompt that fails the first time it's executed
+    def generate_rejected_prompt_events(*args: Any, **kwargs: Any) -> Iterator[ExecutePromptEvent]:
+        execution_id = str(uuid4())
+        yield InitiatedExecutePromptEvent(execution_id=execution_id)
+        yield RejectedExecutePromptEvent(
+            execution_id=execution_id,
+            error=VellumError(message="OpenAI failed", code="PROVIDER_ERROR"),
+        )
+
+    vellum_adhoc_prompt_client.adhoc_execute_prompt_stream.side_effect = [
+        generate_rejected_prompt_events(),
+        generate_prompt_events(input_values=[StringVellumValue(value="Why?")]),
+    ]
+    context = WorkflowContext(prompt_response_cache=InMemoryCache())
+
+    # WHEN we run the workflow twice with the same inputs
+    first_event = InlinePromptWorkflow(context=context).run(inputs=Inputs(question="Why?"))
+    second_event = InlinePromptWorkflow(context=context).run(inputs=Inputs(question="Why?"))
+
+    # THEN the first run should have been rejected
+    assert first_event.name == "workflow.execution.rejected", first_event
+
+    # AND the second should have executed the prompt again
+    assert second_event.name == "workflow.execution.fulfilled", second_event
+    assert second_event.outputs.text == "Answer to: Why?"
+    assert vellum_adhoc_prompt_client.adhoc_execute_prompt_stream.call_count == 2
+
+
+def test_prompt_response_cache__prompt_deployment_node(vellum_client):
+    # GIVEN a workflow with a prompt deployment node
+    class MyPromptDeploymentNode(PromptDeploymentNode):
+        deployment = "my-deployment"
+        prompt_inputs = {"question": Inputs.question}
+
+    class DeploymentWorkflow(BaseWorkflow[Inputs, BaseState]):
+        graph = MyPromptDeploymentNode
+
+        class Outputs(BaseWorkflow.Outputs):
+            text = MyPromptDeploymentNode.Outputs.text
+
+    # AND a context that caches prompt responses
+    vellum_client.execute_prompt_stream.side_effect = generate_prompt_events
+    context = WorkflowContext(prompt_response_cache=InMemoryCache())
+
+    # WHEN we run it twice with the same inputs
+    DeploymentWorkflow(context=context).run(inputs=Inputs(question="Why?"))
+    terminal_event = DeploymentWorkflow(context=context).run(inputs=Inputs(question="Why?"))
+
+    # THEN the prompt deployment should only have been executed once
+    assert vellum_client.execute_prompt_stream.call_count == 1
+    assert terminal_event.name == "workflow.execution.fulfilled", terminal_event
+    assert terminal_event.outputs.text == "Answer to: Why?"
@@ -15,6 +15,7 @@ from vellum.workflows.inputs import BaseInputs
 from vellum.workflows.nodes.displayable.search_node import SearchNode as BaseSearchNode
 from vellum.workflows.state import BaseState
 from vellum.workflows.state.base import StateMeta
+from vellum.workflows.state.context import WorkflowContext
 
 
 @pytest.fixture
@@ -131,3 +132,36 @@ witness or missing person.\
             ),
         ),
     )
+
+
+async def test_search_node_wth_text_output__arun(mocker):
+    """Confirm that SearchNodes search with the async client when run on an event loop."""
+
+    # GIVEN a node that subclasses SearchNode
+    class SearchNode(BaseSearchNode):
+        query = "How often is employee training?"
+        document_index = "vellum-trust-center-policies"
+
+    # AND an async Vellum client whose search returns a known result
+    expected_results = [
+        SearchResult(
+            text="Employees are trained annually.",
+            score=0.8,
+            keywords=[],
+            document=SearchResultDocument(label="Training Policy.pdf", metadata={}),
+        ),
+    ]
+    async_vellum_client = mocker.Mock()
+    async_vellum_client.search = mocker.AsyncMock(return_value=SearchResponse(results=expected_results))
+
+    # WHEN the node is run on the event loop
+    node = SearchNode(state=BaseState(), context=WorkflowContext(_async_vellum_client=async_vellum_client))
+    outputs = await node.arun()
+
+    # THEN the node should have produced the outputs we expect
+    assert outputs.text == "Employees are trained annually."
+    assert outputs.results == expected_results
+
+    # AND we should have searched with the async client
+    async_vellum_client.search.assert_awaited_once()
+    assert async_vellum_client.search.call_args.kwargs["index_name"] == "vellum-trust-center-policies"
@@ -1,5 +1,5 @@
 from uuid import uuid4
-from typing import Any, Iterator, List
+from typing import Any, AsyncIterator, Iterator, List
 
 from vellum import (
     ExecutePromptEvent,
@@ -13,6 +13,7 @@ from vellum.workflows.inputs import BaseInputs
 from vellum.workflows.nodes import PromptDeploymentNode
 from vellum.workflows.state import BaseState
 from vellum.workflows.state.base import StateMeta
+from vellum.workflows.state.context import WorkflowContext
 
 
 def test_text_prompt_deployment_node__basic(vellum_client):
@@ -77,3 +78,39 @@ def test_text_prompt_deployment_node__basic(vellum_client):
         release_tag="LATEST",
         request_options={"additional_body_parameters": {"execution_context": {"parent_context": None}}},
     )
+
+
+async def test_text_prompt_deployment_node__arun(mocker):
+    """Confirm that TextPromptDeploymentNodes stream the prompt execution with the async client when run on a loop."""
+
+    # GIVEN a node that subclasses TextPromptDeploymentNode
+    class MyPromptDeploymentNode(PromptDeploymentNode):
+        deployment = "my-deployment"
+        prompt_inputs = {}
+
+    # AND an async Vellum client that streams a known response
+    expected_outputs: List[PromptOutput] = [
+        StringVellumValue(value="Hello, world!"),
+    ]
+
+    async def generate_prompt_events(*args: Any, **kwargs: Any) -> AsyncIterator[ExecutePromptEvent]:
+        execution_id = str(uuid4())
+        yield InitiatedExecutePromptEvent(execution_id=execution_id)
+        yield FulfilledExecutePromptEvent(execution_id=execution_id, outputs=expected_outputs)
+
+    async_vellum_client = mocker.Mock()
+    async_vellum_client.execute_prompt_stream.side_effect = generate_prompt_events
+
+    # WHEN the node is run on the event loop
+    node = MyPromptDeploymentNode(
+        state=BaseState(),
+        context=WorkflowContext(_async_vellum_client=async_vellum_client),
+    )
+    outputs = [o async for o in node.arun()]
+
+    # THEN the node should have produced the same outputs it does when run synchronously
+    assert [(o.name, o.value) for o in outputs] == [("results", expected_outputs), ("text", "Hello, world!")]
+
+    # AND the prompt execution should have been streamed with the async client
+    async_vellum_client.execute_prompt_stream.assert_called_once()
+    assert async_vellum_client.execute_prompt_stream.call_args.kwargs["prompt_deployment_name"] == "my-deployment"
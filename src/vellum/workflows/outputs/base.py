@@ -7,7 +7,7 @@ from pydantic_core import core_schema
 from vellum.workflows.constants import UNDEF
 from vellum.workflows.descriptors.base import BaseDescriptor
 from vellum.workflows.references.output import OutputReference
-from vellum.workflows.types.utils import get_class_attr_names, infer_types
+from vellum.workflows.types.utils import TypeCacheMeta, get_class_attr_names, infer_types
 
 if TYPE_CHECKING:
     from vellum.workflows.nodes.bases.base import BaseNode
@@ -96,12 +96,16 @@ class BaseOutput(Generic[_Delta, _Accumulated]):
 
 
 @dataclass_transform(kw_only_default=True)
-class _BaseOutputsMeta(type):
+class _BaseOutputsMeta(TypeCacheMeta):
     def __eq__(cls, other: Any) -> bool:
         """
         We need to include custom eq logic to prevent infinite loops during ipython reloading.
         """
 
+        # Output references are compared on every lookup of a node's outputs, so we skip the checks below when we can
+        if cls is other:
+            return True
+
         if not isinstance(other, _BaseOutputsMeta):
             return False
 
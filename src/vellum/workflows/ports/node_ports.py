@@ -1,4 +1,4 @@
-from typing import Any, Dict, Iterator, Optional, Set, Tuple, Type
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Type
 
 from vellum.workflows.outputs.base import BaseOutput, BaseOutputs
 from vellum.workflows.ports.port import Port
@@ -17,6 +17,21 @@ class _NodePortsMeta(type):
 
         return super().__new__(mcs, name, bases, dct)
 
+    def __setattr__(cls, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if not name.startswith("_"):
+            cls._invalidate_validated_ports()
+
+    def __delattr__(cls, name: str) -> None:
+        super().__delattr__(name)
+        if not name.startswith("_"):
+            cls._invalidate_validated_ports()
+
+    def _invalidate_validated_ports(cls) -> None:
+        # Only a class' own ports are validated together, so its subclasses are unaffected
+        if "_validated_ports" in cls.__dict__:
+            super().__delattr__("_validated_ports")
+
     def __iter__(cls) -> Iterator[Port]:
         for attr_name, attr_value in cls.__dict__.items():
             if not attr_name.startswith("_") and isinstance(attr_value, Port):
@@ -33,14 +48,15 @@ class _NodePortsMeta(type):
 
 
 class NodePorts(metaclass=_NodePortsMeta):
+    _validated_ports: Optional[Tuple[List[Port], bool]] = None
+
     def __call__(self, outputs: BaseOutputs, state: BaseState) -> Set[Port]:
         """
         Invokes the appropriate ports based on the fulfilled outputs and state.
         """
 
         invoked_ports: Set[Port] = set()
-        all_ports = [port for port in self.__class__]
-        enforce_single_invoked_conditional_port = validate_ports(all_ports)
+        all_ports, enforce_single_invoked_conditional_port = self._get_validated_ports()
 
         for port in all_ports:
             if port._condition_type == ConditionType.IF:
@@ -67,6 +83,17 @@ class NodePorts(metaclass=_NodePortsMeta):
 
         return invoked_ports
 
+    @classmethod
+    def _get_validated_ports(cls) -> Tuple[List[Port], bool]:
+        # Ports are only validated the first time they are invoked, and again after a port is set or deleted
+        validated_ports = cls.__dict__.get("_validated_ports")
+        if validated_ports is None:
+            all_ports = [port for port in cls]
+            validated_ports = (all_ports, validate_ports(all_ports))
+            cls._validated_ports = validated_ports
+
+        return validated_ports
+
     def __lt__(self, output: BaseOutput) -> Set[Port]:
         """
         Invokes the appropriate ports based on the streamed output
@@ -1,9 +1,11 @@
-from typing import TYPE_CHECKING, Any, Iterator, List, Optional, Type
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Optional, Type
 
+from orderly_set import OrderedSet
 from pydantic import GetCoreSchemaHandler
 from pydantic_core import core_schema
 
 from vellum.workflows.descriptors.base import BaseDescriptor
+from vellum.workflows.descriptors.utils import compile_value
 from vellum.workflows.edges.edge import Edge
 from vellum.workflows.graph import Graph, GraphTarget
 from vellum.workflows.state.base import BaseState
@@ -16,9 +18,10 @@ if TYPE_CHECKING:
 class Port:
     node_class: Type["BaseNode"]
 
-    _edges: List[Edge]
+    _edges: OrderedSet[Edge]
     _condition: Optional[BaseDescriptor]
     _condition_type: Optional[ConditionType]
+    _compiled_condition: Optional[Callable[[BaseState], Any]]
 
     def __init__(
         self,
@@ -30,9 +33,10 @@ class Port:
         self.default = default
         self.node_class = None  # type: ignore[assignment]
         self._fork_state = fork_state
-        self._edges = []
+        self._edges = OrderedSet()
         self._condition: Optional[BaseDescriptor] = condition
         self._condition_type: Optional[ConditionType] = condition_type
+        self._compiled_condition = None
 
     def __set_name__(self, owner: Type, name: str) -> None:
         self.name = name
@@ -64,8 +68,7 @@ class Port:
             return Graph.from_port(self) >> Graph.from_port(other)
 
         edge = Edge(from_port=self, to_node=other)
-        if edge not in self._edges:
-            self._edges.append(edge)
+        self._edges.add(edge)
 
         return Graph.from_edge(edge)
 
@@ -85,7 +88,11 @@ class Port:
         if self._condition is None:
             return False
 
-        value = self._condition.resolve(state)
+        # Conditions are compiled on first use, since they are evaluated each time the node is fulfilled
+        if self._compiled_condition is None:
+            self._compiled_condition = compile_value(self._condition)
+
+        value = self._compiled_condition(state)
         return bool(value)
 
     def serialize(self) -> dict:
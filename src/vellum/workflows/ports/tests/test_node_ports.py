@@ -0,0 +1,139 @@
+import pytest
+
+from vellum.workflows.expressions.and_ import AndExpression
+from vellum.workflows.expressions.between import BetweenExpression
+from vellum.workflows.expressions.equals import EqualsExpression
+from vellum.workflows.expressions.less_than import LessThanExpression
+from vellum.workflows.inputs.base import BaseInputs
+from vellum.workflows.nodes.bases.base import BaseNode
+from vellum.workflows.ports.port import Port
+from vellum.workflows.references import LazyReference
+from vellum.workflows.state.base import BaseState
+from vellum.workflows.workflows.base import BaseWorkflow
+
+
+class State(BaseState):
+    counter = 0
+    mode = "loop"
+
+
+class CounterNode(BaseNode[State]):
+    counter = LazyReference(lambda: CounterNode.Outputs.counter.coalesce(0))
+
+    class Outputs(BaseNode.Outputs):
+        counter: int
+
+    def run(self) -> Outputs:
+        return self.Outputs(counter=self.counter + 1)
+
+
+class LoopNode(BaseNode[State]):
+    class Ports(BaseNode.Ports):
+        loop = Port.on_if(
+            CounterNode.Outputs.counter.less_than(200)
+            & State.mode.equals("loop")
+            & CounterNode.Outputs.counter.between(0, 1000)
+        )
+        exit = Port.on_else()
+
+
+class ExitNode(BaseNode):
+    class Outputs(BaseNode.Outputs):
+        counter = CounterNode.Outputs.counter
+
+
+class LoopHeavyWorkflow(BaseWorkflow[BaseInputs, State]):
+    graph = CounterNode >> {
+        LoopNode.Ports.loop >> CounterNode,
+        LoopNode.Ports.exit >> ExitNode,
+    }
+
+    class Outputs(BaseWorkflow.Outputs):
+        counter = ExitNode.Outputs.counter
+
+
+def test_node_ports__loop_heavy_workflow():
+    # GIVEN a workflow that loops many times on a port condition
+    workflow = LoopHeavyWorkflow()
+
+    # WHEN we run the workflow
+    terminal_event = workflow.run()
+
+    # THEN the condition should have been evaluated on every iteration
+    assert terminal_event.name == "workflow.execution.fulfilled", terminal_event
+    assert terminal_event.outputs.counter == 200
+
+
+def test_node_ports__compiles_conditions_once():
+    # GIVEN a port whose condition has been evaluated once
+    state = State()
+    state.meta.node_outputs[CounterNode.Outputs.counter] = 5
+    assert LoopNode.Ports()(LoopNode.Outputs(), state) == {LoopNode.Ports.loop}
+    compiled_condition = LoopNode.Ports.loop._compiled_condition
+
+    # WHEN we evaluate it against a different state
+    state.meta.node_outputs[CounterNode.Outputs.counter] = 500
+    invoked_ports = LoopNode.Ports()(LoopNode.Outputs(), state)
+
+    # THEN the compiled condition should have been reused
+    assert LoopNode.Ports.loop._compiled_condition is compiled_condition
+
+    # AND it should have been evaluated against the new state
+    assert invoked_ports == {LoopNode.Ports.exit}
+
+
+def test_node_ports__invalid_ports_are_rejected_on_every_call():
+    # GIVEN a node whose ports are out of order
+    class InvalidNode(BaseNode):
+        class Ports(BaseNode.Ports):
+            exit = Port.on_else()
+            loop = Port.on_if(State.mode.equals("loop"))
+
+    # WHEN we invoke its ports twice
+    # THEN both calls should be rejected
+    for _ in range(2):
+        with pytest.raises(ValueError) as exc_info:
+            InvalidNode.Ports()(InvalidNode.Outputs(), State())
+
+        assert str(exc_info.value) == "Port conditions must be in the following order: on_if, on_elif, on_else"
+
+
+def test_node_ports__compiled_condition_does_not_walk_the_expression_tree(mocker):
+    # GIVEN a port condition typical of a loop, that has already been compiled
+    state = State()
+    state.meta.node_outputs[CounterNode.Outputs.counter] = 5
+    assert LoopNode.Ports.loop.resolve_condition(state) is True
+
+    # AND spies on how each of the condition's expressions resolves when it isn't compiled
+    resolve_spies = [
+        mocker.patch.object(expression_class, "resolve")
+        for expression_class in [AndExpression, LessThanExpression, EqualsExpression, BetweenExpression]
+    ]
+
+    # WHEN we evaluate it against a different state
+    state.meta.node_outputs[CounterNode.Outputs.counter] = 500
+
+    # THEN it should have been evaluated against the new state
+    assert LoopNode.Ports.loop.resolve_condition(state) is False
+
+    # AND without resolving any of its expressions one by one
+    for resolve_spy in resolve_spies:
+        resolve_spy.assert_not_called()
+
+
+def test_node_ports__revalidated_when_a_port_is_set():
+    # GIVEN a node with a single conditional port, that has already been invoked
+    class MyNode(BaseNode):
+        class Ports(BaseNode.Ports):
+            loop = Port.on_if(State.mode.equals("loop"))
+
+    state = State()
+    state.mode = "exit"
+    assert MyNode.Ports()(MyNode.Outputs(), state) == set()
+
+    # WHEN an else port is added to it after the fact
+    exit_port = Port.on_else()
+    MyNode.Ports.exit = exit_port  # type: ignore[attr-defined]
+
+    # THEN it should be invoked the next time the ports are
+    assert MyNode.Ports()(MyNode.Outputs(), state) == {exit_port}
@@ -1,5 +1,14 @@
+from .async_runner import AsyncWorkflowRunner
+from .executor import WorkflowExecutor, get_default_executor, set_default_executor
+from .process_executor import get_default_process_executor, set_default_process_executor
 from .runner import WorkflowRunner
 
 __all__ = [
+    "AsyncWorkflowRunner",
+    "WorkflowExecutor",
     "WorkflowRunner",
+    "get_default_executor",
+    "get_default_process_executor",
+    "set_default_executor",
+    "set_default_process_executor",
 ]
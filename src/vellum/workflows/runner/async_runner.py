@@ -0,0 +1,172 @@
+import asyncio
+from queue import Empty, Queue
+from uuid import UUID
+from typing import Any, AsyncIterator, Dict, Optional, Set, Union
+
+from vellum.workflows.context import execution_context, get_parent_context
+from vellum.workflows.errors import WorkflowError
+from vellum.workflows.events.types import ParentContext
+from vellum.workflows.events.workflow import AsyncWorkflowEventStream
+from vellum.workflows.nodes.bases import BaseAsyncNode, BaseNode
+from vellum.workflows.outputs.base import BaseOutput, BaseOutputs
+from vellum.workflows.runner.runner import WorkflowRunner
+from vellum.workflows.types.core import ExecutionMode
+from vellum.workflows.types.generics import StateType
+
+
+class _AsyncWakeupQueue(Queue):
+    """
+    A thread-safe queue that can also be awaited on from an event loop. Producers can live on any thread, including
+    the event loop's own.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+
+    def bind(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._loop = loop
+        self._wakeup = asyncio.Event()
+
+    def put(self, item: Any, block: bool = True, timeout: Optional[float] = None) -> None:
+        super().put(item, block=block, timeout=timeout)
+        if self._loop and self._wakeup and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    async def async_get(self) -> Any:
+        if not self._wakeup:
+            raise RuntimeError("Queue must be bound to an event loop before awaiting on it")
+
+        while True:
+            try:
+                return self.get_nowait()
+            except Empty:
+                # Wakeups are always scheduled on the loop, so one can't be lost between this clear and the wait
+                self._wakeup.clear()
+                await self._wakeup.wait()
+
+
+class AsyncWorkflowRunner(WorkflowRunner[StateType]):
+    """
+    Runs a Workflow on an asyncio event loop. The `arun` of each BaseAsyncNode, which includes the built-in Prompt,
+    Search and API nodes, is run as a task on the loop, so that any number of I/O-bound nodes can run concurrently
+    without a thread each. All other nodes are run on the Workflow's executor, like the WorkflowRunner runs them, so
+    that they're bounded by its `max_workers`.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+
+        self._workflow_event_queue: _AsyncWakeupQueue = _AsyncWakeupQueue()
+        self.workflow.context._register_event_queue(self._workflow_event_queue)
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._tasks: Set["asyncio.Task[None]"] = set()
+
+    def _submit_work_item(
+        self, node: BaseNode[StateType], span_id: UUID, parent_context: Optional[ParentContext]
+    ) -> None:
+        if not self._loop:
+            raise RuntimeError("AsyncWorkflowRunner can only schedule nodes while streaming")
+
+        # Nodes run in a separate process block while they wait on it, so they're run on the executor instead
+        if isinstance(node, BaseAsyncNode) and node.Execution.mode != ExecutionMode.PROCESS:
+            task = self._loop.create_task(self._arun_work_item(node, span_id, parent_context))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+            return
+
+        # Their events wake the loop up through the event queue, so there's nothing to await on here
+        super()._submit_work_item(node, span_id, parent_context)
+
+    async def _arun_work_item(
+        self, node: BaseAsyncNode[StateType], span_id: UUID, parent_context: Optional[ParentContext]
+    ) -> None:
+        if parent_context is None:
+            parent_context = get_parent_context() or self._parent_context
+
+        with execution_context(parent_context=parent_context):
+            parent_context = get_parent_context()
+            self._initiate_node_execution(node, span_id, parent_context)
+
+            try:
+                ports = node.Ports()
+                cache_key, outputs = self._get_cached_node_outputs(node, span_id, parent_context)
+                if outputs is None:
+                    updated_parent_context = self._get_node_parent_context(node, span_id, parent_context)
+                    with execution_context(parent_context=updated_parent_context):
+                        node_arun_response = node.arun()
+                        node_run_response: Union[BaseOutputs, AsyncIterator[BaseOutput]] = (
+                            node_arun_response
+                            if isinstance(node_arun_response, AsyncIterator)
+                            else await node_arun_response
+                        )
+
+                    outputs = self._get_node_outputs(node, node_run_response)
+                    if isinstance(node_run_response, AsyncIterator):
+                        streaming_output_queues: Dict[str, Queue] = {}
+                        with execution_context(parent_context=updated_parent_context):
+                            async for output in node_run_response:
+                                self._handle_node_output(node, span_id, output, outputs, ports, streaming_output_queues)
+
+                    self._cache_node_outputs(node, cache_key, outputs)
+
+                self._fulfill_node_execution(node, span_id, outputs, ports, parent_context)
+            except Exception as e:
+                self._reject_node_execution(node, span_id, e, parent_context)
+
+    async def astream(self) -> AsyncWorkflowEventStream:
+        self._loop = asyncio.get_running_loop()
+        self._workflow_event_queue.bind(self._loop)
+        self._start_background_threads()
+
+        try:
+            yield self._emit_event(self._start_workflow_event())
+
+            rejection_event = self._start_entrypoints()
+            if rejection_event:
+                yield self._emit_event(rejection_event)
+                return
+
+            current_parent = self._get_workflow_parent_context()
+            rejection_error: Optional[WorkflowError] = None
+
+            while self._active_nodes_by_execution_id:
+                event = await self._workflow_event_queue.async_get()
+                yield self._emit_event(event)
+
+                # The Workflow was cancelled
+                if self._is_terminal_event(event):
+                    return
+
+                streaming_events = self._get_workflow_streaming_events(event)
+                with execution_context(parent_context=current_parent):
+                    rejection_error = self._handle_work_item_event(event)
+
+                for streaming_event in streaming_events:
+                    yield self._emit_event(streaming_event)
+
+                if rejection_error:
+                    break
+
+            # Handle any remaining events
+            try:
+                while not rejection_error and (event := self._workflow_event_queue.get_nowait()):
+                    yield self._emit_event(event)
+
+                    streaming_events = self._get_workflow_streaming_events(event)
+                    with execution_context(parent_context=current_parent):
+                        rejection_error = self._handle_work_item_event(event)
+
+                    for streaming_event in streaming_events:
+                        yield self._emit_event(streaming_event)
+            except Empty:
+                pass
+
+            yield self._emit_event(self._complete_workflow_event(rejection_error))
+        finally:
+            for task in list(self._tasks):
+                task.cancel()
+
+            self._stop_background_threads()
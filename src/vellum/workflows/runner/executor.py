@@ -0,0 +1,198 @@
+from collections import deque
+from concurrent.futures import Executor, Future
+from contextlib import contextmanager
+import itertools
+import threading
+from threading import Condition, Lock, Thread
+from typing import Any, Callable, Deque, Dict, Iterator, Optional, Set, Tuple, TypeVar
+
+_T = TypeVar("_T")
+
+DEFAULT_MAX_WORKERS = 64
+
+_WorkItem = Tuple["Future[Any]", Callable[..., Any], Tuple[Any, ...], Dict[str, Any]]
+
+# Tracks which WorkflowExecutor, if any, the current thread is running work for
+_current_worker = threading.local()
+
+
+class WorkflowExecutor(Executor):
+    """
+    A bounded thread pool used by the WorkflowRunner to run nodes. A single instance is safe to share across
+    any number of concurrent Workflow runs. Work submitted while every worker is busy is queued until one frees up.
+
+    Nodes like MapNode and TryNode block on Subworkflows whose nodes are submitted to this same pool. To avoid
+    deadlocking once every worker is blocked on a Subworkflow, a worker waiting on other work does so within
+    `blocking()`, which hands its place in the pool to another worker for as long as it waits.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, thread_name_prefix: str = "vellum-workflows") -> None:
+        self._max_workers = max_workers or DEFAULT_MAX_WORKERS
+        self._thread_name_prefix = thread_name_prefix
+        self._thread_counter = itertools.count()
+        self._condition = Condition()
+        self._work_items: Deque[_WorkItem] = deque()
+        self._threads: Set[Thread] = set()
+        # Workers running work, not counting those blocked waiting on other work
+        self._running = 0
+        self._blocked = 0
+        self._idle = 0
+        self._shutdown = False
+
+    def submit(self, fn: Callable[..., _T], /, *args: Any, **kwargs: Any) -> "Future[_T]":
+        future: Future[_T] = Future()
+        with self._condition:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new futures after shutdown")
+
+            self._work_items.append((future, fn, args, kwargs))
+            self._wake_worker()
+
+        return future
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        with self._condition:
+            self._shutdown = True
+            if cancel_futures:
+                while self._work_items:
+                    self._work_items.popleft()[0].cancel()
+
+            self._idle = 0
+            self._condition.notify_all()
+            threads = list(self._threads)
+
+        if wait:
+            for thread in threads:
+                if thread is not threading.current_thread():
+                    thread.join()
+
+    @contextmanager
+    def _blocking(self) -> Iterator[None]:
+        with self._condition:
+            self._running -= 1
+            self._blocked += 1
+            if self._work_items:
+                self._wake_worker()
+
+        try:
+            yield
+        finally:
+            # We take our place back even if it puts the pool over its limit for a moment, since waiting for a
+            # worker to free up could deadlock on the very work we were waiting on
+            with self._condition:
+                self._blocked -= 1
+                self._running += 1
+
+    def _wake_worker(self) -> None:
+        # Must be called while holding the condition's lock
+        if self._running >= self._max_workers:
+            return
+
+        if self._idle:
+            self._idle -= 1
+            self._condition.notify()
+        elif len(self._threads) < self._max_workers + self._blocked:
+            thread = Thread(
+                target=self._work,
+                name=f"{self._thread_name_prefix}_{next(self._thread_counter)}",
+                daemon=True,
+            )
+            self._threads.add(thread)
+            thread.start()
+
+    def _next_work_item(self) -> Optional[_WorkItem]:
+        with self._condition:
+            while not self._work_items or self._running >= self._max_workers:
+                # Workers started to stand in for blocked ones exit once they're no longer needed
+                if self._shutdown or len(self._threads) > self._max_workers + self._blocked:
+                    self._threads.discard(threading.current_thread())
+                    return None
+
+                self._idle += 1
+                self._condition.wait()
+
+            self._running += 1
+            return self._work_items.popleft()
+
+    def _work(self) -> None:
+        _current_worker.executor = self
+        while work_item := self._next_work_item():
+            future, fn, args, kwargs = work_item
+            try:
+                if future.set_running_or_notify_cancel():
+                    try:
+                        result = fn(*args, **kwargs)
+                    except BaseException as e:
+                        future.set_exception(e)
+                    else:
+                        future.set_result(result)
+            finally:
+                with self._condition:
+                    self._running -= 1
+
+            # Drop our references, so that the work's arguments can be garbage collected while we're idle
+            del future, fn, args, kwargs, work_item
+
+
+def validate_executor(executor: Optional[Executor]) -> None:
+    """
+    Raises if the given executor can't run Workflows. Nodes like MapNode and TryNode wait on Subworkflows whose nodes
+    are submitted to the same executor, which only a WorkflowExecutor can do without deadlocking once every worker is
+    waiting, so other executors such as a plain ThreadPoolExecutor are rejected.
+    """
+
+    if executor is not None and not isinstance(executor, WorkflowExecutor):
+        raise TypeError(
+            f"Workflows can only be run on a WorkflowExecutor, got {executor.__class__.__name__}. "
+            "Use WorkflowExecutor(max_workers=...) to bound the number of worker threads."
+        )
+
+
+@contextmanager
+def blocking() -> Iterator[None]:
+    """
+    Marks the current thread as blocked waiting on other work, like the nodes of a Subworkflow. If the thread is a
+    WorkflowExecutor worker, its place in the pool is handed to another worker until the block is exited.
+    """
+
+    executor: Optional[WorkflowExecutor] = getattr(_current_worker, "executor", None)
+    if executor is None or getattr(_current_worker, "is_blocked", False):
+        yield
+        return
+
+    _current_worker.is_blocked = True
+    try:
+        with executor._blocking():
+            yield
+    finally:
+        _current_worker.is_blocked = False
+
+
+_default_executor: Optional[WorkflowExecutor] = None
+_default_executor_lock = Lock()
+
+
+def get_default_executor() -> WorkflowExecutor:
+    """
+    Returns the process-wide executor used by Workflows that weren't given one explicitly.
+    """
+
+    global _default_executor
+    with _default_executor_lock:
+        if _default_executor is None:
+            _default_executor = WorkflowExecutor()
+
+        return _default_executor
+
+
+def set_default_executor(executor: Optional[WorkflowExecutor]) -> None:
+    """
+    Overrides the process-wide executor used by Workflows that weren't given one explicitly. Passing `None`
+    restores the default, lazily created WorkflowExecutor.
+    """
+
+    validate_executor(executor)
+
+    global _default_executor
+    with _default_executor_lock:
+        _default_executor = executor
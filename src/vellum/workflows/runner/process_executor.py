@@ -0,0 +1,153 @@
+from concurrent.futures import Executor, ProcessPoolExecutor
+import multiprocessing
+import pickle
+from threading import Lock
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, NamedTuple, Optional, Type, Union
+
+from vellum.workflows.errors.types import WorkflowErrorCode
+from vellum.workflows.exceptions import NodeException
+from vellum.workflows.outputs.base import BaseOutput, BaseOutputs
+from vellum.workflows.state.base import BaseState, StateMeta
+
+if TYPE_CHECKING:
+    from vellum.workflows.inputs.base import BaseInputs
+    from vellum.workflows.nodes.bases import BaseNode
+
+
+_default_process_executor: Optional[Executor] = None
+_default_process_executor_lock = Lock()
+
+
+def get_default_process_executor() -> Executor:
+    """
+    Returns the process-wide pool used to run nodes whose `Execution.mode` is `ExecutionMode.PROCESS`.
+    """
+
+    global _default_process_executor
+    with _default_process_executor_lock:
+        if _default_process_executor is None:
+            # Workers are spawned rather than forked, since forking a process with running threads can deadlock
+            _default_process_executor = ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn"))
+
+        return _default_process_executor
+
+
+def set_default_process_executor(executor: Optional[Executor]) -> None:
+    """
+    Overrides the process-wide pool used to run nodes in a separate process. Passing `None` restores the default,
+    lazily created ProcessPoolExecutor.
+    """
+
+    global _default_process_executor
+    with _default_process_executor_lock:
+        _default_process_executor = executor
+
+
+def _get_picklable_value(value: Any) -> Any:
+    # State dicts and lists are wrapped to snapshot on edit, which would drag the entire state along with them
+    if isinstance(value, dict):
+        return {key: _get_picklable_value(item) for key, item in value.items()}
+
+    if isinstance(value, list):
+        return [_get_picklable_value(item) for item in value]
+
+    return value
+
+
+def _get_state_values(state: BaseState) -> Dict[str, Any]:
+    return {
+        key: _get_picklable_value(value)
+        for key, value in vars(state).items()
+        if not key.startswith("_") and key != "meta"
+    }
+
+
+class _NodeError(NamedTuple):
+    """
+    An error raised by a node in a worker process. Exceptions are sent back as plain values, since ones that can't be
+    unpickled, like NodeException, would otherwise break the pool.
+    """
+
+    message: str
+    code: WorkflowErrorCode
+
+
+def _run_node(
+    node_class: Type["BaseNode"],
+    attributes: Dict[str, Any],
+    state_class: Type[BaseState],
+    state_values: Dict[str, Any],
+    workflow_inputs: "BaseInputs",
+) -> Union[BaseOutputs, List[BaseOutput], _NodeError]:
+    try:
+        return _run_node_outputs(node_class, attributes, state_class, state_values, workflow_inputs)
+    except NodeException as e:
+        return _NodeError(message=e.message, code=e.code)
+    except Exception as e:
+        return _NodeError(message=str(e), code=WorkflowErrorCode.INTERNAL_ERROR)
+
+
+def _run_node_outputs(
+    node_class: Type["BaseNode"],
+    attributes: Dict[str, Any],
+    state_class: Type[BaseState],
+    state_values: Dict[str, Any],
+    workflow_inputs: "BaseInputs",
+) -> Union[BaseOutputs, List[BaseOutput]]:
+    # Imported lazily to avoid a circular import, since this module is imported by the runner
+    from vellum.workflows.state.context import WorkflowContext
+
+    state = state_class(meta=StateMeta(workflow_inputs=workflow_inputs), **state_values)
+
+    # The node's attributes were already resolved in the parent process, so we skip resolving them again
+    node = node_class.__new__(node_class)
+    node.state = state
+    node._context = WorkflowContext()
+    node._inputs = MappingProxyType({})
+    for name, value in attributes.items():
+        setattr(node, name, value)
+
+    node_run_response = node.run()
+
+    if isinstance(node_run_response, Iterator):
+        return list(node_run_response)
+
+    return node_run_response
+
+
+def run_node_in_process(
+    node: "BaseNode", executor: Optional[Executor] = None
+) -> Union[BaseOutputs, Iterator[BaseOutput]]:
+    """
+    Runs a node's `run` method in a separate process, blocking until it returns. Nodes that stream their outputs
+    have them all collected in the worker process before they are replayed here.
+    """
+
+    attributes = {
+        descriptor.name: getattr(node, descriptor.name) for descriptor in node.__class__ if descriptor.instance
+    }
+    arguments = (
+        node.__class__,
+        attributes,
+        node.state.__class__,
+        _get_state_values(node.state),
+        node.state.meta.workflow_inputs,
+    )
+
+    try:
+        node_run_response = (executor or get_default_process_executor()).submit(_run_node, *arguments).result()
+    except (pickle.PicklingError, AttributeError, TypeError) as e:
+        # Errors raised by the node itself are sent back as a _NodeError, so these can only come from pickling
+        raise NodeException(
+            message=f"Node {node.__class__.__name__} could not be sent to a separate process: {e}",
+            code=WorkflowErrorCode.INVALID_INPUTS,
+        )
+
+    if isinstance(node_run_response, _NodeError):
+        raise NodeException(message=node_run_response.message, code=node_run_response.code)
+
+    if isinstance(node_run_response, list):
+        return iter(node_run_response)
+
+    return node_run_response
@@ -4,12 +4,29 @@ import logging
 from queue import Empty, Queue
 from threading import Event as ThreadingEvent, Thread
 from uuid import UUID
-from typing import TYPE_CHECKING, Any, Dict, Generic, Iterable, Iterator, Optional, Sequence, Set, Type, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
 
+from vellum.workflows.caches.utils import get_node_cache_key
 from vellum.workflows.constants import UNDEF
 from vellum.workflows.context import execution_context, get_parent_context
 from vellum.workflows.descriptors.base import BaseDescriptor
 from vellum.workflows.edges.edge import Edge
+from vellum.workflows.emitters.pipeline import EmitterPipeline
 from vellum.workflows.errors import WorkflowError, WorkflowErrorCode
 from vellum.workflows.events import (
     NodeExecutionFulfilledEvent,
@@ -24,12 +41,16 @@ from vellum.workflows.events import (
     WorkflowExecutionStreamingEvent,
 )
 from vellum.workflows.events.node import (
+    NodeExecutionCacheHitBody,
+    NodeExecutionCacheHitEvent,
+    NodeExecutionCacheMissBody,
+    NodeExecutionCacheMissEvent,
     NodeExecutionFulfilledBody,
     NodeExecutionInitiatedBody,
     NodeExecutionRejectedBody,
     NodeExecutionStreamingBody,
 )
-from vellum.workflows.events.types import BaseEvent, NodeParentContext, ParentContext, WorkflowParentContext
+from vellum.workflows.events.types import NodeParentContext, ParentContext, WorkflowParentContext
 from vellum.workflows.events.workflow import (
     WorkflowExecutionFulfilledBody,
     WorkflowExecutionInitiatedBody,
@@ -46,9 +67,12 @@ from vellum.workflows.exceptions import NodeException
 from vellum.workflows.nodes.bases import BaseNode
 from vellum.workflows.outputs import BaseOutputs
 from vellum.workflows.outputs.base import BaseOutput
+from vellum.workflows.ports.node_ports import NodePorts
 from vellum.workflows.ports.port import Port
 from vellum.workflows.references import ExternalInputReference, OutputReference
-from vellum.workflows.state.base import BaseState
+from vellum.workflows.runner.executor import WorkflowExecutor, blocking, get_default_executor, validate_executor
+from vellum.workflows.runner.process_executor import run_node_in_process
+from vellum.workflows.types.core import ExecutionMode
 from vellum.workflows.types.generics import OutputsType, StateType, WorkflowInputsType
 
 if TYPE_CHECKING:
@@ -58,7 +82,6 @@ logger = logging.getLogger(__name__)
 
 RunFromNodeArg = Sequence[Type[BaseNode]]
 ExternalInputsArg = Dict[ExternalInputReference, Any]
-BackgroundThreadItem = Union[BaseState, WorkflowEvent, None]
 
 
 class WorkflowRunner(Generic[StateType]):
@@ -73,6 +96,7 @@ class WorkflowRunner(Generic[StateType]):
         external_inputs: Optional[ExternalInputsArg] = None,
         cancel_signal: Optional[ThreadingEvent] = None,
         parent_context: Optional[ParentContext] = None,
+        executor: Optional[WorkflowExecutor] = None,
     ):
         if state and external_inputs:
             raise ValueError("Can only run a Workflow providing one of state or external inputs, not both")
@@ -111,15 +135,13 @@ class WorkflowRunner(Generic[StateType]):
                 self._initial_state = self.workflow.get_default_state(normalized_inputs)
             self._entrypoints = self.workflow.get_entrypoints()
 
-        # This queue is responsible for sending events from WorkflowRunner to the outside world
-        self._workflow_event_outer_queue: Queue[WorkflowEvent] = Queue()
-
-        # This queue is responsible for sending events from the inner worker threads to WorkflowRunner
-        self._workflow_event_inner_queue: Queue[WorkflowEvent] = Queue()
+        # This queue is responsible for sending events from the worker threads running each node to WorkflowRunner,
+        # which yields them to the outside world as it reads them
+        self._workflow_event_queue: Queue[WorkflowEvent] = Queue()
 
-        # This queue is responsible for sending events from WorkflowRunner to the background thread
-        # for user defined emitters
-        self._background_thread_queue: Queue[BackgroundThreadItem] = Queue()
+        # This pipeline is responsible for sending events from WorkflowRunner to each of the user defined emitters
+        # on their own background thread. It is only started once the Workflow starts streaming
+        self._emitter_pipeline: Optional[EmitterPipeline] = None
 
         self._dependencies: Dict[Type[BaseNode], Set[Type[BaseNode]]] = defaultdict(set)
         self._state_forks: Set[StateType] = {self._initial_state}
@@ -127,16 +149,18 @@ class WorkflowRunner(Generic[StateType]):
         self._active_nodes_by_execution_id: Dict[UUID, BaseNode[StateType]] = {}
         self._cancel_signal = cancel_signal
         self._parent_context = get_parent_context() or parent_context
+        validate_executor(executor)
+        self._executor = executor or get_default_executor()
 
         setattr(
             self._initial_state,
             "__snapshot_callback__",
             lambda s: self._snapshot_state(s),
         )
-        self.workflow.context._register_event_queue(self._workflow_event_inner_queue)
+        self.workflow.context._register_event_queue(self._workflow_event_queue)
 
     def _snapshot_state(self, state: StateType) -> StateType:
-        self._workflow_event_inner_queue.put(
+        self._workflow_event_queue.put(
             WorkflowExecutionSnapshottedEvent(
                 trace_id=state.meta.trace_id,
                 span_id=state.meta.span_id,
@@ -148,17 +172,50 @@ class WorkflowRunner(Generic[StateType]):
             )
         )
         self.workflow._store.append_state_snapshot(state)
-        self._background_thread_queue.put(state)
+        if self._emitter_pipeline:
+            self._emitter_pipeline.put(state)
         return state
 
     def _emit_event(self, event: WorkflowEvent) -> WorkflowEvent:
         self.workflow._store.append_event(event)
-        self._background_thread_queue.put(event)
+        if self._emitter_pipeline:
+            self._emitter_pipeline.put(event)
         return event
 
     def _run_work_item(self, node: BaseNode[StateType], span_id: UUID) -> None:
         parent_context = get_parent_context()
-        self._workflow_event_inner_queue.put(
+        self._initiate_node_execution(node, span_id, parent_context)
+
+        try:
+            ports = node.Ports()
+            cache_key, outputs = self._get_cached_node_outputs(node, span_id, parent_context)
+            if outputs is None:
+                updated_parent_context = self._get_node_parent_context(node, span_id, parent_context)
+                with execution_context(parent_context=updated_parent_context):
+                    if node.Execution.mode == ExecutionMode.PROCESS:
+                        node_run_response = run_node_in_process(node)
+                    else:
+                        node_run_response = node.run()
+
+                outputs = self._get_node_outputs(node, node_run_response)
+                if isinstance(node_run_response, Iterator):
+                    streaming_output_queues: Dict[str, Queue] = {}
+                    with execution_context(parent_context=updated_parent_context):
+                        for output in node_run_response:
+                            self._handle_node_output(node, span_id, output, outputs, ports, streaming_output_queues)
+
+                self._cache_node_outputs(node, cache_key, outputs)
+
+            self._fulfill_node_execution(node, span_id, outputs, ports, parent_context)
+        except Exception as e:
+            self._reject_node_execution(node, span_id, e, parent_context)
+
+        logger.debug(f"Finished running node: {node.__class__.__name__}")
+
+    def _initiate_node_execution(
+        self, node: BaseNode[StateType], span_id: UUID, parent_context: Optional[ParentContext]
+    ) -> None:
+        self._workflow_event_queue.put(
             NodeExecutionInitiatedEvent(
                 trace_id=node.state.meta.trace_id,
                 span_id=span_id,
@@ -172,129 +229,212 @@ class WorkflowRunner(Generic[StateType]):
 
         logger.debug(f"Started running node: {node.__class__.__name__}")
 
+    def _get_cached_node_outputs(
+        self, node: BaseNode[StateType], span_id: UUID, parent_context: Optional[ParentContext]
+    ) -> Tuple[Optional[str], Optional[BaseOutputs]]:
+        """
+        Looks up the outputs of a node that opted into caching, emitting whether they were found. Returns the key its
+        outputs are cached under, or `None` if they can't be, along with the cached outputs if they were found.
+        """
+
+        cache = node.Execution.cache
+        if cache is None:
+            return None, None
+
+        cache_key = get_node_cache_key(node)
+        if cache_key is None:
+            logger.debug(f"Node {node.__class__.__name__} has attributes that can't be hashed, skipping its cache")
+            return None, None
+
         try:
-            updated_parent_context = NodeParentContext(
+            cached_outputs = cache.get(cache_key)
+        except Exception:
+            logger.exception(f"Failed to read the cached outputs of node {node.__class__.__name__}")
+            cached_outputs = None
+
+        if cached_outputs is None:
+            self._workflow_event_queue.put(
+                NodeExecutionCacheMissEvent(
+                    trace_id=node.state.meta.trace_id,
+                    span_id=span_id,
+                    body=NodeExecutionCacheMissBody(node_definition=node.__class__, cache_key=cache_key),
+                    parent=parent_context,
+                )
+            )
+            return cache_key, None
+
+        self._workflow_event_queue.put(
+            NodeExecutionCacheHitEvent(
+                trace_id=node.state.meta.trace_id,
                 span_id=span_id,
-                node_definition=node.__class__,
+                body=NodeExecutionCacheHitBody(node_definition=node.__class__, cache_key=cache_key),
                 parent=parent_context,
             )
-            with execution_context(parent_context=updated_parent_context):
-                node_run_response = node.run()
-            ports = node.Ports()
-            if not isinstance(node_run_response, (BaseOutputs, Iterator)):
+        )
+        return cache_key, node.Outputs(**cached_outputs)
+
+    def _cache_node_outputs(self, node: BaseNode[StateType], cache_key: Optional[str], outputs: BaseOutputs) -> None:
+        cache = node.Execution.cache
+        if cache is None or cache_key is None:
+            return
+
+        try:
+            cache.set(cache_key, {descriptor.name: value for descriptor, value in outputs if value is not UNDEF})
+        except Exception:
+            logger.exception(f"Failed to cache the outputs of node {node.__class__.__name__}")
+
+    def _get_node_parent_context(
+        self, node: BaseNode[StateType], span_id: UUID, parent_context: Optional[ParentContext]
+    ) -> NodeParentContext:
+        return NodeParentContext(
+            span_id=span_id,
+            node_definition=node.__class__,
+            parent=parent_context,
+        )
+
+    def _get_node_outputs(self, node: BaseNode[StateType], node_run_response: Any) -> BaseOutputs:
+        """
+        Validates a node's run response, returning the outputs it resolved to, or an empty outputs object to be
+        filled in if the node is streaming its outputs.
+        """
+
+        if not isinstance(node_run_response, (BaseOutputs, Iterator, AsyncIterator)):
+            raise NodeException(
+                message=f"Node {node.__class__.__name__} did not return a valid node run response",
+                code=WorkflowErrorCode.INVALID_OUTPUTS,
+            )
+
+        if isinstance(node_run_response, BaseOutputs):
+            if not isinstance(node_run_response, node.Outputs):
                 raise NodeException(
-                    message=f"Node {node.__class__.__name__} did not return a valid node run response",
+                    message=f"Node {node.__class__.__name__} did not return a valid outputs object",
                     code=WorkflowErrorCode.INVALID_OUTPUTS,
                 )
 
-            if isinstance(node_run_response, BaseOutputs):
-                if not isinstance(node_run_response, node.Outputs):
-                    raise NodeException(
-                        message=f"Node {node.__class__.__name__} did not return a valid outputs object",
-                        code=WorkflowErrorCode.INVALID_OUTPUTS,
-                    )
+            return node_run_response
 
-                outputs = node_run_response
-            else:
-                streaming_output_queues: Dict[str, Queue] = {}
-                outputs = node.Outputs()
-
-                def initiate_node_streaming_output(output: BaseOutput) -> None:
-                    parent_context = get_parent_context()
-                    streaming_output_queues[output.name] = Queue()
-                    output_descriptor = OutputReference(
-                        name=output.name,
-                        types=(type(output.delta),),
-                        instance=None,
-                        outputs_class=node.Outputs,
-                    )
-                    node.state.meta.node_outputs[output_descriptor] = streaming_output_queues[output.name]
-                    initiated_output: BaseOutput = BaseOutput(name=output.name)
-                    initiated_ports = initiated_output > ports
-                    self._workflow_event_inner_queue.put(
-                        NodeExecutionStreamingEvent(
-                            trace_id=node.state.meta.trace_id,
-                            span_id=span_id,
-                            body=NodeExecutionStreamingBody(
-                                node_definition=node.__class__,
-                                output=initiated_output,
-                                invoked_ports=initiated_ports,
-                            ),
-                            parent=parent_context,
-                        ),
-                    )
+        return node.Outputs()
 
-                with execution_context(parent_context=updated_parent_context):
-                    for output in node_run_response:
-                        invoked_ports = output > ports
-                        if output.is_initiated:
-                            initiate_node_streaming_output(output)
-                        elif output.is_streaming:
-                            if output.name not in streaming_output_queues:
-                                initiate_node_streaming_output(output)
-
-                            streaming_output_queues[output.name].put(output.delta)
-                            self._workflow_event_inner_queue.put(
-                                NodeExecutionStreamingEvent(
-                                    trace_id=node.state.meta.trace_id,
-                                    span_id=span_id,
-                                    body=NodeExecutionStreamingBody(
-                                        node_definition=node.__class__,
-                                        output=output,
-                                        invoked_ports=invoked_ports,
-                                    ),
-                                    parent=parent_context,
-                                ),
-                            )
-                        elif output.is_fulfilled:
-                            if output.name in streaming_output_queues:
-                                streaming_output_queues[output.name].put(UNDEF)
-
-                            setattr(outputs, output.name, output.value)
-                            self._workflow_event_inner_queue.put(
-                                NodeExecutionStreamingEvent(
-                                    trace_id=node.state.meta.trace_id,
-                                    span_id=span_id,
-                                    body=NodeExecutionStreamingBody(
-                                        node_definition=node.__class__,
-                                        output=output,
-                                        invoked_ports=invoked_ports,
-                                    ),
-                                    parent=parent_context,
-                                )
-                            )
-
-            node.state.meta.node_execution_cache.fulfill_node_execution(node.__class__, span_id)
-
-            for descriptor, output_value in outputs:
-                if output_value is UNDEF:
-                    if descriptor in node.state.meta.node_outputs:
-                        del node.state.meta.node_outputs[descriptor]
-                    continue
+    def _handle_node_output(
+        self,
+        node: BaseNode[StateType],
+        span_id: UUID,
+        output: BaseOutput,
+        outputs: BaseOutputs,
+        ports: NodePorts,
+        streaming_output_queues: Dict[str, Queue],
+    ) -> None:
+        def initiate_node_streaming_output(output: BaseOutput) -> None:
+            parent_context = get_parent_context()
+            streaming_output_queues[output.name] = Queue()
+            output_descriptor = OutputReference(
+                name=output.name,
+                types=(type(output.delta),),
+                instance=None,
+                outputs_class=node.Outputs,
+            )
+            node.state.meta.node_outputs[output_descriptor] = streaming_output_queues[output.name]
+            initiated_output: BaseOutput = BaseOutput(name=output.name)
+            initiated_ports = initiated_output > ports
+            self._workflow_event_queue.put(
+                NodeExecutionStreamingEvent(
+                    trace_id=node.state.meta.trace_id,
+                    span_id=span_id,
+                    body=NodeExecutionStreamingBody(
+                        node_definition=node.__class__,
+                        output=initiated_output,
+                        invoked_ports=initiated_ports,
+                    ),
+                    parent=parent_context,
+                ),
+            )
 
-                node.state.meta.node_outputs[descriptor] = output_value
+        parent_context = get_parent_context()
+        invoked_ports = output > ports
+        if output.is_initiated:
+            initiate_node_streaming_output(output)
+        elif output.is_streaming:
+            if output.name not in streaming_output_queues:
+                initiate_node_streaming_output(output)
+
+            streaming_output_queues[output.name].put(output.delta)
+            self._workflow_event_queue.put(
+                NodeExecutionStreamingEvent(
+                    trace_id=node.state.meta.trace_id,
+                    span_id=span_id,
+                    body=NodeExecutionStreamingBody(
+                        node_definition=node.__class__,
+                        output=output,
+                        invoked_ports=invoked_ports,
+                    ),
+                    parent=parent_context,
+                ),
+            )
+        elif output.is_fulfilled:
+            if output.name in streaming_output_queues:
+                streaming_output_queues[output.name].put(UNDEF)
 
-            invoked_ports = ports(outputs, node.state)
-            self._workflow_event_inner_queue.put(
-                NodeExecutionFulfilledEvent(
+            setattr(outputs, output.name, output.value)
+            self._workflow_event_queue.put(
+                NodeExecutionStreamingEvent(
                     trace_id=node.state.meta.trace_id,
                     span_id=span_id,
-                    body=NodeExecutionFulfilledBody(
+                    body=NodeExecutionStreamingBody(
                         node_definition=node.__class__,
-                        outputs=outputs,
+                        output=output,
                         invoked_ports=invoked_ports,
                     ),
                     parent=parent_context,
                 )
             )
-        except NodeException as e:
-            self._workflow_event_inner_queue.put(
+
+    def _fulfill_node_execution(
+        self,
+        node: BaseNode[StateType],
+        span_id: UUID,
+        outputs: BaseOutputs,
+        ports: NodePorts,
+        parent_context: Optional[ParentContext],
+    ) -> None:
+        node.state.meta.node_execution_cache.fulfill_node_execution(node.__class__, span_id)
+
+        for descriptor, output_value in outputs:
+            if output_value is UNDEF:
+                if descriptor in node.state.meta.node_outputs:
+                    del node.state.meta.node_outputs[descriptor]
+                continue
+
+            node.state.meta.node_outputs[descriptor] = output_value
+
+        invoked_ports = ports(outputs, node.state)
+        self._workflow_event_queue.put(
+            NodeExecutionFulfilledEvent(
+                trace_id=node.state.meta.trace_id,
+                span_id=span_id,
+                body=NodeExecutionFulfilledBody(
+                    node_definition=node.__class__,
+                    outputs=outputs,
+                    invoked_ports=invoked_ports,
+                ),
+                parent=parent_context,
+            )
+        )
+
+    def _reject_node_execution(
+        self,
+        node: BaseNode[StateType],
+        span_id: UUID,
+        exception: Exception,
+        parent_context: Optional[ParentContext],
+    ) -> None:
+        if isinstance(exception, NodeException):
+            self._workflow_event_queue.put(
                 NodeExecutionRejectedEvent(
                     trace_id=node.state.meta.trace_id,
                     span_id=span_id,
                     body=NodeExecutionRejectedBody(
                         node_definition=node.__class__,
-                        error=e.error,
+                        error=exception.error,
                     ),
                     parent=WorkflowParentContext(
                         span_id=span_id,
@@ -303,25 +443,24 @@ class WorkflowRunner(Generic[StateType]):
                     ),
                 )
             )
-        except Exception as e:
-            logger.exception(f"An unexpected error occurred while running node {node.__class__.__name__}")
+            return
 
-            self._workflow_event_inner_queue.put(
-                NodeExecutionRejectedEvent(
-                    trace_id=node.state.meta.trace_id,
-                    span_id=span_id,
-                    body=NodeExecutionRejectedBody(
-                        node_definition=node.__class__,
-                        error=WorkflowError(
-                            message=str(e),
-                            code=WorkflowErrorCode.INTERNAL_ERROR,
-                        ),
+        logger.exception(f"An unexpected error occurred while running node {node.__class__.__name__}")
+
+        self._workflow_event_queue.put(
+            NodeExecutionRejectedEvent(
+                trace_id=node.state.meta.trace_id,
+                span_id=span_id,
+                body=NodeExecutionRejectedBody(
+                    node_definition=node.__class__,
+                    error=WorkflowError(
+                        message=str(exception),
+                        code=WorkflowErrorCode.INTERNAL_ERROR,
                     ),
-                    parent=parent_context,
                 ),
-            )
-
-        logger.debug(f"Finished running node: {node.__class__.__name__}")
+                parent=parent_context,
+            ),
+        )
 
     def _context_run_work_item(self, node: BaseNode[StateType], span_id: UUID, parent_context=None) -> None:
         if parent_context is None:
@@ -369,11 +508,18 @@ class WorkflowRunner(Generic[StateType]):
             state.meta.node_execution_cache.initiate_node_execution(node_class, node_span_id)
             self._active_nodes_by_execution_id[node_span_id] = node
 
-            worker_thread = Thread(
-                target=self._context_run_work_item,
-                kwargs={"node": node, "span_id": node_span_id, "parent_context": current_parent},
-            )
-            worker_thread.start()
+        # We submit outside of the state lock, since an executor may run the node before `submit` returns
+        self._submit_work_item(node, node_span_id, current_parent)
+
+    def _submit_work_item(
+        self, node: BaseNode[StateType], span_id: UUID, parent_context: Optional[ParentContext]
+    ) -> None:
+        self._executor.submit(
+            self._context_run_work_item,
+            node=node,
+            span_id=span_id,
+            parent_context=parent_context,
+        )
 
     def _handle_work_item_event(self, event: WorkflowEvent) -> Optional[WorkflowError]:
         node = self._active_nodes_by_execution_id.get(event.span_id)
@@ -385,25 +531,6 @@ class WorkflowRunner(Generic[StateType]):
             return event.error
 
         if event.name == "node.execution.streaming":
-            for workflow_output_descriptor in self.workflow.Outputs:
-                node_output_descriptor = workflow_output_descriptor.instance
-                if not isinstance(node_output_descriptor, OutputReference):
-                    continue
-                if node_output_descriptor.outputs_class != event.node_definition.Outputs:
-                    continue
-                if node_output_descriptor.name != event.output.name:
-                    continue
-
-                self._workflow_event_outer_queue.put(
-                    self._stream_workflow_event(
-                        BaseOutput(
-                            name=workflow_output_descriptor.name,
-                            value=event.output.value,
-                            delta=event.output.delta,
-                        )
-                    )
-                )
-
             self._handle_invoked_ports(node.state, event.invoked_ports)
 
             return None
@@ -416,6 +543,36 @@ class WorkflowRunner(Generic[StateType]):
 
         return None
 
+    def _get_workflow_streaming_events(self, event: WorkflowEvent) -> List[WorkflowExecutionStreamingEvent]:
+        """
+        Returns a streaming event for each of the Workflow's outputs that reference the output a node just streamed.
+        """
+
+        if event.name != "node.execution.streaming" or event.span_id not in self._active_nodes_by_execution_id:
+            return []
+
+        streaming_events: List[WorkflowExecutionStreamingEvent] = []
+        for workflow_output_descriptor in self.workflow.Outputs:
+            node_output_descriptor = workflow_output_descriptor.instance
+            if not isinstance(node_output_descriptor, OutputReference):
+                continue
+            if node_output_descriptor.outputs_class != event.node_definition.Outputs:
+                continue
+            if node_output_descriptor.name != event.output.name:
+                continue
+
+            streaming_events.append(
+                self._stream_workflow_event(
+                    BaseOutput(
+                        name=workflow_output_descriptor.name,
+                        value=event.output.value,
+                        delta=event.output.delta,
+                    )
+                )
+            )
+
+        return streaming_events
+
     def _initiate_workflow_event(self) -> WorkflowExecutionInitiatedEvent:
         return WorkflowExecutionInitiatedEvent(
             trace_id=self._initial_state.meta.trace_id,
@@ -480,75 +637,99 @@ class WorkflowRunner(Generic[StateType]):
             parent=self._parent_context,
         )
 
-    def _stream(self) -> None:
-        # TODO: We should likely handle this during initialization
-        # https://app.shortcut.com/vellum/story/4327
-        if not self._entrypoints:
-            self._workflow_event_outer_queue.put(
-                self._reject_workflow_event(
-                    WorkflowError(
-                        message="No entrypoints defined",
-                        code=WorkflowErrorCode.INVALID_WORKFLOW,
-                    )
-                )
-            )
-            return
+    def _stream(self) -> Iterator[WorkflowEvent]:
+        """
+        Runs the Workflow, yielding the events of each of its nodes as they're read off of the event queue, followed
+        by the event that ends the Workflow.
+        """
 
-        for edge in self.workflow.get_edges():
-            self._dependencies[edge.to_node].add(edge.from_port.node_class)
-
-        current_parent = WorkflowParentContext(
-            span_id=self._initial_state.meta.span_id,
-            workflow_definition=self.workflow.__class__,
-            parent=self._parent_context,
-            type="WORKFLOW",
-        )
-        for node_cls in self._entrypoints:
-            try:
-                with execution_context(parent_context=current_parent):
-                    self._run_node_if_ready(self._initial_state, node_cls)
-            except NodeException as e:
-                self._workflow_event_outer_queue.put(self._reject_workflow_event(e.error))
-                return
-            except Exception:
-                err_message = f"An unexpected error occurred while initializing node {node_cls.__name__}"
-                logger.exception(err_message)
-                self._workflow_event_outer_queue.put(
-                    self._reject_workflow_event(
-                        WorkflowError(code=WorkflowErrorCode.INTERNAL_ERROR, message=err_message),
-                    )
-                )
-                return
+        rejection_event = self._start_entrypoints()
+        if rejection_event:
+            yield rejection_event
+            return
 
+        current_parent = self._get_workflow_parent_context()
         rejection_error: Optional[WorkflowError] = None
 
-        while True:
-            if not self._active_nodes_by_execution_id:
-                break
-
-            event = self._workflow_event_inner_queue.get()
+        while self._active_nodes_by_execution_id:
+            event = self._get_next_event()
+            yield event
 
-            self._workflow_event_outer_queue.put(event)
+            # The Workflow was cancelled
+            if self._is_terminal_event(event):
+                return
 
+            streaming_events = self._get_workflow_streaming_events(event)
             with execution_context(parent_context=current_parent):
                 rejection_error = self._handle_work_item_event(event)
 
+            yield from streaming_events
+
             if rejection_error:
                 break
 
         # Handle any remaining events
         try:
-            while event := self._workflow_event_inner_queue.get_nowait():
-                self._workflow_event_outer_queue.put(event)
+            while not rejection_error and (event := self._workflow_event_queue.get_nowait()):
+                yield event
 
+                streaming_events = self._get_workflow_streaming_events(event)
                 with execution_context(parent_context=current_parent):
                     rejection_error = self._handle_work_item_event(event)
 
-                if rejection_error:
-                    break
+                yield from streaming_events
         except Empty:
             pass
 
+        yield self._complete_workflow_event(rejection_error)
+
+    def _get_workflow_parent_context(self) -> WorkflowParentContext:
+        return WorkflowParentContext(
+            span_id=self._initial_state.meta.span_id,
+            workflow_definition=self.workflow.__class__,
+            parent=self._parent_context,
+            type="WORKFLOW",
+        )
+
+    def _start_entrypoints(self) -> Optional[WorkflowExecutionRejectedEvent]:
+        """
+        Kicks off the Workflow's entrypoint nodes, returning a rejection event if the Workflow couldn't be started.
+        """
+
+        # TODO: We should likely handle this during initialization
+        # https://app.shortcut.com/vellum/story/4327
+        if not self._entrypoints:
+            return self._reject_workflow_event(
+                WorkflowError(
+                    message="No entrypoints defined",
+                    code=WorkflowErrorCode.INVALID_WORKFLOW,
+                )
+            )
+
+        for edge in self.workflow.get_edges():
+            self._dependencies[edge.to_node].add(edge.from_port.node_class)
+
+        current_parent = self._get_workflow_parent_context()
+        for node_cls in self._entrypoints:
+            try:
+                with execution_context(parent_context=current_parent):
+                    self._run_node_if_ready(self._initial_state, node_cls)
+            except NodeException as e:
+                return self._reject_workflow_event(e.error)
+            except Exception:
+                err_message = f"An unexpected error occurred while initializing node {node_cls.__name__}"
+                logger.exception(err_message)
+                return self._reject_workflow_event(
+                    WorkflowError(code=WorkflowErrorCode.INTERNAL_ERROR, message=err_message),
+                )
+
+        return None
+
+    def _complete_workflow_event(self, rejection_error: Optional[WorkflowError]) -> WorkflowEvent:
+        """
+        Merges the Workflow's state forks once every node has finished, returning the event that ends the Workflow.
+        """
+
         final_state = self._state_forks.pop()
         for other_state in self._state_forks:
             final_state += other_state
@@ -559,14 +740,10 @@ class WorkflowRunner(Generic[StateType]):
             if node_input_value is UNDEF
         }
         if unresolved_external_inputs:
-            self._workflow_event_outer_queue.put(
-                self._pause_workflow_event(unresolved_external_inputs),
-            )
-            return
+            return self._pause_workflow_event(unresolved_external_inputs)
 
         if rejection_error:
-            self._workflow_event_outer_queue.put(self._reject_workflow_event(rejection_error))
-            return
+            return self._reject_workflow_event(rejection_error)
 
         fulfilled_outputs = self.workflow.Outputs()
         for descriptor, value in fulfilled_outputs:
@@ -579,28 +756,14 @@ class WorkflowRunner(Generic[StateType]):
                     descriptor.instance.resolve(final_state),
                 )
 
-        self._workflow_event_outer_queue.put(self._fulfill_workflow_event(fulfilled_outputs))
-
-    def _run_background_thread(self) -> None:
-        state_class = self.workflow.get_state_class()
-        while True:
-            item = self._background_thread_queue.get()
-            if item is None:
-                break
-
-            if isinstance(item, state_class):
-                for emitter in self.workflow.emitters:
-                    emitter.snapshot_state(item)
-            elif isinstance(item, BaseEvent):
-                for emitter in self.workflow.emitters:
-                    emitter.emit_event(item)
+        return self._fulfill_workflow_event(fulfilled_outputs)
 
     def _run_cancel_thread(self) -> None:
         if not self._cancel_signal:
             return
 
         self._cancel_signal.wait()
-        self._workflow_event_outer_queue.put(
+        self._workflow_event_queue.put(
             self._reject_workflow_event(
                 WorkflowError(
                     code=WorkflowErrorCode.WORKFLOW_CANCELLED,
@@ -618,12 +781,12 @@ class WorkflowRunner(Generic[StateType]):
             return event.workflow_definition == self.workflow.__class__
         return False
 
-    def stream(self) -> WorkflowEventStream:
-        background_thread = Thread(
-            target=self._run_background_thread,
-            name=f"{self.workflow.__class__.__name__}.background_thread",
-        )
-        background_thread.start()
+    def _start_background_threads(self) -> None:
+        if self.workflow.emitters:
+            self._emitter_pipeline = EmitterPipeline(
+                self.workflow.emitters,
+                thread_name_prefix=f"{self.workflow.__class__.__name__}.background_thread",
+            )
 
         if self._cancel_signal:
             cancel_thread = Thread(
@@ -632,37 +795,39 @@ class WorkflowRunner(Generic[StateType]):
             )
             cancel_thread.start()
 
-        event: WorkflowEvent
-        if self._is_resuming:
-            event = self._resume_workflow_event()
-        else:
-            event = self._initiate_workflow_event()
+    def _stop_background_threads(self) -> None:
+        if self._emitter_pipeline:
+            self._emitter_pipeline.close()
 
-        yield self._emit_event(event)
+        self.workflow._store.close()
 
-        # The extra level of indirection prevents the runner from waiting on the caller to consume the event stream
-        stream_thread = Thread(
-            target=self._stream,
-            name=f"{self.workflow.__class__.__name__}.stream_thread",
-        )
-        stream_thread.start()
+    def _start_workflow_event(self) -> Union[WorkflowExecutionInitiatedEvent, WorkflowExecutionResumedEvent]:
+        if self._is_resuming:
+            return self._resume_workflow_event()
 
-        while stream_thread.is_alive():
-            try:
-                event = self._workflow_event_outer_queue.get(timeout=0.1)
-            except Empty:
-                continue
+        return self._initiate_workflow_event()
 
-            yield self._emit_event(event)
+    def _get_next_event(self) -> WorkflowEvent:
+        # When this Workflow is a Subworkflow, we're likely running on one of the executor's workers, which mustn't
+        # hold its place in the pool while waiting on the nodes it submitted
+        with blocking():
+            return self._workflow_event_queue.get()
 
-            if self._is_terminal_event(event):
-                break
+    def stream(self) -> WorkflowEventStream:
+        self._start_background_threads()
 
+        event: WorkflowEvent = self._start_workflow_event()
+        yield self._emit_event(event)
+
+        # Nodes run on the executor, so they keep running while the caller consumes the events they've already sent
         try:
-            while event := self._workflow_event_outer_queue.get_nowait():
+            for event in self._stream():
                 yield self._emit_event(event)
-        except Empty:
-            pass
+
+                if self._is_terminal_event(event):
+                    break
+        except Exception:
+            logger.exception("An unexpected error occurred while streaming Workflow events")
 
         if not self._is_terminal_event(event):
             yield self._reject_workflow_event(
@@ -672,4 +837,4 @@ class WorkflowRunner(Generic[StateType]):
                 )
             )
 
-        self._background_thread_queue.put(None)
+        self._stop_background_threads()
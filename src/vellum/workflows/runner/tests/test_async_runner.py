@@ -0,0 +1,250 @@
+import asyncio
+import threading
+from typing import AsyncIterator, ClassVar, Iterator, List, Optional, Set, Type
+
+from vellum.workflows.inputs.base import BaseInputs
+from vellum.workflows.nodes.bases import BaseAsyncNode, BaseNode
+from vellum.workflows.outputs.base import BaseOutput
+from vellum.workflows.runner.executor import WorkflowExecutor
+from vellum.workflows.state.base import BaseState
+from vellum.workflows.workflows.base import BaseWorkflow
+
+
+class Inputs(BaseInputs):
+    name: str
+
+
+class AsyncGreetingNode(BaseAsyncNode):
+    name = Inputs.name
+
+    class Outputs(BaseAsyncNode.Outputs):
+        greeting: str
+
+    async def arun(self) -> Outputs:
+        await asyncio.sleep(0)
+        return self.Outputs(greeting=f"Hello, {self.name}!")
+
+
+class AsyncGreetingWorkflow(BaseWorkflow[Inputs, BaseState]):
+    graph = AsyncGreetingNode
+
+    class Outputs(BaseWorkflow.Outputs):
+        greeting = AsyncGreetingNode.Outputs.greeting
+
+
+async def test_arun__async_node():
+    # GIVEN a workflow with a node whose run method is a coroutine
+    workflow = AsyncGreetingWorkflow()
+
+    # WHEN we run the workflow on the event loop
+    terminal_event = await workflow.arun(inputs=Inputs(name="Vellum"))
+
+    # THEN the workflow should have completed successfully
+    assert terminal_event.name == "workflow.execution.fulfilled", terminal_event
+    assert terminal_event.outputs.greeting == "Hello, Vellum!"
+
+
+def test_run__async_node():
+    # GIVEN a workflow with a node whose run method is a coroutine
+    workflow = AsyncGreetingWorkflow()
+
+    # WHEN we run the workflow synchronously
+    terminal_event = workflow.run(inputs=Inputs(name="Vellum"))
+
+    # THEN the coroutine should have been awaited on the node's behalf
+    assert terminal_event.name == "workflow.execution.fulfilled", terminal_event
+    assert terminal_event.outputs.greeting == "Hello, Vellum!"
+
+
+class AsyncStreamingNode(BaseAsyncNode):
+    class Outputs(BaseAsyncNode.Outputs):
+        words: List[str]
+
+    async def arun(self) -> AsyncIterator[BaseOutput]:
+        words = []
+        for word in ["Hello", "from", "asyncio"]:
+            await asyncio.sleep(0)
+            words.append(word)
+            yield BaseOutput(name="words", delta=word)
+
+        yield BaseOutput(name="words", value=words)
+
+
+class AsyncStreamingWorkflow(BaseWorkflow):
+    graph = AsyncStreamingNode
+
+    class Outputs(BaseWorkflow.Outputs):
+        words = AsyncStreamingNode.Outputs.words
+
+
+async def test_astream__async_generator_node():
+    # GIVEN a workflow with a node that streams its outputs from an async generator
+    workflow = AsyncStreamingWorkflow()
+
+    # WHEN we stream the workflow on the event loop
+    events = [event async for event in workflow.astream()]
+
+    # THEN the node's deltas should have been streamed in order
+    deltas = [
+        event.output.delta
+        for event in events
+        if event.name == "workflow.execution.streaming" and event.output.is_streaming
+    ]
+    assert deltas == ["Hello", "from", "asyncio"]
+
+    # AND the workflow should have been fulfilled with the final value
+    assert events[0].name == "workflow.execution.initiated"
+    assert events[-1].name == "workflow.execution.fulfilled", events[-1]
+    assert events[-1].outputs.words == ["Hello", "from", "asyncio"]
+
+
+def test_stream__async_generator_node():
+    # GIVEN a workflow with a node that streams its outputs from an async generator
+    workflow = AsyncStreamingWorkflow()
+
+    # WHEN we stream the workflow synchronously
+    events = list(workflow.stream())
+
+    # THEN the workflow should have been fulfilled with the final value
+    assert events[-1].name == "workflow.execution.fulfilled", events[-1]
+    assert events[-1].outputs.words == ["Hello", "from", "asyncio"]
+
+
+class SyncNode(BaseNode):
+    class Outputs(BaseNode.Outputs):
+        thread_name: str
+        chunks: List[str]
+
+    def run(self) -> Iterator[BaseOutput]:
+        yield BaseOutput(name="thread_name", value=threading.current_thread().name)
+        yield BaseOutput(name="chunks", value=["a", "b"])
+
+
+class SyncWorkflow(BaseWorkflow):
+    graph = SyncNode
+
+    class Outputs(BaseWorkflow.Outputs):
+        thread_name = SyncNode.Outputs.thread_name
+        chunks = SyncNode.Outputs.chunks
+
+
+async def test_astream__sync_node_runs_off_the_event_loop():
+    # GIVEN a workflow with a regular, blocking node
+    workflow = SyncWorkflow()
+
+    # WHEN we run the workflow on the event loop
+    terminal_event = await workflow.arun()
+
+    # THEN the node should have been run on a worker thread rather than blocking the event loop
+    assert terminal_event.name == "workflow.execution.fulfilled", terminal_event
+    assert terminal_event.outputs.thread_name != threading.current_thread().name
+    assert terminal_event.outputs.chunks == ["a", "b"]
+
+
+async def test_astream__sync_node_runs_on_the_workflow_executor():
+    # GIVEN a workflow with a regular, blocking node, that was given its own executor
+    executor = WorkflowExecutor(max_workers=1, thread_name_prefix="async-runner-test")
+    workflow = SyncWorkflow(executor=executor)
+
+    # WHEN we run the workflow on the event loop
+    terminal_event = await workflow.arun()
+
+    # THEN the node should have been run on one of the executor's workers, so that it's bounded by its max_workers
+    assert terminal_event.name == "workflow.execution.fulfilled", terminal_event
+    assert terminal_event.outputs.thread_name.startswith("async-runner-test_")
+
+
+class FailingAsyncNode(BaseAsyncNode):
+    async def arun(self) -> BaseAsyncNode.Outputs:
+        await asyncio.sleep(0)
+        raise ValueError("Something went wrong")
+
+
+class FailingAsyncWorkflow(BaseWorkflow):
+    graph = FailingAsyncNode
+
+
+async def test_arun__async_node_rejection():
+    # GIVEN a workflow with an async node that raises
+    workflow = FailingAsyncWorkflow()
+
+    # WHEN we run the workflow on the event loop
+    terminal_event = await workflow.arun()
+
+    # THEN the workflow should have been rejected
+    assert terminal_event.name == "workflow.execution.rejected"
+    assert terminal_event.error.message == "Something went wrong"
+
+
+class _Barrier:
+    """
+    Releases everyone waiting on it at once, but only after `parties` of them are waiting.
+    """
+
+    parties = 0
+    waiting = 0
+    released: Optional[asyncio.Event] = None
+
+    @classmethod
+    def reset(cls, parties: int) -> None:
+        cls.parties = parties
+        cls.waiting = 0
+        cls.released = asyncio.Event()
+
+    @classmethod
+    async def wait(cls) -> None:
+        assert cls.released is not None
+        cls.waiting += 1
+        if cls.waiting == cls.parties:
+            cls.released.set()
+        await cls.released.wait()
+
+
+class BarrierAsyncNode(BaseAsyncNode):
+    class Outputs(BaseAsyncNode.Outputs):
+        done: bool
+
+    async def arun(self) -> Outputs:
+        await _Barrier.wait()
+        return self.Outputs(done=True)
+
+
+class BarrierAsyncNode1(BarrierAsyncNode):
+    pass
+
+
+class BarrierAsyncNode2(BarrierAsyncNode):
+    pass
+
+
+class BarrierAsyncNode3(BarrierAsyncNode):
+    pass
+
+
+class BarrierAsyncNode4(BarrierAsyncNode):
+    pass
+
+
+class FanOutWorkflow(BaseWorkflow):
+    graph: ClassVar[Set[Type[BaseNode]]] = {BarrierAsyncNode1, BarrierAsyncNode2, BarrierAsyncNode3, BarrierAsyncNode4}
+
+    class Outputs(BaseWorkflow.Outputs):
+        done = BarrierAsyncNode4.Outputs.done
+
+
+async def test_arun__concurrent_async_nodes():
+    # GIVEN a workflow that fans out to several async nodes, none of which can finish until all 100 node executions
+    # across the workflows below have started waiting
+    workflow_count = 25
+    _Barrier.reset(parties=workflow_count * 4)
+
+    # WHEN we run many of these workflows concurrently on the same event loop
+    terminal_events = await asyncio.wait_for(
+        asyncio.gather(*(FanOutWorkflow().arun() for _ in range(workflow_count))),
+        # Only guards against a deadlock, if the nodes were run one after another
+        timeout=30,
+    )
+
+    # THEN every workflow should have completed, since all of the node executions were waiting at the same time
+    assert all(event.name == "workflow.execution.fulfilled" for event in terminal_events)
+    assert _Barrier.waiting == workflow_count * 4
@@ -0,0 +1,243 @@
+import pytest
+from concurrent.futures import Future, ThreadPoolExecutor
+import threading
+from threading import Event as ThreadingEvent, Thread
+import time
+from typing import Any, Callable, List, Set, cast
+
+from vellum.workflows.inputs.base import BaseInputs
+from vellum.workflows.nodes.bases.base import BaseNode
+from vellum.workflows.nodes.core.map_node.node import MapNode
+from vellum.workflows.ports.port import Port
+from vellum.workflows.references import LazyReference
+from vellum.workflows.runner.executor import WorkflowExecutor, set_default_executor
+from vellum.workflows.state.base import BaseState
+from vellum.workflows.workflows.base import BaseWorkflow
+
+# The threads that ran StartNode, across every test in this module
+start_node_thread_ids: Set[int] = set()
+
+
+class ThreadPerNodeExecutor(WorkflowExecutor):
+    """
+    Mirrors the original behavior of the WorkflowRunner, which started a new thread for every node execution.
+    """
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future:
+        future: Future = Future()
+
+        def _run() -> None:
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(fn(*args, **kwargs))
+                except BaseException as e:
+                    future.set_exception(e)
+
+        Thread(target=_run, daemon=True).start()
+        return future
+
+
+class State(BaseState):
+    counter = 0
+
+
+class StartNode(BaseNode[State]):
+    counter = LazyReference(lambda: StartNode.Outputs.final_value.coalesce(State.counter))
+
+    class Outputs(BaseNode.Outputs):
+        final_value: int
+
+    def run(self) -> Outputs:
+        start_node_thread_ids.add(threading.get_ident())
+        self.state.counter = self.counter + 1
+        return self.Outputs(final_value=self.counter + 1)
+
+
+class LoopNode(BaseNode):
+    class Ports(BaseNode.Ports):
+        loop = Port.on_if(StartNode.Outputs.final_value.less_than(100))
+        exit = Port.on_else()
+
+
+class ExitNode(BaseNode):
+    class Outputs(BaseNode.Outputs):
+        final_value = StartNode.Outputs.final_value
+
+
+class LoopingWorkflow(BaseWorkflow[BaseInputs, State]):
+    graph = StartNode >> {
+        LoopNode.Ports.loop >> StartNode,
+        LoopNode.Ports.exit >> ExitNode,
+    }
+
+    class Outputs(BaseWorkflow.Outputs):
+        final_value = ExitNode.Outputs.final_value
+
+
+def test_workflow_executor__queues_work_when_saturated():
+    # GIVEN an executor with a single worker
+    executor = WorkflowExecutor(max_workers=1)
+
+    # AND that worker is busy
+    release = ThreadingEvent()
+    busy_future = executor.submit(release.wait)
+
+    # WHEN we submit more work
+    future = executor.submit(threading.get_ident)
+
+    # THEN the work is queued instead of being run on the submitting thread
+    assert not future.done()
+
+    # AND once the worker is free, the work is run on the pool
+    release.set()
+    busy_future.result()
+    assert future.result() != threading.get_ident()
+
+    executor.shutdown()
+
+
+def test_workflow_executor__runs_nested_subworkflows_on_a_single_worker():
+    # GIVEN an executor with a single worker
+    executor = WorkflowExecutor(max_workers=1)
+
+    # AND a map node whose iterations are Subworkflows, whose nodes are submitted to that same worker
+    @MapNode.wrap(items=list(range(3)), concurrency=3)
+    class MapItemNode(BaseNode):
+        item = MapNode.SubworkflowInputs.item
+
+        class Outputs(BaseNode.Outputs):
+            value: int
+
+        def run(self) -> Outputs:
+            return self.Outputs(value=self.item + 1)
+
+    class MapWorkflow(BaseWorkflow):
+        graph = MapItemNode
+
+        class Outputs(BaseWorkflow.Outputs):
+            value = MapItemNode.Outputs.value
+
+    # WHEN we run the workflow
+    terminal_event = MapWorkflow(executor=executor).run()
+
+    # THEN it completes without deadlocking, since blocked workers hand their place to the nodes they wait on
+    assert terminal_event.name == "workflow.execution.fulfilled", terminal_event
+    assert terminal_event.outputs.value == [1, 2, 3]
+
+    executor.shutdown()
+
+
+def test_workflow_executor__bounds_threads_for_looping_workflows():
+    # GIVEN a workflow that loops through its nodes hundreds of times
+    workflow = LoopingWorkflow(executor=WorkflowExecutor(max_workers=4))
+
+    # WHEN we run the workflow, tracking the threads that run its nodes
+    start_node_thread_ids.clear()
+    terminal_event = workflow.run()
+
+    # THEN the workflow completes successfully
+    assert terminal_event.name == "workflow.execution.fulfilled", terminal_event
+    assert terminal_event.outputs.final_value == 100
+
+    # AND the nodes were run on a bounded number of threads
+    assert len(start_node_thread_ids) <= 4
+
+
+def test_workflow_executor__shared_across_concurrent_streams():
+    # GIVEN a single executor shared by many workflows
+    executor = WorkflowExecutor(max_workers=2, thread_name_prefix="shared-executor")
+
+    # AND a map node whose iterations are run through that same executor, which would deadlock a plain pool
+    iteration_thread_names: List[str] = []
+
+    @MapNode.wrap(items=list(range(5)))
+    class MapItemNode(BaseNode):
+        item = MapNode.SubworkflowInputs.item
+
+        class Outputs(BaseNode.Outputs):
+            value: int
+
+        def run(self) -> Outputs:
+            iteration_thread_names.append(threading.current_thread().name)
+            return self.Outputs(value=self.item * 2)
+
+    class MapWorkflow(BaseWorkflow):
+        graph = MapItemNode
+
+        class Outputs(BaseWorkflow.Outputs):
+            value = MapItemNode.Outputs.value
+
+    # WHEN we stream several workflows at once
+    results = {}
+
+    def stream(index: int) -> None:
+        events = list(MapWorkflow(executor=executor).stream())
+        results[index] = events[-1]
+
+    threads = [Thread(target=stream, args=(index,)) for index in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+
+    # THEN every workflow completes successfully
+    assert len(results) == 8
+    for terminal_event in results.values():
+        assert terminal_event.name == "workflow.execution.fulfilled", terminal_event
+        assert terminal_event.outputs.value == [0, 2, 4, 6, 8]
+
+    # AND every map iteration ran on the shared executor
+    assert len(iteration_thread_names) == 40
+    assert all(name.startswith("shared-executor") for name in iteration_thread_names)
+
+    executor.shutdown()
+
+
+def test_workflow_executor__rejects_other_executors():
+    # GIVEN a plain thread pool, which would deadlock once every worker is waiting on a Subworkflow
+    thread_pool_executor = ThreadPoolExecutor(max_workers=1)
+
+    # WHEN we try to run a workflow on it
+    with pytest.raises(TypeError) as exc_info:
+        LoopingWorkflow(executor=cast(WorkflowExecutor, thread_pool_executor)).run()
+
+    # THEN we're told to use a WorkflowExecutor instead
+    assert "WorkflowExecutor" in str(exc_info.value)
+
+    # AND the same goes for the process-wide default
+    with pytest.raises(TypeError):
+        set_default_executor(cast(WorkflowExecutor, thread_pool_executor))
+
+    thread_pool_executor.shutdown()
+
+
+@pytest.mark.benchmark
+def test_workflow_executor__throughput_compared_to_thread_per_node():
+    """
+    Compares how long it takes to run many looping Workflows at once on the shared pool versus a new thread per node.
+    """
+
+    # GIVEN the original thread per node model
+    thread_per_node_executor = ThreadPerNodeExecutor()
+
+    # AND a pool with as many workers as there are workflows to run at once
+    pooled_executor = WorkflowExecutor(max_workers=8)
+
+    def run_concurrently(executor: WorkflowExecutor) -> float:
+        start = time.perf_counter()
+        threads = [Thread(target=LoopingWorkflow(executor=executor).run) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return time.perf_counter() - start
+
+    # WHEN we run the same batch of looping workflows on each, keeping the best of a few runs
+    thread_per_node_seconds = min(run_concurrently(thread_per_node_executor) for _ in range(3))
+    pooled_seconds = min(run_concurrently(pooled_executor) for _ in range(3))
+
+    # THEN the pool should have finished the batch faster, since it reuses its workers instead of starting a thread
+    # for each of the thousands of node executions
+    assert pooled_seconds < thread_per_node_seconds, (pooled_seconds, thread_per_node_seconds)
+
+    pooled_executor.shutdown()
@@ -0,0 +1,168 @@
+from typing import Any, List, Optional
+
+from vellum.workflows.caches.base import BaseCache
+from vellum.workflows.caches.disk import DiskCache
+from vellum.workflows.caches.in_memory import InMemoryCache
+from vellum.workflows.events.node import NodeExecutionCacheHitEvent, NodeExecutionCacheMissEvent
+from vellum.workflows.inputs.base import BaseInputs
+from vellum.workflows.nodes.bases.base import BaseNode
+from vellum.workflows.state.base import BaseState
+from vellum.workflows.workflows.base import BaseWorkflow
+from vellum.workflows.workflows.event_filters import all_workflow_event_filter
+
+
+class Inputs(BaseInputs):
+    text: str
+
+
+def _build_workflow(node_cache: BaseCache, runs: List[str], node_cache_version: Optional[str] = None) -> BaseWorkflow:
+    class SlowUppercaseNode(BaseNode):
+        text = Inputs.text
+
+        class Outputs(BaseNode.Outputs):
+            uppercased: str
+
+        class Execution(BaseNode.Execution):
+            cache = node_cache
+            cache_version = node_cache_version
+
+        def run(self) -> Outputs:
+            runs.append(self.text)
+            return self.Outputs(uppercased=self.text.upper())
+
+    class CachedWorkflow(BaseWorkflow[Inputs, BaseState]):
+        graph = SlowUppercaseNode
+
+        class Outputs(BaseWorkflow.Outputs):
+            uppercased = SlowUppercaseNode.Outputs.uppercased
+
+    return CachedWorkflow()
+
+
+def test_node_cache__skips_node_with_same_inputs():
+    # GIVEN a workflow whose node caches its outputs
+    runs: List[str] = []
+    workflow = _build_workflow(InMemoryCache(), runs)
+
+    # WHEN we run it twice with the same inputs
+    first_events = list(workflow.stream(inputs=Inputs(text="hello"), event_filter=all_workflow_event_filter))
+    second_events = list(workflow.stream(inputs=Inputs(text="hello"), event_filter=all_workflow_event_filter))
+
+    # THEN the node should only have been run the first time
+    assert runs == ["hello"]
+
+    # AND both runs should have produced the same outputs
+    first_terminal_event = first_events[-1]
+    second_terminal_event = second_events[-1]
+    assert first_terminal_event.name == "workflow.execution.fulfilled", first_terminal_event
+    assert second_terminal_event.name == "workflow.execution.fulfilled", second_terminal_event
+    assert first_terminal_event.outputs["uppercased"] == "HELLO"
+    assert second_terminal_event.outputs["uppercased"] == "HELLO"
+
+    # AND the event stream should have reported the miss and then the hit
+    first_names = [event.name for event in first_events if event.name.startswith("node.")]
+    second_names = [event.name for event in second_events if event.name.startswith("node.")]
+    assert first_names == ["node.execution.initiated", "node.execution.cache_miss", "node.execution.fulfilled"]
+    assert second_names == ["node.execution.initiated", "node.execution.cache_hit", "node.execution.fulfilled"]
+
+    # AND both should report the same cache key
+    cache_keys = [
+        event.cache_key
+        for event in first_events + second_events
+        if isinstance(event, (NodeExecutionCacheHitEvent, NodeExecutionCacheMissEvent))
+    ]
+    assert len(set(cache_keys)) == 1
+
+
+def test_node_cache__reruns_node_with_different_inputs():
+    # GIVEN a workflow whose node caches its outputs
+    runs: List[str] = []
+    workflow = _build_workflow(InMemoryCache(), runs)
+
+    # WHEN we run it with different inputs
+    first_event = workflow.run(inputs=Inputs(text="hello"))
+    second_event = workflow.run(inputs=Inputs(text="world"))
+
+    # THEN the node should have been run both times
+    assert runs == ["hello", "world"]
+    assert first_event.name == "workflow.execution.fulfilled", first_event
+    assert second_event.name == "workflow.execution.fulfilled", second_event
+    assert first_event.outputs["uppercased"] == "HELLO"
+    assert second_event.outputs["uppercased"] == "WORLD"
+
+
+def test_node_cache__disk_cache_outlives_workflow(tmp_path):
+    # GIVEN two separate workflows whose nodes cache their outputs to the same directory
+    runs: List[str] = []
+    first_workflow = _build_workflow(DiskCache(str(tmp_path)), runs)
+    second_workflow = _build_workflow(DiskCache(str(tmp_path)), runs)
+
+    # WHEN we run both with the same inputs
+    first_workflow.run(inputs=Inputs(text="hello"))
+    terminal_event = second_workflow.run(inputs=Inputs(text="hello"))
+
+    # THEN the second should have reused the outputs of the first
+    assert runs == ["hello"]
+    assert terminal_event.name == "workflow.execution.fulfilled", terminal_event
+    assert terminal_event.outputs["uppercased"] == "HELLO"
+
+
+class FailingCache(BaseCache):
+    def get(self, key: str) -> Optional[Any]:
+        raise Exception("Cache is down")
+
+    def set(self, key: str, value: Any) -> None:
+        raise Exception("Cache is down")
+
+    def delete(self, key: str) -> None:
+        pass
+
+    def clear(self) -> None:
+        pass
+
+
+def test_node_cache__reruns_node_after_cache_version_is_bumped(tmp_path):
+    # GIVEN a workflow whose node cached its outputs to disk
+    runs: List[str] = []
+    first_event = _build_workflow(DiskCache(str(tmp_path)), runs, node_cache_version="1").run(
+        inputs=Inputs(text="hello")
+    )
+
+    # WHEN the same workflow, with a new cache version for its node, is run with the same inputs
+    second_event = _build_workflow(DiskCache(str(tmp_path)), runs, node_cache_version="2").run(
+        inputs=Inputs(text="hello")
+    )
+
+    # THEN the node should have been run again, rather than reusing the outputs cached by the previous version
+    assert runs == ["hello", "hello"]
+    assert first_event.name == "workflow.execution.fulfilled", first_event
+    assert second_event.name == "workflow.execution.fulfilled", second_event
+
+
+def test_node_cache__failing_cache_does_not_fail_node():
+    # GIVEN a workflow whose node caches its outputs to a cache that always fails
+    runs: List[str] = []
+    workflow = _build_workflow(FailingCache(), runs)
+
+    # WHEN we run it
+    terminal_event = workflow.run(inputs=Inputs(text="hello"))
+
+    # THEN the node should still have been run
+    assert terminal_event.name == "workflow.execution.fulfilled", terminal_event
+    assert terminal_event.outputs["uppercased"] == "HELLO"
+    assert runs == ["hello"]
+
+
+async def test_node_cache__async_runner():
+    # GIVEN a workflow whose node caches its outputs
+    runs: List[str] = []
+    workflow = _build_workflow(InMemoryCache(), runs)
+
+    # WHEN we run it twice with the same inputs on the async runner
+    await workflow.arun(inputs=Inputs(text="hello"))
+    terminal_event = await workflow.arun(inputs=Inputs(text="hello"))
+
+    # THEN the node should only have been run the first time
+    assert runs == ["hello"]
+    assert terminal_event.name == "workflow.execution.fulfilled", terminal_event
+    assert terminal_event.outputs["uppercased"] == "HELLO"
@@ -0,0 +1,248 @@
+import pytest
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+import os
+import time
+from typing import ClassVar, Iterator, List, Set, Type
+
+from vellum.workflows.errors.types import WorkflowErrorCode
+from vellum.workflows.exceptions import NodeException
+from vellum.workflows.inputs.base import BaseInputs
+from vellum.workflows.nodes.bases.base import BaseNode
+from vellum.workflows.outputs.base import BaseOutput
+from vellum.workflows.runner.process_executor import get_default_process_executor, set_default_process_executor
+from vellum.workflows.state.base import BaseState
+from vellum.workflows.types.core import ExecutionMode
+from vellum.workflows.workflows.base import BaseWorkflow
+
+
+@pytest.fixture(scope="module", autouse=True)
+def process_executor() -> Iterator[ProcessPoolExecutor]:
+    executor = ProcessPoolExecutor(max_workers=4, mp_context=multiprocessing.get_context("spawn"))
+    set_default_process_executor(executor)
+    yield executor
+    set_default_process_executor(None)
+    executor.shutdown()
+
+
+class Inputs(BaseInputs):
+    text: str
+
+
+class State(BaseState):
+    multiplier: int = 2
+
+
+class WordCountNode(BaseNode[State]):
+    text = Inputs.text
+
+    class Outputs(BaseNode.Outputs):
+        count: int
+        pid: int
+
+    class Execution(BaseNode.Execution):
+        mode = ExecutionMode.PROCESS
+
+    def run(self) -> Outputs:
+        return self.Outputs(count=len(self.text.split()) * self.state.multiplier, pid=os.getpid())
+
+
+class WordCountWorkflow(BaseWorkflow[Inputs, State]):
+    graph = WordCountNode
+
+    class Outputs(BaseWorkflow.Outputs):
+        count = WordCountNode.Outputs.count
+        pid = WordCountNode.Outputs.pid
+
+
+def test_process_execution__runs_node_in_a_separate_process():
+    # GIVEN a workflow whose node opts into running in a separate process
+    workflow = WordCountWorkflow()
+
+    # WHEN we run the workflow
+    terminal_event = workflow.run(inputs=Inputs(text="the quick brown fox"))
+
+    # THEN the node should have been run with its resolved inputs and the state's values
+    assert terminal_event.name == "workflow.execution.fulfilled", terminal_event
+    assert terminal_event.outputs.count == 8
+
+    # AND it should have run in a different process
+    assert terminal_event.outputs.pid != os.getpid()
+
+
+class StreamingProcessNode(BaseNode):
+    class Outputs(BaseNode.Outputs):
+        words: List[str]
+
+    class Execution(BaseNode.Execution):
+        mode = ExecutionMode.PROCESS
+
+    def run(self) -> Iterator[BaseOutput]:
+        words = []
+        for word in ["hello", "world"]:
+            words.append(word)
+            yield BaseOutput(name="words", delta=word)
+
+        yield BaseOutput(name="words", value=words)
+
+
+class StreamingProcessWorkflow(BaseWorkflow):
+    graph = StreamingProcessNode
+
+    class Outputs(BaseWorkflow.Outputs):
+        words = StreamingProcessNode.Outputs.words
+
+
+def test_process_execution__replays_streamed_outputs():
+    # GIVEN a workflow whose node streams its outputs from a separate process
+    workflow = StreamingProcessWorkflow()
+
+    # WHEN we stream the workflow
+    events = list(workflow.stream())
+
+    # THEN the node's deltas should still have been streamed
+    deltas = [e.output.delta for e in events if e.name == "workflow.execution.streaming" and e.output.is_streaming]
+    assert deltas == ["hello", "world"]
+
+    # AND the workflow should have been fulfilled with its final outputs
+    assert events[-1].name == "workflow.execution.fulfilled", events[-1]
+    assert events[-1].outputs.words == ["hello", "world"]
+
+
+def test_process_execution__node_that_cannot_be_pickled():
+    # GIVEN a node that opts into running in a separate process, but is defined locally and so can't be pickled
+    class LocalNode(BaseNode):
+        class Execution(BaseNode.Execution):
+            mode = ExecutionMode.PROCESS
+
+    class LocalWorkflow(BaseWorkflow):
+        graph = LocalNode
+
+    # WHEN we run the workflow
+    terminal_event = LocalWorkflow().run()
+
+    # THEN the workflow should have been rejected with a helpful error
+    assert terminal_event.name == "workflow.execution.rejected"
+    assert terminal_event.error.code == WorkflowErrorCode.INVALID_INPUTS
+    assert "LocalNode could not be sent to a separate process" in terminal_event.error.message
+
+
+class FailingProcessNode(BaseNode):
+    class Execution(BaseNode.Execution):
+        mode = ExecutionMode.PROCESS
+
+    def run(self) -> BaseNode.Outputs:
+        raise NodeException(message="Something went wrong", code=WorkflowErrorCode.INVALID_OUTPUTS)
+
+
+class FailingProcessWorkflow(BaseWorkflow):
+    graph = FailingProcessNode
+
+
+def test_process_execution__node_exception_does_not_break_the_pool():
+    # GIVEN a workflow whose node raises a NodeException in a separate process
+    workflow = FailingProcessWorkflow()
+
+    # WHEN we run the workflow
+    terminal_event = workflow.run()
+
+    # THEN the workflow should have been rejected with the node's error
+    assert terminal_event.name == "workflow.execution.rejected", terminal_event
+    assert terminal_event.error.code == WorkflowErrorCode.INVALID_OUTPUTS
+    assert terminal_event.error.message == "Something went wrong"
+
+    # AND nodes run in a separate process afterwards should still succeed
+    next_terminal_event = WordCountWorkflow().run(inputs=Inputs(text="hello world"))
+    assert next_terminal_event.name == "workflow.execution.fulfilled", next_terminal_event
+    assert next_terminal_event.outputs.count == 4
+
+
+def _burn_cpu() -> int:
+    total = 0
+    for i in range(3_000_000):
+        total += i % 7
+    return total
+
+
+class ThreadCpuNode(BaseNode):
+    class Outputs(BaseNode.Outputs):
+        total: int
+
+    def run(self) -> Outputs:
+        return self.Outputs(total=_burn_cpu())
+
+
+class ThreadCpuNode1(ThreadCpuNode):
+    pass
+
+
+class ThreadCpuNode2(ThreadCpuNode):
+    pass
+
+
+class ThreadCpuNode3(ThreadCpuNode):
+    pass
+
+
+class ThreadCpuNode4(ThreadCpuNode):
+    pass
+
+
+class ProcessCpuNode(ThreadCpuNode):
+    class Execution(BaseNode.Execution):
+        mode = ExecutionMode.PROCESS
+
+
+class ProcessCpuNode1(ProcessCpuNode):
+    pass
+
+
+class ProcessCpuNode2(ProcessCpuNode):
+    pass
+
+
+class ProcessCpuNode3(ProcessCpuNode):
+    pass
+
+
+class ProcessCpuNode4(ProcessCpuNode):
+    pass
+
+
+class ThreadCpuWorkflow(BaseWorkflow):
+    graph: ClassVar[Set[Type[BaseNode]]] = {ThreadCpuNode1, ThreadCpuNode2, ThreadCpuNode3, ThreadCpuNode4}
+
+
+class ProcessCpuWorkflow(BaseWorkflow):
+    graph: ClassVar[Set[Type[BaseNode]]] = {ProcessCpuNode1, ProcessCpuNode2, ProcessCpuNode3, ProcessCpuNode4}
+
+
+@pytest.mark.benchmark
+@pytest.mark.skipif((os.cpu_count() or 1) < 4, reason="Requires at least 4 cores to measure a speedup")
+def test_process_execution__cpu_bound_benchmark(process_executor, capsys):
+    """
+    Compares how long the same CPU bound branches take on threads and on processes. The timings are only reported,
+    since they depend too much on the machine to assert on.
+    """
+
+    # GIVEN a warmed up process pool, so that we don't measure worker start up
+    list(process_executor.map(time.sleep, [0.1] * 4))
+
+    # WHEN we run the same CPU bound branches on threads and on processes
+    start = time.perf_counter()
+    assert ThreadCpuWorkflow().run().name == "workflow.execution.fulfilled"
+    thread_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    assert ProcessCpuWorkflow().run().name == "workflow.execution.fulfilled"
+    process_elapsed = time.perf_counter() - start
+
+    # THEN we report how long each took
+    with capsys.disabled():
+        print(f"\nthreads: {thread_elapsed:.2f}s, processes: {process_elapsed:.2f}s")  # noqa: T201
+
+
+def test_get_default_process_executor__is_shared():
+    # GIVEN the default process executor is overridden by this module's fixture
+    # THEN the same executor should be returned every time
+    assert get_default_process_executor() is get_default_process_executor()
@@ -0,0 +1,107 @@
+from queue import Queue
+import threading
+import time
+from typing import Iterator
+
+from vellum.workflows.nodes.bases.base import BaseNode
+from vellum.workflows.outputs.base import BaseOutput
+from vellum.workflows.runner.runner import WorkflowRunner
+from vellum.workflows.workflows.base import BaseWorkflow
+
+# Set by the caller of `stream()` once it receives the first token
+first_token_received = threading.Event()
+
+
+class StreamingNode(BaseNode):
+    class Outputs(BaseNode.Outputs):
+        text: str
+        was_token_received: bool
+
+    def run(self) -> Iterator[BaseOutput]:
+        yield BaseOutput(name="text", delta="Hello")
+
+        # Bounded, so that a runner that holds the token back until the node finishes fails rather than hangs
+        was_token_received = first_token_received.wait(timeout=5)
+        yield BaseOutput(name="text", value="Hello")
+        yield BaseOutput(name="was_token_received", value=was_token_received)
+
+
+class StreamingWorkflow(BaseWorkflow):
+    graph = StreamingNode
+
+    class Outputs(BaseWorkflow.Outputs):
+        text = StreamingNode.Outputs.text
+        was_token_received = StreamingNode.Outputs.was_token_received
+
+
+def test_stream__first_token_delivered_while_node_is_running():
+    # GIVEN a workflow whose only node streams a token, then waits for the caller to receive it
+    first_token_received.clear()
+    workflow = StreamingWorkflow()
+
+    # WHEN we stream the workflow, signaling the node as soon as the token arrives
+    events = []
+    for event in workflow.stream():
+        events.append(event)
+        if event.name == "workflow.execution.streaming" and event.output.is_streaming:
+            first_token_received.set()
+
+    # THEN the token should have reached the caller while the node was still running
+    assert events[-1].name == "workflow.execution.fulfilled", events[-1]
+    assert events[-1].outputs.was_token_received is True
+
+
+class SlowNode(BaseNode):
+    class Outputs(BaseNode.Outputs):
+        done: bool
+
+    def run(self) -> Outputs:
+        time.sleep(0.3)
+        return self.Outputs(done=True)
+
+
+class SlowWorkflow(BaseWorkflow):
+    graph = SlowNode
+
+    class Outputs(BaseWorkflow.Outputs):
+        done = SlowNode.Outputs.done
+
+
+def test_stream__does_not_poll_while_waiting_on_a_slow_node(mocker):
+    # GIVEN a workflow whose node takes a while to run
+    workflow = SlowWorkflow()
+
+    # AND a spy on every queue read made by the caller's thread
+    caller_thread = threading.current_thread()
+    queue_get = Queue.get
+    caller_reads = []
+
+    def spy_get(self, *args, **kwargs):
+        if threading.current_thread() is caller_thread:
+            caller_reads.append(kwargs.get("timeout"))
+        return queue_get(self, *args, **kwargs)
+
+    mocker.patch.object(Queue, "get", spy_get)
+
+    # WHEN we stream every event out of the workflow
+    events = list(WorkflowRunner(workflow).stream())
+
+    # THEN the workflow should have been fulfilled
+    assert events[-1].name == "workflow.execution.fulfilled", events[-1]
+
+    # AND the caller should only have read from the queue once per event, plus the final non-blocking drain
+    assert all(timeout is None for timeout in caller_reads)
+    assert len(caller_reads) <= len(events) + 1
+
+
+def test_stream__stream_failure_ends_the_stream(mocker):
+    # GIVEN a runner that fails while streaming, before emitting a terminal event
+    mocker.patch.object(WorkflowRunner, "_stream", side_effect=Exception("Stream failed"))
+
+    # WHEN we stream the workflow
+    events = list(StreamingWorkflow().stream())
+
+    # THEN the stream should end with a rejection, without any node having been run
+    assert [event.name for event in events] == ["workflow.execution.initiated", "workflow.execution.rejected"]
+    assert events[-1].name == "workflow.execution.rejected"
+    assert events[-1].error.message == "An unexpected error occurred while streaming Workflow events"
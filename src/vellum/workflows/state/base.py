@@ -1,12 +1,31 @@
-from collections import defaultdict
+from collections import defaultdict, deque
 from copy import deepcopy
 from dataclasses import field
 from datetime import datetime
+from itertools import count
 from queue import Queue
-from threading import Lock
+from threading import Lock, RLock
 from uuid import UUID, uuid4
-from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Sequence, Set, Tuple, Type, cast
-from typing_extensions import dataclass_transform
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    cast,
+)
+from typing_extensions import Self, SupportsIndex, dataclass_transform
 
 from pydantic import GetCoreSchemaHandler, field_serializer
 from pydantic_core import core_schema
@@ -18,7 +37,13 @@ from vellum.workflows.inputs.base import BaseInputs
 from vellum.workflows.references import ExternalInputReference, OutputReference, StateValueReference
 from vellum.workflows.types.generics import StateType
 from vellum.workflows.types.stack import Stack
-from vellum.workflows.types.utils import datetime_now, deepcopy_with_exclusions, get_class_by_qualname, infer_types
+from vellum.workflows.types.utils import (
+    TypeCacheMeta,
+    datetime_now,
+    deepcopy_with_exclusions,
+    get_class_by_qualname,
+    infer_types,
+)
 
 if TYPE_CHECKING:
     from vellum.workflows.nodes.bases import BaseNode
@@ -38,7 +63,7 @@ class _Snapshottable:
 
 
 @dataclass_transform(kw_only_default=True)
-class _BaseStateMeta(type):
+class _BaseStateMeta(TypeCacheMeta):
     def __getattribute__(cls, name: str) -> Any:
         if not name.startswith("_"):
             instance = vars(cls).get(name)
@@ -48,33 +73,278 @@ class _BaseStateMeta(type):
         return super().__getattribute__(name)
 
 
-class _SnapshottableDict(dict, _Snapshottable):
+class _SnapshottableContainer(_Snapshottable):
+    """
+    A dict or list on state whose edits are tracked, so that snapshots can tell whether it changed in place since the
+    last one and otherwise share their previous copy of it.
+    """
+
+    # Incremented on every edit to this container, or to any container within it
+    _version: int = 0
+    # The containers this one was stored in, whose versions its edits also increment
+    _parents: List["_SnapshottableContainer"]
+
+    def _track(self, value: Any) -> Any:
+        # Makes a value about to be stored in this container snapshottable, so that its own edits are tracked too
+        value = _make_snapshottable(value, self._snapshot_callback)
+        if isinstance(value, _SnapshottableContainer):
+            value._parents.append(self)
+        return value
+
+    def _edited(self) -> None:
+        edited_containers: List[_SnapshottableContainer] = [self]
+        seen: Set[int] = set()
+        while edited_containers:
+            container = edited_containers.pop()
+            if id(container) in seen:
+                continue
+
+            seen.add(id(container))
+            container._version += 1
+            edited_containers.extend(container._parents)
+
+
+class _SnapshottableDict(dict, _SnapshottableContainer):
     def __setitem__(self, key: Any, value: Any) -> None:
-        super().__setitem__(key, value)
+        super().__setitem__(key, self._track(value))
+        self._edited()
         self._snapshot_callback()
 
+    def __delitem__(self, key: Any) -> None:
+        super().__delitem__(key)
+        self._edited()
+
+    def __ior__(self, other: Any) -> Self:  # type: ignore[misc]
+        self.update(other)
+        return self
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        super().update({key: self._track(value) for key, value in dict(*args, **kwargs).items()})
+        self._edited()
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        if key not in self:
+            super().__setitem__(key, self._track(default))
+            self._edited()
+        return self[key]
+
+    def pop(self, *args: Any) -> Any:
+        value = super().pop(*args)
+        self._edited()
+        return value
+
+    def popitem(self) -> Tuple[Any, Any]:
+        item = super().popitem()
+        self._edited()
+        return item
+
+    def clear(self) -> None:
+        super().clear()
+        self._edited()
+
+    def __copy__(self) -> Dict[Any, Any]:
+        return dict(self)
+
+    def __deepcopy__(self, memo: Any) -> "_SnapshottableDict":
+        new_dict = self.__class__()
+        new_dict._snapshot_callback = self._snapshot_callback
+        new_dict._parents = []
+        memo[id(self)] = new_dict
+        dict.update(
+            new_dict, {deepcopy(key, memo): new_dict._track(deepcopy(value, memo)) for key, value in self.items()}
+        )
+        return new_dict
+
+
+class _SnapshottableNodeOutputs(_SnapshottableDict):
+    """
+    Node outputs are kept exactly as their nodes returned them, so unlike other dicts on state, the values stored in
+    them aren't made snapshottable. Snapshots treat each of them as a value that isn't edited in place.
+    """
+
+    def _track(self, value: Any) -> Any:
+        return value
+
+
+class _SnapshottableList(list, _SnapshottableContainer):
+    def __setitem__(self, index: Any, value: Any) -> None:
+        if isinstance(index, slice):
+            super().__setitem__(index, [self._track(item) for item in value])
+        else:
+            super().__setitem__(index, self._track(value))
+        self._edited()
+
+    def __delitem__(self, index: Any) -> None:
+        super().__delitem__(index)
+        self._edited()
+
+    def __iadd__(self, other: Iterable[Any]) -> Self:  # type: ignore[misc]
+        self.extend(other)
+        return self
+
+    def __imul__(self, count: SupportsIndex) -> Self:
+        super().__imul__(count)
+        self._edited()
+        return self
+
+    def append(self, value: Any) -> None:
+        super().append(self._track(value))
+        self._edited()
+
+    def extend(self, values: Any) -> None:
+        super().extend([self._track(value) for value in values])
+        self._edited()
+
+    def insert(self, index: Any, value: Any) -> None:
+        super().insert(index, self._track(value))
+        self._edited()
+
+    def pop(self, *args: Any) -> Any:
+        value = super().pop(*args)
+        self._edited()
+        return value
+
+    def remove(self, value: Any) -> None:
+        super().remove(value)
+        self._edited()
+
+    def clear(self) -> None:
+        super().clear()
+        self._edited()
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        super().sort(*args, **kwargs)
+        self._edited()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._edited()
+
+    def __copy__(self) -> List[Any]:
+        return list(self)
+
+    def __deepcopy__(self, memo: Any) -> "_SnapshottableList":
+        new_list = self.__class__()
+        new_list._snapshot_callback = self._snapshot_callback
+        new_list._parents = []
+        memo[id(self)] = new_list
+        list.extend(new_list, [new_list._track(deepcopy(value, memo)) for value in self])
+        return new_list
+
 
 def _make_snapshottable(value: Any, snapshot_callback: Callable[[], None]) -> Any:
     """
     Edits any value to make it snapshottable on edit. Made as a separate function from `BaseState` to
     avoid namespace conflicts with subclasses.
+
+    Dicts and lists are replaced by snapshottable copies, along with every dict and list within them, so that edits
+    made to them in place are tracked. Any other value is left as is.
     """
     if isinstance(value, _Snapshottable):
         return value
 
     if isinstance(value, dict):
-        snapshottable_dict = _SnapshottableDict(value)
+        snapshottable_dict = _SnapshottableDict()
         snapshottable_dict._snapshot_callback = snapshot_callback
+        snapshottable_dict._parents = []
+        dict.update(snapshottable_dict, {key: snapshottable_dict._track(item) for key, item in value.items()})
         return snapshottable_dict
 
+    if type(value) is list:
+        snapshottable_list = _SnapshottableList()
+        snapshottable_list._snapshot_callback = snapshot_callback
+        snapshottable_list._parents = []
+        list.extend(snapshottable_list, [snapshottable_list._track(item) for item in value])
+        return snapshottable_list
+
     return value
 
 
+def _set_snapshot_callback(value: Any, snapshot_callback: Callable[[], None]) -> None:
+    if isinstance(value, _SnapshottableDict):
+        value._snapshot_callback = snapshot_callback
+        for item in value.values():
+            _set_snapshot_callback(item, snapshot_callback)
+    elif isinstance(value, _SnapshottableList):
+        value._snapshot_callback = snapshot_callback
+        for item in value:
+            _set_snapshot_callback(item, snapshot_callback)
+
+
+class _SnapshotCopy(NamedTuple):
+    """
+    A copy of a value taken for a state snapshot, which later snapshots share for as long as the value is unchanged.
+    """
+
+    value: Any
+    version: int
+    copy: Any
+    # The copies of the items of a snapshottable container, by the id of each item
+    items: Dict[int, "_SnapshotCopy"]
+
+
+def _copy_for_snapshot(value: Any, previous: Optional[_SnapshotCopy]) -> _SnapshotCopy:
+    """
+    Copies a value for a state snapshot, sharing as much as possible with the copy taken for the previous snapshot.
+
+    A snapshottable container that wasn't edited since the previous snapshot reuses its previous copy. One that was
+    only has its spine copied, reusing the copies of every item that didn't change. Any other value is copied once and
+    then shared by every later snapshot for as long as the same object is on state, so edits made inside it in place,
+    such as setting a field on a model, are only picked up by later snapshots once the value is assigned again.
+    """
+    version = value._version if isinstance(value, _SnapshottableContainer) else 0
+    if previous is not None and previous.value is value and previous.version == version:
+        return previous
+
+    if isinstance(value, Queue):
+        # Streaming outputs are shared as is, since they're only ever read from
+        return _SnapshotCopy(value, version, value, {})
+
+    previous_items = previous.items if previous is not None else {}
+    items: Dict[int, _SnapshotCopy] = {}
+
+    def copy_item(item: Any) -> Any:
+        item_copy = items.get(id(item)) or _copy_for_snapshot(item, previous_items.get(id(item)))
+        items[id(item)] = item_copy
+        return item_copy.copy
+
+    if isinstance(value, _SnapshottableDict):
+        return _SnapshotCopy(value, version, {key: copy_item(item) for key, item in list(value.items())}, items)
+
+    if isinstance(value, _SnapshottableList):
+        return _SnapshotCopy(value, version, [copy_item(item) for item in list(value)], items)
+
+    return _SnapshotCopy(value, version, deepcopy(value), {})
+
+
+_T = TypeVar("_T")
+
+# Versions are drawn from a shared counter, since `next` can't lose an update to a concurrent edit the way `+= 1` can
+_node_execution_cache_versions = count()
+
+
 class NodeExecutionCache:
+    """
+    Tracks which executions of each node have been queued, initiated and fulfilled.
+
+    Every state snapshot copies the cache, so copies share each node's containers with the cache they were copied
+    from, and whichever of the two next edits a container first replaces it with its own copy. Snapshots copy and dump
+    the cache from other threads while the runner updates it, so edits, copies and dumps all hold the cache's lock.
+    """
+
     _node_executions_fulfilled: Dict[Type["BaseNode"], Stack[UUID]]
     _node_executions_initiated: Dict[Type["BaseNode"], Set[UUID]]
-    _node_executions_queued: Dict[Type["BaseNode"], List[UUID]]
-    _dependencies_invoked: Dict[UUID, Set[Type["BaseNode"]]]
+    # Used as ordered sets, so that executions can be dequeued in constant time
+    _node_executions_queued: Dict[Type["BaseNode"], Dict[UUID, None]]
+    # For each node and dependency, the queued executions that the dependency has yet to invoke, in queued order
+    _node_executions_pending: Dict[Type["BaseNode"], Dict[Type["BaseNode"], Deque[UUID]]]
+    _dependencies_invoked: Dict[UUID, FrozenSet[Type["BaseNode"]]]
+    _dumped_dependencies_invoked: Dict[str, List[str]]
+    # The ids of the containers that aren't shared with any copy of this cache, and so can be edited in place
+    _owned_containers: Set[int]
+    _version: int
+    _dumped: Optional[Tuple[int, Dict[str, Any]]]
+    _lock: Lock
 
     def __init__(
         self,
@@ -83,13 +353,21 @@ class NodeExecutionCache:
         node_executions_initiated: Optional[Dict[str, Sequence[str]]] = None,
         node_executions_queued: Optional[Dict[str, Sequence[str]]] = None,
     ) -> None:
-        self._dependencies_invoked = defaultdict(set)
+        self._dependencies_invoked = defaultdict(frozenset)
+        self._dumped_dependencies_invoked = {}
         self._node_executions_fulfilled = defaultdict(Stack[UUID])
         self._node_executions_initiated = defaultdict(set)
-        self._node_executions_queued = defaultdict(list)
+        self._node_executions_queued = defaultdict(dict)
+        self._node_executions_pending = defaultdict(dict)
+        self._owned_containers = set()
+        self._version = next(_node_execution_cache_versions)
+        self._dumped = None
+        self._lock = Lock()
 
         for execution_id, dependencies in (dependencies_invoked or {}).items():
-            self._dependencies_invoked[UUID(execution_id)] = {get_class_by_qualname(dep) for dep in dependencies}
+            self._set_dependencies_invoked(
+                UUID(execution_id), frozenset(get_class_by_qualname(dep) for dep in dependencies)
+            )
 
         for node, execution_ids in (node_executions_fulfilled or {}).items():
             node_class = get_class_by_qualname(node)
@@ -101,7 +379,26 @@ class NodeExecutionCache:
 
         for node, execution_ids in (node_executions_queued or {}).items():
             node_class = get_class_by_qualname(node)
-            self._node_executions_queued[node_class].extend(UUID(execution_id) for execution_id in execution_ids)
+            self._node_executions_queued[node_class].update(
+                (UUID(execution_id), None) for execution_id in execution_ids
+            )
+
+    def _get_owned_container(
+        self, containers: Dict[Type["BaseNode"], _T], node: Type["BaseNode"], copy: Callable[[_T], _T]
+    ) -> _T:
+        # Must be called while holding `_lock`, so that the container can't be shared by a copy made in between
+        container = containers[node]
+        if id(container) not in self._owned_containers:
+            container = copy(container)
+            containers[node] = container
+            self._owned_containers.add(id(container))
+
+        return container
+
+    def _set_dependencies_invoked(self, execution_id: UUID, dependencies_invoked: FrozenSet[Type["BaseNode"]]) -> None:
+        self._dependencies_invoked[execution_id] = dependencies_invoked
+        self._dumped_dependencies_invoked[str(execution_id)] = [str(dep) for dep in dependencies_invoked]
+        self._version = next(_node_execution_cache_versions)
 
     def _invoke_dependency(
         self,
@@ -110,9 +407,26 @@ class NodeExecutionCache:
         dependency: Type["BaseNode"],
         dependencies: Set["Type[BaseNode]"],
     ) -> None:
-        self._dependencies_invoked[execution_id].add(dependency)
-        if all(dep in self._dependencies_invoked[execution_id] for dep in dependencies):
-            self._node_executions_queued[node].remove(execution_id)
+        dependencies_invoked = self._dependencies_invoked[execution_id] | {dependency}
+        self._set_dependencies_invoked(execution_id, dependencies_invoked)
+        if dependencies.issubset(dependencies_invoked):
+            del self._get_owned_container(self._node_executions_queued, node, dict)[execution_id]
+
+    def _get_pending_node_executions(self, node: Type["BaseNode"], dependency: Type["BaseNode"]) -> Deque[UUID]:
+        pending_node_executions = self._get_owned_container(
+            self._node_executions_pending,
+            node,
+            lambda pending_by_dependency: {key: deque(pending) for key, pending in pending_by_dependency.items()},
+        )
+        if dependency not in pending_node_executions:
+            # Built from the queue the first time a dependency invokes the node, and kept up to date from then on
+            pending_node_executions[dependency] = deque(
+                execution_id
+                for execution_id in self._node_executions_queued[node]
+                if dependency not in self._dependencies_invoked.get(execution_id, frozenset())
+            )
+
+        return pending_node_executions[dependency]
 
     def queue_node_execution(
         self, node: Type["BaseNode"], dependencies: Set["Type[BaseNode]"], invoked_by: Optional[Edge] = None
@@ -121,13 +435,28 @@ class NodeExecutionCache:
         if not invoked_by:
             return execution_id
 
+        with self._lock:
+            return self._queue_node_execution(execution_id, node, dependencies, invoked_by)
+
+    def _queue_node_execution(
+        self, execution_id: UUID, node: Type["BaseNode"], dependencies: Set["Type[BaseNode]"], invoked_by: Edge
+    ) -> UUID:
         source_node = invoked_by.from_port.node_class
-        for queued_node_execution_id in self._node_executions_queued[node]:
-            if source_node not in self._dependencies_invoked[queued_node_execution_id]:
+        node_executions_queued = self._get_owned_container(self._node_executions_queued, node, dict)
+        pending_node_executions = self._get_pending_node_executions(node, source_node)
+        while pending_node_executions:
+            queued_node_execution_id = pending_node_executions.popleft()
+            # Executions are dequeued once all of their dependencies invoke them, so any that were invoked by
+            # nodes outside of `dependencies` may have been dequeued while still pending for the source node
+            if queued_node_execution_id in node_executions_queued:
                 self._invoke_dependency(queued_node_execution_id, node, source_node, dependencies)
                 return queued_node_execution_id
 
-        self._node_executions_queued[node].append(execution_id)
+        node_executions_queued[execution_id] = None
+        for dependency, pending in self._node_executions_pending[node].items():
+            if dependency is not source_node:
+                pending.append(execution_id)
+
         self._invoke_dependency(execution_id, node, source_node, dependencies)
         return execution_id
 
@@ -135,30 +464,63 @@ class NodeExecutionCache:
         return execution_id in self._node_executions_initiated[node]
 
     def initiate_node_execution(self, node: Type["BaseNode"], execution_id: UUID) -> None:
-        self._node_executions_initiated[node].add(execution_id)
+        with self._lock:
+            self._get_owned_container(self._node_executions_initiated, node, set).add(execution_id)
+            self._version = next(_node_execution_cache_versions)
 
     def fulfill_node_execution(self, node: Type["BaseNode"], execution_id: UUID) -> None:
-        self._node_executions_fulfilled[node].push(execution_id)
+        with self._lock:
+            self._get_owned_container(self._node_executions_fulfilled, node, Stack.copy).push(execution_id)
+            self._version = next(_node_execution_cache_versions)
 
     def get_execution_count(self, node: Type["BaseNode"]) -> int:
         return self._node_executions_fulfilled[node].size()
 
     def dump(self) -> Dict[str, Any]:
-        return {
-            "dependencies_invoked": {
-                str(execution_id): [str(dep) for dep in dependencies]
-                for execution_id, dependencies in self._dependencies_invoked.items()
-            },
-            "node_executions_initiated": {
-                str(node): list(execution_ids) for node, execution_ids in self._node_executions_initiated.items()
-            },
-            "node_executions_fulfilled": {
-                str(node): execution_ids.dump() for node, execution_ids in self._node_executions_fulfilled.items()
-            },
-            "node_executions_queued": {
-                str(node): execution_ids for node, execution_ids in self._node_executions_queued.items()
-            },
-        }
+        """
+        Returns a JSON-serializable view of the cache. The view is reused until the cache next changes, and so must
+        not be mutated.
+        """
+
+        with self._lock:
+            version = self._version
+            if self._dumped is not None and self._dumped[0] == version:
+                return self._dumped[1]
+
+            dumped = {
+                "dependencies_invoked": dict(self._dumped_dependencies_invoked),
+                "node_executions_initiated": {
+                    str(node): list(execution_ids) for node, execution_ids in self._node_executions_initiated.items()
+                },
+                "node_executions_fulfilled": {
+                    str(node): execution_ids.dump() for node, execution_ids in self._node_executions_fulfilled.items()
+                },
+                "node_executions_queued": {
+                    str(node): list(execution_ids) for node, execution_ids in self._node_executions_queued.items()
+                },
+            }
+            self._dumped = (version, dumped)
+            return dumped
+
+    def __deepcopy__(self, memo: Any) -> "NodeExecutionCache":
+        # Execution ids and node classes are immutable, and dependencies are stored as frozensets, so only the
+        # top-level containers are copied. Each node's containers are shared until either cache edits them.
+        cache_copy = self.__class__.__new__(self.__class__)
+        with self._lock:
+            cache_copy._dependencies_invoked = defaultdict(frozenset, self._dependencies_invoked)
+            cache_copy._dumped_dependencies_invoked = dict(self._dumped_dependencies_invoked)
+            cache_copy._node_executions_fulfilled = defaultdict(Stack[UUID], self._node_executions_fulfilled)
+            cache_copy._node_executions_initiated = defaultdict(set, self._node_executions_initiated)
+            cache_copy._node_executions_queued = defaultdict(dict, self._node_executions_queued)
+            cache_copy._node_executions_pending = defaultdict(dict, self._node_executions_pending)
+            cache_copy._owned_containers = set()
+            self._owned_containers = set()
+            cache_copy._version = self._version
+            cache_copy._dumped = self._dumped
+
+        cache_copy._lock = Lock()
+        memo[id(self)] = cache_copy
+        return cache_copy
 
     @classmethod
     def __get_pydantic_core_schema__(
@@ -200,7 +562,11 @@ class StateMeta(UniversalBaseModel):
         self.__snapshot_callback__ = None
 
     def add_snapshot_callback(self, callback: Callable[[], None]) -> None:
-        self.node_outputs = _make_snapshottable(self.node_outputs, callback)
+        if not isinstance(self.node_outputs, _SnapshottableNodeOutputs):
+            node_outputs = _SnapshottableNodeOutputs(self.node_outputs)
+            node_outputs._parents = []
+            self.node_outputs = node_outputs
+        self.node_outputs._snapshot_callback = callback
         self.__snapshot_callback__ = callback
 
     def __setattr__(self, name: str, value: Any) -> None:
@@ -240,14 +606,16 @@ class StateMeta(UniversalBaseModel):
 class BaseState(metaclass=_BaseStateMeta):
     meta: StateMeta = field(init=False)
 
-    __lock__: Lock = field(init=False)
+    __lock__: RLock = field(init=False)
     __is_initializing__: bool = field(init=False)
     __snapshot_callback__: Callable[["BaseState"], None] = field(init=False)
+    __snapshot_cache__: Dict[Any, _SnapshotCopy] = field(init=False)
 
     def __init__(self, meta: Optional[StateMeta] = None, **kwargs: Any) -> None:
         self.__is_initializing__ = True
         self.__snapshot_callback__ = lambda state: None
-        self.__lock__ = Lock()
+        self.__snapshot_cache__ = {}
+        self.__lock__ = RLock()
 
         self.meta = meta or StateMeta()
         self.meta.add_snapshot_callback(self.__snapshot__)
@@ -268,11 +636,15 @@ class BaseState(metaclass=_BaseStateMeta):
         new_state = deepcopy_with_exclusions(
             self,
             exclusions={
-                "__lock__": Lock(),
+                "__lock__": RLock(),
+                "__snapshot_cache__": {},
             },
             memo=memo,
         )
         new_state.meta.add_snapshot_callback(new_state.__snapshot__)
+        for name, value in vars(new_state).items():
+            if not name.startswith("_") and name != "meta":
+                _set_snapshot_callback(value, new_state.__snapshot__)
         return new_state
 
     def __repr__(self) -> str:
@@ -309,12 +681,15 @@ class BaseState(metaclass=_BaseStateMeta):
         return self.__dict__[key]
 
     def __setattr__(self, name: str, value: Any) -> None:
-        if name.startswith("_") or self.__is_initializing__:
+        if name.startswith("_"):
             super().__setattr__(name, value)
             return
 
         snapshottable_value = _make_snapshottable(value, self.__snapshot__)
         super().__setattr__(name, snapshottable_value)
+        if self.__is_initializing__:
+            return
+
         self.meta.updated_ts = datetime_now()
         self.__snapshot__()
 
@@ -350,7 +725,61 @@ class BaseState(metaclass=_BaseStateMeta):
         Snapshots the current state to the workflow emitter. The invoked callback is overridden by the
         workflow runner.
         """
-        self.__snapshot_callback__(deepcopy(self))
+        self.__snapshot_callback__(self.__structural_copy__())
+
+    def __structural_copy__(self) -> "BaseState":
+        """
+        Creates a read-only copy of the current state that shares every unchanged value with the previous copy, so
+        that snapshotting costs the size of what changed rather than the size of the entire state.
+
+        Dicts and lists on state track their edits, so only those edited since the previous copy are copied again.
+        Any other value, like a model or a node output, is copied once and shared until it's replaced, so edits
+        made inside it in place are only picked up once it's assigned again. Consumers that need to mutate a copy
+        should `deepcopy` it first.
+        """
+
+        with self.__lock__:
+            node_outputs = self.meta.node_outputs
+            meta_copy = self.meta.model_copy(
+                update={
+                    "workflow_inputs": self.__copy_snapshot_value__(
+                        ("meta", "workflow_inputs"), self.meta.workflow_inputs
+                    ),
+                    "external_inputs": deepcopy(self.meta.external_inputs),
+                    # Only snapshottable node outputs track their edits, so any others are copied in full
+                    "node_outputs": (
+                        self.__copy_snapshot_value__(("meta", "node_outputs"), node_outputs)
+                        if isinstance(node_outputs, _SnapshottableContainer)
+                        else _copy_for_snapshot(node_outputs, None).copy
+                    ),
+                    "node_execution_cache": deepcopy(self.meta.node_execution_cache),
+                }
+            )
+            meta_copy.__snapshot_callback__ = None
+
+            state_copy = self.__class__.__new__(self.__class__)
+            state_copy.__dict__.update(
+                {
+                    "__is_initializing__": False,
+                    "__snapshot_callback__": lambda state: None,
+                    "__snapshot_cache__": {},
+                    "__lock__": RLock(),
+                    "meta": meta_copy,
+                }
+            )
+            for name, value in list(self.__dict__.items()):
+                if name.startswith("_") or name == "meta":
+                    continue
+
+                state_copy.__dict__[name] = self.__copy_snapshot_value__(("attribute", name), value)
+
+            return state_copy
+
+    def __copy_snapshot_value__(self, key: Any, value: Any) -> Any:
+        # Must be called while holding `__lock__`
+        snapshot_copy = _copy_for_snapshot(value, self.__snapshot_cache__.get(key))
+        self.__snapshot_cache__[key] = snapshot_copy
+        return snapshot_copy.copy
 
     @classmethod
     def __get_pydantic_core_schema__(
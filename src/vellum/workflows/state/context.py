@@ -2,30 +2,70 @@ from functools import cached_property
 from queue import Queue
 from typing import TYPE_CHECKING, Optional
 
-from vellum import Vellum
 from vellum.workflows.events.types import ParentContext
-from vellum.workflows.vellum_client import create_vellum_client
 
 if TYPE_CHECKING:
+    from vellum import AsyncVellum, Vellum
+    from vellum.workflows.caches.base import BaseCache
     from vellum.workflows.events.workflow import WorkflowEvent
+    from vellum.workflows.runner.executor import WorkflowExecutor
 
 
 class WorkflowContext:
     def __init__(
         self,
-        _vellum_client: Optional[Vellum] = None,
+        _vellum_client: Optional["Vellum"] = None,
         _parent_context: Optional[ParentContext] = None,
+        prompt_response_cache: Optional["BaseCache"] = None,
+        executor: Optional["WorkflowExecutor"] = None,
+        _async_vellum_client: Optional["AsyncVellum"] = None,
     ):
         self._vellum_client = _vellum_client
+        self._async_vellum_client = _async_vellum_client
         self._parent_context = _parent_context
+        # Shared by every Prompt Node in the Workflow, including those in nested Workflows
+        self.prompt_response_cache = prompt_response_cache
+        # Runs the nodes of the Workflow, including those in nested Workflows. Defaults to the process-wide executor
+        if executor is not None:
+            # Imported lazily, since the runner package imports this module
+            from vellum.workflows.runner.executor import validate_executor
+
+            validate_executor(executor)
+        self.executor = executor
         self._event_queue: Optional[Queue["WorkflowEvent"]] = None
 
     @cached_property
-    def vellum_client(self) -> Vellum:
+    def vellum_client(self) -> "Vellum":
         if self._vellum_client:
             return self._vellum_client
 
-        return create_vellum_client()
+        # Imported lazily, since importing the client builds every model used by its resources
+        from vellum.workflows.vellum_client import create_vellum_client
+
+        return create_vellum_client(use_shared_pool=True)
+
+    @property
+    def async_vellum_client(self) -> "AsyncVellum":
+        """
+        The client that nodes running on an event loop send their requests with. Unless one was given, it's pooled per
+        event loop, and so isn't cached here.
+        """
+
+        if self._async_vellum_client:
+            return self._async_vellum_client
+
+        from vellum.workflows.vellum_client import create_async_vellum_client
+
+        if self._vellum_client:
+            # Sends requests with the same credentials as the sync client we were given
+            client_wrapper = self._vellum_client._client_wrapper
+            return create_async_vellum_client(
+                api_key=client_wrapper.api_key,
+                environment=client_wrapper.get_environment(),
+                use_shared_pool=True,
+            )
+
+        return create_async_vellum_client(use_shared_pool=True)
 
     @cached_property
     def parent_context(self) -> Optional[ParentContext]:
@@ -1,28 +1,179 @@
-from typing import Iterator, List
+from bisect import bisect_right
+from collections import deque
+from datetime import datetime
+import json
+import logging
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Deque, Dict, Iterator, List, Optional, TextIO, Type, cast
 
 from vellum.workflows.events.workflow import WorkflowEvent
 from vellum.workflows.state.base import BaseState
+from vellum.workflows.state.encoder import DefaultStateEncoder
+
+if TYPE_CHECKING:
+    from vellum.workflows.nodes.bases import BaseNode
+
+logger = logging.getLogger(__name__)
 
 
 class Store:
-    def __init__(self) -> None:
-        self._events: List[WorkflowEvent] = []
-        self._state_snapshots: List[BaseState] = []
+    """
+    Keeps the events and state snapshots emitted while running a Workflow, so that it can later be resumed.
+
+    max_events: Optional[int] = None - Only keep the most recent N events. `None` keeps every event.
+    max_state_snapshots: Optional[int] = None - Only keep the most recent N state snapshots. `None` keeps every
+        snapshot and `0` turns off snapshot retention entirely.
+
+    Lookups used for resuming a Workflow are indexed by node definition and timestamp, and the node index is
+    kept even after the events it was built from are evicted.
+    """
+
+    def __init__(self, max_events: Optional[int] = None, max_state_snapshots: Optional[int] = None) -> None:
+        self._max_events = max_events
+        self._max_state_snapshots = max_state_snapshots
+        self._lock = Lock()
+        self._reset()
+
+    def _reset(self) -> None:
+        self._events: Deque[WorkflowEvent] = deque(maxlen=self._max_events)
+        # Evicted snapshots are skipped over by an offset rather than deleted one at a time, which would shift every
+        # other snapshot. The lists are compacted once the evicted snapshots make up half of them.
+        self._state_snapshots: List[Optional[BaseState]] = []
+        self._state_snapshot_timestamps: List[datetime] = []
+        self._state_snapshot_offset = 0
+        self._most_recent_state_snapshot: Optional[BaseState] = None
+        self._node_initiated_timestamps: Dict[Type["BaseNode"], datetime] = {}
 
     def append_event(self, event: WorkflowEvent) -> None:
-        self._events.append(event)
+        with self._lock:
+            if event.name == "node.execution.initiated":
+                self._node_initiated_timestamps[event.node_definition] = event.timestamp
+
+            if self._max_events == 0:
+                return
+
+            self._events.append(event)
 
     def append_state_snapshot(self, state: BaseState) -> None:
-        self._state_snapshots.append(state)
+        with self._lock:
+            if self._max_state_snapshots == 0:
+                return
+
+            if (
+                self._most_recent_state_snapshot is None
+                or state.meta.updated_ts >= self._most_recent_state_snapshot.meta.updated_ts
+            ):
+                self._most_recent_state_snapshot = state
+
+            # Snapshots from nodes running concurrently may arrive out of order, so each one is inserted in order of
+            # its timestamp for lookups to bisect. In-order snapshots are appended to the end.
+            index = bisect_right(self._state_snapshot_timestamps, state.meta.updated_ts, lo=self._state_snapshot_offset)
+            self._state_snapshots.insert(index, state)
+            self._state_snapshot_timestamps.insert(index, state.meta.updated_ts)
+            if (
+                self._max_state_snapshots is not None
+                and len(self._state_snapshots) - self._state_snapshot_offset > self._max_state_snapshots
+            ):
+                self._evict_state_snapshot()
+
+    def _evict_state_snapshot(self) -> None:
+        # Must be called while holding the lock
+        self._state_snapshots[self._state_snapshot_offset] = None
+        self._state_snapshot_offset += 1
+        if self._state_snapshot_offset * 2 >= len(self._state_snapshots):
+            del self._state_snapshots[: self._state_snapshot_offset]
+            del self._state_snapshot_timestamps[: self._state_snapshot_offset]
+            self._state_snapshot_offset = 0
 
     def clear(self) -> None:
-        self._events = []
-        self._state_snapshots = []
+        with self._lock:
+            self._reset()
+
+    def get_node_initiated_timestamp(self, node: Type["BaseNode"]) -> Optional[datetime]:
+        """
+        Returns when the most recent execution of the given node was initiated.
+        """
+
+        return self._node_initiated_timestamps.get(node)
+
+    def get_state_snapshot_at(self, timestamp: datetime) -> Optional[BaseState]:
+        """
+        Returns the most recent state snapshot that was last updated at or before the given timestamp.
+        """
+
+        with self._lock:
+            index = bisect_right(self._state_snapshot_timestamps, timestamp, lo=self._state_snapshot_offset)
+            if index == self._state_snapshot_offset:
+                return None
+
+            return self._state_snapshots[index - 1]
+
+    def get_most_recent_state_snapshot(self) -> Optional[BaseState]:
+        return self._most_recent_state_snapshot
+
+    def close(self) -> None:
+        """
+        Releases any resources held by the Store. Called by the runner once a Workflow finishes streaming.
+        """
 
     @property
     def events(self) -> Iterator[WorkflowEvent]:
-        return iter(self._events)
+        with self._lock:
+            return iter(list(self._events))
 
     @property
     def state_snapshots(self) -> Iterator[BaseState]:
-        return iter(self._state_snapshots)
+        with self._lock:
+            return iter(cast(List[BaseState], self._state_snapshots[self._state_snapshot_offset :]))
+
+
+class JsonlLogStore(Store):
+    """
+    A Store that also logs every event and state snapshot to an append-only JSON Lines file, so that a Workflow's
+    full history can be inspected after the fact while the Store's in-memory retention stays bounded.
+
+    The file is only a log. Events and states can be serialized but not deserialized, so it can't be read back into
+    a Store, and lookups used for resuming a Workflow are still answered from memory.
+
+    path: str - The file to append to. Each line is an object with a `type` of either "event" or "state".
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_events: Optional[int] = None,
+        max_state_snapshots: Optional[int] = None,
+    ) -> None:
+        super().__init__(max_events=max_events, max_state_snapshots=max_state_snapshots)
+        self._path = path
+        self._file: Optional[TextIO] = None
+        self._file_lock = Lock()
+
+    def append_event(self, event: WorkflowEvent) -> None:
+        super().append_event(event)
+        self._write_line("event", event)
+
+    def append_state_snapshot(self, state: BaseState) -> None:
+        super().append_state_snapshot(state)
+        self._write_line("state", state)
+
+    def close(self) -> None:
+        with self._file_lock:
+            if self._file:
+                self._file.close()
+                self._file = None
+
+    def _write_line(self, type: str, data: Any) -> None:
+        # Called while the Workflow is streaming, so a value that can't be serialized is skipped rather than raised
+        try:
+            serialized_line = json.dumps({"type": type, "data": data}, cls=DefaultStateEncoder)
+        except (TypeError, ValueError):
+            logger.exception(f"Failed to serialize a {type} to log it to {self._path}")
+            return
+
+        with self._file_lock:
+            if not self._file:
+                self._file = open(self._path, "a")
+
+            self._file.write(serialized_line + "\n")
+            self._file.flush()
@@ -0,0 +1,125 @@
+import pytest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+from typing import Iterator
+
+import httpx
+
+from vellum import VellumEnvironment
+from vellum.workflows.state.context import WorkflowContext
+from vellum.workflows.vellum_client import (
+    VellumClientRegistry,
+    get_default_vellum_client_registry,
+    set_default_vellum_client_registry,
+)
+
+
+class _OkHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def local_server_url() -> Iterator[str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _OkHandler)
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def registry() -> Iterator[VellumClientRegistry]:
+    registry = VellumClientRegistry()
+    set_default_vellum_client_registry(registry)
+    yield registry
+    set_default_vellum_client_registry(None)
+    registry.close()
+
+
+def test_workflow_context__vellum_clients_share_a_connection_pool(registry, monkeypatch):
+    # GIVEN an API key set in the environment
+    monkeypatch.setenv("VELLUM_API_KEY", "test-api-key")
+
+    # WHEN we lazily create a Vellum client from two separate workflow contexts
+    first_client = WorkflowContext().vellum_client
+    second_client = WorkflowContext().vellum_client
+
+    # THEN both clients should share the same underlying httpx client
+    assert first_client._client_wrapper.httpx_client.httpx_client is registry.get_httpx_client(
+        "test-api-key", first_client._client_wrapper.get_environment()
+    )
+    assert (
+        first_client._client_wrapper.httpx_client.httpx_client
+        is second_client._client_wrapper.httpx_client.httpx_client
+    )
+
+
+def test_workflow_context__separate_pools_per_api_key(registry, monkeypatch):
+    # GIVEN a Vellum client created for one API key
+    monkeypatch.setenv("VELLUM_API_KEY", "first-api-key")
+    first_client = WorkflowContext().vellum_client
+
+    # WHEN we create another after the API key changes
+    monkeypatch.setenv("VELLUM_API_KEY", "second-api-key")
+    second_client = WorkflowContext().vellum_client
+
+    # THEN each should have its own connection pool
+    assert (
+        first_client._client_wrapper.httpx_client.httpx_client
+        is not second_client._client_wrapper.httpx_client.httpx_client
+    )
+
+
+def test_vellum_client_registry__pool_stats(registry, local_server_url, monkeypatch):
+    # GIVEN the Vellum API pointed at a local server
+    monkeypatch.setenv("VELLUM_API_URL", local_server_url)
+    httpx_client = registry.get_vellum_client(api_key="test-api-key")._client_wrapper.httpx_client.httpx_client
+
+    # WHEN we make several sequential requests through the shared pool
+    for _ in range(3):
+        assert httpx_client.get(f"{local_server_url}/health").status_code == 200
+
+    # THEN the stats should report a single, reused keep-alive connection
+    stats = registry.get_pool_stats()
+    assert len(stats) == 1
+    assert stats[0].environment == local_server_url
+    assert stats[0].connections == 1
+    assert stats[0].idle_connections == 1
+    assert stats[0].active_connections == 0
+    assert stats[0].pending_requests == 0
+
+
+def test_vellum_client_registry__http2_falls_back_without_h2(monkeypatch):
+    # GIVEN the optional h2 package isn't installed
+    monkeypatch.setattr("importlib.util.find_spec", lambda name: None)
+
+    # WHEN we ask for an HTTP/2 registry
+    registry = VellumClientRegistry(limits=httpx.Limits(max_connections=5), http2=True)
+
+    # THEN it should fall back to HTTP/1.1 rather than failing on first use
+    assert isinstance(
+        registry.get_httpx_client(
+            "test-api-key",
+            VellumEnvironment(default="http://default", documents="http://documents", predict="http://predict"),
+        ),
+        httpx.Client,
+    )
+    assert registry.get_pool_stats()[0].http2 is False
+
+
+def test_default_vellum_client_registry__is_shared():
+    # GIVEN the default registry hasn't been overridden
+    set_default_vellum_client_registry(None)
+
+    # THEN the same registry should be returned every time
+    assert get_default_vellum_client_registry() is get_default_vellum_client_registry()
@@ -0,0 +1,154 @@
+from collections import deque
+from copy import deepcopy
+import json
+from threading import Event, Thread
+from uuid import UUID, uuid4
+from typing import Iterable, List, Tuple
+
+from vellum.workflows.edges.edge import Edge
+from vellum.workflows.nodes.bases import BaseNode
+from vellum.workflows.state.base import NodeExecutionCache
+from vellum.workflows.state.encoder import DefaultStateEncoder
+
+
+class FirstNode(BaseNode):
+    pass
+
+
+class SecondNode(BaseNode):
+    pass
+
+
+class MergeNode(BaseNode):
+    pass
+
+
+FIRST_EDGE = Edge(FirstNode.Ports.default, MergeNode)
+SECOND_EDGE = Edge(SecondNode.Ports.default, MergeNode)
+DEPENDENCIES = {FirstNode, SecondNode}
+
+
+def test_node_execution_cache__pairs_invocations_in_order():
+    # GIVEN a cache for a node with two dependencies
+    cache = NodeExecutionCache()
+
+    # WHEN the first dependency invokes the node twice before the second invokes it twice
+    first_execution_id = cache.queue_node_execution(MergeNode, DEPENDENCIES, FIRST_EDGE)
+    second_execution_id = cache.queue_node_execution(MergeNode, DEPENDENCIES, FIRST_EDGE)
+    third_execution_id = cache.queue_node_execution(MergeNode, DEPENDENCIES, SECOND_EDGE)
+    fourth_execution_id = cache.queue_node_execution(MergeNode, DEPENDENCIES, SECOND_EDGE)
+
+    # THEN the second dependency should have invoked the queued executions in the order they were queued
+    assert first_execution_id != second_execution_id
+    assert third_execution_id == first_execution_id
+    assert fourth_execution_id == second_execution_id
+
+    # AND both executions should have been dequeued
+    assert cache.dump()["node_executions_queued"] == {str(MergeNode): []}
+
+
+def test_node_execution_cache__dump_round_trips():
+    # GIVEN a cache with an execution that's only been invoked by one of its dependencies
+    cache = NodeExecutionCache()
+    execution_id = cache.queue_node_execution(MergeNode, DEPENDENCIES, FIRST_EDGE)
+    cache.initiate_node_execution(FirstNode, execution_id)
+
+    # WHEN we serialize it and load it back
+    dumped = json.loads(json.dumps(cache, cls=DefaultStateEncoder))
+    loaded_cache = NodeExecutionCache(**dumped)
+
+    # THEN the loaded cache should serialize the same way
+    assert json.loads(json.dumps(loaded_cache, cls=DefaultStateEncoder)) == dumped
+
+    # AND it should still pair the queued execution with its other dependency
+    assert loaded_cache.queue_node_execution(MergeNode, DEPENDENCIES, SECOND_EDGE) == execution_id
+
+
+def test_node_execution_cache__deepcopy_is_independent():
+    # GIVEN a cache with a queued execution that has been dumped
+    cache = NodeExecutionCache()
+    execution_id = cache.queue_node_execution(MergeNode, DEPENDENCIES, FIRST_EDGE)
+    dumped = json.loads(json.dumps(cache.dump(), cls=DefaultStateEncoder))
+
+    # WHEN we copy it and keep using the original
+    cache_copy = deepcopy(cache)
+    cache.queue_node_execution(MergeNode, DEPENDENCIES, SECOND_EDGE)
+    cache.fulfill_node_execution(MergeNode, execution_id)
+
+    # THEN the copy should be unaffected
+    assert json.loads(json.dumps(cache_copy.dump(), cls=DefaultStateEncoder)) == dumped
+    assert cache_copy.get_execution_count(MergeNode) == 0
+    assert cache.get_execution_count(MergeNode) == 1
+
+    # AND the copy should be usable on its own
+    assert cache_copy.queue_node_execution(MergeNode, DEPENDENCIES, SECOND_EDGE) == execution_id
+
+
+def test_node_execution_cache__copies_taken_while_updating_are_independent():
+    # GIVEN a cache that another thread keeps copying
+    cache = NodeExecutionCache()
+    copies: List[Tuple[NodeExecutionCache, int, dict]] = []
+    done = Event()
+
+    def copy_cache() -> None:
+        while not done.is_set():
+            cache_copy = deepcopy(cache)
+            copies.append((cache_copy, cache_copy.get_execution_count(MergeNode), cache_copy.dump()))
+
+    thread = Thread(target=copy_cache)
+    thread.start()
+
+    # WHEN we keep fulfilling executions in the meantime
+    try:
+        for _ in range(2000):
+            cache.fulfill_node_execution(MergeNode, uuid4())
+    finally:
+        done.set()
+        thread.join()
+
+    # THEN none of the copies should have been changed by the updates made after they were taken
+    assert copies
+    for cache_copy, execution_count, dumped in copies:
+        assert cache_copy.get_execution_count(MergeNode) == execution_count
+        assert cache_copy.dump() == dumped
+        assert len(dumped["node_executions_fulfilled"].get(str(MergeNode), [])) == execution_count
+
+
+class CountingDeque(deque):
+    """
+    Counts how many executions are copied into the pending deques and popped off of them.
+    """
+
+    copied_count = 0
+    popped_count = 0
+
+    def __init__(self, iterable: Iterable[UUID] = ()) -> None:
+        items = list(iterable)
+        CountingDeque.copied_count += len(items)
+        super().__init__(items)
+
+    def popleft(self) -> UUID:
+        CountingDeque.popped_count += 1
+        return super().popleft()
+
+
+def test_node_execution_cache__long_queue_is_drained_in_linear_time(mocker):
+    # GIVEN a cache for a node whose first dependency invokes it far more often than its second
+    mocker.patch("vellum.workflows.state.base.deque", CountingDeque)
+    CountingDeque.copied_count = 0
+    CountingDeque.popped_count = 0
+    cache = NodeExecutionCache()
+
+    # WHEN the queue grows to thousands of executions and is then drained
+    for _ in range(10000):
+        cache.queue_node_execution(MergeNode, DEPENDENCIES, FIRST_EDGE)
+    for _ in range(10000):
+        cache.queue_node_execution(MergeNode, DEPENDENCIES, SECOND_EDGE)
+
+    # THEN every execution should have been dequeued
+    assert cache.dump()["node_executions_queued"] == {str(MergeNode): []}
+
+    # AND the queue should only have been scanned once, with each execution popped off once when it was dequeued,
+    # rather than the queue being scanned on every invocation
+    assert CountingDeque.copied_count == 10000
+    assert CountingDeque.popped_count == 10000
@@ -2,8 +2,9 @@ import pytest
 from collections import defaultdict
 from copy import deepcopy
 import json
-from typing import Dict
+from typing import Dict, List, Tuple, cast
 
+from vellum import ChatMessage
 from vellum.workflows.nodes.bases import BaseNode
 from vellum.workflows.outputs.base import BaseOutputs
 from vellum.workflows.state.base import BaseState
@@ -26,6 +27,26 @@ class MockNode(BaseNode):
         baz: str
 
 
+class SearchNode(BaseNode):
+    class Outputs(BaseOutputs):
+        results: List[ChatMessage]
+
+
+class SnapshotState(BaseState):
+    foo: str
+    items: Tuple[str, ...] = ()
+    history: List[str]
+    nested_dict: Dict[str, int] = {}
+    messages: List[ChatMessage] = []
+    nested_lists: Dict[str, List[int]] = {}
+
+
+def _record_snapshots(state: SnapshotState) -> List[SnapshotState]:
+    snapshots: List[SnapshotState] = []
+    state.__snapshot_callback__ = lambda snapshot: snapshots.append(cast(SnapshotState, snapshot))
+    return snapshots
+
+
 def test_state_snapshot__node_attribute_edit():
     # GIVEN an initial state instance
     state = MockState(foo="bar")
@@ -113,3 +134,140 @@ def test_state_json_serialization__with_node_output_updates():
 
     # THEN the state is serialized correctly
     assert json_state["meta"]["node_outputs"] == {"MockNode.Outputs.baz": "hello"}
+
+
+def test_state_snapshot__shares_unchanged_values():
+    # GIVEN a state that records its snapshots
+    state = SnapshotState(foo="bar", items=("a",) * 1000, history=[])
+    snapshots = _record_snapshots(state)
+
+    # AND a large node output
+    state.meta.node_outputs[MockNode.Outputs.baz] = "result" * 1000
+
+    # WHEN we edit other values on state
+    state.foo = "baz"
+    state.nested_dict["hello"] = 1
+
+    # THEN each edit emits a snapshot with the latest values
+    assert len(snapshots) == 3
+    assert snapshots[1].foo == "baz"
+    assert snapshots[2].nested_dict == {"hello": 1}
+
+    # AND unchanged immutable values are shared between snapshots instead of being copied again
+    assert snapshots[0].items is snapshots[2].items
+    assert snapshots[0].meta.node_outputs[MockNode.Outputs.baz] is snapshots[2].meta.node_outputs[MockNode.Outputs.baz]
+
+    # AND snapshots never share mutable values with the live state
+    assert snapshots[2].history is not state.history
+    assert snapshots[2].nested_dict is not state.nested_dict
+
+
+def test_state_snapshot__values_mutated_in_place():
+    # GIVEN a state that records its snapshots
+    state = SnapshotState(foo="bar", history=[])
+    snapshots = _record_snapshots(state)
+
+    # WHEN we mutate a list in place between two edits
+    state.foo = "b"
+    state.history.append("msg1")
+    state.foo = "c"
+
+    # THEN the latest snapshot reflects the mutation
+    assert snapshots[-1].history == ["msg1"]
+
+    # AND earlier snapshots are left untouched
+    assert snapshots[0].history == []
+
+
+def test_state_snapshot__shares_unchanged_lists_and_models():
+    # GIVEN a state with a long chat history, that records its snapshots
+    state = SnapshotState(
+        foo="bar",
+        history=[],
+        messages=[ChatMessage(role="USER", text=f"Message {index}") for index in range(100)],
+    )
+    snapshots = _record_snapshots(state)
+
+    # AND a node output with a list of models
+    state.meta.node_outputs[SearchNode.Outputs.results] = [ChatMessage(role="ASSISTANT", text="Result")]
+
+    # WHEN we edit other values on state
+    state.foo = "baz"
+    state.foo = "qux"
+
+    # THEN the unchanged chat history and node output are shared between snapshots instead of being copied again
+    assert snapshots[0].messages is snapshots[2].messages
+    assert (
+        snapshots[0].meta.node_outputs[SearchNode.Outputs.results]
+        is snapshots[2].meta.node_outputs[SearchNode.Outputs.results]
+    )
+
+    # AND they still aren't shared with the live state
+    assert snapshots[2].messages is not state.messages
+    assert snapshots[2].messages[0] is not state.messages[0]
+
+
+def test_state_snapshot__appending_to_a_list_only_copies_the_new_item():
+    # GIVEN a state with a chat history, that records its snapshots
+    state = SnapshotState(foo="bar", history=[], messages=[ChatMessage(role="USER", text="Hello")])
+    snapshots = _record_snapshots(state)
+    state.foo = "baz"
+
+    # WHEN we append to the chat history in place and edit state
+    state.messages.append(ChatMessage(role="ASSISTANT", text="Hi"))
+    state.foo = "qux"
+
+    # THEN the latest snapshot has the new message
+    assert [message.text for message in snapshots[-1].messages] == ["Hello", "Hi"]
+
+    # AND it shares the copy of the existing message with the previous snapshot
+    assert snapshots[-1].messages[0] is snapshots[0].messages[0]
+
+    # AND the previous snapshot is left untouched
+    assert [message.text for message in snapshots[0].messages] == ["Hello"]
+
+
+def test_state_snapshot__nested_values_mutated_in_place():
+    # GIVEN a state with a list nested in a dict, that records its snapshots
+    state = SnapshotState(foo="bar", history=[], nested_lists={"numbers": []})
+    snapshots = _record_snapshots(state)
+    state.foo = "baz"
+
+    # WHEN we mutate the nested list in place and edit state
+    state.nested_lists["numbers"].extend([1, 2])
+    state.foo = "qux"
+
+    # THEN the latest snapshot reflects the mutation
+    assert snapshots[-1].nested_lists == {"numbers": [1, 2]}
+
+    # AND the earlier snapshot is left untouched
+    assert snapshots[0].nested_lists == {"numbers": []}
+
+
+def test_state_snapshot__deleted_node_outputs():
+    # GIVEN a state that records its snapshots
+    state = SnapshotState(foo="bar", history=[])
+    snapshots = _record_snapshots(state)
+
+    # AND a node output
+    state.meta.node_outputs[MockNode.Outputs.baz] = "hello"
+
+    # WHEN we delete the node output and edit state
+    del state.meta.node_outputs[MockNode.Outputs.baz]
+    state.foo = "baz"
+
+    # THEN the latest snapshot no longer has the node output
+    assert snapshots[-1].meta.node_outputs == {}
+
+
+def test_state_deepcopy__nested_dictionary():
+    # GIVEN a state with a nested dictionary
+    state = MockState(foo="bar")
+    state.nested_dict["hello"] = 1
+
+    # WHEN we deepcopy the state
+    deepcopied_state = deepcopy(state)
+
+    # THEN the nested dictionary is copied with its contents
+    assert deepcopied_state.nested_dict == {"hello": 1}
+    assert deepcopied_state.nested_dict is not state.nested_dict
@@ -0,0 +1,189 @@
+from datetime import datetime, timedelta
+import json
+import os
+import tempfile
+from uuid import uuid4
+from typing import Any
+
+from vellum.workflows.events.node import NodeExecutionInitiatedBody, NodeExecutionInitiatedEvent
+from vellum.workflows.nodes.bases import BaseNode
+from vellum.workflows.state.base import BaseState, StateMeta
+from vellum.workflows.state.store import JsonlLogStore, Store
+from vellum.workflows.workflows.base import BaseWorkflow
+
+
+class StartNode(BaseNode):
+    pass
+
+
+class NextNode(BaseNode):
+    pass
+
+
+def _state_at(timestamp: datetime) -> BaseState:
+    return BaseState(meta=StateMeta(updated_ts=timestamp))
+
+
+def _node_initiated_event(node: type, timestamp: datetime) -> NodeExecutionInitiatedEvent:
+    return NodeExecutionInitiatedEvent(
+        trace_id=uuid4(),
+        span_id=uuid4(),
+        timestamp=timestamp,
+        body=NodeExecutionInitiatedBody(node_definition=node, inputs={}),
+    )
+
+
+def test_store__keeps_last_n():
+    # GIVEN a store that only keeps the last two events and snapshots
+    store = Store(max_events=2, max_state_snapshots=2)
+    start = datetime(2024, 1, 1)
+
+    # WHEN we append more than that
+    states = [_state_at(start + timedelta(seconds=i)) for i in range(5)]
+    for state in states:
+        store.append_state_snapshot(state)
+        store.append_event(_node_initiated_event(StartNode, state.meta.updated_ts))
+
+    # THEN only the most recent ones are kept
+    assert list(store.state_snapshots) == states[-2:]
+    assert [event.timestamp for event in store.events] == [start + timedelta(seconds=3), start + timedelta(seconds=4)]
+
+    # AND the most recent snapshot is still available
+    assert store.get_most_recent_state_snapshot() == states[-1]
+
+    # AND lookups only find the snapshots that were kept
+    assert store.get_state_snapshot_at(start + timedelta(seconds=2)) is None
+    assert store.get_state_snapshot_at(start + timedelta(seconds=3, milliseconds=500)) == states[3]
+
+
+def test_store__snapshots_off():
+    # GIVEN a store that doesn't keep snapshots
+    store = Store(max_state_snapshots=0)
+
+    # WHEN we append a snapshot
+    store.append_state_snapshot(_state_at(datetime(2024, 1, 1)))
+
+    # THEN nothing is kept
+    assert list(store.state_snapshots) == []
+    assert store.get_most_recent_state_snapshot() is None
+
+
+def test_store__indexed_lookups():
+    # GIVEN a store with snapshots taken over time
+    store = Store()
+    start = datetime(2024, 1, 1)
+    states = [_state_at(start + timedelta(seconds=i)) for i in range(5)]
+    for state in states:
+        store.append_state_snapshot(state)
+
+    # AND nodes initiated along the way
+    store.append_event(_node_initiated_event(StartNode, start + timedelta(seconds=1, milliseconds=500)))
+    store.append_event(_node_initiated_event(NextNode, start + timedelta(seconds=3)))
+
+    # WHEN we look up the state at each node
+    start_node_ts = store.get_node_initiated_timestamp(StartNode)
+    next_node_ts = store.get_node_initiated_timestamp(NextNode)
+
+    # THEN we find the latest snapshot at or before each node was initiated
+    assert start_node_ts and store.get_state_snapshot_at(start_node_ts) == states[1]
+    assert next_node_ts and store.get_state_snapshot_at(next_node_ts) == states[3]
+
+    # AND nothing is found before the first snapshot
+    assert store.get_state_snapshot_at(datetime.min) is None
+
+
+def test_store__out_of_order_snapshots():
+    # GIVEN a store whose snapshots arrive out of order, as they may from nodes running concurrently
+    store = Store()
+    start = datetime(2024, 1, 1)
+    states = [_state_at(start + timedelta(seconds=i)) for i in range(4)]
+    for index in [0, 2, 1, 3]:
+        store.append_state_snapshot(states[index])
+
+    # WHEN we look up the state at each point in time
+    snapshots = [store.get_state_snapshot_at(start + timedelta(seconds=i, milliseconds=500)) for i in range(4)]
+
+    # THEN we find the latest snapshot at or before each of them
+    assert snapshots == states
+
+    # AND the snapshots are kept in order
+    assert list(store.state_snapshots) == states
+
+
+def test_jsonl_log_store__appends_to_disk():
+    # GIVEN a log store that keeps nothing in memory
+    path = os.path.join(tempfile.gettempdir(), f"store_{uuid4()}.jsonl")
+    store = JsonlLogStore(path, max_events=0, max_state_snapshots=0)
+
+    # WHEN we append an event and a snapshot
+    store.append_event(_node_initiated_event(StartNode, datetime(2024, 1, 1)))
+    store.append_state_snapshot(_state_at(datetime(2024, 1, 1)))
+    store.close()
+
+    # THEN both are written to disk
+    with open(path) as f:
+        lines = [json.loads(line) for line in f]
+
+    assert [line["type"] for line in lines] == ["event", "state"]
+    assert lines[0]["data"]["name"] == "node.execution.initiated"
+    assert lines[1]["data"]["meta"]["updated_ts"] == "2024-01-01T00:00:00"
+
+    # AND the node index is still kept in memory
+    assert store.get_node_initiated_timestamp(StartNode) == datetime(2024, 1, 1)
+
+    os.remove(path)
+
+
+def test_jsonl_log_store__closed_when_workflow_finishes():
+    # GIVEN a workflow that writes to a log store
+    path = os.path.join(tempfile.gettempdir(), f"store_{uuid4()}.jsonl")
+    store = JsonlLogStore(path)
+
+    class Workflow(BaseWorkflow):
+        graph = StartNode
+
+    workflow = Workflow(store=store)
+
+    # WHEN we run the workflow
+    final_event = workflow.run()
+
+    # THEN the file is closed once the workflow finishes
+    assert final_event.name == "workflow.execution.fulfilled"
+    assert store._file is None
+
+    # AND every event was written to it
+    with open(path) as f:
+        lines = [json.loads(line) for line in f]
+
+    assert lines[-1]["data"]["name"] == "workflow.execution.fulfilled"
+
+    os.remove(path)
+
+
+def test_jsonl_log_store__skips_values_it_cannot_serialize():
+    # GIVEN a log store
+    path = os.path.join(tempfile.gettempdir(), f"store_{uuid4()}.jsonl")
+    store = JsonlLogStore(path)
+
+    # AND a snapshot of a state holding a value that can't be serialized
+    class State(BaseState):
+        value: Any = None
+
+    unserializable_state = State(value=object(), meta=StateMeta(updated_ts=datetime(2024, 1, 1)))
+
+    # WHEN we append it between two snapshots that can be serialized
+    store.append_state_snapshot(_state_at(datetime(2024, 1, 1)))
+    store.append_state_snapshot(unserializable_state)
+    store.append_state_snapshot(_state_at(datetime(2024, 1, 2)))
+    store.close()
+
+    # THEN the other snapshots are still written to disk
+    with open(path) as f:
+        lines = [json.loads(line) for line in f]
+
+    assert [line["data"]["meta"]["updated_ts"] for line in lines] == ["2024-01-01T00:00:00", "2024-01-02T00:00:00"]
+
+    # AND the one that couldn't be serialized is still kept in memory
+    assert unserializable_state in list(store.state_snapshots)
+
+    os.remove(path)
@@ -1,5 +1,6 @@
-from .core import MergeBehavior
+from .core import ExecutionMode, MergeBehavior
 
 __all__ = [
+    "ExecutionMode",
     "MergeBehavior",
 ]
@@ -86,6 +86,11 @@ class MergeBehavior(Enum):
     AWAIT_ATTRIBUTES = "AWAIT_ATTRIBUTES"
 
 
+class ExecutionMode(Enum):
+    THREAD = "THREAD"
+    PROCESS = "PROCESS"
+
+
 class ConditionType(Enum):
     IF = "IF"
     ELIF = "ELIF"
@@ -32,8 +32,13 @@ class Stack(Generic[_T]):
     def size(self) -> int:
         return len(self._items)
 
+    def copy(self) -> "Stack[_T]":
+        stack: Stack[_T] = Stack()
+        stack._items = self._items.copy()
+        return stack
+
     def __repr__(self) -> str:
         return f"Stack({self.dump()})"
 
     def dump(self) -> List[_T]:
-        return [item for item in self._items][::-1]
+        return list(self._items)[::-1]
@@ -5,7 +5,8 @@ from vellum.workflows.nodes.bases.base import BaseNode
 from vellum.workflows.nodes.core.try_node.node import TryNode
 from vellum.workflows.outputs.base import BaseOutputs
 from vellum.workflows.references.output import OutputReference
-from vellum.workflows.types.utils import get_class_attr_names, infer_types
+from vellum.workflows.types import utils
+from vellum.workflows.types.utils import TypeCacheMeta, get_class_attr_names, infer_types, invalidate_type_cache
 
 
 class ExampleClass:
@@ -87,3 +88,100 @@ def test_infer_types(cls, attr_name, expected_type):
 )
 def test_class_attr_names(cls, expected_attr_names):
     assert get_class_attr_names(cls) == expected_attr_names
+
+
+def test_infer_types__cache_invalidated_on_class_mutation():
+    # GIVEN a node with an attribute whose type is inferred from its default value
+    class MyNode(BaseNode):
+        foo = 1
+
+    class MySubNode(MyNode):
+        pass
+
+    assert MySubNode.foo.types == (int,)
+
+    # WHEN the attribute is reassigned on the base class
+    setattr(MyNode, "foo", "hello")
+
+    # THEN the types inferred for the subclass reflect the new value
+    assert MySubNode.foo.types == (str,)
+
+    # AND newly added attributes are discovered
+    MyNode.bar = 1.0
+    assert "bar" in get_class_attr_names(MySubNode)
+
+
+def test_infer_types__cache_invalidated_on_annotations_assignment():
+    # GIVEN a node whose outputs' types have already been inferred
+    class MyNode(BaseNode):
+        class Outputs(BaseNode.Outputs):
+            foo: int
+
+    assert MyNode.Outputs.foo.types == (int,)
+
+    # WHEN its outputs' annotations are reassigned, the way MapNode wraps its subworkflow's outputs
+    MyNode.Outputs.__annotations__ = {"foo": str, "bar": float}
+
+    # THEN the types inferred reflect the new annotations
+    assert MyNode.Outputs.foo.types == (str,)
+
+    # AND newly annotated outputs are discovered
+    assert "bar" in get_class_attr_names(MyNode.Outputs)
+
+
+def test_class_attr_names__cached_result_cannot_be_mutated():
+    # GIVEN a node whose attribute names have been cached
+    class MyNode(BaseNode):
+        foo = 1
+
+    attr_names = get_class_attr_names(MyNode)
+
+    # THEN the cached names are immutable
+    assert isinstance(attr_names, frozenset)
+    with pytest.raises(AttributeError):
+        attr_names.add("bar")  # type: ignore[attr-defined]
+
+
+def test_infer_types__cached_per_namespace():
+    # GIVEN a class whose attribute is annotated with a forward reference
+    class MyClass(metaclass=TypeCacheMeta):
+        foo: "MyAlias"  # type: ignore[name-defined]  # noqa: F821
+
+    # WHEN we infer its types against two different namespaces
+    int_types = infer_types(MyClass, "foo", localns={"MyAlias": int})
+    str_types = infer_types(MyClass, "foo", localns={"MyAlias": str})
+
+    # THEN each namespace resolves the reference on its own
+    assert int_types == (int,)
+    assert str_types == (str,)
+
+    # AND each result is reused for its own namespace
+    assert infer_types(MyClass, "foo", localns={"MyAlias": int}) is int_types
+
+
+def test_infer_types__node_instantiation_uses_cache(mocker):
+    # GIVEN a node with several attributes and outputs
+    class MyNode(BaseNode):
+        alpha = "a"
+        beta = 2
+        gamma: List[str] = ["c"]
+
+        class Outputs(BaseNode.Outputs):
+            result: str
+            count: int
+
+    # AND a spy on how often type hints are resolved
+    get_type_hints = mocker.spy(utils, "get_type_hints")
+
+    # WHEN we instantiate it with the type cache cleared
+    invalidate_type_cache(MyNode)
+    invalidate_type_cache(MyNode.Outputs)
+    MyNode()
+    uncached_call_count = get_type_hints.call_count
+
+    # AND again with a warm cache
+    MyNode()
+
+    # THEN type hints are only resolved while the cache is cold
+    assert uncached_call_count > 0
+    assert get_type_hints.call_count == uncached_call_count
@@ -5,6 +5,7 @@ from typing import (
     Any,
     ClassVar,
     Dict,
+    FrozenSet,
     Generic,
     Optional,
     Set,
@@ -52,7 +53,86 @@ def resolve_combined_types(
     return tuple(unique_results)
 
 
+_TYPE_CACHE_ATTR = "__type_cache__"
+
+
+class TypeCacheMeta(type):
+    """
+    A metaclass whose classes cache the results of `infer_types` and `get_class_attr_names`, so that our descriptor
+    metaclasses don't rerun `get_type_hints` and walk the MRO on every class attribute access. The cache is
+    invalidated whenever a public attribute or `__annotations__` is set on or deleted from the class or any of its
+    bases.
+    """
+
+    def __setattr__(cls, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if _is_type_cache_attr(name):
+            invalidate_type_cache(cls)
+
+    def __delattr__(cls, name: str) -> None:
+        super().__delattr__(name)
+        if _is_type_cache_attr(name):
+            invalidate_type_cache(cls)
+
+
+def _is_type_cache_attr(name: str) -> bool:
+    # Nodes like MapNode and TemplatingNode assign `__annotations__` directly to declare their outputs' types
+    return not name.startswith("_") or name == "__annotations__"
+
+
+def _get_type_cache(object_: Any) -> Optional[Dict[Any, Any]]:
+    if not isinstance(object_, TypeCacheMeta):
+        return None
+
+    cache = object_.__dict__.get(_TYPE_CACHE_ATTR)
+    if cache is None:
+        cache = {}
+        type.__setattr__(object_, _TYPE_CACHE_ATTR, cache)
+
+    return cache
+
+
+def invalidate_type_cache(cls: Type) -> None:
+    """
+    Clears the inferred types and attribute names cached on the given class and all of its subclasses.
+    """
+
+    to_visit = [cls]
+    while to_visit:
+        current = to_visit.pop()
+        cache = current.__dict__.get(_TYPE_CACHE_ATTR)
+        if cache:
+            cache.clear()
+
+        to_visit.extend(type.__subclasses__(current))
+
+
 def infer_types(object_: Type, attr_name: str, localns: Optional[Dict[str, Any]] = None) -> Tuple[Type, ...]:
+    """
+    Infers the types of the given attribute from the class' type hints or its default value. Results are cached on
+    the class, since this is called on every public class attribute access of our descriptor metaclasses.
+    """
+
+    cache = _get_type_cache(object_)
+    if cache is None:
+        return _infer_types(object_, attr_name, localns)
+
+    # Forward references resolve differently against different namespaces, so the namespace is part of the key
+    cache_key = ("types", attr_name, tuple(localns.items()) if localns else None)
+    try:
+        types = cache.get(cache_key)
+    except TypeError:
+        # The namespace holds unhashable values, so we can't tell whether it matches a cached one
+        return _infer_types(object_, attr_name, localns)
+
+    if types is None:
+        types = _infer_types(object_, attr_name, localns)
+        cache[cache_key] = types
+
+    return types
+
+
+def _infer_types(object_: Type, attr_name: str, localns: Optional[Dict[str, Any]] = None) -> Tuple[Type, ...]:
     try:
         class_ = object_
         type_var_mapping = {}
@@ -97,7 +177,20 @@ def infer_types(object_: Type, attr_name: str, localns: Optional[Dict[str, Any]]
         )
 
 
-def get_class_attr_names(cls: Type) -> Set[str]:
+def get_class_attr_names(cls: Type) -> FrozenSet[str]:
+    cache = _get_type_cache(cls)
+    if cache is None:
+        return _get_class_attr_names(cls)
+
+    attr_names = cache.get("attr_names")
+    if attr_names is None:
+        attr_names = _get_class_attr_names(cls)
+        cache["attr_names"] = attr_names
+
+    return attr_names
+
+
+def _get_class_attr_names(cls: Type) -> FrozenSet[str]:
     # gets type-annotated attributes `foo: int`
     type_annotated_attributes: Set[str] = set()
 
@@ -112,7 +205,8 @@ def get_class_attr_names(cls: Type) -> Set[str]:
         class_attributes.update(base_vars)
 
     # combine and filter out private attributes
-    return {a for a in list(set(class_attributes) | set(type_annotated_attributes)) if not a.startswith("_")}
+    # frozen, since the result is cached and shared by every caller
+    return frozenset(a for a in class_attributes | type_annotated_attributes if not a.startswith("_"))
 
 
 def deepcopy_with_exclusions(
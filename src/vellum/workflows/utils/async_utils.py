@@ -0,0 +1,56 @@
+import asyncio
+from concurrent.futures import Executor
+from typing import AsyncIterator, Awaitable, Iterator, TypeVar, cast
+
+_T = TypeVar("_T")
+
+_EXHAUSTED = object()
+
+
+def run_coroutine_sync(awaitable: Awaitable[_T]) -> _T:
+    """
+    Runs an awaitable to completion from synchronous code, on a private event loop.
+    """
+
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(_await(awaitable))
+    finally:
+        loop.close()
+
+
+def iterate_async_generator_sync(async_iterator: AsyncIterator[_T]) -> Iterator[_T]:
+    """
+    Iterates over an async iterator from synchronous code, driving it one item at a time on a private event loop.
+    """
+
+    loop = asyncio.new_event_loop()
+    try:
+        while True:
+            try:
+                yield loop.run_until_complete(async_iterator.__anext__())
+            except StopAsyncIteration:
+                break
+    finally:
+        aclose = getattr(async_iterator, "aclose", None)
+        if aclose is not None:
+            loop.run_until_complete(aclose())
+        loop.close()
+
+
+async def iterate_sync_iterator_async(iterator: Iterator[_T], executor: Executor) -> AsyncIterator[_T]:
+    """
+    Iterates over a blocking iterator from an event loop, advancing it one item at a time on the given executor.
+    """
+
+    loop = asyncio.get_running_loop()
+    while True:
+        item = await loop.run_in_executor(executor, next, iterator, _EXHAUSTED)
+        if item is _EXHAUSTED:
+            break
+
+        yield cast(_T, item)
+
+
+async def _await(awaitable: Awaitable[_T]) -> _T:
+    return await awaitable
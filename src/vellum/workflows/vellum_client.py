@@ -1,18 +1,246 @@
+import asyncio
+from dataclasses import dataclass
+import importlib.util
+import logging
 import os
-from typing import Optional
+from threading import Lock
+from weakref import WeakKeyDictionary
+from typing import Dict, List, Optional, Tuple
 
-from vellum import Vellum, VellumEnvironment
+import httpx
 
+from vellum import AsyncVellum, Vellum, VellumEnvironment
+from vellum.client.core.rate_limiter import RateLimiter
+from vellum.client.core.retries import RetryBudget
 
-def create_vellum_client(api_key: Optional[str] = None) -> Vellum:
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_KEEPALIVE_EXPIRY = 30.0
+
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=DEFAULT_MAX_CONNECTIONS,
+    max_keepalive_connections=DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry=DEFAULT_KEEPALIVE_EXPIRY,
+)
+
+_ClientKey = Tuple[str, str, str, str]
+_AsyncHttpxClients = Dict[_ClientKey, httpx.AsyncClient]
+
+
+@dataclass(frozen=True)
+class VellumClientPoolStats:
+    """
+    A point-in-time view of one of the connection pools kept by a VellumClientRegistry.
+    """
+
+    environment: str
+    http2: bool
+    connections: int
+    idle_connections: int
+    active_connections: int
+    pending_requests: int
+
+
+def _get_environment() -> VellumEnvironment:
+    return VellumEnvironment(
+        default=os.getenv("VELLUM_DEFAULT_API_URL", os.getenv("VELLUM_API_URL", "https://api.vellum.ai")),
+        documents=os.getenv("VELLUM_DOCUMENTS_API_URL", os.getenv("VELLUM_API_URL", "https://documents.vellum.ai")),
+        predict=os.getenv("VELLUM_PREDICT_API_URL", os.getenv("VELLUM_API_URL", "https://predict.vellum.ai")),
+    )
+
+
+def _get_api_key(api_key: Optional[str]) -> str:
     if api_key is None:
-        api_key = os.getenv("VELLUM_API_KEY", default="")
+        return os.getenv("VELLUM_API_KEY", default="")
+
+    return api_key
+
+
+class VellumClientRegistry:
+    """
+    Keeps one pooled httpx client per API key and environment, so that every Vellum client created for the same
+    credentials shares its connections, no matter how many WorkflowContexts a run creates. Async clients are pooled
+    per event loop as well, since their connections can only be used from the loop they were opened on.
+
+    limits: httpx.Limits = DEFAULT_LIMITS - The connection pool limits and keep-alive expiry of each client.
+    http2: bool = False - Whether to negotiate HTTP/2. Requires the optional `h2` package, and falls back to
+        HTTP/1.1 when it isn't installed.
+    rate_limiter: Optional[RateLimiter] = None - Limits the rate and concurrency of the requests sent by every client
+        the registry creates, such as the prompt executions that a MapNode fans out.
+    retry_budget: Optional[RetryBudget] = None - Stops every client the registry creates from retrying requests once
+        too many of them are failing.
+    """
+
+    def __init__(
+        self,
+        limits: httpx.Limits = DEFAULT_LIMITS,
+        http2: bool = False,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_budget: Optional[RetryBudget] = None,
+    ) -> None:
+        if http2 and importlib.util.find_spec("h2") is None:
+            logger.warning("HTTP/2 was requested, but the `h2` package isn't installed. Falling back to HTTP/1.1.")
+            http2 = False
+
+        self._limits = limits
+        self._http2 = http2
+        self._rate_limiter = rate_limiter
+        self._retry_budget = retry_budget
+        self._httpx_clients: Dict[_ClientKey, httpx.Client] = {}
+        self._async_httpx_clients: WeakKeyDictionary[asyncio.AbstractEventLoop, _AsyncHttpxClients] = (
+            WeakKeyDictionary()
+        )
+        self._lock = Lock()
+
+    def get_httpx_client(self, api_key: str, environment: VellumEnvironment) -> httpx.Client:
+        key = (api_key, environment.default, environment.documents, environment.predict)
+        with self._lock:
+            httpx_client = self._httpx_clients.get(key)
+            if httpx_client is None or httpx_client.is_closed:
+                httpx_client = httpx.Client(
+                    timeout=None,
+                    follow_redirects=True,
+                    limits=self._limits,
+                    http2=self._http2,
+                )
+                self._httpx_clients[key] = httpx_client
+
+            return httpx_client
+
+    def get_async_httpx_client(self, api_key: str, environment: VellumEnvironment) -> httpx.AsyncClient:
+        key = (api_key, environment.default, environment.documents, environment.predict)
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            httpx_clients = self._async_httpx_clients.setdefault(loop, {})
+            httpx_client = httpx_clients.get(key)
+            if httpx_client is None or httpx_client.is_closed:
+                httpx_client = httpx.AsyncClient(
+                    timeout=None,
+                    follow_redirects=True,
+                    limits=self._limits,
+                    http2=self._http2,
+                )
+                httpx_clients[key] = httpx_client
+
+            return httpx_client
+
+    def get_vellum_client(self, api_key: Optional[str] = None) -> Vellum:
+        api_key = _get_api_key(api_key)
+        environment = _get_environment()
+        return Vellum(
+            api_key=api_key,
+            environment=environment,
+            httpx_client=self.get_httpx_client(api_key, environment),
+            rate_limiter=self._rate_limiter,
+            retry_budget=self._retry_budget,
+        )
+
+    def get_async_vellum_client(
+        self, api_key: Optional[str] = None, environment: Optional[VellumEnvironment] = None
+    ) -> AsyncVellum:
+        """
+        Returns an AsyncVellum client pooled for the running event loop, so it may only be used from that loop.
+        """
+
+        api_key = _get_api_key(api_key)
+        environment = environment or _get_environment()
+        return AsyncVellum(
+            api_key=api_key,
+            environment=environment,
+            httpx_client=self.get_async_httpx_client(api_key, environment),
+            rate_limiter=self._rate_limiter,
+            retry_budget=self._retry_budget,
+        )
+
+    def get_pool_stats(self) -> List[VellumClientPoolStats]:
+        with self._lock:
+            items = list(self._httpx_clients.items())
+
+        return [
+            self._get_pool_stats(environment=key[1], httpx_client=httpx_client)
+            for key, httpx_client in items
+            if not httpx_client.is_closed
+        ]
+
+    def close(self) -> None:
+        with self._lock:
+            httpx_clients = list(self._httpx_clients.values())
+            self._httpx_clients.clear()
+            # Async clients can only be closed from their own event loop, so we let go of them instead
+            self._async_httpx_clients.clear()
+
+        for httpx_client in httpx_clients:
+            httpx_client.close()
+
+    def _get_pool_stats(self, environment: str, httpx_client: httpx.Client) -> VellumClientPoolStats:
+        # httpx doesn't expose its connection pool publicly, so we read it off of the default transport's httpcore
+        # pool and report an empty pool for any transport that doesn't have one
+        pool = getattr(getattr(httpx_client, "_transport", None), "_pool", None)
+        connections = list(getattr(pool, "connections", []))
+        idle_connections = sum(1 for connection in connections if connection.is_idle())
+        return VellumClientPoolStats(
+            environment=environment,
+            http2=self._http2,
+            connections=len(connections),
+            idle_connections=idle_connections,
+            active_connections=len(connections) - idle_connections,
+            pending_requests=len(getattr(pool, "_requests", [])),
+        )
+
+
+_default_registry: Optional[VellumClientRegistry] = None
+_default_registry_lock = Lock()
+
+
+def get_default_vellum_client_registry() -> VellumClientRegistry:
+    """
+    Returns the process-wide registry used by WorkflowContexts that weren't given a Vellum client explicitly.
+    """
+
+    global _default_registry
+    with _default_registry_lock:
+        if _default_registry is None:
+            _default_registry = VellumClientRegistry(http2=os.getenv("VELLUM_HTTP2", "").lower() in ("1", "true"))
+
+        return _default_registry
+
+
+def set_default_vellum_client_registry(registry: Optional[VellumClientRegistry]) -> None:
+    """
+    Overrides the process-wide Vellum client registry. Passing `None` restores the default, lazily created registry.
+    The previous registry's connections are not closed, since clients created from it may still be in use.
+    """
+
+    global _default_registry
+    with _default_registry_lock:
+        _default_registry = registry
+
+
+def get_vellum_client_pool_stats() -> List[VellumClientPoolStats]:
+    return get_default_vellum_client_registry().get_pool_stats()
+
+
+def create_vellum_client(api_key: Optional[str] = None, use_shared_pool: bool = False) -> Vellum:
+    if use_shared_pool:
+        return get_default_vellum_client_registry().get_vellum_client(api_key)
 
     return Vellum(
-        api_key=api_key,
-        environment=VellumEnvironment(
-            default=os.getenv("VELLUM_DEFAULT_API_URL", os.getenv("VELLUM_API_URL", "https://api.vellum.ai")),
-            documents=os.getenv("VELLUM_DOCUMENTS_API_URL", os.getenv("VELLUM_API_URL", "https://documents.vellum.ai")),
-            predict=os.getenv("VELLUM_PREDICT_API_URL", os.getenv("VELLUM_API_URL", "https://predict.vellum.ai")),
-        ),
+        api_key=_get_api_key(api_key),
+        environment=_get_environment(),
+    )
+
+
+def create_async_vellum_client(
+    api_key: Optional[str] = None,
+    environment: Optional[VellumEnvironment] = None,
+    use_shared_pool: bool = False,
+) -> AsyncVellum:
+    if use_shared_pool:
+        return get_default_vellum_client_registry().get_async_vellum_client(api_key, environment)
+
+    return AsyncVellum(
+        api_key=_get_api_key(api_key),
+        environment=environment or _get_environment(),
     )
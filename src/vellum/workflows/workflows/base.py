@@ -1,5 +1,7 @@
 # flake8: noqa: E402
 
+from copy import deepcopy
+from dataclasses import dataclass
 import importlib
 import inspect
 
@@ -14,6 +16,7 @@ from threading import Event as ThreadingEvent
 from uuid import uuid4
 from typing import (
     Any,
+    AsyncGenerator,
     Callable,
     ClassVar,
     Dict,
@@ -36,6 +39,10 @@ from vellum.workflows.edges import Edge
 from vellum.workflows.emitters.base import BaseWorkflowEmitter
 from vellum.workflows.errors import WorkflowError, WorkflowErrorCode
 from vellum.workflows.events.node import (
+    NodeExecutionCacheHitBody,
+    NodeExecutionCacheHitEvent,
+    NodeExecutionCacheMissBody,
+    NodeExecutionCacheMissEvent,
     NodeExecutionFulfilledBody,
     NodeExecutionFulfilledEvent,
     NodeExecutionInitiatedBody,
@@ -71,7 +78,7 @@ from vellum.workflows.inputs.base import BaseInputs
 from vellum.workflows.nodes.bases import BaseNode
 from vellum.workflows.outputs import BaseOutputs
 from vellum.workflows.resolvers.base import BaseWorkflowResolver
-from vellum.workflows.runner import WorkflowRunner
+from vellum.workflows.runner import AsyncWorkflowRunner, WorkflowExecutor, WorkflowRunner
 from vellum.workflows.runner.runner import ExternalInputsArg, RunFromNodeArg
 from vellum.workflows.state.base import BaseState, StateMeta
 from vellum.workflows.state.context import WorkflowContext
@@ -91,10 +98,47 @@ class _BaseWorkflowMeta(type):
 GraphAttribute = Union[Type[BaseNode], Graph, Set[Type[BaseNode]], Set[Graph]]
 
 
+@dataclass(frozen=True)
+class _WorkflowGraphViews:
+    graph: GraphAttribute
+    graph_size: int
+    subgraphs: Tuple[Graph, ...]
+    edge_counts: Tuple[int, ...]
+    edges: Tuple[Edge, ...]
+    nodes: Tuple[Type[BaseNode], ...]
+    entrypoints: Tuple[Type[BaseNode], ...]
+
+    @staticmethod
+    def from_subgraphs(graph: GraphAttribute, subgraphs: List[Graph]) -> "_WorkflowGraphViews":
+        return _WorkflowGraphViews(
+            graph=graph,
+            graph_size=_get_graph_size(graph),
+            subgraphs=tuple(subgraphs),
+            edge_counts=tuple(len(subgraph._edges) for subgraph in subgraphs),
+            edges=tuple(dict.fromkeys(edge for subgraph in subgraphs for edge in subgraph.edges)),
+            nodes=tuple(dict.fromkeys(node for subgraph in subgraphs for node in subgraph.nodes)),
+            entrypoints=tuple(dict.fromkeys(node for subgraph in subgraphs for node in subgraph.entrypoints)),
+        )
+
+    def is_current(self, graph: GraphAttribute) -> bool:
+        # Graphs are only ever extended in place, so a graph is unchanged as long as its edge count is
+        return (
+            graph is self.graph
+            and _get_graph_size(graph) == self.graph_size
+            and all(len(subgraph._edges) == count for subgraph, count in zip(self.subgraphs, self.edge_counts))
+        )
+
+
+def _get_graph_size(graph: GraphAttribute) -> int:
+    return len(graph) if isinstance(graph, set) else 1
+
+
 class BaseWorkflow(Generic[WorkflowInputsType, StateType], metaclass=_BaseWorkflowMeta):
     graph: ClassVar[GraphAttribute]
+    _graph_views: ClassVar[Optional["_WorkflowGraphViews"]] = None
     emitters: List[BaseWorkflowEmitter]
     resolvers: List[BaseWorkflowResolver]
+    executor: Optional[WorkflowExecutor]
 
     class Outputs(BaseOutputs):
         pass
@@ -114,18 +158,26 @@ class BaseWorkflow(Generic[WorkflowInputsType, StateType], metaclass=_BaseWorkfl
 
     WorkflowEventStream = Generator[WorkflowEvent, None, None]
 
+    AsyncWorkflowEventStream = AsyncGenerator[WorkflowEvent, None]
+
     def __init__(
         self,
         parent_state: Optional[BaseState] = None,
         emitters: Optional[List[BaseWorkflowEmitter]] = None,
         resolvers: Optional[List[BaseWorkflowResolver]] = None,
         context: Optional[WorkflowContext] = None,
+        executor: Optional[WorkflowExecutor] = None,
+        store: Optional[Store] = None,
     ):
         self._parent_state = parent_state
         self.emitters = emitters or (self.emitters if hasattr(self, "emitters") else [])
         self.resolvers = resolvers or (self.resolvers if hasattr(self, "resolvers") else [])
         self._context = context or WorkflowContext()
-        self._store = Store()
+        self.executor = executor or (self.executor if hasattr(self, "executor") else None) or self._context.executor
+        if self._context.executor is None:
+            # Nested Workflows and nodes like MapNode find the executor through the context
+            self._context.executor = self.executor
+        self._store = store or Store()
 
         self.validate()
 
@@ -135,6 +187,10 @@ class BaseWorkflow(Generic[WorkflowInputsType, StateType], metaclass=_BaseWorkfl
 
     @classmethod
     def get_subgraphs(cls) -> List[Graph]:
+        return list(cls._get_graph_views().subgraphs)
+
+    @classmethod
+    def _build_subgraphs(cls) -> List[Graph]:
         original_graph = cls.graph
         if isinstance(original_graph, Graph):
             return [original_graph]
@@ -147,38 +203,40 @@ class BaseWorkflow(Generic[WorkflowInputsType, StateType], metaclass=_BaseWorkfl
 
         raise ValueError(f"Unexpected graph type: {original_graph.__class__}")
 
+    @classmethod
+    def _get_graph_views(cls) -> "_WorkflowGraphViews":
+        """
+        Returns the subgraphs, edges, nodes and entrypoints of the workflow, computed once per class and
+        recomputed only if its graph has since been reassigned or extended.
+        """
+
+        graph_views = cls.__dict__.get("_graph_views")
+        if graph_views is not None and graph_views.is_current(cls.graph):
+            return graph_views
+
+        graph_views = _WorkflowGraphViews.from_subgraphs(cls.graph, cls._build_subgraphs())
+        cls._graph_views = graph_views
+        return graph_views
+
     @classmethod
     def get_edges(cls) -> Iterator[Edge]:
         """
-        Returns an iterator over the edges in the workflow. We use a set to
-        ensure uniqueness, and the iterator to preserve order.
+        Returns an iterator over the unique edges in the workflow, in the order they were defined.
         """
 
-        edges = set()
-        subgraphs = cls.get_subgraphs()
-        for subgraph in subgraphs:
-            for edge in subgraph.edges:
-                if edge not in edges:
-                    edges.add(edge)
-                    yield edge
+        return iter(cls._get_graph_views().edges)
 
     @classmethod
     def get_nodes(cls) -> Iterator[Type[BaseNode]]:
         """
-        Returns an iterator over the nodes in the workflow. We use a set to
-        ensure uniqueness, and the iterator to preserve order.
+        Returns an iterator over the unique nodes in the workflow, in the order they were defined.
         """
 
-        nodes = set()
-        for subgraph in cls.get_subgraphs():
-            for node in subgraph.nodes:
-                if node not in nodes:
-                    nodes.add(node)
-                    yield node
+        return iter(cls._get_graph_views().nodes)
 
     @classmethod
     def get_entrypoints(cls) -> Iterable[Type[BaseNode]]:
-        return iter({e for g in cls.get_subgraphs() for e in g.entrypoints})
+        return iter(cls._get_graph_views().entrypoints)
 
     def run(
         self,
@@ -221,6 +279,7 @@ class BaseWorkflow(Generic[WorkflowInputsType, StateType], metaclass=_BaseWorkfl
             external_inputs=external_inputs,
             cancel_signal=cancel_signal,
             parent_context=self._context.parent_context,
+            executor=self.executor,
         ).stream()
         first_event: Optional[Union[WorkflowExecutionInitiatedEvent, WorkflowExecutionResumedEvent]] = None
         last_event = None
@@ -229,50 +288,7 @@ class BaseWorkflow(Generic[WorkflowInputsType, StateType], metaclass=_BaseWorkfl
                 first_event = event
             last_event = event
 
-        if not last_event:
-            return WorkflowExecutionRejectedEvent(
-                trace_id=uuid4(),
-                span_id=uuid4(),
-                body=WorkflowExecutionRejectedBody(
-                    error=WorkflowError(
-                        code=WorkflowErrorCode.INTERNAL_ERROR,
-                        message="No events were emitted",
-                    ),
-                    workflow_definition=self.__class__,
-                ),
-            )
-
-        if not first_event:
-            return WorkflowExecutionRejectedEvent(
-                trace_id=uuid4(),
-                span_id=uuid4(),
-                body=WorkflowExecutionRejectedBody(
-                    error=WorkflowError(
-                        code=WorkflowErrorCode.INTERNAL_ERROR,
-                        message="Initiated event was never emitted",
-                    ),
-                    workflow_definition=self.__class__,
-                ),
-            )
-
-        if (
-            last_event.name == "workflow.execution.rejected"
-            or last_event.name == "workflow.execution.fulfilled"
-            or last_event.name == "workflow.execution.paused"
-        ):
-            return last_event
-
-        return WorkflowExecutionRejectedEvent(
-            trace_id=first_event.trace_id,
-            span_id=first_event.span_id,
-            body=WorkflowExecutionRejectedBody(
-                workflow_definition=self.__class__,
-                error=WorkflowError(
-                    code=WorkflowErrorCode.INTERNAL_ERROR,
-                    message=f"Unexpected last event name found: {last_event.name}",
-                ),
-            ),
-        )
+        return self._get_terminal_event(first_event, last_event)
 
     def stream(
         self,
@@ -318,10 +334,163 @@ class BaseWorkflow(Generic[WorkflowInputsType, StateType], metaclass=_BaseWorkfl
             external_inputs=external_inputs,
             cancel_signal=cancel_signal,
             parent_context=self.context.parent_context,
+            executor=self.executor,
         ).stream():
             if should_yield(self.__class__, event):
                 yield event
 
+    async def astream(
+        self,
+        event_filter: Optional[Callable[[Type["BaseWorkflow"], WorkflowEvent], bool]] = None,
+        inputs: Optional[WorkflowInputsType] = None,
+        state: Optional[StateType] = None,
+        entrypoint_nodes: Optional[RunFromNodeArg] = None,
+        external_inputs: Optional[ExternalInputsArg] = None,
+        cancel_signal: Optional[ThreadingEvent] = None,
+    ) -> AsyncWorkflowEventStream:
+        """
+        Invoke a Workflow on the running asyncio event loop, yielding events as they are emitted. The `arun` of
+        each BaseAsyncNode is run as a task on the loop, while all other nodes are run on worker threads.
+
+        Parameters
+        ----------
+        event_filter: Optional[Callable[[Type["BaseWorkflow"], WorkflowEvent], bool]] = None
+            A filter that can be used to filter events based on the Workflow Class and the event itself. If the method
+            returns `False`, the event will not be yielded.
+
+        inputs: Optional[WorkflowInputsType] = None
+            The Inputs instance used to initiate the Workflow Execution.
+
+        state: Optional[StateType] = None
+            The State instance to run the Workflow with. Workflows maintain a global state that can be used to
+            deterministically resume execution from any point.
+
+        entrypoint_nodes: Optional[RunFromNodeArg] = None
+            The entrypoint nodes to run the Workflow with. Useful for resuming execution from a specific node.
+
+        external_inputs: Optional[ExternalInputsArg] = None
+            External inputs to pass to the Workflow. Useful for providing human-in-the-loop behavior to the Workflow.
+
+        cancel_signal: Optional[ThreadingEvent] = None
+            A threading event that can be used to cancel the Workflow Execution.
+        """
+
+        should_yield = event_filter or workflow_event_filter
+        async for event in AsyncWorkflowRunner(
+            self,
+            inputs=inputs,
+            state=state,
+            entrypoint_nodes=entrypoint_nodes,
+            external_inputs=external_inputs,
+            cancel_signal=cancel_signal,
+            parent_context=self.context.parent_context,
+            executor=self.executor,
+        ).astream():
+            if should_yield(self.__class__, event):
+                yield event
+
+    async def arun(
+        self,
+        inputs: Optional[WorkflowInputsType] = None,
+        state: Optional[StateType] = None,
+        entrypoint_nodes: Optional[RunFromNodeArg] = None,
+        external_inputs: Optional[ExternalInputsArg] = None,
+        cancel_signal: Optional[ThreadingEvent] = None,
+    ) -> TerminalWorkflowEvent:
+        """
+        Invoke a Workflow on the running asyncio event loop, returning the last event emitted, which should be one of:
+        - `WorkflowExecutionFulfilledEvent` if the Workflow Execution was successful
+        - `WorkflowExecutionRejectedEvent` if the Workflow Execution was rejected
+        - `WorkflowExecutionPausedEvent` if the Workflow Execution was paused
+
+        Parameters
+        ----------
+        inputs: Optional[WorkflowInputsType] = None
+            The Inputs instance used to initiate the Workflow Execution.
+
+        state: Optional[StateType] = None
+            The State instance to run the Workflow with. Workflows maintain a global state that can be used to
+            deterministically resume execution from any point.
+
+        entrypoint_nodes: Optional[RunFromNodeArg] = None
+            The entrypoint nodes to run the Workflow with. Useful for resuming execution from a specific node.
+
+        external_inputs: Optional[ExternalInputsArg] = None
+            External inputs to pass to the Workflow. Useful for providing human-in-the-loop behavior to the Workflow.
+
+        cancel_signal: Optional[ThreadingEvent] = None
+            A threading event that can be used to cancel the Workflow Execution.
+        """
+
+        events = AsyncWorkflowRunner(
+            self,
+            inputs=inputs,
+            state=state,
+            entrypoint_nodes=entrypoint_nodes,
+            external_inputs=external_inputs,
+            cancel_signal=cancel_signal,
+            parent_context=self._context.parent_context,
+            executor=self.executor,
+        ).astream()
+        first_event: Optional[Union[WorkflowExecutionInitiatedEvent, WorkflowExecutionResumedEvent]] = None
+        last_event = None
+        async for event in events:
+            if event.name == "workflow.execution.initiated" or event.name == "workflow.execution.resumed":
+                first_event = event
+            last_event = event
+
+        return self._get_terminal_event(first_event, last_event)
+
+    def _get_terminal_event(
+        self,
+        first_event: Optional[Union[WorkflowExecutionInitiatedEvent, WorkflowExecutionResumedEvent]],
+        last_event: Optional[WorkflowEvent],
+    ) -> TerminalWorkflowEvent:
+        if not last_event:
+            return WorkflowExecutionRejectedEvent(
+                trace_id=uuid4(),
+                span_id=uuid4(),
+                body=WorkflowExecutionRejectedBody(
+                    error=WorkflowError(
+                        code=WorkflowErrorCode.INTERNAL_ERROR,
+                        message="No events were emitted",
+                    ),
+                    workflow_definition=self.__class__,
+                ),
+            )
+
+        if not first_event:
+            return WorkflowExecutionRejectedEvent(
+                trace_id=uuid4(),
+                span_id=uuid4(),
+                body=WorkflowExecutionRejectedBody(
+                    error=WorkflowError(
+                        code=WorkflowErrorCode.INTERNAL_ERROR,
+                        message="Initiated event was never emitted",
+                    ),
+                    workflow_definition=self.__class__,
+                ),
+            )
+
+        if (
+            last_event.name == "workflow.execution.rejected"
+            or last_event.name == "workflow.execution.fulfilled"
+            or last_event.name == "workflow.execution.paused"
+        ):
+            return last_event
+
+        return WorkflowExecutionRejectedEvent(
+            trace_id=first_event.trace_id,
+            span_id=first_event.span_id,
+            body=WorkflowExecutionRejectedBody(
+                workflow_definition=self.__class__,
+                error=WorkflowError(
+                    code=WorkflowErrorCode.INTERNAL_ERROR,
+                    message=f"Unexpected last event name found: {last_event.name}",
+                ),
+            ),
+        )
+
     def validate(self) -> None:
         """
         Validates the Workflow, by running through our list of linter rules.
@@ -372,37 +541,20 @@ class BaseWorkflow(Generic[WorkflowInputsType, StateType], metaclass=_BaseWorkfl
         )
 
     def get_state_at_node(self, node: Type[BaseNode]) -> StateType:
-        event_ts = datetime.min
-        for event in self._store.events:
-            if event.name == "node.execution.initiated" and event.node_definition == node:
-                event_ts = event.timestamp
-
-        most_recent_state_snapshot: Optional[StateType] = None
-        for snapshot in self._store.state_snapshots:
-            if snapshot.meta.updated_ts > event_ts:
-                break
-
-            most_recent_state_snapshot = cast(StateType, snapshot)
-
+        event_ts = self._store.get_node_initiated_timestamp(node) or datetime.min
+        most_recent_state_snapshot = self._store.get_state_snapshot_at(event_ts)
         if not most_recent_state_snapshot:
             return self.get_default_state()
 
-        return most_recent_state_snapshot
+        # Snapshots share unchanged values with each other, so we hand out a full copy that is safe to mutate
+        return cast(StateType, deepcopy(most_recent_state_snapshot))
 
     def get_most_recent_state(self) -> StateType:
-        most_recent_state_snapshot: Optional[StateType] = None
-
-        for snapshot in self._store.state_snapshots:
-            next_state = cast(StateType, snapshot)
-            if not most_recent_state_snapshot:
-                most_recent_state_snapshot = next_state
-            elif next_state.meta.updated_ts >= most_recent_state_snapshot.meta.updated_ts:
-                most_recent_state_snapshot = next_state
-
+        most_recent_state_snapshot = self._store.get_most_recent_state_snapshot()
         if not most_recent_state_snapshot:
             return self.get_default_state()
 
-        return most_recent_state_snapshot
+        return cast(StateType, deepcopy(most_recent_state_snapshot))
 
     @staticmethod
     def load_from_module(module_path: str) -> Type["BaseWorkflow"]:
@@ -445,6 +597,8 @@ NodeExecutionRejectedBody.model_rebuild()
 NodeExecutionPausedBody.model_rebuild()
 NodeExecutionResumedBody.model_rebuild()
 NodeExecutionStreamingBody.model_rebuild()
+NodeExecutionCacheHitBody.model_rebuild()
+NodeExecutionCacheMissBody.model_rebuild()
 
 WorkflowExecutionInitiatedEvent.model_rebuild()
 WorkflowExecutionFulfilledEvent.model_rebuild()
@@ -460,3 +614,5 @@ NodeExecutionRejectedEvent.model_rebuild()
 NodeExecutionPausedEvent.model_rebuild()
 NodeExecutionResumedEvent.model_rebuild()
 NodeExecutionStreamingEvent.model_rebuild()
+NodeExecutionCacheHitEvent.model_rebuild()
+NodeExecutionCacheMissEvent.model_rebuild()
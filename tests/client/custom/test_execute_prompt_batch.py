@@ -0,0 +1,143 @@
+import pytest
+import json
+import threading
+import time
+import typing
+
+import httpx
+
+from vellum import AsyncVellum, FulfilledExecutePromptResponse, StringInputRequest, Vellum
+from vellum.client.core import retrying_http_client
+from vellum.client.errors.bad_request_error import BadRequestError
+from vellum.environment import VellumEnvironment
+
+ENVIRONMENT = VellumEnvironment(default="https://api.test", documents="https://api.test", predict="https://api.test")
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(retrying_http_client, "_retry_timeout", lambda response, retries: 0)
+
+
+def _fulfilled(question: str) -> httpx.Response:
+    return httpx.Response(
+        200,
+        json={
+            "state": "FULFILLED",
+            "execution_id": f"execution-{question}",
+            "outputs": [{"type": "STRING", "value": f"Answer to: {question}"}],
+        },
+    )
+
+
+def _get_question(request: httpx.Request) -> str:
+    return json.loads(request.content)["inputs"][0]["value"]
+
+
+def _create_input_sets(questions: typing.List[str]) -> typing.List[typing.List[StringInputRequest]]:
+    return [[StringInputRequest(name="question", value=question)] for question in questions]
+
+
+def test_execute_prompt_batch__yields_results_in_order() -> None:
+    # GIVEN a server that answers later questions faster, and rejects one of them
+    bodies: typing.List[typing.Dict[str, typing.Any]] = []
+    lock = threading.Lock()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        with lock:
+            bodies.append(json.loads(request.content))
+        question = _get_question(request)
+        time.sleep(0.05 / (int(question) + 1))
+        if question == "2":
+            return httpx.Response(400, json={"detail": "Invalid inputs"})
+        return _fulfilled(question)
+
+    client = Vellum(
+        api_key="api_key",
+        environment=ENVIRONMENT,
+        httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+
+    # WHEN we execute a batch of prompts
+    results = list(
+        client.execute_prompt_batch(
+            input_sets=_create_input_sets([str(index) for index in range(6)]),
+            prompt_deployment_name="my-deployment",
+            release_tag="production",
+            max_concurrency=3,
+        )
+    )
+
+    # THEN every result should have been yielded in the order of its inputs
+    assert [result.index for result in results] == [0, 1, 2, 3, 4, 5]
+    assert isinstance(results[0].result, FulfilledExecutePromptResponse)
+    assert results[0].result.outputs[0].value == "Answer to: 0"
+
+    # AND the rejected execution should have captured its error without failing the rest of the batch
+    assert isinstance(results[2].error, BadRequestError)
+    assert results[2].result is None
+    assert all(result.error is None for index, result in enumerate(results) if index != 2)
+
+    # AND every request should have included the shared fields
+    assert {body["release_tag"] for body in bodies} == {"production"}
+    assert {body["prompt_deployment_name"] for body in bodies} == {"my-deployment"}
+
+
+def test_execute_prompt_batch__retries_failed_executions() -> None:
+    # GIVEN a server that's unavailable the first time it's asked one of the questions
+    unavailable = {"1"}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        question = _get_question(request)
+        if question in unavailable:
+            unavailable.remove(question)
+            return httpx.Response(503, json={})
+        return _fulfilled(question)
+
+    client = Vellum(
+        api_key="api_key",
+        environment=ENVIRONMENT,
+        httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+
+    # WHEN we execute a batch of prompts, yielding results as they complete
+    results = list(
+        client.execute_prompt_batch(
+            input_sets=_create_input_sets(["0", "1", "2"]),
+            prompt_deployment_name="my-deployment",
+            ordered=False,
+        )
+    )
+
+    # THEN every execution should have succeeded
+    assert sorted(result.index for result in results) == [0, 1, 2]
+    assert all(result.error is None for result in results)
+
+
+async def test_execute_prompt_batch__async() -> None:
+    # GIVEN an async client
+    client = AsyncVellum(
+        api_key="api_key",
+        environment=ENVIRONMENT,
+        httpx_client=httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: _fulfilled(_get_question(request)))
+        ),
+    )
+
+    # WHEN we execute a batch of prompts
+    results = [
+        result
+        async for result in client.execute_prompt_batch(
+            input_sets=_create_input_sets([str(index) for index in range(5)]),
+            prompt_deployment_name="my-deployment",
+            max_concurrency=2,
+        )
+    ]
+
+    # THEN every result should have been yielded in the order of its inputs
+    assert [result.index for result in results] == [0, 1, 2, 3, 4]
+    assert [
+        result.result.outputs[0].value
+        for result in results
+        if isinstance(result.result, FulfilledExecutePromptResponse)
+    ] == [f"Answer to: {index}" for index in range(5)]
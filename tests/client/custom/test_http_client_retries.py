@@ -0,0 +1,160 @@
+import pytest
+import typing
+
+import httpx
+
+from vellum import Vellum
+from vellum.client.core import retrying_http_client
+from vellum.client.core.retrying_http_client import AsyncRetryingHttpClient, RetryingHttpClient
+from vellum.client.core.retries import RetryAttempt, RetryBudget
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(retrying_http_client, "_retry_timeout", lambda response, retries: 0.01)
+
+
+def _create_transport(status_codes: typing.List[int], requests: typing.List[httpx.Request]) -> httpx.MockTransport:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(status_codes.pop(0), json={})
+
+    return httpx.MockTransport(handler)
+
+
+def _create_http_client(
+    transport: httpx.MockTransport, retry_budget: typing.Optional[RetryBudget] = None
+) -> RetryingHttpClient:
+    return RetryingHttpClient(
+        httpx_client=httpx.Client(transport=transport),
+        base_timeout=lambda: None,
+        base_headers=lambda: {"X_API_KEY": "api_key"},
+        base_url=lambda: "https://api.test",
+        retry_budget=retry_budget,
+    )
+
+
+def test_request__retries_in_a_loop_and_reports_each_retry() -> None:
+    # GIVEN a server that's unavailable the first three times
+    requests: typing.List[httpx.Request] = []
+    client = _create_http_client(_create_transport([503, 503, 503, 200], requests))
+
+    # WHEN we send a request that may be retried, with a hook that records each retry
+    attempts: typing.List[RetryAttempt] = []
+    response = client.request(
+        "v1/things",
+        method="POST",
+        json={"hello": "world"},
+        request_options={"max_retries": 5, "on_retry": attempts.append},
+    )
+
+    # THEN the request should have succeeded
+    assert response.status_code == 200
+
+    # AND the same encoded request should have been sent every time
+    assert len(requests) == 4
+    assert {request.content for request in requests} == {b'{"hello":"world"}'}
+
+    # AND each retry should have been reported with the backoff before it
+    assert [attempt.retries for attempt in attempts] == [1, 2, 3]
+    assert [attempt.status_code for attempt in attempts] == [503, 503, 503]
+    assert attempts[-1].total_backoff_seconds == pytest.approx(0.03)
+
+
+def test_request__retry_budget_stops_retry_storms() -> None:
+    # GIVEN a server that's always unavailable
+    requests: typing.List[httpx.Request] = []
+    transport = _create_transport([503] * 10, requests)
+
+    # AND a client whose retry budget only has room for a single retry
+    client = _create_http_client(transport, retry_budget=RetryBudget(max_tokens=4))
+
+    # WHEN we send a request that may be retried many times
+    response = client.request("v1/things", method="GET", request_options={"max_retries": 5})
+
+    # THEN it should have stopped being retried once the budget ran out
+    assert response.status_code == 503
+    assert len(requests) == 2
+
+    # AND the next request shouldn't be retried at all until enough requests succeed
+    client.request("v1/things", method="GET", request_options={"max_retries": 5})
+    assert len(requests) == 3
+
+
+def test_request__failures_that_are_not_retried_keep_the_retry_budget() -> None:
+    # GIVEN a server that's always unavailable
+    requests: typing.List[httpx.Request] = []
+    transport = _create_transport([503] * 10, requests)
+
+    # AND a client with a retry budget
+    retry_budget = RetryBudget(max_tokens=4)
+    client = _create_http_client(transport, retry_budget=retry_budget)
+
+    # WHEN we send requests that may not be retried
+    for _ in range(3):
+        client.request("v1/things", method="GET", request_options={"max_retries": 0})
+
+    # THEN none of them should have withdrawn from the budget
+    assert len(requests) == 3
+    assert retry_budget.tokens == 4
+
+    # AND a request that may be retried should still be
+    client.request("v1/things", method="GET", request_options={"max_retries": 1})
+    assert len(requests) == 5
+
+
+def test_vellum__default_retries_still_work_after_a_burst_of_failures() -> None:
+    # GIVEN a server that's unavailable for a burst of requests, and then only for the first attempt of the next one
+    requests: typing.List[httpx.Request] = []
+    transport = _create_transport([503] * 60 + [503, 200], requests)
+
+    # AND a Vellum client created without a retry budget
+    client = Vellum(api_key="api_key", httpx_client=httpx.Client(transport=transport))
+    http_client = client._client_wrapper.httpx_client
+
+    # WHEN a burst of requests fails, each after being retried twice
+    for _ in range(20):
+        response = http_client.request(
+            "v1/things", base_url="https://api.test", method="GET", request_options={"max_retries": 2}
+        )
+        assert response.status_code == 503
+    assert len(requests) == 60
+
+    # THEN the next request should still be retried
+    response = http_client.request(
+        "v1/things", base_url="https://api.test", method="GET", request_options={"max_retries": 2}
+    )
+    assert response.status_code == 200
+    assert len(requests) == 62
+
+
+def test_request__deadline_stops_retries(monkeypatch: pytest.MonkeyPatch) -> None:
+    # GIVEN a server that asks to be retried later than the request's deadline
+    monkeypatch.setattr(retrying_http_client, "_retry_timeout", lambda response, retries: 10)
+    requests: typing.List[httpx.Request] = []
+    client = _create_http_client(_create_transport([503, 200], requests))
+
+    # WHEN we send a request with a deadline
+    response = client.request("v1/things", method="GET", request_options={"max_retries": 5, "deadline_in_seconds": 1})
+
+    # THEN it shouldn't have been retried, since the backoff would have outlasted the deadline
+    assert response.status_code == 503
+    assert len(requests) == 1
+
+
+async def test_request__async_retries() -> None:
+    # GIVEN a server that's unavailable the first time
+    requests: typing.List[httpx.Request] = []
+    client = AsyncRetryingHttpClient(
+        httpx_client=httpx.AsyncClient(transport=_create_transport([503, 200], requests)),
+        base_timeout=lambda: None,
+        base_headers=lambda: {},
+        base_url=lambda: "https://api.test",
+    )
+
+    # WHEN we send a request that may be retried
+    response = await client.request("v1/things", method="GET", request_options={"max_retries": 1})
+
+    # THEN it should have been retried once
+    assert response.status_code == 200
+    assert len(requests) == 2
@@ -0,0 +1,143 @@
+import pytest
+import json
+import typing
+
+import httpx
+
+from vellum import AsyncVellum, Vellum
+from vellum.client.core import retrying_http_client
+from vellum.client.core.stream_metrics import get_stream_metrics, reset_stream_metrics
+from vellum.environment import VellumEnvironment
+
+ENVIRONMENT = VellumEnvironment(default="https://api.test", documents="https://api.test", predict="https://api.test")
+
+INITIATED_EVENT = {"state": "INITIATED", "execution_id": "e1a3b2c8-0ee5-4b43-a0a2-2dca2f4b4d0d", "meta": {}}
+FULFILLED_EVENT = {
+    "state": "FULFILLED",
+    "execution_id": "e1a3b2c8-0ee5-4b43-a0a2-2dca2f4b4d0d",
+    "outputs": [{"type": "STRING", "value": "Hello"}],
+}
+STREAM_BODY = "\n".join(json.dumps(event) for event in [INITIATED_EVENT, FULFILLED_EVENT])
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch: pytest.MonkeyPatch) -> typing.Iterator[None]:
+    monkeypatch.setattr(retrying_http_client, "_backoff_timeout", lambda retries: 0)
+    monkeypatch.setattr(retrying_http_client, "_retry_timeout", lambda response, retries: 0)
+    reset_stream_metrics()
+    yield
+    reset_stream_metrics()
+
+
+def _create_handler(
+    responses: typing.List[typing.Union[Exception, httpx.Response]],
+) -> typing.Callable[[httpx.Request], httpx.Response]:
+    def handler(request: httpx.Request) -> httpx.Response:
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    return handler
+
+
+def test_stream__retries_failed_connections() -> None:
+    # GIVEN a server that can't be connected to the first time
+    responses: typing.List[typing.Union[Exception, httpx.Response]] = [
+        httpx.ConnectError("Connection refused"),
+        httpx.Response(200, text=STREAM_BODY),
+    ]
+    client = Vellum(
+        api_key="api_key",
+        environment=ENVIRONMENT,
+        httpx_client=httpx.Client(transport=httpx.MockTransport(_create_handler(responses))),
+    )
+
+    # WHEN we stream a prompt
+    events = list(client.execute_prompt_stream(inputs=[], prompt_deployment_name="my-deployment"))
+
+    # THEN the stream should have been re-sent and read in full
+    assert [event.state for event in events] == ["INITIATED", "FULFILLED"]
+    assert get_stream_metrics().connection_retries == 1
+
+
+def test_stream__gives_up_after_connection_retries() -> None:
+    # GIVEN a server that can never be connected to
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("Connection refused")
+
+    client = Vellum(
+        api_key="api_key",
+        environment=ENVIRONMENT,
+        httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+
+    # WHEN we stream a prompt
+    # THEN the connection error should be raised once the retries are exhausted
+    with pytest.raises(httpx.ConnectError):
+        list(client.execute_prompt_stream(inputs=[], prompt_deployment_name="my-deployment"))
+
+    assert get_stream_metrics().connection_retries == retrying_http_client.DEFAULT_STREAM_CONNECTION_RETRIES
+
+
+def test_stream__retries_retriable_status_codes_up_to_max_retries() -> None:
+    # GIVEN a server that's unavailable the first time
+    responses: typing.List[typing.Union[Exception, httpx.Response]] = [
+        httpx.Response(503, json={"detail": "Unavailable"}),
+        httpx.Response(200, text=STREAM_BODY),
+    ]
+    client = Vellum(
+        api_key="api_key",
+        environment=ENVIRONMENT,
+        httpx_client=httpx.Client(transport=httpx.MockTransport(_create_handler(responses))),
+    )
+
+    # WHEN we stream a prompt, allowing one retry
+    events = list(
+        client.execute_prompt_stream(
+            inputs=[], prompt_deployment_name="my-deployment", request_options={"max_retries": 1}
+        )
+    )
+
+    # THEN the stream should have been re-sent and read in full
+    assert [event.state for event in events] == ["INITIATED", "FULFILLED"]
+    assert get_stream_metrics().status_retries == 1
+
+
+def test_stream__counts_dropped_lines() -> None:
+    # GIVEN a stream with a line that can't be parsed
+    body = "\n".join([json.dumps(INITIATED_EVENT), "{not json", json.dumps(FULFILLED_EVENT)])
+    client = Vellum(
+        api_key="api_key",
+        environment=ENVIRONMENT,
+        httpx_client=httpx.Client(transport=httpx.MockTransport(lambda request: httpx.Response(200, text=body))),
+    )
+
+    # WHEN we stream a prompt
+    events = list(client.execute_prompt_stream(inputs=[], prompt_deployment_name="my-deployment"))
+
+    # THEN the rest of the stream should still have been read
+    assert [event.state for event in events] == ["INITIATED", "FULFILLED"]
+
+    # AND the unparseable line should have been counted
+    assert get_stream_metrics().dropped_lines == 1
+
+
+async def test_stream__async_retries_failed_connections() -> None:
+    # GIVEN a server that can't be connected to the first time
+    responses: typing.List[typing.Union[Exception, httpx.Response]] = [
+        httpx.ConnectError("Connection refused"),
+        httpx.Response(200, text=STREAM_BODY),
+    ]
+    client = AsyncVellum(
+        api_key="api_key",
+        environment=ENVIRONMENT,
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(_create_handler(responses))),
+    )
+
+    # WHEN we stream a prompt
+    events = [event async for event in client.execute_prompt_stream(inputs=[], prompt_deployment_name="my-deployment")]
+
+    # THEN the stream should have been re-sent and read in full
+    assert [event.state for event in events] == ["INITIATED", "FULFILLED"]
+    assert get_stream_metrics().connection_retries == 1
@@ -0,0 +1,204 @@
+import pytest
+import datetime as dt
+import json
+import time
+import typing
+
+import httpx
+
+from vellum import (
+    ApiNodeResultData,
+    ArrayChatMessageContentRequest,
+    ChatHistoryInputRequest,
+    ChatMessageRequest,
+    ImageChatMessageContentRequest,
+    PromptDeploymentExpandMetaRequest,
+    PromptDeploymentInputRequest,
+    StringChatMessageContentRequest,
+    StringInputRequest,
+    SubmitCompletionActualRequest,
+    Vellum,
+    VellumImageRequest,
+)
+from vellum.client.core.http_client import get_request_body
+from vellum.client.core.json_body_encoder import encode_json_body
+from vellum.client.core.jsonable_encoder import jsonable_encoder
+from vellum.client.core.pydantic_utilities import IS_PYDANTIC_V2
+from vellum.client.core.request_options import RequestOptions
+from vellum.client.core.retrying_http_client import get_json_request_body
+from vellum.client.core.serialization import convert_and_respect_annotation_metadata
+from vellum.environment import VellumEnvironment
+
+
+def _create_chat_history(message_count: int) -> typing.List[ChatMessageRequest]:
+    messages = []
+    for index in range(message_count):
+        content: typing.Union[StringChatMessageContentRequest, ArrayChatMessageContentRequest]
+        if index % 3 == 0:
+            content = ArrayChatMessageContentRequest(
+                value=[
+                    StringChatMessageContentRequest(value="Look at this image " * 10),
+                    ImageChatMessageContentRequest(value=VellumImageRequest(src="https://example.com/image.png")),
+                ]
+            )
+        else:
+            content = StringChatMessageContentRequest(value="Hello, world! " * 20)
+        messages.append(ChatMessageRequest(role="USER" if index % 2 else "ASSISTANT", content=content))
+    return messages
+
+
+def _create_execute_prompt_body(message_count: int) -> typing.Dict[str, typing.Any]:
+    inputs: typing.List[PromptDeploymentInputRequest] = [
+        ChatHistoryInputRequest(name="chat_history", value=_create_chat_history(message_count)),
+        StringInputRequest(name="question", value="Qu'est-ce que c'est ?"),
+    ]
+    return {
+        "inputs": convert_and_respect_annotation_metadata(
+            object_=inputs, annotation=typing.Sequence[PromptDeploymentInputRequest], direction="write"
+        ),
+        "prompt_deployment_name": "my-deployment",
+        "external_id": None,
+        "expand_meta": PromptDeploymentExpandMetaRequest(usage=True),
+        "metadata": {"created_at": dt.datetime(2024, 1, 1, tzinfo=dt.timezone.utc)},
+    }
+
+
+def test_encode_json_body__matches_jsonable_encoder() -> None:
+    # GIVEN a request body with nested models, some of whose optional fields were set to None explicitly
+    body = {
+        **_create_execute_prompt_body(10),
+        "actuals": [
+            SubmitCompletionActualRequest(id="1", quality=None, timestamp=dt.datetime(2024, 1, 1, 12)),
+            SubmitCompletionActualRequest(external_id="2", quality=1.0),
+        ],
+        "result": ApiNodeResultData(
+            json_={"hello": "world"},
+            text_output_id="text",
+            json_output_id="json",
+            status_code_output_id="status_code",
+            status_code=200,
+        ),
+    }
+
+    # WHEN we encode it in a single pass
+    encoded = encode_json_body(body)
+
+    # THEN it should be encoded exactly like jsonable_encoder encodes it
+    assert json.loads(encoded) == jsonable_encoder(body)
+
+    # AND the explicitly set None should have been kept, while the unset ones were dropped
+    assert json.loads(encoded)["actuals"][0] == {
+        "id": "1",
+        "quality": None,
+        "timestamp": jsonable_encoder(dt.datetime(2024, 1, 1, 12)),
+    }
+
+
+def test_encode_json_body__serializes_nested_naive_datetimes_like_jsonable_encoder() -> None:
+    # GIVEN a request body with naive datetimes nested in plain containers, both outside and inside of models
+    naive = dt.datetime(2024, 1, 1, 12)
+    body = {
+        "metadata": {"ts": naive},
+        "x": [naive],
+        "result": ApiNodeResultData(
+            json_={"ts": naive, "items": [naive, {"ts": naive}]},
+            text_output_id="text",
+            json_output_id="json",
+            status_code_output_id="status_code",
+            status_code=200,
+        ),
+    }
+
+    # WHEN we encode it in a single pass
+    encoded = json.loads(encode_json_body(body))
+
+    # THEN it should be encoded exactly like jsonable_encoder encodes it
+    assert encoded == jsonable_encoder(body)
+
+    # AND every one of the datetimes should have been localized
+    assert encoded["metadata"]["ts"] == jsonable_encoder(naive)
+    assert encoded["x"] == [jsonable_encoder(naive)]
+    assert encoded["result"]["json"]["items"][1] == {"ts": jsonable_encoder(naive)}
+
+
+def test_get_json_request_body__matches_get_request_body() -> None:
+    # GIVEN a request body with an omitted field and additional body parameters
+    omit = typing.cast(typing.Any, ...)
+    body = {**_create_execute_prompt_body(10), "release_tag": omit}
+    request_options: RequestOptions = {
+        "additional_body_parameters": {"extra": PromptDeploymentExpandMetaRequest(cost=True)}
+    }
+
+    # WHEN we build the request body as bytes
+    content = get_json_request_body(json=body, request_options=request_options, omit=omit)
+
+    # THEN it should be the same body as the one built for httpx to encode
+    json_body, _ = get_request_body(json=body, data=None, request_options=request_options, omit=omit)
+    assert content is not None
+    assert json.loads(content) == json_body
+
+    # AND empty bodies still shouldn't be sent at all
+    assert get_json_request_body(json={}, request_options=None, omit=omit) is None
+
+
+def test_execute_prompt__sends_encoded_json_content() -> None:
+    # GIVEN a client whose server records the requests it receives
+    requests: typing.List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"state": "FULFILLED", "execution_id": "execution", "outputs": []})
+
+    client = Vellum(
+        api_key="api_key",
+        environment=VellumEnvironment(
+            default="https://api.test", documents="https://api.test", predict="https://api.test"
+        ),
+        httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+
+    # WHEN we execute a prompt with a chat history
+    client.execute_prompt(
+        inputs=[ChatHistoryInputRequest(name="chat_history", value=_create_chat_history(3))],
+        prompt_deployment_name="my-deployment",
+    )
+
+    # THEN the body should have been sent as JSON
+    assert requests[0].headers["Content-Type"] == "application/json"
+    body = json.loads(requests[0].content)
+    assert body["prompt_deployment_name"] == "my-deployment"
+    assert body["inputs"][0]["value"][1] == {
+        "role": "USER",
+        "content": {"type": "STRING", "value": "Hello, world! " * 20},
+    }
+
+
+@pytest.mark.benchmark
+@pytest.mark.skipif(not IS_PYDANTIC_V2, reason="The single pass encoder requires Pydantic v2")
+def test_encode_json_body__benchmark_large_execute_prompt_payload() -> None:
+    # GIVEN the body of an execute prompt request with a very long chat history
+    body = _create_execute_prompt_body(2000)
+
+    def encode_with_jsonable_encoder() -> bytes:
+        json_body, _ = get_request_body(json=body, data=None, request_options=None, omit=None)
+        return json.dumps(json_body).encode("utf-8")
+
+    def encode_in_a_single_pass() -> bytes:
+        content = get_json_request_body(json=body, request_options=None, omit=None)
+        assert content is not None
+        return content
+
+    def benchmark(encode: typing.Callable[[], bytes]) -> float:
+        timings = []
+        for _ in range(3):
+            start = time.perf_counter()
+            encode()
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+
+    # WHEN we encode it in a single pass, and the way it used to be encoded
+    single_pass_seconds = benchmark(encode_in_a_single_pass)
+    jsonable_encoder_seconds = benchmark(encode_with_jsonable_encoder)
+
+    # THEN the single pass should have been faster
+    assert single_pass_seconds < jsonable_encoder_seconds, (single_pass_seconds, jsonable_encoder_seconds)
@@ -0,0 +1,70 @@
+import json
+import subprocess
+import sys
+import typing
+
+IMPORT_BENCHMARK_SCRIPT = """
+import json
+import sys
+import time
+
+start = time.perf_counter()
+{statement}
+duration = time.perf_counter() - start
+
+print(json.dumps({{
+    "duration": duration,
+    "client_types": len([name for name in sys.modules if name.startswith("vellum.client.types.")]),
+}}))
+"""
+
+
+def _benchmark_import(statement: str) -> typing.Dict[str, typing.Any]:
+    # Each import is measured in a fresh interpreter, since modules are cached once imported
+    output = subprocess.check_output(
+        [sys.executable, "-c", IMPORT_BENCHMARK_SCRIPT.format(statement=statement)],
+        text=True,
+    )
+    return json.loads(output)
+
+
+def test_lazy_imports__package_root_is_cheap() -> None:
+    # WHEN we import the top level package
+    result = _benchmark_import("import vellum")
+
+    # THEN none of the generated models are imported
+    assert result["client_types"] == 0
+
+
+def test_lazy_imports__single_type() -> None:
+    # WHEN we import a single type from the top level package
+    result = _benchmark_import("from vellum import ApiNodeResult")
+
+    # THEN only the modules that type depends on are imported
+    assert 0 < result["client_types"] < 10
+
+
+def test_lazy_imports__workflows() -> None:
+    # WHEN we import the Workflows SDK
+    result = _benchmark_import("import vellum.workflows")
+
+    # THEN it only imports the generated models it uses, rather than every model in the client
+    assert result["client_types"] < 250
+
+
+def test_lazy_imports__names_still_resolve() -> None:
+    # GIVEN the package roots that are loaded lazily
+    import vellum
+    import vellum.client
+    import vellum.client.types
+    import vellum.types
+
+    # THEN every name they export still resolves
+    for module in [vellum, vellum.client, vellum.client.types, vellum.types]:
+        for name in module.__all__:
+            assert getattr(module, name) is not None, f"{module.__name__}.{name}"
+
+    # AND the shims resolve to the same objects
+    assert vellum.ApiNodeResult is vellum.client.types.ApiNodeResult
+    assert vellum.types.ApiNodeResult is vellum.client.types.ApiNodeResult
+    assert vellum.Vellum is vellum.client.Vellum
@@ -0,0 +1,86 @@
+import pytest
+from unittest import mock
+import typing
+
+import pydantic
+
+from vellum import ApiNodeResultData, ExecutePromptEvent, WorkflowStreamEvent
+from vellum.client.core.pydantic_utilities import IS_PYDANTIC_V2, UniversalBaseModel, parse_obj_as
+from vellum.client.core.serialization import convert_and_respect_annotation_metadata
+from vellum.client.core.type_caches import get_type_adapter, has_annotation_metadata
+
+STREAMING_PROMPT_EVENT = {
+    "state": "STREAMING",
+    "execution_id": "e1a3b2c8-0ee5-4b43-a0a2-2dca2f4b4d0d",
+    "output_index": 0,
+    "output": {"type": "STRING", "value": "Hello"},
+}
+
+API_NODE_RESULT_DATA = {
+    "text_output_id": "text-output-id",
+    "text": "{}",
+    "json_output_id": "json-output-id",
+    "json": {"key": "value"},
+    "status_code_output_id": "status-code-output-id",
+    "status_code": 200,
+}
+
+
+def _parse_obj_as_uncached(type_: typing.Any, object_: typing.Any) -> typing.Any:
+    dealiased_object = convert_and_respect_annotation_metadata(object_=object_, annotation=type_, direction="read")
+    return pydantic.TypeAdapter(type_).validate_python(dealiased_object)
+
+
+def test_has_annotation_metadata() -> None:
+    # GIVEN a type with no aliased fields anywhere in its type tree
+    # THEN it is detected as not needing dealiasing
+    assert not has_annotation_metadata(ExecutePromptEvent)
+
+    # AND types that do contain aliased fields, directly or nested, are detected
+    assert has_annotation_metadata(ApiNodeResultData)
+    assert has_annotation_metadata(WorkflowStreamEvent)
+    assert has_annotation_metadata(typing.List[ApiNodeResultData])
+
+
+def test_get_type_adapter__cached_per_type() -> None:
+    # WHEN we fetch the adapter for the same type twice
+    first: "pydantic.TypeAdapter[ExecutePromptEvent]" = get_type_adapter(ExecutePromptEvent)  # type: ignore[arg-type]
+    second: "pydantic.TypeAdapter[ExecutePromptEvent]" = get_type_adapter(ExecutePromptEvent)  # type: ignore[arg-type]
+
+    # THEN it is only built once
+    assert first is second
+
+
+def test_parse_obj_as__respects_aliases() -> None:
+    # WHEN we parse an API node result, which uses an aliased field
+    result = parse_obj_as(ApiNodeResultData, API_NODE_RESULT_DATA)
+
+    # THEN the aliased field is still read
+    assert result.json_ == {"key": "value"}
+    assert result == _parse_obj_as_uncached(ApiNodeResultData, API_NODE_RESULT_DATA)
+
+
+def test_parse_obj_as__alias_free_fast_path() -> None:
+    # WHEN we parse a prompt event, which has no aliased fields
+    event: ExecutePromptEvent = parse_obj_as(ExecutePromptEvent, STREAMING_PROMPT_EVENT)  # type: ignore[arg-type]
+
+    # THEN it matches the result of the full dealiasing path
+    assert event == _parse_obj_as_uncached(ExecutePromptEvent, STREAMING_PROMPT_EVENT)
+
+
+@pytest.mark.skipif(not IS_PYDANTIC_V2, reason="TypeAdapters require Pydantic v2")
+def test_parse_obj_as__reuses_type_adapter() -> None:
+    # GIVEN a type that hasn't been parsed before
+    class StreamingEvent(UniversalBaseModel):
+        state: str
+        output_index: int
+
+    # WHEN we parse a stream's worth of it, one event at a time as they would be off the wire
+    with mock.patch("pydantic.TypeAdapter", wraps=pydantic.TypeAdapter) as type_adapter:
+        events = [parse_obj_as(StreamingEvent, {"state": "STREAMING", "output_index": i}) for i in range(50)]
+
+    # THEN every event is parsed
+    assert [event.output_index for event in events] == list(range(50))
+
+    # AND its TypeAdapter is only built once
+    type_adapter.assert_called_once_with(StreamingEvent)
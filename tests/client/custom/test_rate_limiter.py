@@ -0,0 +1,242 @@
+import pytest
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+import typing
+
+import httpx
+
+from vellum.client.core import rate_limiter as rate_limiter_module
+from vellum.client.core.client_wrapper import AsyncClientWrapper, SyncClientWrapper
+from vellum.client.core.rate_limiter import RateLimit, RateLimiter
+from vellum.environment import VellumEnvironment
+
+ENVIRONMENT = VellumEnvironment(
+    default="https://api.test", documents="https://documents.test", predict="https://predict.test"
+)
+
+
+class FakeClock:
+    """
+    Stands in for the rate limiter's clock, so that sleeping advances time instantly and is recorded.
+    """
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+        self.sleeps: typing.List[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def fake_clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    fake_clock = FakeClock()
+    monkeypatch.setattr(rate_limiter_module, "time", fake_clock)
+    return fake_clock
+
+
+def _create_client_wrapper(
+    handler: typing.Callable[[httpx.Request], httpx.Response], rate_limiter: RateLimiter
+) -> SyncClientWrapper:
+    return SyncClientWrapper(
+        api_key="api_key",
+        environment=ENVIRONMENT,
+        httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        rate_limiter=rate_limiter,
+    )
+
+
+def test_rate_limiter__limits_requests_per_second(fake_clock: FakeClock) -> None:
+    # GIVEN a client limited to 20 predict requests per second, without any burst
+    client_wrapper = _create_client_wrapper(
+        lambda request: httpx.Response(200, json={}),
+        RateLimiter(predict=RateLimit(requests_per_second=20, burst=1)),
+    )
+
+    # WHEN we send five predict requests
+    for _ in range(5):
+        client_wrapper.httpx_client.request("v1/execute-prompt", method="POST", base_url=ENVIRONMENT.predict)
+
+    # THEN every predict request after the first should have waited its turn to match the rate
+    assert fake_clock.sleeps == [pytest.approx(0.05)] * 4
+
+    # AND requests to the default endpoints shouldn't have been limited
+    for _ in range(5):
+        client_wrapper.httpx_client.request("v1/deployments", method="GET", base_url=ENVIRONMENT.default)
+    assert len(fake_clock.sleeps) == 4
+
+
+def test_rate_limiter__limits_requests_in_flight() -> None:
+    # GIVEN a server that tracks how many requests it's handling at once
+    lock = threading.Lock()
+    in_flight = 0
+    max_in_flight = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, max_in_flight
+        with lock:
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+        time.sleep(0.05)
+        with lock:
+            in_flight -= 1
+        return httpx.Response(200, json={})
+
+    # AND a client that allows two predict requests in flight at once
+    client_wrapper = _create_client_wrapper(handler, RateLimiter(predict=RateLimit(max_in_flight=2)))
+
+    # WHEN we send eight predict requests from a thread pool
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for _ in range(8):
+            executor.submit(
+                client_wrapper.httpx_client.request, "v1/execute-prompt", method="POST", base_url=ENVIRONMENT.predict
+            )
+
+    # THEN no more than two of them should have been in flight at once
+    assert max_in_flight == 2
+
+
+def test_rate_limiter__waits_out_retry_after(fake_clock: FakeClock) -> None:
+    # GIVEN a server that rate limits the first predict request
+    responses = [httpx.Response(429, headers={"retry-after-ms": "200"}, json={})]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return responses.pop(0) if responses else httpx.Response(200, json={})
+
+    client_wrapper = _create_client_wrapper(handler, RateLimiter())
+
+    # WHEN we send a predict request that gets rate limited
+    response = client_wrapper.httpx_client.request("v1/execute-prompt", method="POST", base_url=ENVIRONMENT.predict)
+    assert response.status_code == 429
+
+    # AND then send a documents request
+    client_wrapper.httpx_client.request("v1/documents", method="GET", base_url=ENVIRONMENT.documents)
+
+    # THEN it shouldn't have waited
+    assert fake_clock.sleeps == []
+
+    # AND the next predict request should have waited out the server's Retry-After
+    client_wrapper.httpx_client.request("v1/execute-prompt", method="POST", base_url=ENVIRONMENT.predict)
+    assert fake_clock.sleeps == [pytest.approx(0.2)]
+
+
+async def test_rate_limiter__sync_and_async_clients_share_requests_in_flight() -> None:
+    # GIVEN sync and async clients sharing a rate limiter that allows one predict request in flight at once
+    rate_limiter = RateLimiter(predict=RateLimit(max_in_flight=1))
+    requests: typing.List[str] = []
+    sync_request_received = threading.Event()
+    sync_request_released = threading.Event()
+
+    def sync_handler(request: httpx.Request) -> httpx.Response:
+        requests.append("sync")
+        sync_request_received.set()
+        sync_request_released.wait()
+        return httpx.Response(200, json={})
+
+    async def async_handler(request: httpx.Request) -> httpx.Response:
+        requests.append("async")
+        return httpx.Response(200, json={})
+
+    sync_client_wrapper = _create_client_wrapper(sync_handler, rate_limiter)
+    async_client_wrapper = AsyncClientWrapper(
+        api_key="api_key",
+        environment=ENVIRONMENT,
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(async_handler)),
+        rate_limiter=rate_limiter,
+    )
+
+    # AND a sync predict request that's in flight
+    thread = threading.Thread(
+        target=sync_client_wrapper.httpx_client.request,
+        args=("v1/execute-prompt",),
+        kwargs={"method": "POST", "base_url": ENVIRONMENT.predict},
+    )
+    thread.start()
+    sync_request_received.wait()
+
+    try:
+        # WHEN we send an async predict request
+        task = asyncio.create_task(
+            async_client_wrapper.httpx_client.request("v1/execute-prompt", method="POST", base_url=ENVIRONMENT.predict)
+        )
+        for _ in range(10):
+            await asyncio.sleep(0)
+
+        # THEN it should wait for the sync request to finish
+        assert requests == ["sync"]
+        assert not task.done()
+    finally:
+        sync_request_released.set()
+        thread.join()
+
+    # AND be sent once it did
+    response = await task
+    assert response.status_code == 200
+    assert requests == ["sync", "async"]
+
+
+def test_rate_limiter__limits_requests_in_flight_across_event_loops() -> None:
+    # GIVEN an async client that allows one predict request in flight at once
+    in_flight = 0
+    max_in_flight = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return httpx.Response(200, json={})
+
+    client_wrapper = AsyncClientWrapper(
+        api_key="api_key",
+        environment=ENVIRONMENT,
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        rate_limiter=RateLimiter(predict=RateLimit(max_in_flight=1)),
+    )
+
+    async def send_requests() -> None:
+        await asyncio.gather(
+            *(
+                client_wrapper.httpx_client.request("v1/execute-prompt", method="POST", base_url=ENVIRONMENT.predict)
+                for _ in range(3)
+            )
+        )
+
+    # WHEN we send concurrent predict requests from one event loop and then from another
+    asyncio.run(send_requests())
+    asyncio.run(send_requests())
+
+    # THEN no more than one of them should have been in flight at once
+    assert max_in_flight == 1
+
+
+async def test_rate_limiter__cancelled_request_hands_on_its_turn() -> None:
+    # GIVEN a rate limiter that allows one predict request in flight at once
+    rate_limiter = RateLimiter(predict=RateLimit(max_in_flight=1))
+
+    # AND a request that's in flight, and another waiting for its turn
+    holder = rate_limiter.async_acquire("predict")
+    await holder.__aenter__()
+
+    async def wait_for_turn() -> None:
+        async with rate_limiter.async_acquire("predict"):
+            pass
+
+    waiting_task = asyncio.create_task(wait_for_turn())
+    await asyncio.sleep(0)
+
+    # WHEN the waiting request is cancelled
+    waiting_task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiting_task
+
+    # THEN the next request should still get its turn once the first one finishes
+    await holder.__aexit__(None, None, None)
+    await asyncio.wait_for(wait_for_turn(), timeout=1)
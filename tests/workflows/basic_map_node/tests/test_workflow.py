@@ -54,7 +54,12 @@ def test_map_node_streaming_events():
         assert event.parent.parent.workflow_definition == CodeResourceDefinition.encode(SimpleMapExample)
 
     # Node events
-    assert len(node_events) == 6  # 2 initiated + 2 fulfilled + 2 others
+    assert len(node_events) == 10  # 3 initiated + 3 fulfilled + 4 streaming from the map node
+
+    # Map node streaming events
+    map_node_streaming = [e for e in node_events if e.name == "node.execution.streaming"]
+    assert sorted(e.output.delta for e in map_node_streaming if e.output.is_streaming) == [(0, 5), (1, 7)]
+    assert map_node_streaming[-1].output.value == [5, 7]
 
     # Node initiated events
     node_initiated = [e for e in node_events if e.name == "node.execution.initiated"]
@@ -1,19 +1,18 @@
 from unittest import mock
 
-import requests_mock.mocker
+import httpx
 
 from vellum.workflows.references.vellum_secret import VellumSecretReference
 
 from tests.workflows.basic_vellum_api_node.workflow import SimpleAPIWorkflow
 
 
-def test_run_workflow__happy_path(requests_mock: requests_mock.mocker.Mocker):
+def test_run_workflow__happy_path(mock_api_node_transport):
     # GIVEN an API request that will return a 200 OK response
-    requests_mock.post(
-        "https://api.vellum.ai",
-        json={"data": [1, 2, 3]},
-        headers={"X-Response-Header": "bar"},
+    mock_api_node_transport.handle_request.return_value = httpx.Response(
         status_code=200,
+        headers={"X-Response-Header": "bar"},
+        stream=httpx.ByteStream(b'{"data": [1, 2, 3]}'),
     )
 
     # AND a simple workflow that has an API node targeting this request
@@ -31,3 +30,10 @@ def test_run_workflow__happy_path(requests_mock: requests_mock.mocker.Mocker):
         "headers": {"X-Response-Header": "bar"},
         "status_code": 200,
     }
+
+    # AND the request should have been sent to the expected URL
+    request = mock_api_node_transport.handle_request.call_args.args[0]
+    assert request.method == "POST"
+    assert request.url == "https://api.vellum.ai"
+    assert request.headers["CUSTOM_API_KEY"] == "SECRET_VALUE"
+    assert request.headers["additional_header"] == "additional header value"
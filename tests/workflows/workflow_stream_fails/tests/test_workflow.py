@@ -38,15 +38,13 @@ def test_run_workflow__stream_fails__last_event_is_not_workflow_event():
 
     # AND the failure happens after a NODE FULFILLED event
     def mock_stream_side_effect(self):
-        self._workflow_event_outer_queue.put(
-            NodeExecutionFulfilledEvent(
-                trace_id=uuid4(),
-                span_id=uuid4(),
-                body=NodeExecutionFulfilledBody(
-                    node_definition=BaseNode,
-                    outputs=BaseOutputs(),
-                ),
-            )
+        yield NodeExecutionFulfilledEvent(
+            trace_id=uuid4(),
+            span_id=uuid4(),
+            body=NodeExecutionFulfilledBody(
+                node_definition=BaseNode,
+                outputs=BaseOutputs(),
+            ),
         )
         raise Exception("Stream failed")
 